@@ -0,0 +1,285 @@
+# "Confidence Intervals" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Confidence Intervals")
+
+if not st.session_state.global_dataframes:
+    st.info("Please load or enter data in the 'Data Input' tab first to use raw data input.")
+
+ci_type_options = [
+    'Mean (sigma unknown) - t-interval',
+    'One Proportion',
+    'Difference Between Two Means (Independent, sigma known)',
+    'Difference Between Two Means (Independent, sigma unknown, equal variances)',
+    'Difference Between Two Means (Independent, sigma unknown, unequal variances)',
+    'Difference Between Two Proportions',
+    'Paired Differences'
+]
+selected_ci_type = st.selectbox("Select CI Type", options=ci_type_options, key="ci_type_select")
+
+# Determine input method options based on selected CI type
+input_method_options = []
+if selected_ci_type in ['One Proportion', 'Difference Between Two Proportions']:
+    input_method_options = ['Summary Statistics Input']
+else:
+    input_method_options = ['Raw Data', 'Summary Statistics Input']
+
+input_method = st.radio("Input Method", options=input_method_options, key="ci_input_method")
+
+st.subheader("Inputs")
+
+# Dynamic parameter inputs based on CI type and input method
+params = {}
+numeric_cols = [''] + get_numeric_columns()
+
+# Helper to get the value from session state if available, else a default
+def get_state_value(key, default):
+    return st.session_state.get(key, default)
+
+
+if selected_ci_type == 'Mean (sigma unknown) - t-interval':
+    if input_method == 'Raw Data':
+        params['data_column'] = st.selectbox('Select Data Column', options=numeric_cols, key="ci_mean_suk_raw_data_col")
+    else: # Summary Statistics Input
+        params['sample_mean'] = st.number_input('Sample Mean (x̄):', value=get_state_value('ci_mean_suk_sum_mean', 0.0), key="ci_mean_suk_sum_mean")
+        params['sample_std_dev'] = st.number_input('Sample Std Dev (s):', value=get_state_value('ci_mean_suk_sum_std_dev', 1.0), min_value=0.001, key="ci_mean_suk_sum_std_dev")
+        params['sample_size'] = st.number_input('Sample Size (n):', value=get_state_value('ci_mean_suk_sum_size', 30), min_value=2, step=1, key="ci_mean_suk_sum_size")
+
+elif selected_ci_type == 'One Proportion':
+    # Only Summary Statistics Input
+    params['num_successes'] = st.number_input('Number of Observed Successes (x):', value=get_state_value('ci_prop_sum_succ', 10), min_value=0, step=1, key="ci_prop_sum_succ")
+    params['num_trials'] = st.number_input('Number of Trials (n):', value=get_state_value('ci_prop_sum_trials', 20), min_value=1, step=1, key="ci_prop_sum_trials")
+
+elif selected_ci_type == 'Difference Between Two Means (Independent, sigma known)':
+    if input_method == 'Raw Data':
+        col1, col2 = st.columns(2)
+        with col1:
+            params['data_column1'] = st.selectbox('Select Sample 1 Data', options=numeric_cols, key="ci_diff_mean_sk_raw_data_col1")
+            params['pop_std_dev1'] = st.number_input('Pop. Std Dev 1 (σ1):', value=get_state_value('ci_diff_mean_sk_pop_std_dev1', 1.0), min_value=0.001, key="ci_diff_mean_sk_pop_std_dev1")
+        with col2:
+            params['data_column2'] = st.selectbox('Select Sample 2 Data', options=numeric_cols, key="ci_diff_mean_sk_raw_data_col2")
+            params['pop_std_dev2'] = st.number_input('Pop. Std Dev 2 (σ2):', value=get_state_value('ci_diff_mean_sk_pop_std_dev2', 1.0), min_value=0.001, key="ci_diff_mean_sk_pop_std_dev2")
+    else: # Summary Statistics Input
+        col1, col2 = st.columns(2)
+        with col1:
+            params['sample_mean1'] = st.number_input('Sample 1 Mean (x̄1):', value=get_state_value('ci_diff_mean_sk_sum_mean1', 0.0), key="ci_diff_mean_sk_sum_mean1")
+            params['pop_std_dev1'] = st.number_input('Pop. Std Dev 1 (σ1):', value=get_state_value('ci_diff_mean_sk_sum_pop_std_dev1', 1.0), min_value=0.001, key="ci_diff_mean_sk_sum_pop_std_dev1")
+            params['sample_size1'] = st.number_input('Sample 1 Size (n1):', value=get_state_value('ci_diff_mean_sk_sum_size1', 30), min_value=1, step=1, key="ci_diff_mean_sk_sum_size1")
+        with col2:
+            params['sample_mean2'] = st.number_input('Sample 2 Mean (x̄2):', value=get_state_value('ci_diff_mean_sk_sum_mean2', 0.0), key="ci_diff_mean_sk_sum_mean2")
+            params['pop_std_dev2'] = st.number_input('Pop. Std Dev 2 (σ2):', value=get_state_value('ci_diff_mean_sk_sum_pop_std_dev2', 1.0), min_value=0.001, key="ci_diff_mean_sk_sum_pop_std_dev2")
+            params['sample_size2'] = st.number_input('Sample 2 Size (n2):', value=get_state_value('ci_diff_mean_sk_sum_size2', 30), min_value=1, step=1, key="ci_diff_mean_sk_sum_size2")
+
+elif selected_ci_type == 'Difference Between Two Means (Independent, sigma unknown, equal variances)':
+    if input_method == 'Raw Data':
+        col1, col2 = st.columns(2)
+        with col1:
+            params['data_column1'] = st.selectbox('Select Sample 1 Data', options=numeric_cols, key="ci_diff_mean_suev_raw_data_col1")
+        with col2:
+            params['data_column2'] = st.selectbox('Select Sample 2 Data', options=numeric_cols, key="ci_diff_mean_suev_raw_data_col2")
+    else: # Summary Statistics Input
+        col1, col2 = st.columns(2)
+        with col1:
+            params['sample_mean1'] = st.number_input('Sample 1 Mean (x̄1):', value=get_state_value('ci_diff_mean_suev_sum_mean1', 0.0), key="ci_diff_mean_suev_sum_mean1")
+            params['sample_std_dev1'] = st.number_input('Sample 1 Std Dev (s1):', value=get_state_value('ci_diff_mean_suev_sum_std_dev1', 1.0), min_value=0.001, key="ci_diff_mean_suev_sum_std_dev1")
+            params['sample_size1'] = st.number_input('Sample 1 Size (n1):', value=get_state_value('ci_diff_mean_suev_sum_size1', 30), min_value=2, step=1, key="ci_diff_mean_suev_sum_size1")
+        with col2:
+            params['sample_mean2'] = st.number_input('Sample 2 Mean (x̄2):', value=get_state_value('ci_diff_mean_suev_sum_mean2', 0.0), key="ci_diff_mean_suev_sum_mean2")
+            params['sample_std_dev2'] = st.number_input('Sample 2 Std Dev (s2):', value=get_state_value('ci_diff_mean_suev_sum_std_dev2', 1.0), min_value=0.001, key="ci_diff_mean_suev_sum_std_dev2")
+            params['sample_size2'] = st.number_input('Sample 2 Size (n2):', value=get_state_value('ci_diff_mean_suev_sum_size2', 30), min_value=2, step=1, key="ci_diff_mean_suev_sum_size2")
+
+elif selected_ci_type == 'Difference Between Two Means (Independent, sigma unknown, unequal variances)':
+    if input_method == 'Raw Data':
+        col1, col2 = st.columns(2)
+        with col1:
+            params['data_column1'] = st.selectbox('Select Sample 1 Data', options=numeric_cols, key="ci_diff_mean_suuv_raw_data_col1")
+        with col2:
+            params['data_column2'] = st.selectbox('Select Sample 2 Data', options=numeric_cols, key="ci_diff_mean_suuv_raw_data_col2")
+    else: # Summary Statistics Input
+        col1, col2 = st.columns(2)
+        with col1:
+            params['sample_mean1'] = st.number_input('Sample 1 Mean (x̄1):', value=get_state_value('ci_diff_mean_suuv_sum_mean1', 0.0), key="ci_diff_mean_suuv_sum_mean1")
+            params['sample_std_dev1'] = st.number_input('Sample 1 Std Dev (s1):', value=get_state_value('ci_diff_mean_suuv_sum_std_dev1', 1.0), min_value=0.001, key="ci_diff_mean_suuv_sum_std_dev1")
+            params['sample_size1'] = st.number_input('Sample 1 Size (n1):', value=get_state_value('ci_diff_mean_suuv_sum_size1', 30), min_value=2, step=1, key="ci_diff_mean_suuv_sum_size1")
+        with col2:
+            params['sample_mean2'] = st.number_input('Sample 2 Mean (x̄2):', value=get_state_value('ci_diff_mean_suuv_sum_mean2', 0.0), key="ci_diff_mean_suuv_sum_mean2")
+            params['sample_std_dev2'] = st.number_input('Sample 2 Std Dev (s2):', value=get_state_value('ci_diff_mean_suuv_sum_std_dev2', 1.0), min_value=0.001, key="ci_diff_mean_suuv_sum_std_dev2")
+            params['sample_size2'] = st.number_input('Sample 2 Size (n2):', value=get_state_value('ci_diff_mean_suuv_sum_size2', 30), min_value=2, step=1, key="ci_diff_mean_suuv_sum_size2")
+
+elif selected_ci_type == 'Difference Between Two Proportions':
+    col1, col2 = st.columns(2)
+    with col1:
+        params['num_successes1'] = st.number_input('Observed Successes 1 (x1):', value=get_state_value('ci_diff_prop_sum_succ1', 10), min_value=0, step=1, key="ci_diff_prop_sum_succ1")
+        params['num_trials1'] = st.number_input('Trials 1 (n1):', value=get_state_value('ci_diff_prop_sum_trials1', 20), min_value=1, step=1, key="ci_diff_prop_sum_trials1")
+    with col2:
+        params['num_successes2'] = st.number_input('Observed Successes 2 (x2):', value=get_state_value('ci_diff_prop_sum_succ2', 8), min_value=0, step=1, key="ci_diff_prop_sum_succ2")
+        params['num_trials2'] = st.number_input('Trials 2 (n2):', value=get_state_value('ci_diff_prop_sum_trials2', 15), min_value=1, step=1, key="ci_diff_prop_sum_trials2")
+
+elif selected_ci_type == 'Paired Differences':
+    if input_method == 'Raw Data':
+        col1, col2 = st.columns(2)
+        with col1:
+            params['data_column1'] = st.selectbox('Select Sample 1 (Before)', options=numeric_cols, key="ci_paired_raw_data_col1")
+        with col2:
+            params['data_column2'] = st.selectbox('Select Sample 2 (After)', options=numeric_cols, key="ci_paired_raw_data_col2")
+    else: # Summary Statistics Input
+        params['mean_difference'] = st.number_input('Mean of Differences (d̄):', value=get_state_value('ci_paired_sum_mean_diff', 0.0), key="ci_paired_sum_mean_diff")
+        params['std_dev_difference'] = st.number_input('Std Dev of Differences (sd):', value=get_state_value('ci_paired_sum_std_diff', 1.0), min_value=0.001, key="ci_paired_sum_std_diff")
+        params['sample_size_difference'] = st.number_input('Number of Pairs (n):', value=get_state_value('ci_paired_sum_size_diff', 20), min_value=2, step=1, key="ci_paired_sum_size_diff")
+
+confidence_level = st.number_input('Confidence Level (e.g., 0.95):', value=get_state_value('ci_confidence_level', 0.95), min_value=0.01, max_value=0.99, step=0.01, format="%.2f", key="ci_confidence_level_input")
+
+if st.button("Calculate Confidence Interval", key="calc_ci_button"):
+    st.subheader("Calculation Results")
+    try:
+        lower_bound, upper_bound = None, None
+        sample_statistic, std_error, margin_of_error = None, None, None
+
+        if selected_ci_type == 'Mean (sigma unknown) - t-interval':
+            if input_method == 'Raw Data':
+                data = get_data_from_col_string(params['data_column'])
+                sample_mean = data.mean()
+                sample_std_dev = data.std()
+                sample_size = len(data)
+                lower_bound, upper_bound = ci_mean_sigma_unknown(sample_mean, sample_std_dev, sample_size, confidence_level)
+            else:
+                sample_mean = params['sample_mean']
+                sample_std_dev = params['sample_std_dev']
+                sample_size = params['sample_size']
+                lower_bound, upper_bound = ci_mean_sigma_unknown(sample_mean, sample_std_dev, sample_size, confidence_level)
+
+            alpha = 1 - confidence_level
+            t_critical = stats.t.ppf(1 - alpha / 2, df=sample_size - 1)
+            sample_statistic = sample_mean
+            std_error = sample_std_dev / np.sqrt(sample_size)
+            margin_of_error = t_critical * std_error
+
+        elif selected_ci_type == 'One Proportion':
+            lower_bound, upper_bound = ci_proportion(params['num_successes'], params['num_trials'], confidence_level)
+            sample_statistic = params['num_successes'] / params['num_trials']
+            alpha = 1 - confidence_level
+            z_critical = stats.norm.ppf(1 - alpha / 2)
+            std_error = np.sqrt((sample_statistic * (1 - sample_statistic)) / params['num_trials'])
+            margin_of_error = z_critical * std_error
+
+        elif selected_ci_type == 'Difference Between Two Means (Independent, sigma known)':
+            if input_method == 'Raw Data':
+                data1 = get_data_from_col_string(params['data_column1'])
+                data2 = get_data_from_col_string(params['data_column2'])
+                sample_mean1, sample_size1 = data1.mean(), len(data1)
+                sample_mean2, sample_size2 = data2.mean(), len(data2)
+                lower_bound, upper_bound = ci_diff_means_sigma_known(sample_mean1, params['pop_std_dev1'], sample_size1, sample_mean2, params['pop_std_dev2'], sample_size2, confidence_level)
+            else:
+                sample_mean1, sample_size1 = params['sample_mean1'], params['sample_size1']
+                sample_mean2, sample_size2 = params['sample_mean2'], params['sample_size2']
+                lower_bound, upper_bound = ci_diff_means_sigma_known(sample_mean1, params['pop_std_dev1'], sample_size1, sample_mean2, params['pop_std_dev2'], sample_size2, confidence_level)
+
+            alpha = 1 - confidence_level
+            z_critical = stats.norm.ppf(1 - alpha / 2)
+            sample_statistic = sample_mean1 - sample_mean2
+            std_error = np.sqrt((params['pop_std_dev1']**2 / sample_size1) + (params['pop_std_dev2']**2 / sample_size2))
+            margin_of_error = z_critical * std_error
+
+        elif selected_ci_type == 'Difference Between Two Means (Independent, sigma unknown, equal variances)':
+            if input_method == 'Raw Data':
+                data1 = get_data_from_col_string(params['data_column1'])
+                data2 = get_data_from_col_string(params['data_column2'])
+                sample_mean1, sample_std_dev1, sample_size1 = data1.mean(), data1.std(), len(data1)
+                sample_mean2, sample_std_dev2, sample_size2 = data2.mean(), data2.std(), len(data2)
+                lower_bound, upper_bound = ci_diff_means_sigma_unknown_equal_var(sample_mean1, sample_std_dev1, sample_size1, sample_mean2, sample_std_dev2, sample_size2, confidence_level)
+            else:
+                sample_mean1, sample_std_dev1, sample_size1 = params['sample_mean1'], params['sample_std_dev1'], params['sample_size1']
+                sample_mean2, sample_std_dev2, sample_size2 = params['sample_mean2'], params['sample_std_dev2'], params['sample_size2']
+                lower_bound, upper_bound = ci_diff_means_sigma_unknown_equal_var(sample_mean1, sample_std_dev1, sample_size1, sample_mean2, sample_std_dev2, sample_size2, confidence_level)
+
+            alpha = 1 - confidence_level
+            pooled_std_dev = np.sqrt(((sample_size1 - 1) * sample_std_dev1**2 + (sample_size2 - 1) * sample_std_dev2**2) / (sample_size1 + sample_size2 - 2))
+            t_critical = stats.t.ppf(1 - alpha / 2, df=sample_size1 + sample_size2 - 2)
+            sample_statistic = sample_mean1 - sample_mean2
+            std_error = pooled_std_dev * np.sqrt((1 / sample_size1) + (1 / sample_size2))
+            margin_of_error = t_critical * std_error
+
+        elif selected_ci_type == 'Difference Between Two Means (Independent, sigma unknown, unequal variances)':
+            if input_method == 'Raw Data':
+                data1 = get_data_from_col_string(params['data_column1'])
+                data2 = get_data_from_col_string(params['data_column2'])
+                sample_mean1, sample_std_dev1, sample_size1 = data1.mean(), data1.std(), len(data1)
+                sample_mean2, sample_std_dev2, sample_size2 = data2.mean(), data2.std(), len(data2)
+                lower_bound, upper_bound = ci_diff_means_sigma_unknown_unequal_var(sample_mean1, sample_std_dev1, sample_size1, sample_mean2, sample_std_dev2, sample_size2, confidence_level)
+            else:
+                sample_mean1, sample_std_dev1, sample_size1 = params['sample_mean1'], params['sample_std_dev1'], params['sample_size1']
+                sample_mean2, sample_std_dev2, sample_size2 = params['sample_mean2'], params['sample_std_dev2'], params['sample_size2']
+                lower_bound, upper_bound = ci_diff_means_sigma_unknown_unequal_var(sample_mean1, sample_std_dev1, sample_size1, sample_mean2, sample_std_dev2, sample_size2, confidence_level)
+
+            alpha = 1 - confidence_level
+            sample_statistic = sample_mean1 - sample_mean2
+            se1_sq = (sample_std_dev1**2) / sample_size1
+            se2_sq = (sample_std_dev2**2) / sample_size2
+            std_error = np.sqrt(se1_sq + se2_sq)
+            welch_df = ((se1_sq + se2_sq)**2) / ((se1_sq**2 / (sample_size1 - 1)) + (se2_sq**2 / (sample_size2 - 1)))
+            t_critical = stats.t.ppf(1 - alpha / 2, df=welch_df)
+            margin_of_error = t_critical * std_error
+
+        elif selected_ci_type == 'Difference Between Two Proportions':
+            lower_bound, upper_bound = ci_diff_proportions(params['num_successes1'], params['num_trials1'], params['num_successes2'], params['num_trials2'], confidence_level)
+            prop1 = params['num_successes1'] / params['num_trials1']
+            prop2 = params['num_successes2'] / params['num_trials2']
+            sample_statistic = prop1 - prop2
+            alpha = 1 - confidence_level
+            z_critical = stats.norm.ppf(1 - alpha / 2)
+            std_error = np.sqrt((prop1 * (1 - prop1) / params['num_trials1']) + (prop2 * (1 - prop2) / params['num_trials2']))
+            margin_of_error = z_critical * std_error
+
+        elif selected_ci_type == 'Paired Differences':
+            if input_method == 'Raw Data':
+                data1 = get_data_from_col_string(params['data_column1'])
+                data2 = get_data_from_col_string(params['data_column2'])
+                differences = np.array(data1) - np.array(data2)
+                mean_difference = np.mean(differences)
+                std_dev_difference = np.std(differences, ddof=1)
+                sample_size_difference = len(differences)
+                lower_bound, upper_bound = ci_paired_differences(data1, data2, confidence_level)
+            else:
+                mean_difference = params['mean_difference']
+                std_dev_difference = params['std_dev_difference']
+                sample_size_difference = params['sample_size_difference']
+                lower_bound, upper_bound = ci_paired_differences_summary(
+                    mean_difference,
+                    std_dev_difference,
+                    sample_size_difference,
+                    confidence_level
+                )
+
+            alpha = 1 - confidence_level
+            t_critical = stats.t.ppf(1 - alpha / 2, df=sample_size_difference - 1)
+            sample_statistic = mean_difference
+            std_error = std_dev_difference / np.sqrt(sample_size_difference)
+            margin_of_error = t_critical * std_error
+
+        st.success(f"Confidence Interval ({confidence_level*100:.0f}%): ({lower_bound:.4f}, {upper_bound:.4f})")
+        if sample_statistic is not None and std_error is not None and margin_of_error is not None:
+            sample_stat_symbol_map = {
+                'Mean (sigma unknown) - t-interval': 'x̄',
+                'One Proportion': 'p̂',
+                'Difference Between Two Means (Independent, sigma known)': 'x̄₁ - x̄₂',
+                'Difference Between Two Means (Independent, sigma unknown, equal variances)': 'x̄₁ - x̄₂',
+                'Difference Between Two Means (Independent, sigma unknown, unequal variances)': 'x̄₁ - x̄₂',
+                'Difference Between Two Proportions': 'p̂₁ - p̂₂',
+                'Paired Differences': 'd̄'
+            }
+            sample_stat_symbol = sample_stat_symbol_map.get(selected_ci_type, 'Statistic')
+            summary_df = pd.DataFrame(
+                {
+                    'Metric': ['Sample Statistic', 'Standard Error', 'Margin of Error'],
+                    'Symbol': [sample_stat_symbol, 'SE', 'ME'],
+                    'Value': [sample_statistic, std_error, margin_of_error]
+                }
+            )
+            st.write("Summary")
+            summary_display_df = summary_df.copy()
+            summary_display_df['Value'] = summary_display_df['Value'].map(lambda v: f"{v:.6f}")
+            st.markdown(summary_display_df.to_html(index=False), unsafe_allow_html=True)
+
+    except ValueError as ve:
+        st.error(f"Input Error: {ve}")
+    except Exception as e:
+        st.error(f"An unexpected error occurred: {e}")
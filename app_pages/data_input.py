@@ -0,0 +1,517 @@
+# "Data Input" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Data Input")
+
+# Instructor authentication for auto-loading feature
+with st.sidebar:
+    if not st.session_state.is_instructor:
+        st.divider()
+        instructor_password = st.text_input(
+            "Instructor Options",
+            type="password",
+            placeholder="Enter password if you're an instructor",
+            help="Optional: Instructors can authenticate to use the auto-loading link feature"
+        )
+        if instructor_password:
+            # Simple password check - using CUESTAT_INSTRUCTOR_PASSWORD environment variable
+            correct_password = os.getenv('CUESTAT_INSTRUCTOR_PASSWORD', 'instructor')
+            if instructor_password == correct_password:
+                st.session_state.is_instructor = True
+                st.success("✅ Authenticated as instructor")
+                st.rerun()
+            else:
+                st.error("❌ Incorrect password")
+    else:
+        st.divider()
+        st.success("✅ Instructor mode enabled")
+        if st.button("Logout", key="instructor_logout"):
+            st.session_state.is_instructor = False
+            st.rerun()
+
+# Check for auto-load Google Sheets URL in query parameters.
+# Note: creating auto-load links remains an instructor-only action,
+# but students should be able to *use* a link posted by an instructor.
+auto_load_url = get_query_param('sheets_url')
+auto_load_tabs = get_query_param('sheets_tabs')
+
+# FIRST: If a dataset was previously auto-loaded but sheets_url param is now missing,
+# immediately clear the auto-loaded data and remove the query param from the URL.
+if st.session_state.get('auto_loaded_sheets') and (not auto_load_url or (isinstance(auto_load_url, (list, tuple)) and len(auto_load_url) == 0)):
+    try:
+        # Clear auto-loaded dataset
+        st.session_state.global_dataframes = {}
+        st.session_state.manual_entry_df = pd.DataFrame({'Column A': ['']})
+        st.session_state['auto_loaded_sheets'] = False
+        st.session_state.pop('sheets_autoload_started', None)
+        # Remove the sheets_url param from the URL to show clean state
+        clear_query_param('sheets_url')
+        clear_query_param('sheets_tabs')
+    except Exception:
+        pass
+
+# SECOND: Check if sheets_url param exists and try to auto-load
+if auto_load_url:
+    # st.query_params values are lists when present in URL; handle both cases
+    sheets_param = auto_load_url[0] if isinstance(auto_load_url, (list, tuple)) and len(auto_load_url) > 0 else auto_load_url
+    tabs_param = auto_load_tabs[0] if isinstance(auto_load_tabs, (list, tuple)) and len(auto_load_tabs) > 0 else (auto_load_tabs or '')
+    if sheets_param:
+        # Start the download once per link; the page keeps rendering while it runs
+        if st.session_state.get('sheets_autoload_started') != (sheets_param, tabs_param):
+            st.session_state.sheets_autoload_started = (sheets_param, tabs_param)
+            start_google_sheets_load(sheets_param, 'auto', tabs_param)
+        datasets, error = poll_google_sheets_load('auto')
+
+        if datasets:
+            st.markdown("---")
+            st.write("You can now proceed to analyze this data using the CueStat tools, or load different data below.")
+            # Mark that this dataset was auto-loaded from a query parameter so
+            # it can be cleared automatically on subsequent refreshes/new sessions
+            try:
+                st.session_state['auto_loaded_sheets'] = True
+                st.session_state.pop('sheets_autoload_started', None)
+                # Clear the sheets_url from the URL so "Start New Session" starts with a clean URL
+                clear_query_param('sheets_url')
+                clear_query_param('sheets_tabs')
+            except Exception:
+                pass
+            if not st.session_state.is_instructor:
+                st.info("ℹ️ This dataset was loaded from a link provided by your instructor. If you have concerns about the data source, please contact them.")
+        elif error:
+            st.error(f"❌ {error}")
+            st.info("""
+                💡 **Troubleshooting steps:**
+                - Verify the sheet is published to the web (File → Share → Publish to web)
+                - Ensure you selected 'Comma-separated values (.csv)' as the format
+                - Check that the URL starts with https://docs.google.com/spreadsheets/
+                - Make sure the sheet is not restricted or private
+                - Try copying the publish link again
+                """)
+
+# Create tabs for different input methods
+input_method = st.radio(
+    "Choose Data Input Method:",
+    options=["Upload File", "Google Sheets", "Manual Entry"],
+    horizontal=True,
+    key="data_input_method"
+)
+
+if input_method == "Upload File":
+    st.subheader("Upload Data File")
+    uploaded_file = st.file_uploader("Choose a CSV, Excel, Parquet or Feather file", type=None)
+elif input_method == "Google Sheets":
+    st.subheader("Import from Google Sheets")
+    st.markdown("""
+        <div role="region" aria-label="Google Sheets Import Instructions">
+        <strong>Instructions:</strong>
+        <ol>
+        <li>Open your Google Sheet in a web browser</li>
+        <li>Click the <strong>Share</strong> button (top right)</li>
+        <li>Under "General access", select <strong>Anyone with the link</strong> (Viewer access is sufficient)</li>
+        <li>Click <strong>Copy link</strong></li>
+        <li>Paste the link in the field below</li>
+        </ol>
+        <p><strong>Note:</strong> The app will automatically convert your share link to the proper format.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    sheets_url = st.text_input(
+        "Google Sheets URL * (Required)",
+        placeholder="Example: https://docs.google.com/spreadsheets/d/abc123.../edit?usp=sharing",
+        help="Paste your Google Sheets share link. Works with regular share links or published CSV links.",
+        key="google_sheets_url_input"
+    )
+    sheets_tabs = st.text_input(
+        "Sheet tabs (optional)",
+        placeholder="Example: Lab 1, Lab 2!A1:D50, gid=123456789",
+        help="Leave blank to load the tab the link points to. To load several tabs at once, list tab names or gid numbers separated by commas; add !A1:D50 after a tab to load only that range. Each tab becomes its own dataset.",
+        key="google_sheets_tabs_input"
+    )
+    
+    if st.button("Load from Google Sheets", key="load_sheets_btn", help="Click to import data from the URL above"):
+        if sheets_url:
+            start_google_sheets_load(sheets_url, 'manual', sheets_tabs)
+        else:
+            st.warning("⚠️ Required field: Please enter a Google Sheets URL in the field above before clicking Load.")
+
+    datasets, error = poll_google_sheets_load('manual')
+    if datasets:
+        # Reset manual entry if Google Sheets is loaded
+        st.session_state.manual_entry_df = pd.DataFrame({'Column A': ['']})
+    elif error:
+        st.error(f"❌ Error: {error}")
+        st.info("""
+            💡 **Troubleshooting steps:**
+            - Make sure the sheet is shared with "Anyone with the link" (click Share button → General access)
+            - Check that the URL starts with https://docs.google.com/spreadsheets/
+            - Verify the sheet contains data and is not empty
+            - Try copying the share link again
+            - If using a regular share link, ensure the sheet has public or link-sharing enabled
+            """)
+    
+    # Auto-loading link section (Instructor only)
+    if st.session_state.is_instructor:
+        st.divider()
+        st.subheader("📤 Create an Auto-Loading Link (Instructor Feature)")
+        st.markdown("""
+            Want to share your Google Sheet so students can load it with one click? Create an auto-loading link:
+            
+            1. First, get your Google Sheets share link from above
+            2. Then, create a link in this format and share it with your students:
+            """)
+        
+        if sheets_url:
+            # Generate the auto-loading URL
+            encoded_sheets_url = urllib.parse.quote(sheets_url, safe='')
+            if sheets_tabs.strip():
+                # Students get the same set of tabs, each as its own dataset
+                encoded_sheets_url += "&sheets_tabs=" + urllib.parse.quote(sheets_tabs.strip(), safe='')
+            
+            st.markdown(f"""
+                **Example auto-loading link format:**
+                ```
+                https://your-cuestat-url.com?sheets_url={encoded_sheets_url}
+                ```
+                
+                To create your auto-loading link:
+                1. Replace `https://your-cuestat-url.com` with your actual CueStat app URL
+                2. The URL above includes your Google Sheets link
+                3. Share this complete link with students - they'll load your data with one click!
+                
+                **Quick example:**
+                If your CueStat app is at `https://cuestat.streamlit.app`:
+                ```
+                https://cuestat.streamlit.app?sheets_url={encoded_sheets_url}
+                ```
+                """)
+            st.success("✅ Copy your custom URL from above and test it!")
+        else:
+            st.info("📝 Enter a Google Sheets URL above to see the auto-loading link option.")
+    
+    uploaded_file = None  # Set to None so file upload logic doesn't run
+else:  # Manual Entry
+    uploaded_file = None  # Set to None so file upload logic doesn't run
+
+if input_method == "Upload File":
+    uploaded_file_original = uploaded_file  # Store for later reference
+else:
+    uploaded_file = None
+
+if uploaded_file is not None:
+    try:
+        file_name = uploaded_file.name
+        file_extension = file_name.split('.')[-1].lower().strip()
+        df = None
+        dataset = None
+        sheet_name = None
+        if file_extension in EXCEL_FILE_EXTENSIONS:
+            try:
+                sheet_names = get_excel_sheet_names(uploaded_file, file_extension)
+            except ImportError as ie:
+                st.error(f"Error: an Excel reader (openpyxl) is not installed. Details: {str(ie)}")
+                sheet_names = []
+            except Exception as e:
+                st.error(f"Error reading Excel file: {str(e)}")
+                sheet_names = []
+            if len(sheet_names) > 1:
+                sheet_name = st.selectbox("Sheet", options=sheet_names, key="excel_sheet_select",
+                                          help="Only the selected sheet is read from the workbook.")
+            elif sheet_names:
+                sheet_name = sheet_names[0]
+        # The sheet is part of the cache key: each sheet of a workbook is its own dataset
+        upload_key = get_upload_cache_key(uploaded_file, file_extension if sheet_name is None else f"{file_extension}:{sheet_name}")
+        ingest_cache = get_ingest_cache()
+        cached_dataset = ingest_cache.get(upload_key)
+        active_dataset = get_active_dataset()
+
+        if active_dataset is not None and getattr(active_dataset, 'source_key', None) == upload_key:
+            # Same upload as the previous rerun: keep the parsed (and possibly renamed) dataset
+            dataset = active_dataset
+        elif cached_dataset is not None:
+            # Identical bytes were parsed before (in this or another session)
+            dataset = cached_dataset
+        elif file_extension == 'csv':
+            if getattr(uploaded_file, 'size', 0) >= CHUNKED_CSV_MIN_BYTES:
+                dataset = load_large_csv_upload(uploaded_file)
+            else:
+                df = pd.read_csv(uploaded_file)
+        elif file_extension in EXCEL_FILE_EXTENSIONS:
+            if sheet_name is not None:
+                try:
+                    df = load_excel_upload(uploaded_file, file_extension, sheet_name)
+                except ImportError as ie:
+                    st.error(f"Error: an Excel reader (openpyxl) is not installed. Details: {str(ie)}")
+                    df = None
+                except Exception as e:
+                    st.error(f"Error reading Excel file: {str(e)}")
+                    df = None
+        elif file_extension in COLUMNAR_FILE_EXTENSIONS:
+            try:
+                df = read_columnar_file(uploaded_file.getvalue(), file_extension)
+            except ImportError as ie:
+                st.error(f"Error: pyarrow is not installed. Details: {str(ie)}")
+                df = None
+            except Exception as e:
+                st.error(f"Error reading {file_extension.capitalize()} file: {str(e)}")
+                df = None
+        else:
+            st.error(f"Unsupported file type: '{file_extension}'. Please upload a CSV, Excel (.xlsx/.xlsm/.xls), Parquet or Feather (.feather/.arrow) file.")
+            df = None
+
+        if df is not None:
+            # Type the columns once (1-based index, blanks tracked separately)
+            dataset = build_active_dataset(df)
+        if dataset is not None and dataset.source_key is None:
+            dataset.source_key = upload_key
+            ingest_cache.put(upload_key, dataset)
+
+        if dataset is not None:
+            df = dataset.frame
+            if dataset is not active_dataset:
+                # Replace any existing dataframe with the new one
+                set_loaded_datasets({'active_data': dataset})
+                # Reset manual entry if a file is uploaded, as it's separate data
+                st.session_state.manual_entry_df = pd.DataFrame({'Column A': ['']})
+
+            # --- Allow inline header renaming for the uploaded DataFrame ---
+            try:
+                st.markdown("**Edit Column Names for Uploaded Data**")
+                header_valid = True
+                new_header_names = []
+                if df is not None and not df.empty:
+                    header_cols = st.columns(len(df.columns))
+                    for i, col in enumerate(df.columns):
+                        with header_cols[i]:
+                            new_name = st.text_input(f"Column {i+1}", value=col, key=f"upload_header_input_active_{i}", label_visibility="collapsed")
+                        new_header_names.append(new_name.strip())
+
+                    # Validate header names
+                    empty_headers = [i+1 for i, n in enumerate(new_header_names) if n == ""]
+                    seen = {}
+                    duplicate_headers = []
+                    for i, n in enumerate(new_header_names):
+                        if n in seen:
+                            duplicate_headers.extend([seen[n]+1, i+1])
+                        else:
+                            seen[n] = i
+                    duplicate_headers = sorted(list(set(duplicate_headers)))
+
+                    if empty_headers or duplicate_headers:
+                        header_valid = False
+                        if empty_headers:
+                            st.error(f"Column name(s) cannot be empty. Check column(s): {', '.join(map(str, empty_headers))}.")
+                        if duplicate_headers:
+                            st.error(f"Duplicate column name(s) detected for columns: {', '.join(map(str, duplicate_headers))}. Please use unique names.")
+                    else:
+                        if new_header_names != list(df.columns):
+                            rename_map = {old: new for old, new in zip(df.columns, new_header_names) if new and new != old}
+                            if rename_map:
+                                try:
+                                    dataset = dataset.rename(rename_map)
+                                    st.session_state.global_dataframes['active_data'] = dataset
+                                    df = dataset.frame
+                                    st.success("Applied column name changes to uploaded data.")
+                                except Exception:
+                                    st.warning("Could not apply header rename changes.")
+                else:
+                    df = dataset.frame
+
+                # Persist header validity flag for this uploaded dataset
+                st.session_state['header_valid_active'] = header_valid
+            except Exception:
+                st.warning("Header rename UI unavailable for this upload.")
+        else:
+            st.error(f"Unsupported file type: {file_extension}")
+    except Exception as e:
+        st.error(f"Error processing file: {e}")
+
+if input_method == "Manual Entry":
+    st.subheader("Manual Data Entry")
+    
+    # Initialize with 30 rows if empty
+    if 'table_data' not in st.session_state:
+        st.session_state.table_data = create_default_manual_entry_table()
+    
+    # This is our working copy that persists across reruns
+    table_data = st.session_state.table_data
+
+    # Editable column headers
+    st.markdown("**Click column name to edit:**")
+    header_cols = st.columns(len(table_data.columns))
+    new_header_names = []
+    for i, col in enumerate(table_data.columns):
+        with header_cols[i]:
+            if f'editing_col_{i}' not in st.session_state:
+                st.session_state[f'editing_col_{i}'] = False
+        
+            if st.session_state[f'editing_col_{i}']:
+                new_name = st.text_input(f"Edit Column {i+1} Name", value=col, key=f"header_input_{i}", label_visibility="collapsed")
+                if st.button("✓", key=f"save_header_{i}"):
+                    st.session_state[f'editing_col_{i}'] = False
+                    if new_name.strip() and new_name.strip() not in [c for j, c in enumerate(table_data.columns) if j != i]:
+                        new_header_names.append(new_name.strip())
+                    else:
+                        new_header_names.append(col)
+                        if not new_name.strip():
+                            st.warning("Column name cannot be empty.")
+                        else:
+                            st.warning("Column name must be unique.")
+                else:
+                    new_header_names.append(col)
+            else:
+                if st.button(col, key=f"edit_header_{i}"):
+                    st.session_state[f'editing_col_{i}'] = True
+                new_header_names.append(col)
+
+    # Apply renamed headers if changed
+    if new_header_names != list(table_data.columns) and len(new_header_names) == len(table_data.columns):
+        rename_map = {old: new for old, new in zip(table_data.columns, new_header_names) if new != old}
+        if rename_map:
+            table_data = table_data.rename(columns=rename_map)
+            st.session_state.table_data = table_data
+            safe_rerun()
+
+    # Data editor with automatic new row on Enter
+    st.markdown("**Enter data below:**")
+    st.markdown("""
+        <div role="region" aria-label="Manual Data Entry Grid">
+        <p id="data-editor-help">💡 Tip: Type in the table and use Tab to navigate between cells. 
+        Click the '+' icon at the bottom of the table to add rows. Use the trash icon to delete rows.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Use data editor with dynamic rows - this allows adding/removing rows
+    # Reset index to avoid warnings with hide_index
+    # Create a copy with 1-based index for display
+    display_df = table_data.copy()
+    display_df.index = range(1, len(display_df) + 1)
+
+    edited_df = st.data_editor(
+        display_df,
+        num_rows="dynamic",
+        width="stretch",
+        height=390,
+        key="data_editor",
+        hide_index=True,  # Hide index to avoid "None" issue when adding rows
+    )
+
+    # Keep 1-based index for consistency with uploaded data
+    if edited_df is not None and len(edited_df) > 0:
+        edited_df.index = range(1, len(edited_df) + 1)
+        edited_df.index.name = None  # Set to None to avoid showing "None" header
+
+    # One blank-cell scan of the edited table serves both the processing fallback and the save filter
+    non_empty_rows = ~blank_cell_mask(edited_df).all(axis=1)
+
+    # DO NOT update session state here - it causes reruns that erase data
+    # The data_editor widget manages its own state via the key
+    # We'll only sync to session state when needed (buttons) or when processing
+
+    # Auto-process toggle
+    st.markdown("---")
+    col_toggle1, col_toggle2 = st.columns([3, 1])
+    with col_toggle1:
+        auto_process_enabled = st.checkbox(
+            "⚡ Auto-process data as you type",
+            value=True,
+            key="manual_auto_process_toggle",
+            help="Data will be automatically processed and stored in real-time as you type. Disable this if you want to enter all data first before processing."
+        )
+    with col_toggle2:
+        st.markdown("**ON by default**")
+    
+    # Auto-process logic: if enabled, process data with debouncing (500ms)
+    current_time = time.time()
+    # Debounce: only process if 0.5+ seconds have passed since last processing
+    if auto_process_enabled and edited_df is not None and not edited_df.empty:
+        if current_time - st.session_state.last_manual_process_time >= 0.5:
+            try:
+                # Only the cells edited since the last run are re-typed; blank rows are dropped
+                processed_manual_df = get_manual_entry_dataset(table_data, edited_df, non_empty_rows)
+                if processed_manual_df is not None:
+                    # Update session state automatically
+                    set_loaded_datasets({'active_data': processed_manual_df})
+                    st.session_state.last_manual_process_time = current_time
+                    st.success(f"✨ Data auto-processed! {processed_manual_df.shape[0]} rows, {processed_manual_df.shape[1]} columns")
+            except Exception as e:
+                st.warning(f"Auto-processing error: {e}")
+        elif current_time - st.session_state.last_manual_process_time < 0.5:
+            st.info("⏳ Processing your changes...")
+
+    # Action buttons
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        if st.button("➕ Add Column", key="add_col_btn"):
+            new_col_num = len(edited_df.columns) + 1
+            new_col_name = f"Column {new_col_num}"
+            while new_col_name in edited_df.columns:
+                new_col_num += 1
+                new_col_name = f"Column {new_col_num}"
+            edited_df[new_col_name] = ""
+            # Update our persistent table_data
+            st.session_state.table_data = edited_df
+            st.rerun()
+
+    with col2:
+        if st.button("🗑️ Clear All", key="clear_all_btn_unique"):
+            # Clear all manual entry data and state
+            st.session_state.table_data = create_default_manual_entry_table()
+            st.session_state.global_dataframes = {}
+            st.session_state.edited_data = pd.DataFrame()
+            # Clear the data_editor widget's internal state
+            if 'data_editor' in st.session_state:
+                del st.session_state['data_editor']
+            st.rerun()
+
+    # Save/export options for manual entry data
+    st.markdown("---")
+    st.markdown("**Save Manual Data**")
+    data_to_save = edited_df.loc[non_empty_rows].copy()
+
+    if data_to_save.empty:
+        st.caption("Enter at least one non-empty row to enable saving.")
+    else:
+        data_to_save.index = range(1, len(data_to_save) + 1)
+        data_to_save.index.name = None
+
+        csv_bytes = data_to_save.to_csv(index=False).encode('utf-8')
+        st.download_button(
+            label="💾 Save as CSV",
+            data=csv_bytes,
+            file_name="manual_entry_data.csv",
+            mime="text/csv",
+            key="manual_save_csv_btn"
+        )
+
+# Display currently loaded dataframe only when meaningful data exists
+dataset = get_active_dataset()
+if dataset is not None and has_meaningful_dataframe_data(dataset):
+    st.subheader("Current Data:")
+    dataset_names = list(st.session_state.global_dataframes)
+    if len(dataset_names) > 1:
+        # Every loaded tab stays in memory, so switching never downloads it again
+        active_name = st.selectbox(
+            "Active Dataset",
+            options=dataset_names,
+            index=dataset_names.index(get_active_dataset_name()),
+            help="Choose which loaded sheet tab the analysis tabs use."
+        )
+        st.session_state.active_dataset_name = active_name
+        dataset = get_active_dataset()
+    st.write(f"**Active Dataset** ({dataset.shape[0]} rows, {dataset.shape[1]} columns)")
+    show_table(dataset)
+
+    # Serialized only on request: every manual-entry edit changes the dataset version
+    parquet_bytes = dataset_to_parquet_bytes(dataset, prepare=False)
+    if parquet_bytes is None and PYARROW_AVAILABLE and st.button(
+            "Prepare Parquet download", key="prepare_parquet_btn",
+            help="Build a typed copy of the current dataset for download."):
+        parquet_bytes = dataset_to_parquet_bytes(dataset)
+    if parquet_bytes is not None:
+        st.download_button(
+            label="💾 Download as Parquet",
+            data=parquet_bytes,
+            file_name="cuestat_dataset.parquet",
+            mime="application/octet-stream",
+            key="download_parquet_btn",
+            help="Typed copy of the current dataset. Upload it again later to skip CSV parsing."
+        )
@@ -0,0 +1,102 @@
+# "Descriptive Statistics" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Descriptive Statistics")
+
+if get_active_dataset() is None:
+    st.info("Please load or enter data in the 'Data Input' tab first.")
+else:
+    selected_df = get_active_dataset()
+
+    # Numeric columns (blanks allowed) were identified when the dataset was loaded
+    numeric_cols = [col for col in selected_df.columns if is_numeric_column(selected_df, col)]
+
+    if not numeric_cols:
+        st.warning("No numeric columns found in the active dataset. Please ensure your data contains numeric values.")
+    else:
+        multiple_columns = st.checkbox("Select multiple columns", value=False, key="descriptive_multiple_cols")
+        
+        if multiple_columns:
+            selected_columns = st.multiselect(
+                "Select Columns * (Required)", 
+                options=numeric_cols, 
+                key="descriptive_col_multiselect",
+                help="Choose one or more numeric columns to analyze"
+            )
+        else:
+            selected_column = st.selectbox(
+                "Select a Column * (Required)", 
+                options=[''] + numeric_cols, 
+                key="descriptive_col_select",
+                help="Choose a numeric column to analyze"
+            )
+            selected_columns = [selected_column] if selected_column else []
+
+        if not selected_columns:
+            st.info("👆 Please select at least one column above to begin analysis")
+        
+        if selected_columns:
+            # Define all available statistics
+            all_stats = [
+                'n', 'Mean', 'Median', 'Mode',
+                'Sample Standard Deviation', 'Variance', 'Range',
+                'Min Value', 'Max Value',
+                'Q1', 'Q3', 'IQR',
+                'Skewness', 'Kurtosis'
+            ]
+            
+            # Let users select which statistics to display using checkboxes
+            st.markdown("**Select Statistics to Display:**")
+            
+            # Create checkboxes in a compact grid layout
+            cols = st.columns(3)
+            selected_stats = []
+            
+            for idx, stat in enumerate(all_stats):
+                col_idx = idx % 3
+                with cols[col_idx]:
+                    if st.checkbox(stat, value=False, key=f"stat_checkbox_{stat}"):
+                        selected_stats.append(stat)
+            
+            if st.button("Calculate Descriptive Statistics", key="calc_descriptive_stats"):
+                if not selected_stats:
+                    st.warning("⚠️ Please select at least one statistic from the checkboxes above to display results.")
+                else:
+                    # Create a dictionary to store all columns' statistics
+                    all_columns_stats = {}
+                    has_error = False
+                    
+                    # Process each selected column
+                    for column in selected_columns:
+                        data_for_analysis = selected_df.numeric_series(column)
+                        if data_for_analysis.empty:
+                            st.warning(f"Column '{column}' is empty or contains no valid numeric data after dropping NaNs.")
+                            has_error = True
+                        else:
+                            stats_results = calculate_descriptive_statistics(data_for_analysis, cache_key=(selected_df.version, column))
+                            if "Error" in stats_results:
+                                st.error(f"Error in column '{column}': {stats_results['Error']}")
+                                has_error = True
+                            else:
+                                # Filter results based on selected statistics
+                                filtered_stats = {k: v for k, v in stats_results.items() if k in selected_stats}
+                                all_columns_stats[column] = filtered_stats
+                    
+                    # If we have valid statistics for at least one column, display the combined table
+                    if all_columns_stats:
+                        st.subheader("Descriptive Statistics Results")
+                        
+                        # Create a combined DataFrame with statistics as rows and columns as columns
+                        # Start with the statistic names as the index
+                        combined_df = pd.DataFrame(index=selected_stats)
+                        combined_df.index.name = None
+                        
+                        # Add each column's statistics
+                        for column_name, stats_dict in all_columns_stats.items():
+                            # Create a column with the statistics values
+                            column_values = [stats_dict.get(stat, '') for stat in selected_stats]
+                            # Format float values to 4 decimal places
+                            formatted_values = [f'{v:.4f}' if isinstance(v, (float, np.float32, np.float64)) else str(v) for v in column_values]
+                            combined_df[column_name] = formatted_values
+                        
+                        # Display the combined table
+                        show_table(combined_df, paged=False)
@@ -0,0 +1,941 @@
+# "Hypothesis Testing" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Hypothesis Testing")
+
+if not st.session_state.global_dataframes:
+    st.info("Please load or enter data in the 'Data Input' tab first to use raw data input.")
+
+ht_type_options = [
+    'One-Sample t-test',
+    'Two-Sample t-test (Independent Samples)',
+    'Paired t-test',
+    'One-Sample Z-test for Proportions',
+    'Two-Sample Z-test for Proportions',
+    'Chi-Square Goodness-of-Fit Test',
+    'Chi-Square Test of Independence',
+    'ANOVA (Analysis of Variance) F-test'
+]
+selected_ht_type = st.selectbox("Select Hypothesis Test Type", options=ht_type_options, key="ht_type_select")
+
+# Determine input method options based on selected HT type
+ht_input_method_options = []
+if selected_ht_type in ['One-Sample Z-test for Proportions', 'Two-Sample Z-test for Proportions', 'Chi-Square Goodness-of-Fit Test']:
+    ht_input_method_options = ['Summary Statistics']
+elif selected_ht_type == 'Chi-Square Test of Independence':
+    ht_input_method_options = ['Raw Data', 'Summary Statistics (Contingency Table)']
+elif selected_ht_type == 'ANOVA (Analysis of Variance) F-test':
+    ht_input_method_options = ['Raw Data'] # ANOVA typically uses raw data groups
+else:
+    ht_input_method_options = ['Raw Data', 'Summary Statistics']
+
+st.subheader("Inputs")
+
+input_method = st.radio("Input Type:", options=ht_input_method_options, key="ht_input_method")
+
+params = {}
+numeric_cols = [''] + get_numeric_columns()
+all_cols = [''] + get_all_columns() # For categorical variables if needed
+
+# Helper to get the value from session state if available, else a default
+def get_state_value(key, default):
+    return st.session_state.get(key, default)
+
+alternative_options = {
+    'Two-sided (≠)': 'two-sided',
+    'Greater Than (>)': 'greater',
+    'Less Than (<)': 'less'
+}
+
+# Dynamic parameter inputs based on HT type and input method
+if selected_ht_type == 'One-Sample t-test':
+    st.write("**Hypotheses**")
+    # Create columns for hypothesis display with input box
+    col_h0_1, col_h0_input, col_h0_2 = st.columns([1, 2, 4])
+    with col_h0_1:
+        st.write("H₀: μ =")
+    with col_h0_input:
+        if input_method == 'Raw Data':
+            params['hypothesized_mean'] = st.number_input('μ₀', value=get_state_value('ht_os_t_hypo_mean_raw', 0.0), key="ht_os_t_hypo_mean_raw", label_visibility="collapsed")
+        else:
+            params['hypothesized_mean'] = st.number_input('μ₀', value=get_state_value('ht_os_t_hypo_mean_sum', 0.0), key="ht_os_t_hypo_mean_sum", label_visibility="collapsed")
+    
+    alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
+    selected_alternative_display = st.selectbox(
+        "Alternative Hypothesis (HA):",
+        options=list(alternative_options.keys()),
+        format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
+        key=alt_hypothesis_key
+    )
+    params['alternative'] = alternative_options[selected_alternative_display]
+    
+    # Display HA based on selection
+    if params['alternative'] == 'two-sided':
+        st.write(f"Hₐ: μ ≠ {params['hypothesized_mean']}")
+    elif params['alternative'] == 'greater':
+        st.write(f"Hₐ: μ > {params['hypothesized_mean']}")
+    elif params['alternative'] == 'less':
+        st.write(f"Hₐ: μ < {params['hypothesized_mean']}")
+
+    if input_method == 'Raw Data':
+        params['sample_data'] = st.selectbox('Select Sample Data Column', options=numeric_cols, key="ht_os_t_raw_data_col")
+    else: # Summary Statistics Input
+        params['sample_mean'] = st.number_input('Sample Mean (x̄):', value=get_state_value('ht_os_t_sum_mean', 0.0), key="ht_os_t_sum_mean")
+        params['sample_std_dev'] = st.number_input('Sample Std Dev (s):', value=get_state_value('ht_os_t_sum_std_dev', 1.0), min_value=0.001, key="ht_os_t_sum_std_dev")
+        params['sample_size'] = st.number_input('Sample Size (n):', value=get_state_value('ht_os_t_sum_size', 30), min_value=2, step=1, key="ht_os_t_sum_size")
+
+elif selected_ht_type == 'Two-Sample t-test (Independent Samples)':
+    st.write("**Hypotheses**")
+    st.write("H₀: μ₁ = μ₂")
+    
+    alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
+    selected_alternative_display = st.selectbox(
+        "Alternative Hypothesis (HA):",
+        options=list(alternative_options.keys()),
+        format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
+        key=alt_hypothesis_key
+    )
+    params['alternative'] = alternative_options[selected_alternative_display]
+    
+    # Display HA based on selection
+    if params['alternative'] == 'two-sided':
+        st.write("Hₐ: μ₁ ≠ μ₂")
+    elif params['alternative'] == 'greater':
+        st.write("Hₐ: μ₁ > μ₂")
+    elif params['alternative'] == 'less':
+        st.write("Hₐ: μ₁ < μ₂")
+
+    params['equal_variances'] = st.checkbox('Assume Equal Variances', value=True, key="ht_ts_t_equal_var")
+    if input_method == 'Raw Data':
+        col1, col2 = st.columns(2)
+        with col1:
+            params['sample_data1'] = st.selectbox('Select Sample 1 Data Column', options=numeric_cols, key="ht_ts_t_raw_data_col1")
+        with col2:
+            params['sample_data2'] = st.selectbox('Select Sample 2 Data Column', options=numeric_cols, key="ht_ts_t_raw_data_col2")
+    else: # Summary Statistics Input
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**Sample 1**")
+            params['sample1_mean'] = st.number_input('Sample 1 Mean (x̄1):', value=get_state_value('ht_ts_t_sum_mean1', 0.0), key="ht_ts_t_sum_mean1")
+            params['sample1_std_dev'] = st.number_input('Sample 1 Std Dev (s1):', value=get_state_value('ht_ts_t_sum_std_dev1', 1.0), min_value=0.001, key="ht_ts_t_sum_std_dev1")
+            params['sample1_size'] = st.number_input('Sample 1 Size (n1):', value=get_state_value('ht_ts_t_sum_size1', 30), min_value=2, step=1, key="ht_ts_t_sum_size1")
+        with col2:
+            st.write("**Sample 2**")
+            params['sample2_mean'] = st.number_input('Sample 2 Mean (x̄2):', value=get_state_value('ht_ts_t_sum_mean2', 0.0), key="ht_ts_t_sum_mean2")
+            params['sample2_std_dev'] = st.number_input('Sample 2 Std Dev (s2):', value=get_state_value('ht_ts_t_sum_std_dev2', 1.0), min_value=0.001, key="ht_ts_t_sum_std_dev2")
+            params['sample2_size'] = st.number_input('Sample 2 Size (n2):', value=get_state_value('ht_ts_t_sum_size2', 30), min_value=2, step=1, key="ht_ts_t_sum_size2")
+
+elif selected_ht_type == 'Paired t-test':
+    st.write("**Hypotheses**")
+    st.write("H₀: μd = 0")
+    
+    alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
+    selected_alternative_display = st.selectbox(
+        "Alternative Hypothesis (HA):",
+        options=list(alternative_options.keys()),
+        format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
+        key=alt_hypothesis_key
+    )
+    params['alternative'] = alternative_options[selected_alternative_display]
+    
+    # Display HA based on selection
+    if params['alternative'] == 'two-sided':
+        st.write("Hₐ: μd ≠ 0")
+    elif params['alternative'] == 'greater':
+        st.write("Hₐ: μd > 0")
+    elif params['alternative'] == 'less':
+        st.write("Hₐ: μd < 0")
+
+    if input_method == 'Raw Data':
+        col1, col2 = st.columns(2)
+        with col1:
+            params['sample_data1'] = st.selectbox('Select Sample 1 Data (Before)', options=numeric_cols, key="ht_paired_t_raw_data_col1")
+        with col2:
+            params['sample_data2'] = st.selectbox('Select Sample 2 Data (After)', options=numeric_cols, key="ht_paired_t_raw_data_col2")
+    else: # Summary Statistics Input
+        params['mean_difference'] = st.number_input('Mean of Differences (d̄):', value=get_state_value('ht_paired_t_sum_mean_diff', 0.0), key="ht_paired_t_sum_mean_diff")
+        params['std_dev_difference'] = st.number_input('Std Dev of Differences (sd):', value=get_state_value('ht_paired_t_sum_std_diff', 1.0), min_value=0.001, key="ht_paired_t_sum_std_diff")
+        params['sample_size_difference'] = st.number_input('Number of Pairs (n):', value=get_state_value('ht_paired_t_sum_size_diff', 20), min_value=2, step=1, key="ht_paired_t_sum_size_diff")
+
+elif selected_ht_type == 'One-Sample Z-test for Proportions':
+    st.write("**Hypotheses**")
+    # Create columns for hypothesis display with input box
+    col_h0_1, col_h0_input, col_h0_2 = st.columns([1, 2, 4])
+    with col_h0_1:
+        st.write("H₀: p =")
+    with col_h0_input:
+        params['hypothesized_proportion'] = st.number_input('p₀', value=get_state_value('ht_os_z_prop_sum_hypo_prop', 0.5), min_value=0.0, max_value=1.0, step=0.01, key="ht_os_z_prop_sum_hypo_prop", label_visibility="collapsed")
+    
+    alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
+    selected_alternative_display = st.selectbox(
+        "Alternative Hypothesis (HA):",
+        options=list(alternative_options.keys()),
+        format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
+        key=alt_hypothesis_key
+    )
+    params['alternative'] = alternative_options[selected_alternative_display]
+    
+    # Display HA based on selection
+    if params['alternative'] == 'two-sided':
+        st.write(f"Hₐ: p ≠ {params['hypothesized_proportion']}")
+    elif params['alternative'] == 'greater':
+        st.write(f"Hₐ: p > {params['hypothesized_proportion']}")
+    elif params['alternative'] == 'less':
+        st.write(f"Hₐ: p < {params['hypothesized_proportion']}")
+
+    # Only Summary Statistics Input
+    params['num_successes'] = st.number_input('Number of Observed Successes (x):', value=get_state_value('ht_os_z_prop_sum_succ', 10), min_value=0, step=1, key="ht_os_z_prop_sum_succ")
+    params['num_trials'] = st.number_input('Number of Trials (n):', value=get_state_value('ht_os_z_prop_sum_trials', 20), min_value=1, step=1, key="ht_os_z_prop_sum_trials")
+
+elif selected_ht_type == 'Two-Sample Z-test for Proportions':
+    st.write("**Hypotheses**")
+    st.write("H₀: p₁ = p₂")
+    
+    alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
+    selected_alternative_display = st.selectbox(
+        "Alternative Hypothesis (HA):",
+        options=list(alternative_options.keys()),
+        format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
+        key=alt_hypothesis_key
+    )
+    params['alternative'] = alternative_options[selected_alternative_display]
+    
+    # Display HA based on selection
+    if params['alternative'] == 'two-sided':
+        st.write("Hₐ: p₁ ≠ p₂")
+    elif params['alternative'] == 'greater':
+        st.write("Hₐ: p₁ > p₂")
+    elif params['alternative'] == 'less':
+        st.write("Hₐ: p₁ < p₂")
+
+    # Only Summary Statistics Input
+    col1, col2 = st.columns(2)
+    with col1:
+        st.write("**Sample 1**")
+        params['num_successes1'] = st.number_input('Observed Successes 1 (x1):', value=get_state_value('ht_ts_z_prop_sum_succ1', 10), min_value=0, step=1, key="ht_ts_z_prop_sum_succ1")
+        params['num_trials1'] = st.number_input('Trials 1 (n1):', value=get_state_value('ht_ts_z_prop_sum_trials1', 20), min_value=1, step=1, key="ht_ts_z_prop_sum_trials1")
+    with col2:
+        st.write("**Sample 2**")
+        params['num_successes2'] = st.number_input('Observed Successes 2 (x2):', value=get_state_value('ht_ts_z_prop_sum_succ2', 8), min_value=0, step=1, key="ht_ts_z_prop_sum_succ2")
+        params['num_trials2'] = st.number_input('Trials 2 (n2):', value=get_state_value('ht_ts_z_prop_sum_trials2', 15), min_value=1, step=1, key="ht_ts_z_prop_sum_trials2")
+
+elif selected_ht_type == 'Chi-Square Goodness-of-Fit Test':
+    # Only Summary Statistics Input
+    st.write("**Frequencies Table**")
+    num_categories = st.number_input('Number of Categories:', value=get_state_value('ht_chi2_gof_num_cat', 3), min_value=2, max_value=20, step=1, key="ht_chi2_gof_num_cat")
+    
+    # Input category names
+    st.write("**Category Names:**")
+    cat_cols = st.columns(min(int(num_categories), 5))  # Max 5 columns per row
+    category_names = []
+    for i in range(int(num_categories)):
+        col_idx = i % 5
+        with cat_cols[col_idx]:
+            cat_key = f"ht_chi2_gof_cat_name_{i}"
+            default_name = get_state_value(cat_key, f"Cat {i+1}")
+            name = st.text_input(f'Category {i+1}', value=default_name, key=cat_key, label_visibility="collapsed")
+            category_names.append(name)
+    
+    # Create table input with borders
+    st.write("**Enter frequencies:**")
+    
+    with st.container(border=True):
+        # Header row
+        header_cols = st.columns([2, 1.5, 1.5])
+        with header_cols[0]:
+            st.markdown("**Category**")
+        with header_cols[1]:
+            st.markdown("**Observed**")
+        with header_cols[2]:
+            st.markdown("**Expected**")
+        
+        st.markdown('<hr style="margin: 5px 0; border: 1px solid #4a4a4a;">', unsafe_allow_html=True)
+        
+        # Data rows
+        observed_values = []
+        expected_values = []
+        for i in range(int(num_categories)):
+            cols = st.columns([2, 1.5, 1.5])
+            with cols[0]:
+                st.markdown(f"**{category_names[i]}**")
+            with cols[1]:
+                obs_key = f"ht_chi2_gof_obs_{i}"
+                obs_val = st.number_input(f'Obs {i}', value=get_state_value(obs_key, 10.0), min_value=0.0, step=1.0, key=obs_key, label_visibility="collapsed")
+                observed_values.append(obs_val)
+            with cols[2]:
+                exp_key = f"ht_chi2_gof_exp_{i}"
+                exp_val = st.number_input(f'Exp {i}', value=get_state_value(exp_key, 0.0), min_value=0.0, step=1.0, key=exp_key, label_visibility="collapsed")
+                expected_values.append(exp_val)
+            
+            # Add horizontal line between rows (except after last row)
+            if i < int(num_categories) - 1:
+                st.markdown('<hr style="margin: 5px 0; border: 0.5px solid #ddd;">', unsafe_allow_html=True)
+    
+    # Convert to comma-separated strings for compatibility
+    params['observed_frequencies'] = ','.join([str(v) for v in observed_values])
+    # Store category names for output display
+    params['category_names'] = category_names
+    # If all expected values are 0, leave empty string for equal distribution
+    if all(v == 0.0 for v in expected_values):
+        params['expected_frequencies'] = ''
+    else:
+        params['expected_frequencies'] = ','.join([str(v) for v in expected_values])
+
+elif selected_ht_type == 'Chi-Square Test of Independence':
+    if input_method == "Raw Data":
+        st.write("**Select Two Categorical Variables**")
+        
+        # Get categorical columns only, keyed by (dataset name, column) so names containing ': ' stay intact
+        categorical_cols_options = [None]
+        for df_name, dataset in st.session_state.global_dataframes.items():
+            for col in get_categorical_columns(dataset):
+                categorical_cols_options.append((df_name, col))
+        format_variable = lambda x: '' if x is None else f"{x[0]}: {x[1]}"
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            row_var = st.selectbox("Row Variable", options=categorical_cols_options, format_func=format_variable, key="chi2_ind_row_var")
+        with col2:
+            col_var = st.selectbox("Column Variable", options=categorical_cols_options, format_func=format_variable, key="chi2_ind_col_var")
+        
+        params['chi2_ind_input_type'] = 'raw_data'
+        params['row_variable'] = row_var
+        params['col_variable'] = col_var
+        
+    else:  # Summary Statistics
+        st.write("**Contingency Table**")
+        num_rows = st.number_input('Number of Rows:', value=int(get_state_value('ht_chi2_ind_num_rows', 2)), min_value=2, max_value=10, step=1, key="ht_chi2_ind_num_rows", format="%d")
+        num_cols = st.number_input('Number of Columns:', value=int(get_state_value('ht_chi2_ind_num_cols', 2)), min_value=2, max_value=10, step=1, key="ht_chi2_ind_num_cols", format="%d")
+        params['chi2_ind_input_type'] = 'summary'
+        
+        # Input category names for rows
+        st.write("**Row Categories:**")
+        row_cols = st.columns(int(num_rows))
+        row_names = []
+        for i in range(int(num_rows)):
+            with row_cols[i]:
+                row_key = f"ht_chi2_ind_row_name_{i}"
+                default_name = get_state_value(row_key, f"Row {i+1}")
+                name = st.text_input(f'Row {i+1} Name', value=default_name, key=row_key, label_visibility="collapsed")
+                row_names.append(name)
+        
+        # Input category names for columns
+        st.write("**Column Categories:**")
+        col_cols = st.columns(int(num_cols))
+        col_names = []
+        for j in range(int(num_cols)):
+            with col_cols[j]:
+                col_key = f"ht_chi2_ind_col_name_{j}"
+                default_name = get_state_value(col_key, f"Col {j+1}")
+                name = st.text_input(f'Col {j+1} Name', value=default_name, key=col_key, label_visibility="collapsed")
+                col_names.append(name)
+        
+        # Create table input with category labels and borders
+        st.write("**Enter values for each cell:**")
+        
+        # Add CSS for better table styling with column borders
+        st.markdown("""
+            <style>
+            .chi2-table-cell {
+                border-right: 1px solid #ddd;
+                padding: 5px;
+            }
+            .chi2-table-header {
+                border-right: 1px solid #ddd;
+                border-bottom: 2px solid #4a4a4a;
+                padding: 5px;
+                text-align: center;
+                font-weight: bold;
+            }
+            .chi2-table-row-header {
+                border-right: 2px solid #4a4a4a;
+                padding: 5px;
+                font-weight: bold;
+            }
+            </style>
+            """, unsafe_allow_html=True)
+        
+        # Container with border styling
+        with st.container(border=True):
+            # Header row with column names
+            header_cols = st.columns([1.5] + [1] * int(num_cols))
+            with header_cols[0]:
+                st.markdown('<div class="chi2-table-row-header">&nbsp;</div>', unsafe_allow_html=True)  # Empty corner cell
+            for j in range(int(num_cols)):
+                with header_cols[j + 1]:
+                    st.markdown(f'<div class="chi2-table-header">{col_names[j]}</div>', unsafe_allow_html=True)
+            
+            st.markdown('<hr style="margin: 5px 0; border: 1px solid #4a4a4a;">', unsafe_allow_html=True)
+            
+            # Data rows
+            table_data = []
+            for i in range(int(num_rows)):
+                # Create header column for row name plus data columns
+                cols = st.columns([1.5] + [1] * int(num_cols))
+                with cols[0]:
+                    st.markdown(f'<div class="chi2-table-row-header">{row_names[i]}</div>', unsafe_allow_html=True)
+                
+                row_data = []
+                for j in range(int(num_cols)):
+                    with cols[j + 1]:
+                        cell_key = f"ht_chi2_ind_cell_{i}_{j}"
+                        default_val = get_state_value(cell_key, 10.0)
+                        val = st.number_input(f'{row_names[i]}-{col_names[j]}', value=default_val, min_value=0.0, step=1.0, key=cell_key, label_visibility="collapsed")
+                        row_data.append(val)
+                table_data.append(row_data)
+                
+                # Add horizontal line between rows (except after last row)
+                if i < int(num_rows) - 1:
+                    st.markdown('<hr style="margin: 5px 0; border: 0.5px solid #ddd;">', unsafe_allow_html=True)
+        
+        # Convert table to string format for compatibility with existing code
+        params['contingency_table'] = ';'.join([','.join([str(val) for val in row]) for row in table_data])
+        # Store row and column names for labeled output
+        params['row_names'] = row_names
+        params['col_names'] = col_names
+
+elif selected_ht_type == 'ANOVA (Analysis of Variance) F-test':
+    # Only Raw Data Input
+    if not numeric_cols:
+        st.warning("No numeric columns available. Please upload or enter data first.")
+    else:
+        num_groups = st.number_input('Number of Groups:', value=get_state_value('ht_anova_num_groups', 2), min_value=2, step=1, key="ht_anova_num_groups")
+
+        group_data_cols = []
+        for i in range(int(num_groups)):
+            col_key = f"ht_anova_group_data_col_{i+1}"
+            # Default to empty selection (index 0 is the empty string '')
+            selected_col = st.selectbox(f'Select Group {i+1} Data Column', options=numeric_cols, index=0, key=col_key)
+            group_data_cols.append(selected_col)
+        params['group_data_cols'] = group_data_cols
+
+alpha_level = st.number_input('Significance Level (α) for visualization:', value=get_state_value('ht_alpha_level', 0.05), min_value=0.001, max_value=0.999, step=0.01, key="ht_alpha_level")
+
+if st.button("Perform Hypothesis Test", key="perform_ht_button"):
+    st.subheader("Test Results")
+    try:
+        test_statistic, p_value, degrees_freedom, expected_frequencies = None, None, None, None
+        st.write(f"--- **{selected_ht_type}** ---")
+
+        # Execute the selected test
+        if selected_ht_type == 'One-Sample t-test':
+            if input_method == 'Raw Data':
+                data = get_data_from_col_string(params['sample_data'])
+                test_statistic, p_value = one_sample_t_test(data, params['hypothesized_mean'], alternative=params['alternative'])
+                st.write(f"Sample Mean: {np.mean(data):.4f}")
+            else:
+                test_statistic, p_value = one_sample_t_test_summary(params['sample_mean'], params['sample_std_dev'], params['sample_size'], params['hypothesized_mean'], alternative=params['alternative'])
+                st.write(f"Sample Mean: {params['sample_mean']:.4f}, Sample Std Dev: {params['sample_std_dev']:.4f}, Sample Size: {params['sample_size']}")
+            st.write(f"Hypothesized Mean (μ0): {params['hypothesized_mean']}")
+
+        elif selected_ht_type == 'Two-Sample t-test (Independent Samples)':
+            if input_method == 'Raw Data':
+                data1 = get_data_from_col_string(params['sample_data1'])
+                data2 = get_data_from_col_string(params['sample_data2'])
+                test_statistic, p_value = two_sample_t_test_independent(data1, data2, equal_variances=params['equal_variances'], alternative=params['alternative'])
+                st.write(f"Sample 1 Mean: {np.mean(data1):.4f} (N={len(data1)}) ")
+                st.write(f"Sample 2 Mean: {np.mean(data2):.4f} (N={len(data2)}) ")
+            else:
+                test_statistic, p_value = two_sample_t_test_independent_summary(params['sample1_mean'], params['sample1_std_dev'], params['sample1_size'], params['sample2_mean'], params['sample2_std_dev'], params['sample2_size'], equal_variances=params['equal_variances'], alternative=params['alternative'])
+                st.write(f"Sample 1: Mean={params['sample1_mean']:.4f}, Std Dev={params['sample1_std_dev']:.4f}, Size={params['sample1_size']}")
+                st.write(f"Sample 2: Mean={params['sample2_mean']:.4f}, Std Dev={params['sample2_std_dev']:.4f}, Size={params['sample2_size']}")
+            st.write(f"Assumed Equal Variances: {params['equal_variances']}")
+
+        elif selected_ht_type == 'Paired t-test':
+            if input_method == 'Raw Data':
+                data1 = get_data_from_col_string(params['sample_data1'])
+                data2 = get_data_from_col_string(params['sample_data2'])
+                test_statistic, p_value = paired_t_test(data1, data2, alternative=params['alternative'])
+                st.write(f"Sample 1 (Before) Mean: {np.mean(data1):.4f}")
+                st.write(f"Sample 2 (After) Mean: {np.mean(data2):.4f}")
+            else:
+                test_statistic, p_value = paired_t_test_summary(params['mean_difference'], params['std_dev_difference'], params['sample_size_difference'], alternative=params['alternative'])
+                st.write(f"Mean Difference: {params['mean_difference']:.4f}, Std Dev of Differences: {params['std_dev_difference']:.4f}, Number of Pairs: {params['sample_size_difference']}")
+
+        elif selected_ht_type == 'One-Sample Z-test for Proportions':
+            test_statistic, p_value = one_sample_z_test_proportion(params['num_successes'], params['num_trials'], params['hypothesized_proportion'], alternative=params['alternative'])
+            st.write(f"Sample Proportion: {(params['num_successes']/params['num_trials']):.4f} (x={params['num_successes']}, n={params['num_trials']})")
+            st.write(f"Hypothesized Proportion (p0): {params['hypothesized_proportion']}")
+
+        elif selected_ht_type == 'Two-Sample Z-test for Proportions':
+            test_statistic, p_value = two_sample_z_test_proportion(params['num_successes1'], params['num_trials1'], params['num_successes2'], params['num_trials2'], alternative=params['alternative'])
+            st.write(f"Sample 1 Proportion: {(params['num_successes1']/params['num_trials1']):.4f} (x1={params['num_successes1']}, n1={params['num_trials1']})")
+            st.write(f"Sample 2 Proportion: {(params['num_successes2']/params['num_trials2']):.4f} (x2={params['num_successes2']}, n2={params['num_trials2']})")
+
+        elif selected_ht_type == 'Chi-Square Goodness-of-Fit Test':
+            observed = [float(x.strip()) for x in params['observed_frequencies'].split(',') if x.strip()]
+            expected = []
+            if params['expected_frequencies']:
+                expected = [float(x.strip()) for x in params['expected_frequencies'].split(',') if x.strip()]
+            else:
+                # Use equal distribution
+                expected = [np.mean(observed)] * len(observed)
+            
+            test_statistic, p_value = chi_square_goodness_of_fit_test(observed, expected_frequencies=expected if params['expected_frequencies'] else None)
+            
+            # Get category names
+            category_names = params.get('category_names', [f"Category {i+1}" for i in range(len(observed))])
+            
+            # Create HTML table with black borders
+            table_html = """
+                <style>
+                .gof-table {
+                    border-collapse: collapse;
+                    width: 100%;
+                    margin: 10px 0;
+                }
+                .gof-table th, .gof-table td {
+                    border: 1px solid black;
+                    padding: 8px;
+                    text-align: center;
+                }
+                .gof-table th {
+                    background-color: #f0f0f0;
+                    font-weight: bold;
+                }
+                </style>
+                <table class="gof-table">
+                <tr>
+                    <th>Category</th>
+                    <th>Observed</th>
+                    <th>Expected</th>
+                </tr>
+                """
+            
+            for i, (cat_name, obs_val, exp_val) in enumerate(zip(category_names, observed, expected)):
+                table_html += f"""
+                <tr>
+                    <td>{cat_name}</td>
+                    <td>{obs_val:.2f}</td>
+                    <td>{exp_val:.2f}</td>
+                </tr>
+                """
+            
+            table_html += "</table>"
+            st.markdown(table_html, unsafe_allow_html=True)
+
+        elif selected_ht_type == 'Chi-Square Test of Independence':
+            if params.get('chi2_ind_input_type') == 'raw_data':
+                # Process raw data
+                if not params.get('row_variable') or not params.get('col_variable'):
+                    raise ValueError("Please select both row and column variables.")
+                
+                df_name_row, col_name_row = params['row_variable']
+                df_name_col, col_name_col = params['col_variable']
+                
+                if df_name_row != df_name_col:
+                    raise ValueError("Both variables must come from the same DataFrame.")
+                
+                dataset = st.session_state.global_dataframes.get(df_name_row)
+                if dataset is None:
+                    raise ValueError(f"DataFrame '{df_name_row}' not found.")
+                df = dataset.frame
+                
+                # Create contingency table from raw data
+                contingency_table = pd.crosstab(df[col_name_row], df[col_name_col])
+                table = contingency_table.values.tolist()
+                
+                test_statistic, p_value, degrees_freedom, expected_frequencies = chi_square_test_of_independence(table)
+                
+                st.write(f"**Observed Frequencies:**")
+                contingency_table.index.name = None
+                contingency_table.columns.name = None
+                show_table(contingency_table, paged=False)
+                
+                expected_df = pd.DataFrame(
+                    expected_frequencies, 
+                    index=contingency_table.index, 
+                    columns=contingency_table.columns
+                )
+                expected_df.index.name = None
+                expected_df.columns.name = None
+                st.write(f"**Expected Frequencies:**")
+                show_table(expected_df.round(2), paged=False)
+                st.write(f"**Degrees of Freedom:** {degrees_freedom}")
+                
+            else:
+                # Process summary statistics (contingency table input)
+                rows = params['contingency_table'].split(';')
+                table = []
+                for row in rows:
+                    table.append([float(val.strip()) for val in row.split(',')])
+                test_statistic, p_value, degrees_freedom, expected_frequencies = chi_square_test_of_independence(table)
+                
+                # Create labeled DataFrames using user-provided row and column names
+                row_names = params.get('row_names', [f"Row {i+1}" for i in range(len(table))])
+                col_names = params.get('col_names', [f"Col {j+1}" for j in range(len(table[0]))])
+                
+                observed_df = pd.DataFrame(table, index=row_names, columns=col_names)
+                expected_df = pd.DataFrame(expected_frequencies, index=row_names, columns=col_names)
+                
+                st.write(f"**Observed Frequencies:**")
+                show_table(observed_df, paged=False)
+                st.write(f"**Expected Frequencies:**")
+                show_table(expected_df.round(2), paged=False)
+                st.write(f"**Degrees of Freedom:** {degrees_freedom}")
+
+        elif selected_ht_type == 'ANOVA (Analysis of Variance) F-test':
+            group_data = []
+            for i, col_string in enumerate(params['group_data_cols']):
+                if col_string:
+                    try:
+                        data = get_data_from_col_string(col_string)
+                        if len(data) < 2:
+                            raise ValueError(f"Group {i+1} has only {len(data)} observation(s). At least 2 observations are required.")
+                        group_data.append(data)
+                    except Exception as e:
+                        raise ValueError(f"Error loading Group {i+1} data: {str(e)}")
+            
+            if len(group_data) < 2:
+                raise ValueError("ANOVA requires at least two groups with data.")
+            test_statistic, p_value = anova_f_test(*group_data)
+            for i, data in enumerate(group_data):
+                st.write(f"Group {i+1} Mean: {np.mean(data):.4f} (N={len(data)}) ")
+
+        if test_statistic is not None and p_value is not None:
+            st.write(f"**Test Statistic**: {test_statistic:.4f}")
+            if p_value < 0.0001:
+                st.write(f"**P-value**: <.0001")
+            else:
+                st.write(f"**P-value**: {p_value:.4f}")
+            
+            # Create visualization
+            st.write("**Visualization**")
+            fig, ax = plt.subplots(figsize=(10, 6))
+            
+            # Determine the distribution and plot accordingly
+            if selected_ht_type in ['One-Sample t-test', 'Two-Sample t-test (Independent Samples)', 'Paired t-test']:
+                # t-distribution - convert to original scale
+                if selected_ht_type == 'One-Sample t-test':
+                    if input_method == 'Raw Data':
+                        data = get_data_from_col_string(params['sample_data'])
+                        df = len(data) - 1
+                        sample_mean = np.mean(data)
+                        se = np.std(data, ddof=1) / np.sqrt(len(data))
+                    else:
+                        df = params['sample_size'] - 1
+                        sample_mean = params['sample_mean']
+                        se = params['sample_std_dev'] / np.sqrt(params['sample_size'])
+                    
+                    mu0 = params['hypothesized_mean']
+                    # Convert t-scores to original scale
+                    t_range = np.linspace(-4, 4, 1000)
+                    x_original = mu0 + t_range * se
+                    # Scale the density appropriately
+                    y = stats.t.pdf(t_range, df) / se
+                    ax.plot(x_original, y, 'b-', linewidth=2, label=f't-distribution (df={df})')
+                    
+                    # Get actual sample mean value
+                    actual_value = sample_mean
+                    
+                elif selected_ht_type == 'Two-Sample t-test (Independent Samples)':
+                    if input_method == 'Raw Data':
+                        data1 = get_data_from_col_string(params['sample_data1'])
+                        data2 = get_data_from_col_string(params['sample_data2'])
+                        n1, n2 = len(data1), len(data2)
+                        df = n1 + n2 - 2
+                        mean1, mean2 = np.mean(data1), np.mean(data2)
+                        if params['equal_variances']:
+                            s1, s2 = np.std(data1, ddof=1), np.std(data2, ddof=1)
+                            sp = np.sqrt(((n1-1)*s1**2 + (n2-1)*s2**2) / df)
+                            se = sp * np.sqrt(1/n1 + 1/n2)
+                        else:
+                            se = np.sqrt(np.var(data1, ddof=1)/n1 + np.var(data2, ddof=1)/n2)
+                    else:
+                        df = params['sample1_size'] + params['sample2_size'] - 2
+                        mean1, mean2 = params['sample1_mean'], params['sample2_mean']
+                        n1, n2 = params['sample1_size'], params['sample2_size']
+                        if params['equal_variances']:
+                            sp = np.sqrt(((n1-1)*params['sample1_std_dev']**2 + (n2-1)*params['sample2_std_dev']**2) / df)
+                            se = sp * np.sqrt(1/n1 + 1/n2)
+                        else:
+                            se = np.sqrt(params['sample1_std_dev']**2/n1 + params['sample2_std_dev']**2/n2)
+                    
+                    # Convert t-scores to difference in means scale
+                    t_range = np.linspace(-4, 4, 1000)
+                    x_original = t_range * se  # centered at 0 for H0: μ1 - μ2 = 0
+                    y = stats.t.pdf(t_range, df) / se
+                    ax.plot(x_original, y, 'b-', linewidth=2, label=f't-distribution (df={df})')
+                    
+                    actual_value = mean1 - mean2
+                    
+                else:  # Paired t-test
+                    if input_method == 'Raw Data':
+                        data1 = get_data_from_col_string(params['sample_data1'])
+                        data2 = get_data_from_col_string(params['sample_data2'])
+                        differences = np.array(data1) - np.array(data2)
+                        df = len(differences) - 1
+                        mean_diff = np.mean(differences)
+                        se = np.std(differences, ddof=1) / np.sqrt(len(differences))
+                    else:
+                        df = params['sample_size_difference'] - 1
+                        mean_diff = params['mean_difference']
+                        se = params['std_dev_difference'] / np.sqrt(params['sample_size_difference'])
+                    
+                    # Convert t-scores to difference scale
+                    t_range = np.linspace(-4, 4, 1000)
+                    x_original = t_range * se  # centered at 0 for H0: μd = 0
+                    y = stats.t.pdf(t_range, df) / se
+                    ax.plot(x_original, y, 'b-', linewidth=2, label=f't-distribution (df={df})')
+                    
+                    actual_value = mean_diff
+                
+                # Determine critical values and shade regions on original scale
+                if params['alternative'] == 'two-sided':
+                    critical_low_t = stats.t.ppf(alpha_level/2, df)
+                    critical_high_t = stats.t.ppf(1 - alpha_level/2, df)
+                    
+                    if selected_ht_type == 'One-Sample t-test':
+                        critical_low = mu0 + critical_low_t * se
+                        critical_high = mu0 + critical_high_t * se
+                        x_left = np.linspace(x_original.min(), critical_low, 100)
+                        x_right = np.linspace(critical_high, x_original.max(), 100)
+                    else:
+                        critical_low = critical_low_t * se
+                        critical_high = critical_high_t * se
+                        x_left = np.linspace(x_original.min(), critical_low, 100)
+                        x_right = np.linspace(critical_high, x_original.max(), 100)
+                    
+                    t_left = (x_left - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                    t_right = (x_right - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                    ax.fill_between(x_left, stats.t.pdf(t_left, df) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
+                    ax.fill_between(x_right, stats.t.pdf(t_right, df) / se, alpha=0.3, color='red')
+                    
+                    # Shade p-value region
+                    if actual_value < (mu0 if selected_ht_type == 'One-Sample t-test' else 0):
+                        x_pval_left = np.linspace(x_original.min(), actual_value, 100)
+                        t_pval_left = (x_pval_left - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                        ax.fill_between(x_pval_left, stats.t.pdf(t_pval_left, df) / se, alpha=0.5, color='yellow', label=f'p-value region')
+                        
+                        mirror_value = 2*(mu0 if selected_ht_type == 'One-Sample t-test' else 0) - actual_value
+                        x_pval_right = np.linspace(mirror_value, x_original.max(), 100)
+                        t_pval_right = (x_pval_right - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                        ax.fill_between(x_pval_right, stats.t.pdf(t_pval_right, df) / se, alpha=0.5, color='yellow')
+                    else:
+                        mirror_value = 2*(mu0 if selected_ht_type == 'One-Sample t-test' else 0) - actual_value
+                        x_pval_left = np.linspace(x_original.min(), mirror_value, 100)
+                        t_pval_left = (x_pval_left - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                        ax.fill_between(x_pval_left, stats.t.pdf(t_pval_left, df) / se, alpha=0.5, color='yellow', label=f'p-value region')
+                        
+                        x_pval_right = np.linspace(actual_value, x_original.max(), 100)
+                        t_pval_right = (x_pval_right - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                        ax.fill_between(x_pval_right, stats.t.pdf(t_pval_right, df) / se, alpha=0.5, color='yellow')
+                        
+                elif params['alternative'] == 'greater':
+                    critical_val_t = stats.t.ppf(1 - alpha_level, df)
+                    if selected_ht_type == 'One-Sample t-test':
+                        critical_val = mu0 + critical_val_t * se
+                    else:
+                        critical_val = critical_val_t * se
+                    
+                    x_crit = np.linspace(critical_val, x_original.max(), 100)
+                    t_crit = (x_crit - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                    ax.fill_between(x_crit, stats.t.pdf(t_crit, df) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
+                    
+                    x_pval = np.linspace(actual_value, x_original.max(), 100)
+                    t_pval = (x_pval - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                    ax.fill_between(x_pval, stats.t.pdf(t_pval, df) / se, alpha=0.5, color='yellow', label=f'p-value region')
+                    
+                else:  # less
+                    critical_val_t = stats.t.ppf(alpha_level, df)
+                    if selected_ht_type == 'One-Sample t-test':
+                        critical_val = mu0 + critical_val_t * se
+                    else:
+                        critical_val = critical_val_t * se
+                    
+                    x_crit = np.linspace(x_original.min(), critical_val, 100)
+                    t_crit = (x_crit - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                    ax.fill_between(x_crit, stats.t.pdf(t_crit, df) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
+                    
+                    x_pval = np.linspace(x_original.min(), actual_value, 100)
+                    t_pval = (x_pval - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
+                    ax.fill_between(x_pval, stats.t.pdf(t_pval, df) / se, alpha=0.5, color='yellow', label=f'p-value region')
+                
+                # Mark test statistic on original scale
+                ax.axvline(actual_value, color='green', linestyle='--', linewidth=2, label=f'Sample statistic = {actual_value:.3f}')
+                
+                if selected_ht_type == 'One-Sample t-test':
+                    ax.set_xlabel('Mean (μ)')
+                    ax.axvline(mu0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label=f'H₀: μ = {mu0}')
+                elif selected_ht_type == 'Two-Sample t-test (Independent Samples)':
+                    ax.set_xlabel('Difference in Means (μ₁ - μ₂)')
+                    ax.axvline(0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label='H₀: μ₁ - μ₂ = 0')
+                else:
+                    ax.set_xlabel('Mean Difference (μd)')
+                    ax.axvline(0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label='H₀: μd = 0')
+                
+                ax.set_ylabel('Probability Density')
+                ax.set_title(f'{selected_ht_type} Visualization')
+                
+            elif selected_ht_type in ['One-Sample Z-test for Proportions', 'Two-Sample Z-test for Proportions']:
+                # Standard normal distribution - convert to proportion scale
+                if selected_ht_type == 'One-Sample Z-test for Proportions':
+                    p0 = params['hypothesized_proportion']
+                    n = params['num_trials']
+                    p_hat = params['num_successes'] / n
+                    se = np.sqrt(p0 * (1 - p0) / n)
+                    
+                    # Convert z-scores to proportion scale
+                    z_range = np.linspace(-4, 4, 1000)
+                    x_original = p0 + z_range * se
+                    # Clip to valid proportion range [0, 1]
+                    x_original = np.clip(x_original, 0, 1)
+                    y = stats.norm.pdf(z_range) / se
+                    ax.plot(x_original, y, 'b-', linewidth=2, label='Normal Approximation')
+                    
+                    actual_value = p_hat
+                    center = p0
+                    
+                else:  # Two-Sample Z-test for Proportions
+                    p1_hat = params['num_successes1'] / params['num_trials1']
+                    p2_hat = params['num_successes2'] / params['num_trials2']
+                    n1, n2 = params['num_trials1'], params['num_trials2']
+                    
+                    # Pooled proportion under H0
+                    p_pool = (params['num_successes1'] + params['num_successes2']) / (n1 + n2)
+                    se = np.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
+                    
+                    # Convert z-scores to difference in proportions scale
+                    z_range = np.linspace(-4, 4, 1000)
+                    x_original = z_range * se  # centered at 0 for H0: p1 - p2 = 0
+                    # Clip to valid range [-1, 1]
+                    x_original = np.clip(x_original, -1, 1)
+                    y = stats.norm.pdf(z_range) / se
+                    ax.plot(x_original, y, 'b-', linewidth=2, label='Normal Approximation')
+                    
+                    actual_value = p1_hat - p2_hat
+                    center = 0
+                
+                # Determine critical values and shade regions on original scale
+                if params['alternative'] == 'two-sided':
+                    critical_low_z = stats.norm.ppf(alpha_level/2)
+                    critical_high_z = stats.norm.ppf(1 - alpha_level/2)
+                    
+                    critical_low = center + critical_low_z * se
+                    critical_high = center + critical_high_z * se
+                    
+                    x_left = np.linspace(x_original.min(), critical_low, 100)
+                    x_right = np.linspace(critical_high, x_original.max(), 100)
+                    
+                    z_left = (x_left - center) / se
+                    z_right = (x_right - center) / se
+                    ax.fill_between(x_left, stats.norm.pdf(z_left) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
+                    ax.fill_between(x_right, stats.norm.pdf(z_right) / se, alpha=0.3, color='red')
+                    
+                    # Shade p-value region
+                    if actual_value < center:
+                        x_pval_left = np.linspace(x_original.min(), actual_value, 100)
+                        z_pval_left = (x_pval_left - center) / se
+                        ax.fill_between(x_pval_left, stats.norm.pdf(z_pval_left) / se, alpha=0.5, color='yellow', label=f'p-value region')
+                        
+                        mirror_value = 2*center - actual_value
+                        x_pval_right = np.linspace(mirror_value, x_original.max(), 100)
+                        z_pval_right = (x_pval_right - center) / se
+                        ax.fill_between(x_pval_right, stats.norm.pdf(z_pval_right) / se, alpha=0.5, color='yellow')
+                    else:
+                        mirror_value = 2*center - actual_value
+                        x_pval_left = np.linspace(x_original.min(), mirror_value, 100)
+                        z_pval_left = (x_pval_left - center) / se
+                        ax.fill_between(x_pval_left, stats.norm.pdf(z_pval_left) / se, alpha=0.5, color='yellow', label=f'p-value region')
+                        
+                        x_pval_right = np.linspace(actual_value, x_original.max(), 100)
+                        z_pval_right = (x_pval_right - center) / se
+                        ax.fill_between(x_pval_right, stats.norm.pdf(z_pval_right) / se, alpha=0.5, color='yellow')
+                        
+                elif params['alternative'] == 'greater':
+                    critical_val_z = stats.norm.ppf(1 - alpha_level)
+                    critical_val = center + critical_val_z * se
+                    
+                    x_crit = np.linspace(critical_val, x_original.max(), 100)
+                    z_crit = (x_crit - center) / se
+                    ax.fill_between(x_crit, stats.norm.pdf(z_crit) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
+                    
+                    x_pval = np.linspace(actual_value, x_original.max(), 100)
+                    z_pval = (x_pval - center) / se
+                    ax.fill_between(x_pval, stats.norm.pdf(z_pval) / se, alpha=0.5, color='yellow', label=f'p-value region')
+                    
+                else:  # less
+                    critical_val_z = stats.norm.ppf(alpha_level)
+                    critical_val = center + critical_val_z * se
+                    
+                    x_crit = np.linspace(x_original.min(), critical_val, 100)
+                    z_crit = (x_crit - center) / se
+                    ax.fill_between(x_crit, stats.norm.pdf(z_crit) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
+                    
+                    x_pval = np.linspace(x_original.min(), actual_value, 100)
+                    z_pval = (x_pval - center) / se
+                    ax.fill_between(x_pval, stats.norm.pdf(z_pval) / se, alpha=0.5, color='yellow', label=f'p-value region')
+                
+                # Mark test statistic on original scale
+                ax.axvline(actual_value, color='green', linestyle='--', linewidth=2, label=f'Sample statistic = {actual_value:.4f}')
+                
+                if selected_ht_type == 'One-Sample Z-test for Proportions':
+                    ax.set_xlabel('Proportion (p)')
+                    ax.axvline(p0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label=f'H₀: p = {p0}')
+                else:
+                    ax.set_xlabel('Difference in Proportions (p₁ - p₂)')
+                    ax.axvline(0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label='H₀: p₁ - p₂ = 0')
+                
+                ax.set_ylabel('Probability Density')
+                ax.set_title(f'{selected_ht_type} Visualization')
+                
+            elif selected_ht_type == 'Chi-Square Goodness-of-Fit Test' or selected_ht_type == 'Chi-Square Test of Independence':
+                # Chi-square distribution
+                if selected_ht_type == 'Chi-Square Goodness-of-Fit Test':
+                    df = len([float(x.strip()) for x in params['observed_frequencies'].split(',') if x.strip()]) - 1
+                else:
+                    df = degrees_freedom
+                
+                x = np.linspace(0, max(test_statistic * 1.5, stats.chi2.ppf(0.999, df)), 1000)
+                y = stats.chi2.pdf(x, df)
+                ax.plot(x, y, 'b-', linewidth=2, label=f'Chi-square distribution (df={df})')
+                
+                # Critical value (always right-tailed for chi-square)
+                critical_val = stats.chi2.ppf(1 - alpha_level, df)
+                x_crit = np.linspace(critical_val, max(test_statistic * 1.5, stats.chi2.ppf(0.999, df)), 100)
+                ax.fill_between(x_crit, stats.chi2.pdf(x_crit, df), alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
+                
+                # Shade p-value region
+                x_pval = np.linspace(test_statistic, max(test_statistic * 1.5, stats.chi2.ppf(0.999, df)), 100)
+                ax.fill_between(x_pval, stats.chi2.pdf(x_pval, df), alpha=0.5, color='yellow', label=f'p-value region')
+                
+                ax.axvline(test_statistic, color='green', linestyle='--', linewidth=2, label=f'Test statistic = {test_statistic:.3f}')
+                ax.set_xlabel('χ² value')
+                ax.set_ylabel('Probability Density')
+                ax.set_title(f'{selected_ht_type} Visualization')
+                
+            elif selected_ht_type == 'ANOVA (Analysis of Variance) F-test':
+                # F-distribution
+                k = len(params['group_data_cols'])  # number of groups
+                n = sum(len(get_data_from_col_string(col)) for col in params['group_data_cols'] if col)
+                df1 = k - 1  # between groups
+                df2 = n - k  # within groups
+                
+                x = np.linspace(0, max(test_statistic * 1.5, stats.f.ppf(0.999, df1, df2)), 1000)
+                y = stats.f.pdf(x, df1, df2)
+                ax.plot(x, y, 'b-', linewidth=2, label=f'F-distribution (df1={df1}, df2={df2})')
+                
+                # Critical value (always right-tailed for F-test)
+                critical_val = stats.f.ppf(1 - alpha_level, df1, df2)
+                x_crit = np.linspace(critical_val, max(test_statistic * 1.5, stats.f.ppf(0.999, df1, df2)), 100)
+                ax.fill_between(x_crit, stats.f.pdf(x_crit, df1, df2), alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
+                
+                # Shade p-value region
+                x_pval = np.linspace(test_statistic, max(test_statistic * 1.5, stats.f.ppf(0.999, df1, df2)), 100)
+                ax.fill_between(x_pval, stats.f.pdf(x_pval, df1, df2), alpha=0.5, color='yellow', label=f'p-value region')
+                
+                ax.axvline(test_statistic, color='green', linestyle='--', linewidth=2, label=f'Test statistic = {test_statistic:.3f}')
+                ax.set_xlabel('F-value')
+                ax.set_ylabel('Probability Density')
+                ax.set_title(f'{selected_ht_type} Visualization')
+            
+            ax.legend(loc='best')
+            ax.grid(True, alpha=0.3)
+            st.pyplot(fig)
+            plt.close()
+        else:
+            st.warning("Could not complete the hypothesis test. Check inputs and test type.")
+
+    except ValueError as ve:
+        st.error(f"Input Error: {ve}")
+    except Exception as e:
+        st.error(f"An unexpected error occurred: {e}")
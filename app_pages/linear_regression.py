@@ -0,0 +1,55 @@
+# "Linear Regression" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Linear Regression")
+
+if not st.session_state.global_dataframes:
+    st.info("Please load or enter data in the 'Data Input' tab first to perform linear regression.")
+else:
+    numeric_cols_options = [''] + get_numeric_columns()
+
+    col1, col2 = st.columns(2)
+    with col1:
+        lr_x_axis_selector = st.selectbox("Select X-axis Variable (Independent)", options=numeric_cols_options, key="lr_x_axis_select")
+    with col2:
+        lr_y_axis_selector = st.selectbox("Select Y-axis Variable (Dependent)", options=numeric_cols_options, key="lr_y_axis_select")
+
+    if st.button("Calculate Linear Regression", key="calc_lr_button"):
+        st.subheader("Linear Regression Results")
+        try:
+            if not lr_x_axis_selector: raise ValueError("Please select an X-axis variable.")
+            if not lr_y_axis_selector: raise ValueError("Please select a Y-axis variable.")
+
+            source_df = get_active_dataset()
+            if source_df is None: raise ValueError("No active dataframe found. Please load data first.")
+
+            if lr_x_axis_selector not in source_df.columns: raise ValueError(f"Column '{lr_x_axis_selector}' not found in active dataframe.")
+            if lr_y_axis_selector not in source_df.columns: raise ValueError(f"Column '{lr_y_axis_selector}' not found in active dataframe.")
+
+            # Ensure that x_data and y_data correspond to the same rows after cleaning
+            # This is important if original DataFrame had NaNs at different positions.
+            # Re-create a temporary DataFrame to align indices and drop NaNs commonly.
+            combined_data = pd.DataFrame({'x': source_df.numeric_series(lr_x_axis_selector),
+                                          'y': source_df.numeric_series(lr_y_axis_selector)}).dropna()
+            if combined_data.empty:
+                raise ValueError("No common numeric data points found for X and Y axes after cleaning.")
+
+            cleaned_x = combined_data['x']
+            cleaned_y = combined_data['y']
+
+            r_value, r_squared, regression_equation, fig = perform_linear_regression_analysis(
+                cleaned_x, cleaned_y,
+                title=f'Linear Regression: {lr_y_axis_selector} vs {lr_x_axis_selector}',
+                xlabel=lr_x_axis_selector, ylabel=lr_y_axis_selector
+            )
+
+            st.write(f"**Correlation Coefficient (r)**: {r_value:.4f}")
+            st.write(f"**Coefficient of Determination (R²)**: {r_squared:.4f}")
+            st.write(f"**Regression Equation**: {regression_equation}")
+            st.pyplot(fig)
+            # Accessibility: Add text alternative for screen readers
+            st.caption(f"Linear regression scatter plot with fitted line. X-axis: {lr_x_axis_selector}, Y-axis: {lr_y_axis_selector}. "
+                      f"Correlation r={r_value:.4f}, R²={r_squared:.4f}. {regression_equation}")
+        except ValueError as ve:
+            st.error(f"Input Error: {ve}")
+        except Exception as e:
+            st.error(f"An unexpected error occurred: {e}")
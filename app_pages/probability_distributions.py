@@ -0,0 +1,205 @@
+# "Probability Distributions" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Probability Distributions")
+
+# Float inputs in this section support up to 10 decimal places.
+PROB_INPUT_STEP = 1e-10
+PROB_INPUT_FORMAT = "%.10g"
+
+selected_dist_type = st.selectbox(
+    "Select Distribution Type",
+    options=['Normal', 'Binomial', 'Chi-square', 'Student-t', 'F-Distribution'],
+    key="dist_type_select"
+)
+
+st.subheader("Distribution Inputs")
+params = {}
+if selected_dist_type == 'Normal':
+    params['mean'] = st.number_input('Mean (μ):', value=0.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="normal_mean")
+    params['std_dev'] = st.number_input('Std Dev (σ):', value=1.0, min_value=PROB_INPUT_STEP, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="normal_std_dev")
+elif selected_dist_type == 'Binomial':
+    params['n'] = st.number_input('Trials (n):', value=10, min_value=1, step=1, key="binomial_n")
+    params['p'] = st.number_input('Prob. of Success (p):', value=0.5, min_value=0.0, max_value=1.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="binomial_p")
+elif selected_dist_type == 'Chi-square':
+    params['df'] = st.number_input('Degrees of Freedom (df):', value=5, min_value=1, step=1, key="chi2_df")
+elif selected_dist_type == 'Student-t':
+    params['df'] = st.number_input('Degrees of Freedom (df):', value=10, min_value=1, step=1, key="t_df")
+elif selected_dist_type == 'F-Distribution':
+    params['dfn'] = st.number_input('Numerator df (df1):', value=5, min_value=1, step=1, key="f_dfn")
+    params['dfd'] = st.number_input('Denominator df (df2):', value=10, min_value=1, step=1, key="f_dfd")
+
+st.subheader("Probability Calculation")
+
+# Different options for binomial (discrete) vs continuous distributions
+if selected_dist_type == 'Binomial':
+    selected_calc_type = st.selectbox(
+        "Calculation Type",
+        options=['P(X = k)', 'P(X ≤ k)', 'P(X ≥ k)', 'P(X < k)', 'P(X > k)', 'P(a ≤ X ≤ b)'],
+        key="prob_calc_type"
+    )
+elif selected_dist_type == 'Chi-square':
+    selected_calc_type = st.selectbox(
+        "Calculation Type",
+        options=['P(X > a)'],
+        key="prob_calc_type"
+    )
+else:
+    inverse_normal_options = [
+        'Inverse Normal (find x from left-tail p)',
+        'Inverse Normal (find x from right-tail p)',
+        'Inverse Normal (find two values for in-between probability p)'
+    ]
+    selected_calc_type = st.selectbox(
+        "Calculation Type",
+        options=['P(X < a)', 'P(X > a)', 'P(a < X < b)'] + (inverse_normal_options if selected_dist_type == 'Normal' else []),
+        key="prob_calc_type"
+    )
+
+x_val, a_val, b_val, p_val = None, None, None, None
+if selected_calc_type in ['P(X < a)', 'P(X > a)', 'P(X = k)', 'P(X ≤ k)', 'P(X ≥ k)', 'P(X < k)', 'P(X > k)']:
+    if selected_dist_type == 'Binomial':
+        x_val = st.number_input('Value of k:', value=0, min_value=0, step=1, key="prob_x_input")
+    else:
+        x_val = st.number_input('Value of a:', value=0.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_x_input")
+elif selected_calc_type in ['P(a < X < b)', 'P(a ≤ X ≤ b)']:
+    col1, col2 = st.columns(2)
+    with col1:
+        if selected_dist_type == 'Binomial':
+            a_val = st.number_input('Value of a:', value=0, min_value=0, step=1, key="prob_a_input")
+        else:
+            a_val = st.number_input('Value of a:', value=0.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_a_input")
+    with col2:
+        if selected_dist_type == 'Binomial':
+            b_val = st.number_input('Value of b:', value=1, min_value=0, step=1, key="prob_b_input")
+        else:
+            b_val = st.number_input('Value of b:', value=1.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_b_input")
+elif selected_calc_type == 'Inverse Normal (find x from left-tail p)':
+    p_val = st.number_input('Left-tail probability p = P(X < x):', value=0.95, min_value=PROB_INPUT_STEP, max_value=1.0 - PROB_INPUT_STEP, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_inverse_p_input")
+elif selected_calc_type == 'Inverse Normal (find x from right-tail p)':
+    p_val = st.number_input('Right-tail probability p = P(X > x):', value=0.05, min_value=PROB_INPUT_STEP, max_value=1.0 - PROB_INPUT_STEP, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_inverse_right_p_input")
+elif selected_calc_type == 'Inverse Normal (find two values for in-between probability p)':
+    p_val = st.number_input('In-between probability p = P(lower < X < upper):', value=0.95, min_value=PROB_INPUT_STEP, max_value=1.0 - PROB_INPUT_STEP, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_inverse_middle_p_input")
+
+if st.button("Calculate Probability and Plot", key="calc_prob_button"):
+    st.subheader("Calculation Results")
+    try:
+        result = None
+        fig = None
+        calc_kwargs = {}
+
+        calc_type_mapping = {
+            'P(X < a)': 'cdf_strict',
+            'P(X > a)': 'survival_strict',
+            'P(a < X < b)': 'interval',
+            'P(X = k)': 'pmf',
+            'P(X ≤ k)': 'cdf',
+            'P(X ≥ k)': 'survival',
+            'P(X < k)': 'cdf_strict',
+            'P(X > k)': 'survival_strict',
+            'P(a ≤ X ≤ b)': 'interval_inclusive'
+        }
+        calc_kwargs['calc_type'] = calc_type_mapping.get(selected_calc_type)
+
+        if selected_calc_type in ['P(X < a)', 'P(X > a)', 'P(X = k)', 'P(X ≤ k)', 'P(X ≥ k)', 'P(X < k)', 'P(X > k)']:
+            if selected_dist_type == 'Binomial':
+                calc_kwargs['k'] = int(x_val) if x_val is not None else None
+            else:
+                calc_kwargs['x'] = x_val
+        elif selected_calc_type in ['P(a < X < b)', 'P(a ≤ X ≤ b)']:
+            if selected_dist_type == 'Binomial':
+                calc_kwargs['a'] = int(a_val) if a_val is not None else None
+                calc_kwargs['b'] = int(b_val) if b_val is not None else None
+            else:
+                calc_kwargs['a'] = a_val
+                calc_kwargs['b'] = b_val
+        elif selected_calc_type in [
+            'Inverse Normal (find x from left-tail p)',
+            'Inverse Normal (find x from right-tail p)',
+            'Inverse Normal (find two values for in-between probability p)'
+        ]:
+            calc_kwargs['p'] = p_val
+
+        if selected_dist_type == 'Normal':
+            if selected_calc_type == 'Inverse Normal (find x from left-tail p)':
+                result = stats.norm.ppf(calc_kwargs['p'], loc=params['mean'], scale=params['std_dev'])
+                fig = plot_normal_distribution(**params, shade_x=result, shade_a=None, shade_b=None, calc_type='cdf')
+            elif selected_calc_type == 'Inverse Normal (find x from right-tail p)':
+                result = stats.norm.ppf(1 - calc_kwargs['p'], loc=params['mean'], scale=params['std_dev'])
+                fig = plot_normal_distribution(**params, shade_x=result, shade_a=None, shade_b=None, calc_type='survival')
+            elif selected_calc_type == 'Inverse Normal (find two values for in-between probability p)':
+                lower_result = stats.norm.ppf((1 - calc_kwargs['p']) / 2, loc=params['mean'], scale=params['std_dev'])
+                upper_result = stats.norm.ppf((1 + calc_kwargs['p']) / 2, loc=params['mean'], scale=params['std_dev'])
+                result = (lower_result, upper_result)
+                fig = plot_normal_distribution(**params, shade_x=None, shade_a=lower_result, shade_b=upper_result, calc_type='interval')
+            else:
+                result = calculate_normal_distribution(**params, **calc_kwargs)
+                fig = plot_normal_distribution(**params, shade_x=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
+        elif selected_dist_type == 'Binomial':
+            result = calculate_binomial_distribution(**params, **calc_kwargs)
+            fig = plot_binomial_distribution(**params, shade_k=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
+        elif selected_dist_type == 'Chi-square':
+            result = calculate_chi_square_distribution(**params, **calc_kwargs)
+            fig = plot_chi_square_distribution(**params, shade_x=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
+        elif selected_dist_type == 'Student-t':
+            result = calculate_student_t_distribution(**params, **calc_kwargs)
+            fig = plot_student_t_distribution(**params, shade_x=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
+        elif selected_dist_type == 'F-Distribution':
+            result = calculate_f_distribution(**params, **calc_kwargs)
+            fig = plot_f_distribution(**params, shade_x=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
+
+        if result is not None:
+            st.write(f"--- **{selected_dist_type} Distribution Calculation** ---")
+            st.write(f"**Inputs**: {params}")
+            st.write(f"**Calculation Type**: {selected_calc_type}")
+            if x_val is not None:
+                value_label = 'x'
+                if selected_dist_type == 'Binomial':
+                    value_label = 'k'
+                elif selected_calc_type in ['P(X < a)', 'P(X > a)']:
+                    value_label = 'a'
+                st.write(f"**{value_label}** = {x_val}")
+            if a_val is not None:
+                st.write(f"**a** = {a_val}")
+            if b_val is not None:
+                st.write(f"**b** = {b_val}")
+            if selected_calc_type in [
+                'Inverse Normal (find x from left-tail p)',
+                'Inverse Normal (find x from right-tail p)',
+                'Inverse Normal (find two values for in-between probability p)'
+            ]:
+                st.write(f"**p** = {p_val}")
+                if selected_calc_type == 'Inverse Normal (find two values for in-between probability p)':
+                    st.markdown(
+                        f"<p style='color: black; font-size: 18px;'><b>Inverse Normal values: lower = {result[0]:.6f}, upper = {result[1]:.6f}</b></p>",
+                        unsafe_allow_html=True
+                    )
+                else:
+                    st.markdown(f"<p style='color: black; font-size: 18px;'><b>Inverse Normal x-value: {result:.6f}</b></p>", unsafe_allow_html=True)
+            else:
+                st.markdown(f"<p style='color: black; font-size: 18px;'><b>Calculated Probability: {result:.6f}</b></p>", unsafe_allow_html=True)
+            if fig is not None:
+                st.pyplot(fig)
+                # Accessibility: Add text alternative for screen readers
+                caption_text = f"{selected_dist_type} distribution plot. Inputs: {', '.join([f'{k}={v}' for k,v in params.items()])}. "
+                if selected_calc_type == 'Inverse Normal (find x from left-tail p)':
+                    caption_text += f"Shows inverse normal result x={result:.6f} such that P(X < x) = {p_val:.6f}."
+                elif selected_calc_type == 'Inverse Normal (find x from right-tail p)':
+                    caption_text += f"Shows inverse normal result x={result:.6f} such that P(X > x) = {p_val:.6f}."
+                elif selected_calc_type == 'Inverse Normal (find two values for in-between probability p)':
+                    caption_text += f"Shows inverse normal values lower={result[0]:.6f} and upper={result[1]:.6f} such that P(lower < X < upper) = {p_val:.6f}."
+                elif calc_kwargs['calc_type'] == 'cdf':
+                    caption_text += f"Shows cumulative probability P(X ≤ {x_val}) = {result:.6f}. Shaded area represents probability."
+                elif calc_kwargs['calc_type'] == 'survival':
+                    caption_text += f"Shows survival probability P(X ≥ {x_val}) = {result:.6f}. Shaded area represents probability."
+                elif calc_kwargs['calc_type'] == 'interval':
+                    caption_text += f"Shows interval probability P({a_val} < X < {b_val}) = {result:.6f}. Shaded area represents probability."
+                elif calc_kwargs['calc_type'] == 'pmf':
+                    caption_text += f"Shows probability mass function. P(X = {x_val}) = {result:.6f}. Highlighted bar shows probability."
+                st.caption(caption_text)
+        else:
+            st.warning("No calculation performed.")
+
+    except ValueError as ve:
+        st.error(f"Input Error: {ve}")
+    except Exception as e:
+        st.error(f"An unexpected error occurred: {e}")
@@ -0,0 +1,2306 @@
+# "Simulations" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Simulations")
+
+# Create tabs for different simulations
+sim_tabs = st.tabs(["Binomial Approximation", "Sample Means", "Sample Proportions", "Unusual Proportions", "Confidence Intervals", "Hypothesis Testing", "Two Proportions", "Two Means", "t vs Normal", "F-Statistic Explorer"])
+
+with sim_tabs[0]:
+    st.subheader("Normal Approximation of the Binomial Distribution")
+    st.write("""
+        This simulation helps you explore how the binomial distribution approaches a normal distribution 
+        as the sample size increases. This is a key concept in statistics known as the **Central Limit Theorem**.
+        """)
+    
+    # Create input columns
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        n_trials = st.number_input(
+            "Number of Trials (n)", 
+            min_value=0, 
+            max_value=500, 
+            value=0,
+            step=1,
+            help="Type the sample size to see how the number of trials affects the approximation"
+        )
+    
+    with col2:
+        p_prob = st.number_input(
+            "Probability of Success (p)", 
+            min_value=0.01, 
+            max_value=0.99, 
+            value=0.5, 
+            step=0.01,
+            format="%.2f",
+            help="The probability of success on each trial"
+        )
+    
+    # Plot updates automatically (no button needed)
+    try:
+        # Calculate binomial distribution
+        x_values = np.arange(0, n_trials + 1)
+        binomial_pmf = stats.binom.pmf(x_values, n=n_trials, p=p_prob)
+        
+        # Calculate normal approximation
+        mean = n_trials * p_prob
+        std_dev = np.sqrt(n_trials * p_prob * (1 - p_prob))
+        
+        # Create continuous x values for normal curve
+        x_continuous = np.linspace(0, n_trials, 1000)
+        if std_dev > 0:
+            normal_pdf = stats.norm.pdf(x_continuous, loc=mean, scale=std_dev)
+        else:
+            normal_pdf = None
+        
+        # Create the plot
+        fig, ax = plt.subplots(figsize=(12, 6))
+        
+        # Plot binomial distribution as vertical lines
+        markerline, stemlines, baseline = ax.stem(x_values, binomial_pmf, linefmt='steelblue', 
+                                                   markerfmt='o', basefmt=' ',
+                                                   label=f'Binomial(n={n_trials}, p={p_prob})')
+        plt.setp(stemlines, 'linewidth', 2)
+        plt.setp(markerline, 'markersize', 6, 'markerfacecolor', 'steelblue', 'markeredgecolor', 'steelblue')
+        
+        # Plot normal approximation as a curve when variance is positive
+        if normal_pdf is not None:
+            ax.plot(x_continuous, normal_pdf, 'r-', linewidth=2, 
+                    label=f'Normal(μ={mean:.2f}, σ={std_dev:.2f})')
+        
+        # Add labels and title
+        ax.set_xlabel('Number of Successes', fontsize=12)
+        ax.set_ylabel('Probability', fontsize=12)
+        ax.set_title(f'Binomial Distribution vs Normal Approximation\n(n={n_trials}, p={p_prob})', 
+                    fontsize=14, fontweight='bold')
+        ax.legend(fontsize=10)
+        ax.grid(True, alpha=0.3)
+        
+        # Display the plot
+        st.pyplot(fig)
+        
+        # Add interpretation
+        st.write("---")
+        st.subheader("Interpretation")
+        st.write(f"**Mean (μ)**: {mean:.2f}")
+        st.write(f"**Standard Deviation (σ)**: {std_dev:.2f}")
+        
+        # Check if normal approximation is appropriate
+        np_value = n_trials * p_prob
+        nq_value = n_trials * (1 - p_prob)
+        
+        if np_value >= 10 and nq_value >= 10:
+            st.success(f"✓ Normal approximation is appropriate: np = {np_value:.2f} ≥ 10 and n(1-p) = {nq_value:.2f} ≥ 10")
+        else:
+            st.warning(f"⚠ Normal approximation may not be accurate: np = {np_value:.2f} and n(1-p) = {nq_value:.2f}")
+            st.write("**Rule of thumb**: The normal approximation works well when both np ≥ 10 and n(1-p) ≥ 10")
+
+        if n_trials == 0:
+            st.info("When n = 0, the binomial distribution is degenerate at X = 0 and a normal approximation is not meaningful.")
+        
+        st.write("""
+            **What to observe:**
+            - As the number of trials increases, the binomial distribution becomes more symmetric and bell-shaped
+            - The normal curve (red line) approximates the binomial bars more closely with larger sample sizes
+            - When p is close to 0.5, the approximation works better for smaller sample sizes
+            """)
+        
+    except Exception as e:
+        st.error(f"An error occurred while generating the plot: {e}")
+
+with sim_tabs[1]:
+    st.subheader("Sampling Distribution of Sample Means")
+    st.write("""
+        This simulation demonstrates the **Central Limit Theorem** for sample means. It shows how the 
+        sampling distribution of sample means becomes approximately normal, regardless of the shape of 
+        the population distribution, as the sample size increases.
+        """)
+    
+    # Create input columns
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        pop_dist_type = st.selectbox(
+            "Population Distribution",
+            options=["Normal", "Right Skewed (Exponential)", "Left Skewed (Beta)", "Uniform", "Bimodal"],
+            help="Choose the shape of the population distribution"
+        )
+    
+    with col2:
+        sample_size_means = st.slider(
+            "Sample Size (n)", 
+            min_value=2, 
+            max_value=100, 
+            value=30,
+            help="The size of each random sample"
+        )
+    
+    with col3:
+        num_samples_means = st.number_input(
+            "Number of Samples", 
+            min_value=100, 
+            max_value=SIMULATION_MAX_REPLICATES, 
+            value=1000,
+            step=100,
+            help="How many samples to draw from the population"
+        )
+    
+    if st.button("Run Simulation", key="sampling_means_button"):
+        try:
+            # Population parameters are analytic; the drawn population is only displayed
+            population_info = SAMPLE_MEANS_POPULATIONS[pop_dist_type]
+            pop_mean = population_info['mean']
+            pop_std = population_info['std']
+            pop_counts, pop_edges = population_histogram(pop_dist_type, SAMPLE_MEANS_POPULATION_SEED)
+            
+            # Population panel: drawn once before sampling, it does not change during the run
+            pop_fig = go.Figure()
+            pop_fig.add_trace(go.Bar(
+                x=(pop_edges[:-1] + pop_edges[1:]) / 2, y=pop_counts, width=np.diff(pop_edges),
+                marker=dict(color=population_info['color'], line=dict(color='black', width=1)), opacity=0.7,
+                name='Population Distribution'
+            ))
+            pop_fig.add_trace(go.Scatter(
+                x=[pop_mean, pop_mean], y=[0, pop_counts.max() * 1.1], mode='lines',
+                line=dict(color='darkred', dash='dash', width=2), name=f'Population Mean = {pop_mean:.2f}'
+            ))
+            pop_fig.update_layout(title=f'Population Distribution: {pop_dist_type}', bargap=0, height=520,
+                                  margin=dict(t=110), legend=dict(orientation='h', yanchor='top', y=-0.2))
+            pop_fig.update_xaxes(title_text='Value', showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
+            pop_fig.update_yaxes(title_text='Density', showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
+            
+            # Create placeholders for progressive updates
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            pop_col, means_col = st.columns(2)
+            with pop_col:
+                st.plotly_chart(pop_fig, use_container_width=True, config=PLOTLY_CONFIG)
+            with means_col:
+                plot_placeholder = st.empty()
+            stats_placeholder = st.empty()
+            
+            theoretical_mean = pop_mean
+            theoretical_std = pop_std / np.sqrt(sample_size_means)
+            
+            # Sample means are binned as they arrive against edges fixed by the theoretical SE
+            lower_bound, upper_bound = population_info['bounds']
+            edges = theoretical_bin_edges(theoretical_mean, theoretical_std, 40, lower=lower_bound, upper=upper_bound)
+            sample_means = HistogramAccumulator(edges)
+            frames = []
+            
+            # Draw the sample means in fixed-size chunks
+            draw_means = lambda chunk_rng, size: draw_sample_means(chunk_rng, pop_dist_type, sample_size_means, size)
+            for done, is_frame, batch_means in monte_carlo_chunks(draw_means, num_samples_means):
+                # Update progress
+                progress = done / num_samples_means
+                progress_bar.progress(progress)
+                status_text.text(f"Generating samples... {int(progress * 100)}%")
+                
+                sample_means.add(batch_means)
+                
+                # Record an animation frame at each frame point
+                if is_frame:
+                    frames.append({
+                        'label': f"{sample_means.count:,} samples",
+                        'counts': sample_means.counts.copy(),
+                        'lines': [(sample_means.mean, 'orange', 'dot', f'Mean of Sample Means = {sample_means.mean:.2f}')],
+                    })
+            
+            # Sampling distribution panel: one frame per progress update, played in the browser
+            x_range = np.linspace(edges[0], edges[-1], 200)
+            normal_curve = stats.norm.pdf(x_range, loc=theoretical_mean, scale=theoretical_std)
+            means_fig = histogram_animation_figure(
+                edges, frames,
+                title=f'Sampling Distribution of Sample Means (n={sample_size_means})',
+                xlabel='Sample Mean', bar_name='Sample Means',
+                static_curves=[(x_range, normal_curve, 'red', f'Normal(μ={theoretical_mean:.2f}, σ={theoretical_std:.2f})')],
+                static_lines=[(pop_mean, 'darkred', 'dash', f'Population Mean = {pop_mean:.2f}')]
+            )
+            with plot_placeholder.container():
+                st.plotly_chart(means_fig, use_container_width=True, config=PLOTLY_CONFIG)
+                if sample_means.outside:
+                    st.caption(f"{sample_means.outside:,} sample means fell outside the plotted range "
+                               f"(±{SIMULATION_RANGE_SES} standard errors).")
+            
+            # Clear progress indicators
+            progress_bar.empty()
+            status_text.empty()
+            
+            # Display final statistics
+            with stats_placeholder.container():
+                st.write("---")
+                st.subheader("Summary Statistics")
+                
+                col_a, col_b, col_c = st.columns(3)
+                
+                with col_a:
+                    st.metric("Population Mean (μ)", f"{pop_mean:.2f}")
+                    st.metric("Population Std Dev (σ)", f"{pop_std:.2f}")
+                
+                with col_b:
+                    mean_of_means = sample_means.mean
+                    std_of_means = sample_means.std(ddof=1)
+                    st.metric("Mean of Sample Means", f"{mean_of_means:.2f}")
+                    st.metric("Std Dev of Sample Means", f"{std_of_means:.2f}")
+                
+                with col_c:
+                    theoretical_mean = pop_mean
+                    theoretical_std = pop_std / np.sqrt(sample_size_means)
+                    st.metric("Expected Mean", f"{theoretical_mean:.2f}")
+                    st.metric("Expected Std Dev (σ/√n)", f"{theoretical_std:.2f}")
+                
+                st.write("---")
+                st.write("**Central Limit Theorem Observations:**")
+                st.write(f"- The mean of sample means ({mean_of_means:.2f}) is approximately equal to the population mean ({pop_mean:.2f})")
+                st.write(f"- The standard deviation of sample means ({std_of_means:.2f}) is approximately σ/√n = {theoretical_std:.2f}")
+                st.write(f"- Even though the population distribution is **{pop_dist_type}**, the sampling distribution")
+                st.write(f"  of sample means appears approximately **normal** (especially with larger sample sizes)")
+                st.write(f"- Larger sample sizes (n) → narrower sampling distribution → more precise estimates")
+                
+                st.write("---")
+                st.info("""
+                    **Key Insight**: The Central Limit Theorem states that the sampling distribution of sample means 
+                    will be approximately normal, regardless of the population distribution shape, when the sample 
+                    size is sufficiently large (typically n ≥ 30). Try different distributions and sample sizes 
+                    to see this in action!
+                    """)
+            
+        except Exception as e:
+            st.error(f"An error occurred while running the simulation: {e}")
+
+with sim_tabs[2]:
+    st.subheader("Sampling Distribution of Sample Proportions")
+    st.write("""
+        This simulation demonstrates how sample proportions from repeated random samples form a distribution 
+        centered around the true population proportion. This illustrates the **Central Limit Theorem for Proportions**.
+        """)
+    
+    # Create input columns
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        pop_proportion = st.number_input(
+            "Population Proportion (p)", 
+            min_value=0.01, 
+            max_value=0.99, 
+            value=0.6, 
+            step=0.01,
+            format="%.2f",
+            help="The true proportion in the population"
+        )
+    
+    with col2:
+        sample_size = st.slider(
+            "Sample Size (n)", 
+            min_value=10, 
+            max_value=500, 
+            value=50,
+            help="The size of each random sample"
+        )
+    
+    with col3:
+        num_samples = st.number_input(
+            "Number of Samples", 
+            min_value=10, 
+            max_value=SIMULATION_MAX_REPLICATES, 
+            value=100,
+            step=10,
+            help="How many samples to draw from the population"
+        )
+    
+    # Add a button to run the simulation
+    if st.button("Run Simulation", key="sampling_dist_button"):
+        try:
+            # Generator for the sample strip; the proportions come from the Monte Carlo engine
+            rng = np.random.default_rng()
+            # Initialize session state for animation if not exists
+            if 'sample_proportions' not in st.session_state:
+                st.session_state.sample_proportions = []
+            
+            # Create placeholders for dynamic updates
+            dist_plot_placeholder = st.empty()
+            stats_placeholder = st.empty()
+            
+            # Progress bar
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+
+            mean_prop = pop_proportion
+            std_prop = np.sqrt(pop_proportion * (1 - pop_proportion) / sample_size)
+            x_norm = np.linspace(max(0, mean_prop - 4*std_prop), min(1, mean_prop + 4*std_prop), 400)
+            y_norm = stats.norm.pdf(x_norm, mean_prop, std_prop)
+            
+            # Sample proportions are binned as they arrive against edges fixed by the theoretical SE
+            edges = theoretical_bin_edges(mean_prop, std_prop, min(30, max(10, num_samples // 5)), lower=0, upper=1)
+            sample_proportions = HistogramAccumulator(edges)
+            
+            # Each sample is drawn as a single binomial count; limit the number of
+            # animation frames to keep the figure small.
+            draw_props = lambda chunk_rng, size: draw_sample_proportions(chunk_rng, pop_proportion, sample_size, size)
+            frames = []
+            for done, is_frame, batch_props in monte_carlo_chunks(draw_props, num_samples, max_frames=20):
+                # Update progress
+                progress = done / num_samples
+                progress_bar.progress(progress)
+                status_text.text(f"Drawing sample {done:,} of {num_samples:,}...")
+                
+                sample_proportions.add(batch_props)
+                if not is_frame:
+                    continue
+
+                # Show the latest sample: its successes are spread over a random ordering of
+                # the observations, and the first 100 observations max are displayed
+                sample_prop = batch_props[-1]
+                successes = int(round(sample_prop * sample_size))
+                display_count = min(100, sample_size)
+                display_sample = (rng.permutation(sample_size)[:display_count] < successes).astype(np.int8)
+                strip_title = (f'Sample #{done:,}: p̂ = {sample_prop:.4f} (Green = Success, Red = Failure) - '
+                               f'Showing {display_count} of {sample_size} observations')
+                frames.append({
+                    'label': f"Sample {done:,}",
+                    'counts': sample_proportions.counts.copy(),
+                    'lines': [(sample_proportions.mean, 'orange', 'dash',
+                               f'Mean of Sample Proportions ({sample_proportions.mean:.4f})')],
+                    'strip': (np.arange(display_count), display_sample, strip_title),
+                })
+
+            dist_fig = histogram_animation_figure(
+                edges, frames,
+                title='Sampling Distribution of Sample Proportions',
+                xlabel='Sample Proportion', bar_name='Sample Proportions',
+                static_curves=[(x_norm, y_norm, 'red', f'Theoretical N(μ={mean_prop:.3f}, σ={std_prop:.4f})')],
+                static_lines=[(pop_proportion, 'green', 'dash', f'Population Proportion (p={pop_proportion})')]
+            )
+            with dist_plot_placeholder.container():
+                st.write("---")
+                st.write("**Sampling Distribution of Sample Proportions**")
+                st.plotly_chart(dist_fig, use_container_width=True, config=PLOTLY_CONFIG)
+            
+            # Clear progress indicators
+            progress_bar.empty()
+            status_text.empty()
+            
+            # Display final statistics
+            with stats_placeholder.container():
+                st.write("---")
+                st.subheader("Summary Statistics")
+                
+                col_a, col_b, col_c = st.columns(3)
+                
+                with col_a:
+                    st.metric("Population Proportion (p)", f"{pop_proportion:.4f}")
+                    st.metric("Sample Size (n)", sample_size)
+                
+                with col_b:
+                    mean_sample_props = sample_proportions.mean
+                    st.metric("Mean of Sample Proportions", f"{mean_sample_props:.4f}")
+                    st.metric("Standard Deviation of Sample Proportions", f"{sample_proportions.std(ddof=1):.4f}")
+                
+                with col_c:
+                    theoretical_mean = pop_proportion
+                    theoretical_std = np.sqrt(pop_proportion * (1 - pop_proportion) / sample_size)
+                    st.metric("Theoretical Mean", f"{theoretical_mean:.4f}")
+                    st.metric("Theoretical Std Dev", f"{theoretical_std:.4f}")
+                
+                st.write("---")
+                st.write("**Key Observations:**")
+                st.write(f"- The mean of sample proportions ({mean_sample_props:.4f}) should be close to the population proportion ({pop_proportion:.4f})")
+                st.write(f"- The standard deviation of sample proportions is approximately {theoretical_std:.4f}")
+                st.write(f"- As sample size increases, the sampling distribution becomes narrower (smaller standard deviation)")
+                st.write(f"- The sampling distribution is approximately normal when np ≥ 10 and n(1-p) ≥ 10")
+                
+                # Check conditions for normality
+                np_check = sample_size * pop_proportion
+                nq_check = sample_size * (1 - pop_proportion)
+                
+                if np_check >= 10 and nq_check >= 10:
+                    st.success(f"✓ Conditions met for normal approximation: np = {np_check:.1f} ≥ 10 and n(1-p) = {nq_check:.1f} ≥ 10")
+                else:
+                    st.warning(f"⚠ Conditions not fully met: np = {np_check:.1f} and n(1-p) = {nq_check:.1f}")
+            
+        except Exception as e:
+            st.error(f"An error occurred while running the simulation: {e}")
+
+with sim_tabs[3]:
+    st.subheader("Unusual Sample Proportions")
+    st.write("""
+        This simulation helps you determine if a sample proportion is unusual given a population proportion. 
+        A sample proportion is typically considered unusual if it falls more than **2 standard errors** away 
+        from the population proportion (approximately outside the 95% confidence region).
+        """)
+    
+    # Create input columns
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        pop_prop = st.number_input(
+            "Population Proportion (p)", 
+            min_value=0.01, 
+            max_value=0.99, 
+            value=0.5, 
+            step=0.01,
+            format="%.3f",
+            help="The assumed or known population proportion",
+            key="unusual_pop_prop"
+        )
+    
+    with col2:
+        sample_prop = st.number_input(
+            "Sample Proportion (p̂)", 
+            min_value=0.0, 
+            max_value=1.0, 
+            value=0.65, 
+            step=0.01,
+            format="%.3f",
+            help="The proportion observed in your sample",
+            key="unusual_sample_prop"
+        )
+    
+    with col3:
+        samp_size = st.number_input(
+            "Sample Size (n)", 
+            min_value=10, 
+            max_value=10000, 
+            value=100, 
+            step=10,
+            help="The size of your sample",
+            key="unusual_sample_size"
+        )
+    
+    # Calculate and plot automatically
+    try:
+        # Check conditions for normal approximation
+        np_val = samp_size * pop_prop
+        nq_val = samp_size * (1 - pop_prop)
+        
+        if np_val < 10 or nq_val < 10:
+            st.warning(f"⚠ **Note**: Normal approximation may not be accurate. np = {np_val:.1f} and n(1-p) = {nq_val:.1f}. Both should be ≥ 10.")
+        
+        # Calculate standard error
+        standard_error = np.sqrt(pop_prop * (1 - pop_prop) / samp_size)
+        
+        # Calculate z-score
+        z_score = (sample_prop - pop_prop) / standard_error
+        
+        # Calculate bounds for ±2 SE
+        lower_bound_2se = pop_prop - 2 * standard_error
+        upper_bound_2se = pop_prop + 2 * standard_error
+        
+        # Create the plot
+        fig, ax = plt.subplots(figsize=(12, 7))
+        
+        # Create x values for the normal curve
+        x_min = max(0, pop_prop - 4 * standard_error)
+        x_max = min(1, pop_prop + 4 * standard_error)
+        x_values = np.linspace(x_min, x_max, 1000)
+        
+        # Calculate normal distribution values
+        y_values = stats.norm.pdf(x_values, loc=pop_prop, scale=standard_error)
+        
+        # Plot the normal curve
+        ax.plot(x_values, y_values, 'b-', linewidth=2, label='Sampling Distribution')
+        
+        # Shade the region within ±2 SE (usual region)
+        x_fill = x_values[(x_values >= lower_bound_2se) & (x_values <= upper_bound_2se)]
+        y_fill = stats.norm.pdf(x_fill, loc=pop_prop, scale=standard_error)
+        ax.fill_between(x_fill, y_fill, alpha=0.3, color='green', 
+                       label=f'Within 2 SE (Usual)\n[{lower_bound_2se:.4f}, {upper_bound_2se:.4f}]')
+        
+        # Shade unusual regions (beyond ±2 SE)
+        x_left = x_values[x_values < lower_bound_2se]
+        if len(x_left) > 0:
+            y_left = stats.norm.pdf(x_left, loc=pop_prop, scale=standard_error)
+            ax.fill_between(x_left, y_left, alpha=0.3, color='red', label='Unusual (Below -2 SE)')
+        
+        x_right = x_values[x_values > upper_bound_2se]
+        if len(x_right) > 0:
+            y_right = stats.norm.pdf(x_right, loc=pop_prop, scale=standard_error)
+            ax.fill_between(x_right, y_right, alpha=0.3, color='red', label='Unusual (Above +2 SE)')
+        
+        # Mark the population proportion
+        ax.axvline(pop_prop, color='blue', linestyle='--', linewidth=2, 
+                  label=f'Population Proportion (p={pop_prop:.3f})')
+        
+        # Mark the ±2 SE bounds
+        ax.axvline(lower_bound_2se, color='orange', linestyle=':', linewidth=1.5, 
+                  label=f'-2 SE = {lower_bound_2se:.4f}')
+        ax.axvline(upper_bound_2se, color='orange', linestyle=':', linewidth=1.5, 
+                  label=f'+2 SE = {upper_bound_2se:.4f}')
+        
+        # Mark the sample proportion
+        y_max = max(y_values)
+        ax.axvline(sample_prop, color='red' if abs(z_score) > 2 else 'green', 
+                  linestyle='-', linewidth=3, alpha=0.8,
+                  label=f'Sample Proportion (p̂={sample_prop:.3f})')
+        
+        # Add a marker at the top for the sample proportion
+        ax.plot(sample_prop, y_max * 1.05, 'v', 
+               color='red' if abs(z_score) > 2 else 'green', 
+               markersize=15, markeredgecolor='black', markeredgewidth=1.5)
+        
+        # Labels and title
+        ax.set_xlabel('Sample Proportion', fontsize=12)
+        ax.set_ylabel('Probability Density', fontsize=12)
+        ax.set_title('Is the Sample Proportion Unusual?\nSampling Distribution of Sample Proportions', 
+                    fontsize=14, fontweight='bold')
+        ax.legend(fontsize=9, loc='upper right')
+        ax.grid(True, alpha=0.3)
+        
+        st.pyplot(fig)
+        plt.close(fig)
+        
+        # Display statistics and interpretation
+        st.write("---")
+        st.subheader("Analysis")
+        
+        col_a, col_b, col_c = st.columns(3)
+        
+        with col_a:
+            st.metric("Standard Error (SE)", f"{standard_error:.4f}")
+            st.metric("2 × SE", f"{2 * standard_error:.4f}")
+        
+        with col_b:
+            st.metric("Z-Score", f"{z_score:.3f}")
+            st.metric("Distance from p", f"{abs(sample_prop - pop_prop):.4f}")
+        
+        with col_c:
+            st.metric("Lower Bound (-2 SE)", f"{lower_bound_2se:.4f}")
+            st.metric("Upper Bound (+2 SE)", f"{upper_bound_2se:.4f}")
+        
+        st.write("---")
+        st.subheader("Interpretation")
+        
+        # Determine if unusual
+        if abs(z_score) > 2:
+            st.error(f"🔴 **The sample proportion ({sample_prop:.3f}) is UNUSUAL**")
+            st.write(f"The sample proportion is **{abs(z_score):.2f} standard errors** away from the population proportion.")
+            st.write(f"This falls **outside** the usual range of ±2 SE from the population proportion.")
+            if z_score > 2:
+                st.write(f"📈 The sample proportion is **significantly higher** than expected.")
+            else:
+                st.write(f"📉 The sample proportion is **significantly lower** than expected.")
+        else:
+            st.success(f"🟢 **The sample proportion ({sample_prop:.3f}) is NOT unusual**")
+            st.write(f"The sample proportion is only **{abs(z_score):.2f} standard errors** away from the population proportion.")
+            st.write(f"This falls **within** the usual range of ±2 SE from the population proportion.")
+            st.write(f"✓ This difference could easily occur by random chance.")
+        
+        st.write("---")
+        st.write("**Rule of Thumb:**")
+        st.write("- If |z-score| > 2: The sample proportion is considered **unusual** (roughly outside the 95% range)")
+        st.write("- If |z-score| ≤ 2: The sample proportion is considered **usual** (within the 95% range)")
+        st.write("- Standard Error (SE) = √[p(1-p)/n]")
+        
+    except Exception as e:
+        st.error(f"An error occurred: {e}")
+
+with sim_tabs[4]:
+    st.subheader("Confidence Interval Explorer for Proportions")
+    st.write("""
+        This simulation helps you understand how confidence intervals work. A confidence interval constructed 
+        around a **sample proportion** will capture the **true population proportion** a certain percentage of the time 
+        (e.g., 95% of the time for a 95% confidence interval).
+        """)
+    
+    # Create input columns
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        ci_pop_prop = st.number_input(
+            "True Population Proportion (p)", 
+            min_value=0.01, 
+            max_value=0.99, 
+            value=0.6, 
+            step=0.01,
+            format="%.3f",
+            help="The true (but usually unknown) population proportion",
+            key="ci_pop_prop"
+        )
+    
+    with col2:
+        ci_sample_size = st.number_input(
+            "Sample Size (n)", 
+            min_value=10, 
+            max_value=1000, 
+            value=100, 
+            step=10,
+            help="The size of your sample",
+            key="ci_sample_size"
+        )
+    
+    with col3:
+        confidence_level = st.selectbox(
+            "Confidence Level",
+            options=[0.90, 0.95, 0.99],
+            index=1,
+            format_func=lambda x: f"{int(x*100)}%",
+            help="The confidence level for the interval",
+            key="ci_confidence_level"
+        )
+    
+    # Calculate z-critical value based on confidence level
+    z_critical = stats.norm.ppf((1 + confidence_level) / 2)
+    
+    # Calculate margin of error based on population proportion
+    standard_error = np.sqrt(ci_pop_prop * (1 - ci_pop_prop) / ci_sample_size)
+    margin_of_error = z_critical * standard_error
+    
+    st.write("---")
+    col_info1, col_info2 = st.columns(2)
+    with col_info1:
+        st.info(f"**Z-critical value**: {z_critical:.3f}")
+        st.info(f"**Standard Error**: {standard_error:.4f}")
+    with col_info2:
+        st.info(f"**Margin of Error**: ±{margin_of_error:.4f}")
+        st.info(f"**Formula**: ME = z* × √[p(1-p)/n]")
+    
+    # Calculate confidence interval around the population proportion (for reference)
+    pop_ci_lower = ci_pop_prop - margin_of_error
+    pop_ci_upper = ci_pop_prop + margin_of_error
+    
+    # Sample proportion input or random generation
+    st.write("---")
+    st.subheader("Choose Exploration Method")
+    
+    exploration_mode = st.radio(
+        "Select Mode",
+        options=["Single Sample", "Multiple Samples"],
+        key="ci_exploration_mode",
+        horizontal=True
+    )
+    
+    ci_sample_prop = None
+    sample_provided = False
+    multiple_samples = []
+    
+    if exploration_mode == "Single Sample":
+        st.write("Add a sample proportion (p̂) to see if an interval with the same margin of error would capture the population proportion.")
+        
+        col_choice1, col_choice2 = st.columns(2)
+        
+        with col_choice1:
+            sample_method = st.radio(
+                "Method",
+                options=["Enter Manually", "Generate Random Sample"],
+                key="ci_sample_method"
+            )
+        
+        with col_choice2:
+            if sample_method == "Enter Manually":
+                ci_sample_prop = st.slider(
+                    "Sample Proportion (p̂)", 
+                    min_value=0.0, 
+                    max_value=1.0, 
+                    value=None,
+                    step=0.01,
+                    format="%.3f",
+                    help="Move the slider to explore different sample proportions",
+                    key="ci_sample_prop_slider"
+                )
+                if ci_sample_prop is not None:
+                    sample_provided = True
+            else:
+                if st.button("Generate Random Sample", key="generate_random_sample"):
+                    # Generate a random sample
+                    sample = np.random.binomial(1, ci_pop_prop, ci_sample_size)
+                    st.session_state.random_sample_prop = np.mean(sample)
+                    sample_provided = True
+                
+                # Display the random sample proportion
+                if 'random_sample_prop' in st.session_state:
+                    ci_sample_prop = st.session_state.random_sample_prop
+                    st.metric("Generated Sample Proportion", f"{ci_sample_prop:.4f}")
+                    sample_provided = True
+    
+    else:  # Multiple Samples mode
+        st.write(f"""
+            Generate multiple random samples to see what percentage of confidence intervals 
+            capture the true population proportion. This illustrates that a **{int(confidence_level*100)}% confidence level** 
+            means approximately **{int(confidence_level*100)}%** of intervals will contain the true parameter.
+            """)
+        
+        col_multi1, col_multi2 = st.columns(2)
+        
+        with col_multi1:
+            num_samples_to_generate = st.slider(
+                "Number of Samples to Generate",
+                min_value=10,
+                max_value=200,
+                value=100,
+                step=10,
+                key="num_samples_multi"
+            )
+        
+        with col_multi2:
+            if st.button("Generate Multiple Samples", key="generate_multiple_samples"):
+                # Generate multiple samples
+                st.session_state.multiple_samples_data = []
+                for i in range(num_samples_to_generate):
+                    sample = np.random.binomial(1, ci_pop_prop, ci_sample_size)
+                    sample_prop = np.mean(sample)
+                    ci_low = sample_prop - margin_of_error
+                    ci_high = sample_prop + margin_of_error
+                    captures_p = ci_low <= ci_pop_prop <= ci_high
+                    st.session_state.multiple_samples_data.append({
+                        'sample_prop': sample_prop,
+                        'ci_lower': ci_low,
+                        'ci_upper': ci_high,
+                        'captures': captures_p
+                    })
+        
+        if 'multiple_samples_data' in st.session_state and st.session_state.multiple_samples_data:
+            multiple_samples = st.session_state.multiple_samples_data
+            sample_provided = True
+    
+    # Create visualization
+    st.write("---")
+    st.subheader("Visualization")
+    
+    try:
+        if exploration_mode == "Multiple Samples" and multiple_samples:
+            # Multiple samples visualization
+            fig, ax = plt.subplots(figsize=(14, 10))
+            
+            # Calculate statistics
+            num_captured = sum(1 for s in multiple_samples if s['captures'])
+            capture_rate = (num_captured / len(multiple_samples)) * 100
+            
+            # Determine plot range
+            all_bounds = [s['ci_lower'] for s in multiple_samples] + [s['ci_upper'] for s in multiple_samples]
+            plot_min = max(0, min(all_bounds + [ci_pop_prop]) - 0.1)
+            plot_max = min(1, max(all_bounds + [ci_pop_prop]) + 0.1)
+            
+            # Draw vertical line at population proportion
+            ax.axvline(ci_pop_prop, color='purple', linestyle='--', linewidth=3, 
+                      label=f'Population Proportion (p = {ci_pop_prop:.3f})', zorder=10)
+            
+            # Draw each confidence interval
+            for i, sample_data in enumerate(multiple_samples):
+                y_pos = i
+                color = 'green' if sample_data['captures'] else 'red'
+                
+                # Draw interval line
+                ax.plot([sample_data['ci_lower'], sample_data['ci_upper']], [y_pos, y_pos],
+                       color=color, linewidth=1.5, alpha=0.7)
+                
+                # Draw endpoints
+                ax.plot([sample_data['ci_lower'], sample_data['ci_upper']], [y_pos, y_pos],
+                       'o', color=color, markersize=3)
+            
+            # Add legend entries for captured/missed
+            ax.plot([], [], color='green', linewidth=2, label=f'Captures p ({num_captured})')
+            ax.plot([], [], color='red', linewidth=2, label=f'Misses p ({len(multiple_samples) - num_captured})')
+            
+            ax.set_xlim(plot_min, plot_max)
+            ax.set_ylim(-1, len(multiple_samples))
+            ax.set_xlabel('Proportion', fontsize=12, fontweight='bold')
+            ax.set_ylabel('Sample Number', fontsize=12, fontweight='bold')
+            ax.set_title(f'{len(multiple_samples)} Confidence Intervals: {capture_rate:.1f}% Capture the Population Proportion\n' + 
+                        f'(Expected: {int(confidence_level*100)}%)', 
+                        fontsize=14, fontweight='bold', pad=15)
+            ax.legend(fontsize=10, loc='upper right')
+            ax.grid(True, alpha=0.3, axis='x')
+            
+            st.pyplot(fig)
+            plt.close(fig)
+            
+            # Display statistics
+            st.write("---")
+            st.subheader("Results Summary")
+            
+            col_stat1, col_stat2, col_stat3 = st.columns(3)
+            
+            with col_stat1:
+                st.metric("Total Samples", len(multiple_samples))
+                st.metric("Intervals Capturing p", num_captured)
+            
+            with col_stat2:
+                st.metric("Intervals Missing p", len(multiple_samples) - num_captured)
+                st.metric("Capture Rate", f"{capture_rate:.1f}%")
+            
+            with col_stat3:
+                st.metric("Expected Rate", f"{int(confidence_level*100)}%")
+                difference = capture_rate - (confidence_level * 100)
+                st.metric("Difference", f"{difference:+.1f}%")
+            
+            st.write("---")
+            if abs(difference) <= 5:
+                st.success(f"""
+                    ✓ The observed capture rate ({capture_rate:.1f}%) is very close to the expected {int(confidence_level*100)}%! 
+                    This demonstrates that confidence intervals work as intended.
+                    """)
+            else:
+                st.info(f"""
+                    The observed capture rate ({capture_rate:.1f}%) differs from the expected {int(confidence_level*100)}% by {abs(difference):.1f}%. 
+                    This is normal due to random variation. Try generating more samples to see the rate approach {int(confidence_level*100)}%.
+                    """)
+            
+            st.write("""
+                **Key Insight:**
+                - Each horizontal line represents a confidence interval from a different sample
+                - Green intervals successfully capture the true population proportion (purple line)
+                - Red intervals miss the population proportion
+                - With a large number of samples, approximately the confidence level percentage will be green
+                """)
+        
+        else:
+            # Single sample visualization
+            fig, ax = plt.subplots(figsize=(14, 8))
+            
+            # Determine plot range
+            if sample_provided and ci_sample_prop is not None:
+                plot_min = max(0, min(ci_pop_prop, ci_sample_prop) - 0.2)
+                plot_max = min(1, max(ci_pop_prop, ci_sample_prop) + 0.2)
+                # Calculate confidence interval around the sample proportion
+                ci_lower = ci_sample_prop - margin_of_error
+                ci_upper = ci_sample_prop + margin_of_error
+                # Check if interval captures population proportion
+                captures = ci_lower <= ci_pop_prop <= ci_upper
+            else:
+                plot_min = max(0, ci_pop_prop - 0.3)
+                plot_max = min(1, ci_pop_prop + 0.3)
+                captures = None
+            
+            # ALWAYS draw the interval around population proportion (static)
+            y_pop = 0.65
+            ax.plot([pop_ci_lower, pop_ci_upper], [y_pop, y_pop], 
+                   color='steelblue', linewidth=8, alpha=0.5,
+                   label=f'Interval Around p (ME = ±{margin_of_error:.3f})')
+            
+            # Draw endpoints
+            ax.plot([pop_ci_lower, pop_ci_upper], [y_pop, y_pop], 
+                   'o', color='steelblue', markersize=15, markeredgecolor='black', 
+                   markeredgewidth=2)
+            
+            # Draw the population proportion
+            ax.plot(ci_pop_prop, y_pop, 's', color='purple', markersize=20,
+                   markeredgecolor='black', markeredgewidth=2,
+                   label=f'Population Proportion (p = {ci_pop_prop:.3f})', zorder=5)
+            
+            # Add shaded region for population interval
+            ax.axvspan(pop_ci_lower, pop_ci_upper, alpha=0.15, color='steelblue', zorder=1)
+            
+            # Add text annotations for population interval
+            ax.text(pop_ci_lower, y_pop + 0.12, f'{pop_ci_lower:.3f}', 
+                   ha='center', va='bottom', fontsize=10, fontweight='bold', color='steelblue')
+            ax.text(pop_ci_upper, y_pop + 0.12, f'{pop_ci_upper:.3f}', 
+                   ha='center', va='bottom', fontsize=10, fontweight='bold', color='steelblue')
+            
+            # If sample proportion is provided, draw interval around it
+            if sample_provided and ci_sample_prop is not None:
+                y_sample = 0.35
+                interval_color = 'green' if captures else 'red'
+                
+                # Draw the interval line around sample proportion
+                ax.plot([ci_lower, ci_upper], [y_sample, y_sample], 
+                       color=interval_color, linewidth=8, alpha=0.7,
+                       label=f'Interval Around p̂ (same ME)')
+                
+                # Draw endpoints of the interval
+                ax.plot([ci_lower, ci_upper], [y_sample, y_sample], 
+                       'o', color=interval_color, markersize=15, markeredgecolor='black', 
+                       markeredgewidth=2)
+                
+                # Draw the sample proportion at the center
+                ax.plot(ci_sample_prop, y_sample, 'D', color='blue', markersize=20,
+                       markeredgecolor='black', markeredgewidth=2,
+                       label=f'Sample Proportion (p̂ = {ci_sample_prop:.3f})', zorder=5)
+                
+                # Add shaded region for sample interval
+                ax.axvspan(ci_lower, ci_upper, alpha=0.15, color=interval_color, zorder=1)
+                
+                # Add text annotations for sample interval
+                ax.text(ci_lower, y_sample - 0.12, f'{ci_lower:.3f}', 
+                       ha='center', va='top', fontsize=10, fontweight='bold', color=interval_color)
+                ax.text(ci_upper, y_sample - 0.12, f'{ci_upper:.3f}', 
+                       ha='center', va='top', fontsize=10, fontweight='bold', color=interval_color)
+                
+                # Draw vertical line at population proportion to see if it's captured
+                ax.axvline(ci_pop_prop, color='purple', linestyle='--', linewidth=2, alpha=0.6, zorder=3)
+            
+            # Formatting
+            ax.set_xlim(plot_min, plot_max)
+            ax.set_ylim(0, 1)
+            ax.set_yticks([])
+            ax.set_xlabel('Proportion', fontsize=14, fontweight='bold')
+            
+            if sample_provided and ci_sample_prop is not None:
+                if captures:
+                    title_text = f'✓ Confidence Interval Around p̂ CAPTURES the Population Proportion!'
+                    title_color = 'green'
+                else:
+                    title_text = f'✗ Confidence Interval Around p̂ DOES NOT capture the Population Proportion'
+                    title_color = 'red'
+            else:
+                title_text = 'Confidence Interval Around Population Proportion\n(Add a sample proportion to compare)'
+                title_color = 'black'
+            
+            ax.set_title(title_text, fontsize=16, fontweight='bold', color=title_color, pad=20)
+            ax.legend(fontsize=11, loc='upper right')
+            ax.grid(True, alpha=0.3, axis='x')
+            
+            st.pyplot(fig)
+            plt.close(fig)
+            
+            # Explanation - only show when sample is provided
+            if sample_provided and ci_sample_prop is not None:
+                st.write("---")
+                st.subheader("Interpretation")
+                
+                col_result1, col_result2 = st.columns(2)
+                
+                with col_result1:
+                    st.metric("Confidence Interval Around p̂", f"[{ci_lower:.4f}, {ci_upper:.4f}]")
+                    st.metric("Interval Width", f"{ci_upper - ci_lower:.4f}")
+                    st.metric("Sample Proportion (p̂)", f"{ci_sample_prop:.4f}")
+                
+                with col_result2:
+                    st.metric("Population Proportion (p)", f"{ci_pop_prop:.4f}")
+                    st.metric("Distance from p̂ to p", f"{abs(ci_sample_prop - ci_pop_prop):.4f}")
+                    if captures:
+                        st.success("✓ Interval captures p")
+                    else:
+                        st.error("✗ Interval does not capture p")
+                
+                st.write("---")
+                st.write("**Key Concepts:**")
+                
+                if captures:
+                    st.success(f"""
+                        🎯 **Success!** The confidence interval [{ci_lower:.3f}, {ci_upper:.3f}] constructed around 
+                        the sample proportion (p̂ = {ci_sample_prop:.3f}) successfully captures the true population 
+                        proportion (p = {ci_pop_prop:.3f}).
+                        """)
+                else:
+                    st.error(f"""
+                        ❌ **Miss!** The confidence interval [{ci_lower:.3f}, {ci_upper:.3f}] constructed around 
+                        the sample proportion (p̂ = {ci_sample_prop:.3f}) does NOT capture the true population 
+                        proportion (p = {ci_pop_prop:.3f}). This happens about {100-int(confidence_level*100)}% of the time.
+                        """)
+                
+                st.write(f"""
+                    - A **{int(confidence_level*100)}% confidence interval** means that if we took many samples and 
+                      constructed an interval around each sample proportion using the same margin of error, 
+                      approximately **{int(confidence_level*100)}%** of those intervals would capture the true population proportion.
+                    
+                    - The **margin of error** ({margin_of_error:.4f}) determines the width of the interval.
+                    
+                    - **Larger sample sizes** lead to smaller margins of error (narrower, more precise intervals).
+                    
+                    - **Higher confidence levels** lead to larger margins of error (wider intervals to increase 
+                      the chance of capturing the true parameter).
+                    
+                    - Try moving the slider or generating random samples to see which intervals capture the population 
+                      proportion and which don't!
+                    """)
+            
+    except Exception as e:
+        st.error(f"An error occurred while creating the visualization: {e}")
+
+with sim_tabs[5]:
+    st.subheader("Hypothesis Testing Explorer")
+    st.write("""
+        This interactive simulation helps you understand hypothesis testing by visualizing the relationship 
+        between test statistics, p-values, and significance levels. Adjust the sample statistic to see 
+        how the p-value changes and whether you would reject the null hypothesis.
+        """)
+    
+    # Put controls in an expander to make visualization more prominent
+    with st.expander("⚙️ Test Configuration & Controls", expanded=True):
+        # Test selection and parameters
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            test_type = st.selectbox(
+                "Select Test Type",
+                options=["Z-test (Proportion)", "Z-test (Mean)", "T-test (Mean)", "Chi-Square Test"],
+                key="ht_test_type"
+            )
+        
+        with col2:
+            alternative = st.selectbox(
+                "Alternative Hypothesis",
+                options=["Two-tailed (≠)", "Right-tailed (>)", "Left-tailed (<)"],
+                key="ht_alternative"
+            )
+        
+        with col3:
+            alpha = st.selectbox(
+                "Significance Level (α)",
+                options=[0.01, 0.05, 0.10],
+                index=1,
+                format_func=lambda x: f"{x}",
+                key="ht_alpha"
+            )
+        
+        st.write("---")
+        
+        # Test-specific parameters
+        if test_type == "Z-test (Proportion)":
+            null_value = st.number_input(
+                "Null Hypothesis Value (p₀)",
+                min_value=0.01,
+                max_value=0.99,
+                value=0.5,
+                step=0.01,
+                format="%.2f",
+                key="ht_null_prop"
+            )
+            sample_size_ht = st.number_input(
+                "Sample Size (n)",
+                min_value=10,
+                max_value=1000,
+                value=100,
+                step=10,
+                key="ht_n_prop"
+            )
+            se = np.sqrt(null_value * (1 - null_value) / sample_size_ht)
+            test_stat_min = null_value - 4 * se
+            test_stat_max = null_value + 4 * se
+            default_stat = null_value + 1.5 * se
+            x_label = "Sample Proportion (p̂)"
+            dist_name = "Normal Distribution"
+        elif test_type in ["Z-test (Mean)", "T-test (Mean)"]:  # Mean tests
+            null_value = st.number_input(
+                "Null Hypothesis Value (μ₀)",
+                min_value=-100.0,
+                max_value=100.0,
+                value=0.0,
+                step=0.1,
+                format="%.1f",
+                key="ht_null_mean"
+            )
+            
+            # Get sample size to calculate SE
+            sample_size_mean = st.number_input(
+                "Sample Size (n)",
+                min_value=2,
+                max_value=500,
+                value=30,
+                step=1,
+                key="ht_n_mean"
+            )
+            
+            sample_std = st.number_input(
+                "Sample Std Dev (s)" if test_type == "T-test (Mean)" else "Population Std Dev (σ)",
+                min_value=0.1,
+                max_value=50.0,
+                value=5.0,
+                step=0.1,
+                format="%.1f",
+                key="ht_std_mean"
+            )
+            
+            # Calculate SE automatically
+            se = sample_std / np.sqrt(sample_size_mean)
+            if test_type == "T-test (Mean)":
+                df_ht = sample_size_mean - 1
+            
+            test_stat_min = null_value - 4 * se
+            test_stat_max = null_value + 4 * se
+            default_stat = null_value + 1.5 * se
+            x_label = "Sample Mean (x̄)"
+            dist_name = "T-Distribution" if test_type == "T-test (Mean)" else "Normal Distribution"
+            
+            # Display computed SE
+            st.caption(f"Computed SE = {se:.4f}")
+        elif test_type == "Chi-Square Test":
+            df_chi = st.number_input(
+                "Degrees of Freedom",
+                min_value=1,
+                max_value=50,
+                value=5,
+                step=1,
+                key="ht_df_chi"
+            )
+            
+            null_value = df_chi  # For chi-square, center is at df
+            dist_name = "Chi-Square Distribution"
+            x_label = "χ² Statistic"
+            test_stat_min = 0.0
+            test_stat_max = float(df_chi * 4)
+            default_stat = float(df_chi * 1.5)
+    
+    # Sample statistic slider - separate section for better visibility
+    st.write("---")
+    st.subheader("📊 Adjust Sample Statistic")
+    test_statistic = st.slider(
+        x_label,
+        min_value=float(test_stat_min),
+        max_value=float(test_stat_max),
+        value=float(default_stat),
+        step=float((test_stat_max - test_stat_min)/200) if test_type != "Chi-Square Test" else 0.1,
+        format="%.3f" if test_type != "Chi-Square Test" else "%.2f",
+        key="ht_test_stat",
+        help="Move the slider to adjust the sample statistic and observe how the p-value and test decision change"
+    )
+    
+    # Visualization section - now more prominent above detailed results
+    st.write("---")
+    st.subheader("Visualization")
+    
+    try:
+        fig, ax = plt.subplots(figsize=(10, 4))
+        
+        # Generate distribution
+        if test_type == "Chi-Square Test":
+            x_vals = np.linspace(0.001, df_chi * 4, 1000)
+            y_vals = stats.chi2.pdf(x_vals, df_chi)
+            
+            # Calculate critical values and p-value for chi-square (always right-tailed)
+            crit_val = stats.chi2.ppf(1 - alpha, df_chi)
+            p_value = stats.chi2.sf(test_statistic, df_chi)
+            
+            # Plot distribution
+            ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f'χ²({df_chi})')
+            
+            # Shade significance region (right tail)
+            x_crit = x_vals[x_vals >= crit_val]
+            y_crit = stats.chi2.pdf(x_crit, df_chi)
+            ax.fill_between(x_crit, y_crit, alpha=0.3, color='red', label=f'Rejection Region (α={alpha})')
+            
+            # Shade p-value region
+            x_pval = x_vals[x_vals >= test_statistic]
+            y_pval = stats.chi2.pdf(x_pval, df_chi)
+            ax.fill_between(x_pval, y_pval, alpha=0.5, color='orange', label=f'P-value = {p_value:.4f}')
+            
+            # Mark test statistic
+            ax.axvline(test_statistic, color='green', linestyle='--', linewidth=2, 
+                      label=f'Test Statistic = {test_statistic:.2f}')
+            ax.axvline(crit_val, color='red', linestyle=':', linewidth=2,
+                      label=f'Critical Value = {crit_val:.2f}')
+            
+        else:
+            # For Z-test and T-test - use original scale
+            if test_type == "T-test (Mean)":
+                # Calculate on original scale
+                t_stat = (test_statistic - null_value) / se
+                
+                # Calculate critical values on standardized scale, then convert to original
+                if alternative == "Two-tailed (≠)":
+                    crit_lower_std = stats.t.ppf(alpha/2, df_ht)
+                    crit_upper_std = stats.t.ppf(1 - alpha/2, df_ht)
+                    crit_lower = null_value + crit_lower_std * se
+                    crit_upper = null_value + crit_upper_std * se
+                    p_value = 2 * min(stats.t.cdf(t_stat, df_ht), stats.t.sf(t_stat, df_ht))
+                elif alternative == "Right-tailed (>)":
+                    crit_upper_std = stats.t.ppf(1 - alpha, df_ht)
+                    crit_upper = null_value + crit_upper_std * se
+                    crit_lower = None
+                    p_value = stats.t.sf(t_stat, df_ht)
+                else:  # Left-tailed
+                    crit_lower_std = stats.t.ppf(alpha, df_ht)
+                    crit_lower = null_value + crit_lower_std * se
+                    crit_upper = None
+                    p_value = stats.t.cdf(t_stat, df_ht)
+                
+                # Generate x values on original scale
+                x_vals = np.linspace(null_value - 4*se, null_value + 4*se, 1000)
+                # Calculate y values using scaled t-distribution
+                y_vals = stats.t.pdf((x_vals - null_value) / se, df_ht) / se
+                
+                ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f't-distribution (df={df_ht})')
+                test_stat_plot = test_statistic  # Original scale for plotting
+                std_test_stat = t_stat  # Standardized for display
+                
+            else:  # Z-tests
+                z_stat = (test_statistic - null_value) / se
+                
+                # Calculate critical values on standardized scale, then convert to original
+                if alternative == "Two-tailed (≠)":
+                    crit_lower_std = stats.norm.ppf(alpha/2)
+                    crit_upper_std = stats.norm.ppf(1 - alpha/2)
+                    crit_lower = null_value + crit_lower_std * se
+                    crit_upper = null_value + crit_upper_std * se
+                    p_value = 2 * min(stats.norm.cdf(z_stat), stats.norm.sf(z_stat))
+                elif alternative == "Right-tailed (>)":
+                    crit_upper_std = stats.norm.ppf(1 - alpha)
+                    crit_upper = null_value + crit_upper_std * se
+                    crit_lower = None
+                    p_value = stats.norm.sf(z_stat)
+                else:  # Left-tailed
+                    crit_lower_std = stats.norm.ppf(alpha)
+                    crit_lower = null_value + crit_lower_std * se
+                    crit_upper = None
+                    p_value = stats.norm.cdf(z_stat)
+                
+                # Generate x values on original scale
+                x_vals = np.linspace(null_value - 4*se, null_value + 4*se, 1000)
+                # Calculate y values using scaled normal distribution
+                y_vals = stats.norm.pdf(x_vals, loc=null_value, scale=se)
+                
+                ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f'Normal Distribution')
+                test_stat_plot = test_statistic  # Original scale for plotting
+                std_test_stat = z_stat  # Standardized for display
+            
+            # Shade significance regions
+            if alternative == "Two-tailed (≠)":
+                x_left = x_vals[x_vals <= crit_lower]
+                if test_type == "T-test (Mean)":
+                    y_left = stats.t.pdf((x_left - null_value) / se, df_ht) / se
+                else:
+                    y_left = stats.norm.pdf(x_left, loc=null_value, scale=se)
+                ax.fill_between(x_left, y_left, alpha=0.3, color='red', label=f'Rejection Region (α={alpha})')
+                
+                x_right = x_vals[x_vals >= crit_upper]
+                if test_type == "T-test (Mean)":
+                    y_right = stats.t.pdf((x_right - null_value) / se, df_ht) / se
+                else:
+                    y_right = stats.norm.pdf(x_right, loc=null_value, scale=se)
+                ax.fill_between(x_right, y_right, alpha=0.3, color='red')
+                
+            elif alternative == "Right-tailed (>)":
+                x_right = x_vals[x_vals >= crit_upper]
+                if test_type == "T-test (Mean)":
+                    y_right = stats.t.pdf((x_right - null_value) / se, df_ht) / se
+                else:
+                    y_right = stats.norm.pdf(x_right, loc=null_value, scale=se)
+                ax.fill_between(x_right, y_right, alpha=0.3, color='red', label=f'Rejection Region (α={alpha})')
+                
+            else:  # Left-tailed
+                x_left = x_vals[x_vals <= crit_lower]
+                if test_type == "T-test (Mean)":
+                    y_left = stats.t.pdf((x_left - null_value) / se, df_ht) / se
+                else:
+                    y_left = stats.norm.pdf(x_left, loc=null_value, scale=se)
+                ax.fill_between(x_left, y_left, alpha=0.3, color='red', label=f'Rejection Region (α={alpha})')
+            
+            # Shade p-value region
+            if alternative == "Two-tailed (≠)":
+                if test_stat_plot >= null_value:
+                    x_pval = x_vals[x_vals >= test_stat_plot]
+                    x_pval_mirror = x_vals[x_vals <= (null_value - (test_stat_plot - null_value))]
+                else:
+                    x_pval = x_vals[x_vals <= test_stat_plot]
+                    x_pval_mirror = x_vals[x_vals >= (null_value + (null_value - test_stat_plot))]
+                
+                if test_type == "T-test (Mean)":
+                    y_pval = stats.t.pdf((x_pval - null_value) / se, df_ht) / se
+                    y_pval_mirror = stats.t.pdf((x_pval_mirror - null_value) / se, df_ht) / se
+                else:
+                    y_pval = stats.norm.pdf(x_pval, loc=null_value, scale=se)
+                    y_pval_mirror = stats.norm.pdf(x_pval_mirror, loc=null_value, scale=se)
+                
+                ax.fill_between(x_pval, y_pval, alpha=0.5, color='orange', label=f'P-value = {p_value:.4f}')
+                ax.fill_between(x_pval_mirror, y_pval_mirror, alpha=0.5, color='orange')
+                
+            elif alternative == "Right-tailed (>)":
+                x_pval = x_vals[x_vals >= test_stat_plot]
+                if test_type == "T-test (Mean)":
+                    y_pval = stats.t.pdf((x_pval - null_value) / se, df_ht) / se
+                else:
+                    y_pval = stats.norm.pdf(x_pval, loc=null_value, scale=se)
+                ax.fill_between(x_pval, y_pval, alpha=0.5, color='orange', label=f'P-value = {p_value:.4f}')
+                
+            else:  # Left-tailed
+                x_pval = x_vals[x_vals <= test_stat_plot]
+                if test_type == "T-test (Mean)":
+                    y_pval = stats.t.pdf((x_pval - null_value) / se, df_ht) / se
+                else:
+                    y_pval = stats.norm.pdf(x_pval, loc=null_value, scale=se)
+                ax.fill_between(x_pval, y_pval, alpha=0.5, color='orange', label=f'P-value = {p_value:.4f}')
+            
+            # Mark test statistic and critical values
+            if test_type == "Chi-Square Test":
+                stat_label = f'Test Statistic = {test_stat_plot:.3f}'
+            else:
+                # Show standardized statistic for Z and T tests
+                stat_label = f'Test Statistic = {std_test_stat:.3f}'
+            ax.axvline(test_stat_plot, color='green', linestyle='--', linewidth=2,
+                      label=stat_label)
+            
+            if alternative == "Two-tailed (≠)":
+                ax.axvline(crit_lower, color='red', linestyle=':', linewidth=2,
+                          label=f'Critical Values = {crit_lower:.4f}, {crit_upper:.4f}')
+                ax.axvline(crit_upper, color='red', linestyle=':', linewidth=2)
+            elif alternative == "Right-tailed (>)":
+                ax.axvline(crit_upper, color='red', linestyle=':', linewidth=2,
+                          label=f'Critical Value = {crit_upper:.4f}')
+            else:  # Left-tailed
+                ax.axvline(crit_lower, color='red', linestyle=':', linewidth=2,
+                          label=f'Critical Value = {crit_lower:.4f}')
+        
+        # Formatting
+        if test_type == "Chi-Square Test":
+            x_label = 'χ² Statistic'
+        elif test_type == "Z-test (Proportion)":
+            x_label = 'Sampling Distribution of Sample Proportion'
+        else:  # Mean tests
+            x_label = 'Sampling Distribution of Sample Mean'
+        ax.set_xlabel(x_label, 
+                     fontsize=12, fontweight='bold')
+        ax.set_ylabel('Probability Density', fontsize=12, fontweight='bold')
+        
+        # Add null value to x-axis tick marks for non-Chi-Square tests
+        if test_type != "Chi-Square Test":
+            current_ticks = list(ax.get_xticks())
+            # Add the null value if it's not already very close to an existing tick
+            if not any(abs(tick - null_value) < (test_stat_max - test_stat_min) * 0.05 for tick in current_ticks):
+                current_ticks.append(null_value)
+                current_ticks.sort()
+            ax.set_xticks(current_ticks)
+        
+        # Determine decision
+        reject = p_value <= alpha
+        
+        ax.legend(fontsize=10, loc='upper right')
+        ax.grid(True, alpha=0.3)
+        
+        st.pyplot(fig)
+        plt.close(fig)
+        
+        # Display detailed results below
+        st.write("---")
+        st.subheader("Detailed Test Results")
+        
+        col_res1, col_res2, col_res3 = st.columns(3)
+        
+        with col_res1:
+            st.metric("Test Statistic", f"{test_statistic:.4f}" if test_type != "Chi-Square Test" else f"{test_statistic:.2f}")
+            if test_type != "Chi-Square Test":
+                std_stat = (test_statistic - null_value) / se
+                st.metric("Standardized Statistic", f"{std_stat:.3f}")
+        
+        with col_res2:
+            st.metric("P-value", f"{p_value:.4f}")
+            st.metric("Significance Level (α)", f"{alpha}")
+        
+        with col_res3:
+            if reject:
+                st.error("**Decision: REJECT H₀**")
+            else:
+                st.success("**Decision: FAIL TO REJECT H₀**")
+        
+        st.write("---")
+        st.write("**Hypotheses:**")
+        
+        if test_type == "Z-test (Proportion)":
+            h0_text = f"H₀: p = {null_value}"
+            if alternative == "Two-tailed (≠)":
+                ha_text = f"Hₐ: p ≠ {null_value}"
+            elif alternative == "Right-tailed (>)":
+                ha_text = f"Hₐ: p > {null_value}"
+            else:
+                ha_text = f"Hₐ: p < {null_value}"
+        elif test_type == "Chi-Square Test":
+            h0_text = "H₀: Variables are independent (or goodness of fit)"
+            ha_text = "Hₐ: Variables are not independent (or poor fit)"
+        else:
+            h0_text = f"H₀: μ = {null_value}"
+            if alternative == "Two-tailed (≠)":
+                ha_text = f"Hₐ: μ ≠ {null_value}"
+            elif alternative == "Right-tailed (>)":
+                ha_text = f"Hₐ: μ > {null_value}"
+            else:
+                ha_text = f"Hₐ: μ < {null_value}"
+        
+        st.write(f"- **Null Hypothesis**: {h0_text}")
+        st.write(f"- **Alternative Hypothesis**: {ha_text}")
+        
+        st.write("---")
+        st.write("**Interpretation:**")
+        st.write(f"""
+            - The **red shaded region(s)** represent the rejection region (significance level α = {alpha})
+            - The **orange shaded region(s)** represent the p-value area
+            - The **green vertical line** shows your test statistic
+            - The **red dotted line(s)** show the critical value(s)
+            """)
+        
+        if reject:
+            st.error(f"""
+                🔴 **Reject the null hypothesis**: The p-value ({p_value:.4f}) is less than or equal to the significance 
+                level ({alpha}), indicating that the observed result is statistically significant. The test 
+                statistic falls in the rejection region.
+                """)
+        else:
+            st.success(f"""
+                🟢 **Fail to reject the null hypothesis**: The p-value ({p_value:.4f}) is strictly greater 
+                to the significance level ({alpha}), indicating that we do not have sufficient evidence to reject 
+                the null hypothesis. The test statistic does not fall in the rejection region.
+                """)
+        
+        st.write("""
+            **Key Concepts:**
+            - Move the slider to see how different test statistics affect the p-value
+            - The p-value represents the probability of observing a test statistic as extreme or more extreme 
+              than the observed value, assuming the null hypothesis is true
+            - When p-value ≤ α, we reject the null hypothesis
+            - When p-value > α, we fail to reject the null hypothesis
+            """)
+        
+    except Exception as e:
+        st.error(f"An error occurred: {e}")
+
+with sim_tabs[6]:
+    st.subheader("Two Proportions")
+    st.write("""
+        This simulation demonstrates the sampling distribution of the difference between two sample proportions.
+        It helps you understand how differences between two groups behave under repeated sampling and visualizes
+        the Central Limit Theorem for the difference between two proportions.
+        """)
+    
+    # Create input columns
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        p1_pop = st.number_input(
+            "Population 1 Proportion (p₁)", 
+            min_value=0.01, 
+            max_value=0.99, 
+            value=0.6, 
+            step=0.01,
+            format="%.3f",
+            help="The true proportion in population 1",
+            key="diff_prop_p1"
+        )
+        n1_size = st.number_input(
+            "Sample Size from Population 1 (n₁)", 
+            min_value=10, 
+            max_value=1000, 
+            value=100, 
+            step=10,
+            help="Size of each sample from population 1",
+            key="diff_prop_n1"
+        )
+    
+    with col2:
+        p2_pop = st.number_input(
+            "Population 2 Proportion (p₂)", 
+            min_value=0.01, 
+            max_value=0.99, 
+            value=0.4, 
+            step=0.01,
+            format="%.3f",
+            help="The true proportion in population 2",
+            key="diff_prop_p2"
+        )
+        n2_size = st.number_input(
+            "Sample Size from Population 2 (n₂)", 
+            min_value=10, 
+            max_value=1000, 
+            value=100, 
+            step=10,
+            help="Size of each sample from population 2",
+            key="diff_prop_n2"
+        )
+    
+    with col3:
+        num_samples_diff_prop = st.number_input(
+            "Number of Samples", 
+            min_value=100, 
+            max_value=SIMULATION_MAX_REPLICATES, 
+            value=1000, 
+            step=100,
+            help="Number of pairs of samples to generate",
+            key="diff_prop_num_samples"
+        )
+    
+    if st.button("Run Simulation", key="run_diff_prop_sim"):
+        try:
+            # Create placeholders for progressive updates
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            plot_placeholder = st.empty()
+            stats_placeholder = st.empty()
+            
+            true_diff = p1_pop - p2_pop
+            theoretical_std = np.sqrt(p1_pop * (1 - p1_pop) / n1_size + p2_pop * (1 - p2_pop) / n2_size)
+            
+            # Differences are binned as they arrive against edges fixed by the theoretical SE
+            edges = theoretical_bin_edges(true_diff, theoretical_std, 50, lower=-1, upper=1)
+            differences = HistogramAccumulator(edges)
+            frames = []
+            
+            # Each sample proportion is drawn as a single binomial count
+            def draw_differences(chunk_rng, size):
+                return (draw_sample_proportions(chunk_rng, p1_pop, n1_size, size)
+                        - draw_sample_proportions(chunk_rng, p2_pop, n2_size, size))
+            
+            for done, is_frame, batch_differences in monte_carlo_chunks(draw_differences, num_samples_diff_prop):
+                # Update progress
+                progress = done / num_samples_diff_prop
+                progress_bar.progress(progress)
+                status_text.text(f"Generating samples... {int(progress * 100)}%")
+                
+                differences.add(batch_differences)
+                
+                # Record an animation frame at each frame point
+                if is_frame:
+                    frames.append({
+                        'label': f"{differences.count:,} samples",
+                        'counts': differences.counts.copy(),
+                        'lines': [(differences.mean, 'orange', 'dot', f'Mean of Differences = {differences.mean:.3f}')],
+                    })
+            
+            x_range = np.linspace(edges[0], edges[-1], 200)
+            normal_curve = stats.norm.pdf(x_range, loc=true_diff, scale=theoretical_std)
+            fig = histogram_animation_figure(
+                edges, frames,
+                title='Sampling Distribution of Difference Between Two Proportions',
+                xlabel='Difference in Sample Proportions (p̂₁ - p̂₂)', bar_name='Sample Differences',
+                static_curves=[(x_range, normal_curve, 'red', f'Normal(μ={true_diff:.3f}, σ={theoretical_std:.3f})')],
+                static_lines=[(true_diff, 'darkgreen', 'dash', f'True Difference (p₁ - p₂ = {true_diff:.3f})')]
+            )
+            with plot_placeholder.container():
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                if differences.outside:
+                    st.caption(f"{differences.outside:,} differences fell outside the plotted range "
+                               f"(±{SIMULATION_RANGE_SES} standard errors).")
+            
+            # Clear progress indicators
+            progress_bar.empty()
+            status_text.empty()
+            
+            # Display final statistics
+            with stats_placeholder.container():
+                st.write("---")
+                st.subheader("Summary Statistics")
+                
+                col_a, col_b, col_c = st.columns(3)
+                
+                with col_a:
+                    st.metric("Population 1 Proportion (p₁)", f"{p1_pop:.4f}")
+                    st.metric("Population 2 Proportion (p₂)", f"{p2_pop:.4f}")
+                    st.metric("True Difference (p₁ - p₂)", f"{p1_pop - p2_pop:.4f}")
+                
+                with col_b:
+                    mean_diff = differences.mean
+                    std_diff = differences.std(ddof=1)
+                    st.metric("Mean of Sample Differences", f"{mean_diff:.4f}")
+                    st.metric("Std Dev of Sample Differences", f"{std_diff:.4f}")
+                    st.metric("Number of Samples", f"{differences.count}")
+                
+                with col_c:
+                    theoretical_mean = p1_pop - p2_pop
+                    theoretical_std = np.sqrt(p1_pop * (1 - p1_pop) / n1_size + p2_pop * (1 - p2_pop) / n2_size)
+                    st.metric("Theoretical Mean", f"{theoretical_mean:.4f}")
+                    st.metric("Theoretical Std Dev", f"{theoretical_std:.4f}")
+                
+                st.write("---")
+                st.write("**Key Observations:**")
+                st.write(f"- The mean of sample differences ({mean_diff:.4f}) should be close to the true difference ({theoretical_mean:.4f})")
+                st.write(f"- The standard deviation is approximately {theoretical_std:.4f}")
+                st.write(f"- The distribution is approximately normal by the Central Limit Theorem")
+                st.write(f"- Larger sample sizes lead to a narrower (more precise) distribution")
+                
+                # Check conditions for normality
+                n1p1 = n1_size * p1_pop
+                n1q1 = n1_size * (1 - p1_pop)
+                n2p2 = n2_size * p2_pop
+                n2q2 = n2_size * (1 - p2_pop)
+                
+                st.write("**Conditions for Normal Approximation:**")
+                if n1p1 >= 10 and n1q1 >= 10 and n2p2 >= 10 and n2q2 >= 10:
+                    st.success(f"✓ All conditions met: n₁p₁={n1p1:.1f}, n₁(1-p₁)={n1q1:.1f}, n₂p₂={n2p2:.1f}, n₂(1-p₂)={n2q2:.1f} (all ≥ 10)")
+                else:
+                    st.warning(f"⚠ Some conditions not met: n₁p₁={n1p1:.1f}, n₁(1-p₁)={n1q1:.1f}, n₂p₂={n2p2:.1f}, n₂(1-p₂)={n2q2:.1f}")
+            
+        except Exception as e:
+            st.error(f"An error occurred while running the simulation: {e}")
+
+with sim_tabs[7]:
+    st.subheader("Two Means")
+    st.write("""
+        This simulation demonstrates the sampling distribution of the difference between two sample means
+        using **sample standard deviations** and the **t-distribution**. This reflects real-world scenarios
+        where population standard deviations are unknown and must be estimated from the samples.
+        """)
+    
+    # Create input columns
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        mu1_pop = st.number_input(
+            "Population 1 Mean (μ₁)", 
+            min_value=-100.0, 
+            max_value=100.0, 
+            value=50.0, 
+            step=1.0,
+            format="%.2f",
+            help="The true mean of population 1",
+            key="diff_mean_mu1"
+        )
+        sigma1_pop = st.number_input(
+            "Population 1 Std Dev (σ₁)", 
+            min_value=0.1, 
+            max_value=100.0, 
+            value=10.0, 
+            step=0.5,
+            format="%.2f",
+            help="The true standard deviation of population 1 (used to generate samples)",
+            key="diff_mean_sigma1"
+        )
+        n1_mean_size = st.number_input(
+            "Sample Size from Population 1 (n₁)", 
+            min_value=5, 
+            max_value=500, 
+            value=30, 
+            step=5,
+            help="Size of each sample from population 1",
+            key="diff_mean_n1"
+        )
+    
+    with col2:
+        mu2_pop = st.number_input(
+            "Population 2 Mean (μ₂)", 
+            min_value=-100.0, 
+            max_value=100.0, 
+            value=45.0, 
+            step=1.0,
+            format="%.2f",
+            help="The true mean of population 2",
+            key="diff_mean_mu2"
+        )
+        sigma2_pop = st.number_input(
+            "Population 2 Std Dev (σ₂)", 
+            min_value=0.1, 
+            max_value=100.0, 
+            value=12.0, 
+            step=0.5,
+            format="%.2f",
+            help="The true standard deviation of population 2 (used to generate samples)",
+            key="diff_mean_sigma2"
+        )
+        n2_mean_size = st.number_input(
+            "Sample Size from Population 2 (n₂)", 
+            min_value=5, 
+            max_value=500, 
+            value=30, 
+            step=5,
+            help="Size of each sample from population 2",
+            key="diff_mean_n2"
+        )
+    
+    with col3:
+        num_samples_diff_mean = st.number_input(
+            "Number of Samples", 
+            min_value=100, 
+            max_value=SIMULATION_MAX_REPLICATES, 
+            value=1000, 
+            step=100,
+            help="Number of pairs of samples to generate",
+            key="diff_mean_num_samples"
+        )
+        equal_vars = st.checkbox(
+            "Assume Equal Variances (Pooled)",
+            value=True,
+            help="If checked, uses pooled standard deviation; otherwise uses Welch's approximation",
+            key="diff_mean_equal_vars"
+        )
+    
+    if st.button("Run Simulation", key="run_diff_mean_sim"):
+        try:
+            # Create placeholders for progressive updates
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            plot_placeholder = st.empty()
+            stats_placeholder = st.empty()
+            
+            true_diff = mu1_pop - mu2_pop
+            theoretical_se = np.sqrt(sigma1_pop**2 / n1_mean_size + sigma2_pop**2 / n2_mean_size)
+            
+            # Differences are binned as they arrive against edges fixed by the theoretical SE;
+            # only running sums of the sample standard deviations are needed
+            edges = theoretical_bin_edges(true_diff, theoretical_se, 50)
+            x_range = np.linspace(edges[0], edges[-1], 200)
+            differences = HistogramAccumulator(edges)
+            s1_total = 0.0
+            s2_total = 0.0
+            frames = []
+            
+            # For normal populations each sample reduces to its mean and standard deviation
+            def draw_differences(chunk_rng, size):
+                mean1, s1 = draw_normal_mean_and_sd(chunk_rng, mu1_pop, sigma1_pop, n1_mean_size, size)
+                mean2, s2 = draw_normal_mean_and_sd(chunk_rng, mu2_pop, sigma2_pop, n2_mean_size, size)
+                return mean1 - mean2, s1, s2
+            
+            for done, is_frame, (batch_differences, s1_batch, s2_batch) in monte_carlo_chunks(
+                    draw_differences, num_samples_diff_mean):
+                # Update progress
+                progress = done / num_samples_diff_mean
+                progress_bar.progress(progress)
+                status_text.text(f"Generating samples... {int(progress * 100)}%")
+                
+                differences.add(batch_differences)
+                s1_total += float(s1_batch.sum())
+                s2_total += float(s2_batch.sum())
+                
+                # Record an animation frame at each frame point
+                if not is_frame:
+                    continue
+                
+                # Calculate average sample standard deviations
+                avg_s1 = s1_total / differences.count
+                avg_s2 = s2_total / differences.count
+                
+                # Calculate standard error using sample std devs
+                if equal_vars:
+                    # Pooled standard deviation approach
+                    pooled_var = ((n1_mean_size - 1) * avg_s1**2 + (n2_mean_size - 1) * avg_s2**2) / (n1_mean_size + n2_mean_size - 2)
+                    se = np.sqrt(pooled_var * (1/n1_mean_size + 1/n2_mean_size))
+                    df = n1_mean_size + n2_mean_size - 2
+                else:
+                    # Welch's approach
+                    se = np.sqrt(avg_s1**2 / n1_mean_size + avg_s2**2 / n2_mean_size)
+                    df = (avg_s1**2 / n1_mean_size + avg_s2**2 / n2_mean_size)**2 / \
+                         ((avg_s1**2 / n1_mean_size)**2 / (n1_mean_size - 1) + \
+                          (avg_s2**2 / n2_mean_size)**2 / (n2_mean_size - 1))
+                
+                # t-distribution curve for this frame
+                t_curve = stats.t.pdf((x_range - true_diff) / se, df) / se
+                frames.append({
+                    'label': f"{differences.count:,} samples",
+                    'counts': differences.counts.copy(),
+                    'curves': [(x_range, t_curve, 'red', f't-distribution (df≈{df:.1f}, SE≈{se:.2f})')],
+                    'lines': [(differences.mean, 'orange', 'dot', f'Mean of Differences = {differences.mean:.2f}')],
+                })
+            
+            fig = histogram_animation_figure(
+                edges, frames,
+                title='Sampling Distribution of Difference Between Two Means (Using t-distribution)',
+                xlabel='Difference in Sample Means (x̄₁ - x̄₂)', bar_name='Sample Differences',
+                static_lines=[(true_diff, 'darkgreen', 'dash', f'True Difference (μ₁ - μ₂ = {true_diff:.2f})')]
+            )
+            with plot_placeholder.container():
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                if differences.outside:
+                    st.caption(f"{differences.outside:,} differences fell outside the plotted range "
+                               f"(±{SIMULATION_RANGE_SES} standard errors).")
+            
+            # Clear progress indicators
+            progress_bar.empty()
+            status_text.empty()
+            
+            # Calculate final statistics
+            mean_diff = differences.mean
+            std_diff = differences.std(ddof=1)
+            avg_s1 = s1_total / differences.count
+            avg_s2 = s2_total / differences.count
+            
+            # Calculate standard error and degrees of freedom
+            if equal_vars:
+                pooled_var = ((n1_mean_size - 1) * avg_s1**2 + (n2_mean_size - 1) * avg_s2**2) / (n1_mean_size + n2_mean_size - 2)
+                se_final = np.sqrt(pooled_var * (1/n1_mean_size + 1/n2_mean_size))
+                df_final = n1_mean_size + n2_mean_size - 2
+                pooled_s = np.sqrt(pooled_var)
+            else:
+                se_final = np.sqrt(avg_s1**2 / n1_mean_size + avg_s2**2 / n2_mean_size)
+                df_final = (avg_s1**2 / n1_mean_size + avg_s2**2 / n2_mean_size)**2 / \
+                           ((avg_s1**2 / n1_mean_size)**2 / (n1_mean_size - 1) + \
+                            (avg_s2**2 / n2_mean_size)**2 / (n2_mean_size - 1))
+            
+            # Display final statistics
+            with stats_placeholder.container():
+                st.write("---")
+                st.subheader("Summary Statistics")
+                
+                col_a, col_b, col_c = st.columns(3)
+                
+                with col_a:
+                    st.metric("Population 1 Mean (μ₁)", f"{mu1_pop:.2f}")
+                    st.metric("Population 2 Mean (μ₂)", f"{mu2_pop:.2f}")
+                    st.metric("True Difference (μ₁ - μ₂)", f"{mu1_pop - mu2_pop:.2f}")
+                    st.metric("Number of Samples", f"{differences.count}")
+                
+                with col_b:
+                    st.metric("Mean of Sample Differences", f"{mean_diff:.2f}")
+                    st.metric("Std Dev of Sample Differences", f"{std_diff:.2f}")
+                    st.metric("Average Sample s₁", f"{avg_s1:.2f}")
+                    st.metric("Average Sample s₂", f"{avg_s2:.2f}")
+                
+                with col_c:
+                    st.metric("Standard Error (SE)", f"{se_final:.2f}")
+                    st.metric("Degrees of Freedom", f"{df_final:.1f}")
+                    if equal_vars:
+                        st.metric("Pooled Std Dev (sp)", f"{pooled_s:.2f}")
+                    else:
+                        st.metric("Method", "Welch's")
+                
+                st.write("---")
+                st.write("**Key Observations:**")
+                st.write(f"- The mean of sample differences ({mean_diff:.2f}) should be close to the true difference ({mu1_pop - mu2_pop:.2f})")
+                st.write(f"- Using **sample standard deviations** (s₁ and s₂) to estimate the standard error")
+                st.write(f"- The **t-distribution** with df ≈ {df_final:.1f} is used instead of the normal distribution")
+                st.write(f"- Standard Error: SE ≈ {se_final:.2f}")
+                
+                if equal_vars:
+                    st.write(f"- **Pooled approach**: Assumes equal population variances, df = n₁ + n₂ - 2 = {df_final:.0f}")
+                    st.write(f"- Pooled standard deviation: sp = {pooled_s:.2f}")
+                    st.write(f"- SE = sp × √(1/n₁ + 1/n₂)")
+                else:
+                    st.write(f"- **Welch's approach**: Does not assume equal variances")
+                    st.write(f"- Degrees of freedom calculated using Welch-Satterthwaite equation: df ≈ {df_final:.1f}")
+                    st.write(f"- SE = √(s₁²/n₁ + s₂²/n₂)")
+                
+                st.write("**Note:** In practice, population standard deviations are unknown, so we use sample")
+                st.write("standard deviations and the t-distribution, which accounts for the additional uncertainty.")
+            
+        except Exception as e:
+            st.error(f"An error occurred while running the simulation: {e}")
+
+with sim_tabs[8]:
+    st.subheader("t-Distribution vs Standard Normal Distribution")
+    st.write("""
+        This simulation illustrates the key differences between the **t-distribution** and the **Standard Normal (Z) distribution**.
+        The t-distribution is used when the population standard deviation is unknown and must be estimated from the sample.
+        It has heavier tails than the normal distribution, especially with small sample sizes.
+        """)
+    
+    # Create input columns
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        df_value = st.slider(
+            "Degrees of Freedom (df)", 
+            min_value=1, 
+            max_value=100, 
+            value=5,
+            help="Lower degrees of freedom → heavier tails and more spread"
+        )
+    
+    with col2:
+        show_multiple = st.checkbox(
+            "Show Multiple df Values",
+            value=False,
+            help="Display multiple t-distributions with different degrees of freedom"
+        )
+    
+    try:
+        # Generate x values for plotting
+        x = np.linspace(-5, 5, 1000)
+        
+        # Calculate distributions
+        standard_normal = stats.norm.pdf(x, 0, 1)
+        t_dist = stats.t.pdf(x, df_value)
+        
+        # Create the plot
+        fig, ax = plt.subplots(figsize=(12, 7))
+        
+        # Plot Standard Normal
+        ax.plot(x, standard_normal, 'b-', linewidth=2.5, label='Standard Normal (Z)', alpha=0.8)
+        
+        if show_multiple:
+            # Show multiple t-distributions
+            df_values = [1, 3, 5, 10, 30]
+            colors = ['red', 'orange', 'green', 'purple', 'brown']
+            
+            for df, color in zip(df_values, colors):
+                t_curve = stats.t.pdf(x, df)
+                ax.plot(x, t_curve, color=color, linewidth=2, 
+                       label=f't-distribution (df={df})', alpha=0.7)
+        else:
+            # Show single t-distribution
+            ax.plot(x, t_dist, 'r-', linewidth=2.5, 
+                   label=f't-distribution (df={df_value})', alpha=0.8)
+        
+        # Add shaded regions to highlight tail differences
+        if not show_multiple:
+            # Shade the tails beyond ±2
+            tail_mask_right = x >= 2
+            tail_mask_left = x <= -2
+            
+            ax.fill_between(x[tail_mask_right], 0, standard_normal[tail_mask_right], 
+                           alpha=0.2, color='blue', label='Normal tail area')
+            ax.fill_between(x[tail_mask_right], 0, t_dist[tail_mask_right], 
+                           alpha=0.2, color='red', label='t-distribution tail area')
+            
+            ax.fill_between(x[tail_mask_left], 0, standard_normal[tail_mask_left], 
+                           alpha=0.2, color='blue')
+            ax.fill_between(x[tail_mask_left], 0, t_dist[tail_mask_left], 
+                           alpha=0.2, color='red')
+        
+        # Styling
+        ax.set_xlabel('Value', fontsize=12)
+        ax.set_ylabel('Probability Density', fontsize=12)
+        ax.set_title('Comparison: t-Distribution vs Standard Normal Distribution', 
+                    fontsize=14, fontweight='bold')
+        ax.legend(fontsize=10, loc='upper right')
+        ax.grid(True, alpha=0.3)
+        ax.axhline(y=0, color='black', linewidth=0.5)
+        ax.axvline(x=0, color='gray', linestyle='--', linewidth=1, alpha=0.5)
+        
+        st.pyplot(fig)
+        
+        # Add comprehensive accessibility description
+        if show_multiple:
+            st.caption(f"""
+                **Accessibility Description:** Comparison plot showing Standard Normal distribution (blue curve) 
+                overlaid with multiple t-distributions at different degrees of freedom. 
+                The t-distributions shown have df values of 1, 3, 5, 10, and 30 in colors red, orange, green, 
+                purple, and brown respectively. As degrees of freedom increase, the t-distribution curves 
+                converge toward the Standard Normal distribution. Distributions with lower df show heavier 
+                tails and flatter peaks compared to the Standard Normal.
+                """)
+        else:
+            st.caption(f"""
+                **Accessibility Description:** Comparison plot showing Standard Normal distribution (blue curve) 
+                overlaid with t-distribution having {df_value} degrees of freedom (red curve). 
+                Shaded regions highlight differences in tail areas beyond ±2 standard deviations. 
+                Blue shaded areas show Standard Normal tail probabilities, red shaded areas show 
+                t-distribution tail probabilities. The t-distribution with df={df_value} has 
+                {'heavier' if df_value < 30 else 'similar'} tails compared to the Standard Normal, 
+                meaning extreme values are {'more' if df_value < 30 else 'similarly'} likely.
+                """)
+        plt.close()
+        
+        # Add interpretation section
+        st.write("---")
+        st.subheader("Key Differences")
+        
+        col_a, col_b = st.columns(2)
+        
+        with col_a:
+            st.write("**Standard Normal (Z) Distribution:**")
+            st.write("- Mean = 0, Standard Deviation = 1")
+            st.write("- Used when σ (population std dev) is **known**")
+            st.write("- Fixed shape - always the same")
+            st.write("- Lighter tails")
+            st.write("- Critical values: z* = 1.96 (95% confidence)")
+            
+        with col_b:
+            st.write(f"**t-Distribution (df = {df_value}):**")
+            st.write("- Mean = 0 (when df > 1)")
+            st.write("- Used when σ is **unknown** (estimated by s)")
+            st.write("- Shape depends on degrees of freedom")
+            st.write("- Heavier tails (especially with small df)")
+            t_critical = stats.t.ppf(0.975, df_value)
+            st.write(f"- Critical values: t* = {t_critical:.3f} (95% confidence)")
+        
+        st.write("---")
+        
+        # Calculate and display tail probabilities
+        st.subheader("Tail Probability Comparison")
+        
+        # Calculate probabilities beyond certain values
+        test_values = [1.5, 2.0, 2.5, 3.0]
+        
+        comparison_data = {
+            'Value': test_values,
+            'P(Z > value)': [1 - stats.norm.cdf(v) for v in test_values],
+            f'P(t > value) [df={df_value}]': [1 - stats.t.cdf(v, df_value) for v in test_values],
+        }
+        
+        comparison_df = pd.DataFrame(comparison_data)
+        comparison_df['P(Z > value)'] = comparison_df['P(Z > value)'].map('{:.4f}'.format)
+        comparison_df[f'P(t > value) [df={df_value}]'] = comparison_df[f'P(t > value) [df={df_value}]'].map('{:.4f}'.format)
+        
+        st.dataframe(comparison_df, use_container_width=True)
+        
+        st.write("""
+            **Observations:**
+            - The t-distribution has **heavier tails**, meaning extreme values are more likely
+            - As degrees of freedom increase, the t-distribution approaches the standard normal
+            - With small sample sizes (low df), using the t-distribution is more conservative
+            - When df ≥ 30, the t-distribution is very similar to the standard normal
+            """)
+        
+        # Interactive section: Critical values
+        st.write("---")
+        st.subheader("Critical Values Comparison")
+        
+        confidence_level = st.slider(
+            "Confidence Level (%)", 
+            min_value=80, 
+            max_value=99, 
+            value=95,
+            help="Select the confidence level to compare critical values"
+        )
+        
+        alpha = 1 - confidence_level/100
+        
+        # Calculate critical values
+        z_critical = stats.norm.ppf(1 - alpha/2)
+        t_critical = stats.t.ppf(1 - alpha/2, df_value)
+        
+        col_c, col_d, col_e = st.columns(3)
+        
+        with col_c:
+            st.metric("Confidence Level", f"{confidence_level}%")
+        
+        with col_d:
+            st.metric("z* (Standard Normal)", f"{z_critical:.4f}")
+        
+        with col_e:
+            st.metric(f"t* (df={df_value})", f"{t_critical:.4f}")
+            difference = t_critical - z_critical
+            st.metric("Difference (t* - z*)", f"{difference:.4f}")
+        
+        st.write(f"""
+            - For a {confidence_level}% confidence interval, the t* critical value ({t_critical:.4f}) is 
+            **{'larger' if t_critical > z_critical else 'smaller'}** than the z* critical value ({z_critical:.4f})
+            - This results in **wider confidence intervals** when using the t-distribution
+            - This accounts for the additional uncertainty from estimating σ with the sample standard deviation
+            """)
+        
+    except Exception as e:
+        st.error(f"An error occurred while generating the comparison: {e}")
+
+with sim_tabs[9]:
+    st.subheader("F-Statistic Explorer: Understanding Within-Group and Between-Group Variation")
+    st.write("""
+        This side-by-side simulation keeps group means and sample sizes fixed and lets you compare
+        two scenarios with different **within-group standard deviations**.
+
+        Because the means are fixed, this view isolates how changes in within-group spread affect
+        the ANOVA F-statistic.
+        """)
+
+    fixed_means = [50.0, 55.0, 60.0]
+    fixed_sizes = [30, 30, 30]
+
+    st.write("**Fixed configuration (applies to both scenarios):**")
+    st.write(f"- Group means: {fixed_means}")
+    st.write(f"- Group sample sizes: {fixed_sizes}")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        std_scenario_a = st.slider(
+            "Scenario A Std Dev",
+            min_value=1.0,
+            max_value=20.0,
+            value=4.0,
+            step=0.5,
+            help="Common within-group standard deviation for Scenario A",
+            key="f_explorer_std_a"
+        )
+
+    with col2:
+        std_scenario_b = st.slider(
+            "Scenario B Std Dev",
+            min_value=1.0,
+            max_value=20.0,
+            value=10.0,
+            step=0.5,
+            help="Common within-group standard deviation for Scenario B",
+            key="f_explorer_std_b"
+        )
+
+    st.write("""
+        The F-statistic still follows: **F = (Between-Group Variability) / (Within-Group Variability)**.
+        Since means are fixed here, changing standard deviation primarily changes the denominator (MSW).
+        """)
+
+    if 'f_explorer_seed' not in st.session_state:
+        st.session_state.f_explorer_seed = 42
+
+    seed_col1, seed_col2 = st.columns([1, 2])
+    with seed_col1:
+        if st.button("Reseed Samples", key="f_explorer_reseed"):
+            st.session_state.f_explorer_seed = int(np.random.default_rng().integers(1, 2_147_483_647))
+    with seed_col2:
+        st.caption(f"Current sample seed: {st.session_state.f_explorer_seed}")
+    
+    try:
+        def compute_anova_components(groups):
+            all_values = np.concatenate(groups)
+            k_groups = len(groups)
+            n_total = len(all_values)
+            group_means = [np.mean(g) for g in groups]
+            group_sizes = [len(g) for g in groups]
+            grand_mean = float(np.mean(all_values))
+
+            ssb_local = float(sum(n * (m - grand_mean) ** 2 for n, m in zip(group_sizes, group_means)))
+            ssw_local = float(sum(np.sum((g - m) ** 2) for g, m in zip(groups, group_means)))
+
+            df_between_local = k_groups - 1
+            df_within_local = n_total - k_groups
+            msb_local = ssb_local / df_between_local
+            msw_local = ssw_local / df_within_local
+            f_local = msb_local / msw_local if msw_local > 0 else np.inf
+            p_local = 1 - stats.f.cdf(f_local, df_between_local, df_within_local)
+
+            return {
+                "all_values": all_values,
+                "group_means": group_means,
+                "group_sizes": group_sizes,
+                "grand_mean": grand_mean,
+                "ssb": ssb_local,
+                "ssw": ssw_local,
+                "df_between": df_between_local,
+                "df_within": df_within_local,
+                "msb": msb_local,
+                "msw": msw_local,
+                "f": f_local,
+                "p": p_local,
+            }
+
+        base_seed = int(st.session_state.f_explorer_seed)
+        rng_a = np.random.default_rng(base_seed)
+        rng_b = np.random.default_rng(base_seed + 1)
+
+        groups_a = [
+            rng_a.normal(fixed_means[0], std_scenario_a, fixed_sizes[0]),
+            rng_a.normal(fixed_means[1], std_scenario_a, fixed_sizes[1]),
+            rng_a.normal(fixed_means[2], std_scenario_a, fixed_sizes[2]),
+        ]
+        groups_b = [
+            rng_b.normal(fixed_means[0], std_scenario_b, fixed_sizes[0]),
+            rng_b.normal(fixed_means[1], std_scenario_b, fixed_sizes[1]),
+            rng_b.normal(fixed_means[2], std_scenario_b, fixed_sizes[2]),
+        ]
+
+        stats_a = compute_anova_components(groups_a)
+        stats_b = compute_anova_components(groups_b)
+
+        fig, axes = plt.subplots(2, 2, figsize=(16, 10))
+        ax_raw_a, ax_raw_b = axes[0, 0], axes[0, 1]
+        ax_box_a, ax_box_b = axes[1, 0], axes[1, 1]
+
+        colors = ['#0173B2', '#DE8F05', '#029E73']
+        group_names = ['Group 1', 'Group 2', 'Group 3']
+
+        def draw_raw_panel(ax, groups, summary_stats, std_value, title_prefix):
+            for idx, (group_values, color, group_name) in enumerate(zip(groups, colors, group_names), start=1):
+                jitter = np.random.default_rng(idx).normal(0, 0.04, len(group_values))
+                ax.scatter(
+                    np.ones(len(group_values)) * idx + jitter,
+                    group_values,
+                    alpha=0.6,
+                    s=30,
+                    color=color,
+                    label=group_name
+                )
+                ax.hlines(
+                    fixed_means[idx - 1],
+                    idx - 0.25,
+                    idx + 0.25,
+                    colors=color,
+                    linewidth=3,
+                )
+
+            ax.axhline(
+                summary_stats["grand_mean"],
+                color='red',
+                linestyle='--',
+                linewidth=2,
+                label=f"Grand Mean = {summary_stats['grand_mean']:.2f}"
+            )
+            ax.set_xlim(0.5, 3.5)
+            ax.set_xticks([1, 2, 3])
+            ax.set_xticklabels(group_names)
+            ax.set_ylabel('Value', fontsize=11)
+            ax.set_title(f"{title_prefix} Raw Data (Std Dev = {std_value:.1f})", fontsize=12, fontweight='bold')
+            ax.grid(True, alpha=0.3, axis='y')
+            ax.legend(fontsize=8, loc='best')
+
+        def draw_box_panel(ax, groups, summary_stats, std_value, title_prefix):
+            bp = ax.boxplot(
+                groups,
+                positions=[1, 2, 3],
+                widths=0.55,
+                patch_artist=True,
+                labels=group_names,
+            )
+            for patch, color in zip(bp['boxes'], colors):
+                patch.set_facecolor(color)
+                patch.set_alpha(0.6)
+
+            ax.axhline(
+                summary_stats["grand_mean"],
+                color='red',
+                linestyle='--',
+                linewidth=2,
+                label=f"Grand Mean = {summary_stats['grand_mean']:.2f}"
+            )
+            ax.set_ylabel('Value', fontsize=11)
+            ax.set_title(f"{title_prefix} Boxplots (Std Dev = {std_value:.1f})", fontsize=12, fontweight='bold')
+            ax.grid(True, alpha=0.3, axis='y')
+            ax.legend(fontsize=8, loc='best')
+
+        draw_raw_panel(ax_raw_a, groups_a, stats_a, std_scenario_a, "Scenario A")
+        draw_raw_panel(ax_raw_b, groups_b, stats_b, std_scenario_b, "Scenario B")
+        draw_box_panel(ax_box_a, groups_a, stats_a, std_scenario_a, "Scenario A")
+        draw_box_panel(ax_box_b, groups_b, stats_b, std_scenario_b, "Scenario B")
+
+        # Use common y-axis limits across each visual pair to make comparisons direct.
+        all_values_both_scenarios = np.concatenate(groups_a + groups_b)
+        y_min = float(np.min(all_values_both_scenarios))
+        y_max = float(np.max(all_values_both_scenarios))
+        y_padding = max(1.0, (y_max - y_min) * 0.08)
+        shared_ylim = (y_min - y_padding, y_max + y_padding)
+
+        ax_raw_a.set_ylim(shared_ylim)
+        ax_raw_b.set_ylim(shared_ylim)
+        ax_box_a.set_ylim(shared_ylim)
+        ax_box_b.set_ylim(shared_ylim)
+
+        plt.tight_layout()
+        st.pyplot(fig)
+        
+        st.caption(f"""
+            **Accessibility Description:** Four-panel F-statistic comparison with two scenarios.
+            Top row: raw-data scatter plots (Scenario A left, Scenario B right).
+            Bottom row: boxplots (Scenario A left, Scenario B right).
+            Both scenarios use fixed means {fixed_means} and fixed sample sizes {fixed_sizes}.
+            Scenario A uses standard deviation {std_scenario_a:.1f} with F = {stats_a['f']:.4f}, p = {stats_a['p']:.6f}.
+            Scenario B uses standard deviation {std_scenario_b:.1f} with F = {stats_b['f']:.4f}, p = {stats_b['p']:.6f}.
+            """)
+        plt.close()
+        
+        st.write("---")
+        st.subheader("ANOVA Calculation Breakdown (Side-by-Side)")
+
+        col_a, col_b = st.columns(2)
+
+        with col_a:
+            st.write("**Scenario A**")
+            st.write(f"- Std Dev: {std_scenario_a:.2f}")
+            st.write(f"- SSB: {stats_a['ssb']:.2f}")
+            st.write(f"- SSW: {stats_a['ssw']:.2f}")
+            st.write(f"- MSB: {stats_a['msb']:.2f}")
+            st.write(f"- MSW: {stats_a['msw']:.2f}")
+            st.metric("F-value (A)", f"{stats_a['f']:.4f}")
+            st.metric("p-value (A)", f"{stats_a['p']:.6f}")
+            if stats_a['p'] < 0.05:
+                st.success("Scenario A: Significant at α = 0.05")
+            else:
+                st.info("Scenario A: Not significant at α = 0.05")
+        
+        with col_b:
+            st.write("**Scenario B**")
+            st.write(f"- Std Dev: {std_scenario_b:.2f}")
+            st.write(f"- SSB: {stats_b['ssb']:.2f}")
+            st.write(f"- SSW: {stats_b['ssw']:.2f}")
+            st.write(f"- MSB: {stats_b['msb']:.2f}")
+            st.write(f"- MSW: {stats_b['msw']:.2f}")
+            st.metric("F-value (B)", f"{stats_b['f']:.4f}")
+            st.metric("p-value (B)", f"{stats_b['p']:.6f}")
+            if stats_b['p'] < 0.05:
+                st.success("Scenario B: Significant at α = 0.05")
+            else:
+                st.info("Scenario B: Not significant at α = 0.05")
+        
+        st.write("---")
+        st.write("**F-Statistic Formula:**")
+        st.latex(r"F = \frac{MSB}{MSW}")
+        st.write(f"Scenario A: F = {stats_a['msb']:.2f} / {stats_a['msw']:.2f} = {stats_a['f']:.4f}")
+        st.write(f"Scenario B: F = {stats_b['msb']:.2f} / {stats_b['msw']:.2f} = {stats_b['f']:.4f}")
+        
+        st.write("---")
+        st.subheader("Key Insights")
+        
+        st.write("**Comparison Focus:**")
+        st.write("- Group means and sample sizes are fixed, so between-group structure is held constant.")
+        st.write("- Increasing within-group standard deviation raises MSW (denominator).")
+        st.write("- As MSW rises, F typically decreases, making significance harder to achieve.")
+
+        if stats_a['f'] > stats_b['f']:
+            st.write(f"- Scenario A currently has the larger F-statistic ({stats_a['f']:.2f} vs {stats_b['f']:.2f}).")
+        elif stats_b['f'] > stats_a['f']:
+            st.write(f"- Scenario B currently has the larger F-statistic ({stats_b['f']:.2f} vs {stats_a['f']:.2f}).")
+        else:
+            st.write(f"- Both scenarios currently have similar F-statistics ({stats_a['f']:.2f} vs {stats_b['f']:.2f}).")
+        
+        st.write("---")
+        st.info("""
+            **Try These Experiments:**
+            1. Set Scenario A to low std dev and Scenario B to high std dev.
+            2. Observe that Scenario B usually has larger within-group spread and lower F.
+            3. Bring both std dev sliders together and observe F-statistics become more similar.
+
+            This view emphasizes the role of within-group variation in ANOVA when means are held fixed.
+            """)
+        
+    except Exception as e:
+        st.error(f"An error occurred while running the F-statistic explorer: {e}")
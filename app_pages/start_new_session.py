@@ -0,0 +1,28 @@
+# "Start New Session" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Start New Session")
+st.warning("⚠️ This will clear all data and reset the application to its initial state.")
+st.write("**The following will be cleared:**")
+st.write("- All uploaded and manually entered data")
+st.write("- All session state and saved inputs")
+st.write("- All analysis results")
+
+col1, col2, col3 = st.columns([1, 1, 2])
+with col1:
+    if st.button("🔄 Reset Everything", type="primary", use_container_width=True):
+        # Clear all session state
+        for key in list(st.session_state.keys()):
+            del st.session_state[key]
+        # Reinitialize essential session state
+        st.session_state.global_dataframes = {}
+        st.session_state.manual_entry_df = pd.DataFrame({'Column A': ['']})
+        # Set flag to force navigation to Data Input
+        st.session_state._force_data_input = True
+        st.rerun()
+with col2:
+    if st.button("❌ Cancel", use_container_width=True):
+        # Set flag to force navigation to Data Input without clearing data
+        st.session_state._force_data_input = True
+        st.rerun()
+
+st.stop()  # Stop execution so no other tab content is shown
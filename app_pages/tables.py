@@ -0,0 +1,113 @@
+# "Tables" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Tables")
+
+if get_active_dataset() is None:
+    st.info("Please load or enter data in the 'Data Input' tab first.")
+else:
+    df = get_active_dataset().frame
+    
+    table_type = st.selectbox(
+        "Select Table Type",
+        ["Frequency Table", "Relative Frequency Table", "Two-Way Table"],
+        key="table_type_select"
+    )
+
+    if table_type in ["Frequency Table", "Relative Frequency Table"]:
+        st.subheader(table_type)
+        
+        # Get only categorical columns (non-numeric or numeric with 15 or fewer unique values)
+        categorical_cols_options = [''] + get_categorical_columns()
+        
+        selected_col = st.selectbox(
+            "Select Categorical Column for Table",
+            options=categorical_cols_options,
+            key="table_column_select"
+        )
+
+        if selected_col and st.button("Generate Table", key="generate_freq_table"):
+            try:
+                # Get the column data and drop NaN values
+                data = df[selected_col].dropna()
+                
+                if data.empty:
+                    raise ValueError(f"Column '{selected_col}' is empty after removing missing values.")
+                
+                # Count frequencies
+                frequency_counts = data.value_counts().sort_index()
+                total_count = len(data)
+                
+                if table_type == "Frequency Table":
+                    # Create frequency table without cumulative column
+                    freq_table = pd.DataFrame({
+                        'Category': frequency_counts.index,
+                        'Frequency': frequency_counts.values
+                    })
+                    # Add total row
+                    total_row = pd.DataFrame({'Category': ['Total'], 'Frequency': [total_count]})
+                    freq_table = pd.concat([freq_table, total_row], ignore_index=True)
+                    
+                    st.write(f"**Frequency Table for '{selected_col}'**")
+                    show_table(freq_table, hide_index=True, paged=False)
+                    st.caption(f"Frequency table showing counts for each category in {selected_col}. Total observations: {total_count}.")
+                    
+                else:  # Relative Frequency Table
+                    # Create relative frequency table without cumulative column
+                    rel_freq_table = pd.DataFrame({
+                        'Category': frequency_counts.index,
+                        'Frequency': frequency_counts.values,
+                        'Relative Frequency': (frequency_counts.values / total_count).round(4),
+                        'Percentage': ((frequency_counts.values / total_count) * 100).round(2)
+                    })
+                    # Add total row
+                    total_row = pd.DataFrame({
+                        'Category': ['Total'], 
+                        'Frequency': [total_count],
+                        'Relative Frequency': [1.0000],
+                        'Percentage': [100.00]
+                    })
+                    rel_freq_table = pd.concat([rel_freq_table, total_row], ignore_index=True)
+                    
+                    st.write(f"**Relative Frequency Table for '{selected_col}'**")
+                    show_table(rel_freq_table, hide_index=True, paged=False)
+                    st.caption(f"Relative frequency table showing proportions and percentages for each category in {selected_col}. Total observations: {total_count}.")
+
+            except ValueError as ve:
+                st.error(f"⚠️ Error: {ve}. Please check that you've selected a valid column with data.")
+            except Exception as e:
+                st.error(f"❌ An unexpected error occurred: {e}. Please try selecting a different column or reloading your data.")
+
+    elif table_type == "Two-Way Table":
+        st.subheader("Two-Way Contingency Table")
+        
+        # Get only categorical columns
+        categorical_cols_options = [''] + get_categorical_columns()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            row_col = st.selectbox("Select Row Variable", options=categorical_cols_options, key="twoway_row_select")
+        with col2:
+            col_col = st.selectbox("Select Column Variable", options=categorical_cols_options, key="twoway_col_select")
+
+        if row_col and col_col and st.button("Generate Two-Way Table", key="generate_twoway_table"):
+            try:
+                # Create contingency table
+                contingency_table = pd.crosstab(
+                    df[row_col], 
+                    df[col_col], 
+                    margins=True, 
+                    margins_name='Total'
+                )
+                
+                # Remove variable names from index and columns
+                contingency_table.index.name = None
+                contingency_table.columns.name = None
+                
+                st.write(f"**Two-Way Frequency Table**")
+                show_table(contingency_table, paged=False)
+                st.caption(f"Two-way frequency table showing counts for combinations of {row_col} (rows) and {col_col} (columns).")
+
+            except ValueError as ve:
+                st.error(f"⚠️ Error: {ve}. Please ensure both variables are selected and contain valid categorical data.")
+            except Exception as e:
+                st.error(f"❌ An unexpected error occurred: {e}. Please verify your column selections and data format.")
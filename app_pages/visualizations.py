@@ -0,0 +1,189 @@
+# "Visualizations" tab, executed by run_page() in streamlit_app.py.
+
+st.header("Visualizations")
+
+if not st.session_state.global_dataframes:
+    st.info("Please load or enter data in the 'Data Input' tab first to generate visualizations.")
+else:
+    plot_type = st.selectbox(
+        "Select Plot Type",
+        options=['Histogram', 'Boxplot', 'Bar Plot', 'Dot Plot', 'Scatter Plot'],
+        key="plot_type_select"
+    )
+
+    numeric_cols_options = [''] + get_numeric_columns()
+    all_cols_options = [''] + get_all_columns()
+
+    x_axis_col = None
+    y_axis_col = None
+    plot_options = {}
+
+    if plot_type in ['Histogram', 'Boxplot', 'Dot Plot']:
+        if plot_type == 'Boxplot':
+            plot_options['multiple'] = st.checkbox("Plot multiple boxplots", value=False, key="boxplot_multiple")
+            if plot_options['multiple']:
+                x_axis_col = st.multiselect("Select Data Columns", options=numeric_cols_options[1:], key="x_axis_select_multiple_numeric")
+            else:
+                x_axis_col = st.selectbox("Select Data Column", options=numeric_cols_options, key="x_axis_select_single_numeric")
+            plot_options['horizontal'] = st.radio("Orientation:", options=['Vertical', 'Horizontal'], index=0, key="boxplot_orientation") == 'Horizontal'
+        else:
+            x_axis_col = st.selectbox("Select Data Column", options=numeric_cols_options, key="x_axis_select_single_numeric")
+        if plot_type == 'Histogram':
+            # Calculate optimal number of bins using Sturges' rule
+            optimal_bins = 'auto'  # Default to matplotlib's auto binning
+            if x_axis_col:
+                dataset = get_active_dataset()
+                if dataset is not None and x_axis_col in dataset.columns:
+                    n = get_sorted_numeric_values(dataset, x_axis_col).size
+                    if n > 0:
+                        optimal_bins = sturges_bin_count(n)
+            
+            # Allow user to override with manual bin count or use 'auto'
+            if isinstance(optimal_bins, int):
+                plot_options['bins'] = st.number_input("Number of Bins", min_value=1, max_value=100, value=optimal_bins, step=1, key="hist_bins")
+            else:
+                # Use auto as default, but provide option to manually specify
+                manual_bins = st.checkbox("Manually specify number of bins", value=False, key="manual_bins_checkbox")
+                if manual_bins:
+                    plot_options['bins'] = st.number_input("Number of Bins", min_value=1, max_value=100, value=10, step=1, key="hist_bins")
+                else:
+                    plot_options['bins'] = 'auto'
+                    st.caption("Using automatic bin selection (Sturges' rule)")
+            
+            plot_options['force_integer_bins'] = st.checkbox("Use integer bin boundaries", value=False, key="force_integer_bins")
+            plot_options['use_relative'] = st.radio("Y-axis:", options=['Frequency', 'Relative Frequency'], index=0, key="hist_yaxis") == 'Relative Frequency'
+    elif plot_type == 'Bar Plot':
+        x_axis_col = st.selectbox("Select Data Column (Categorical/Numeric)", options=all_cols_options, key="x_axis_select_single_all")
+        plot_options['stacked'] = st.radio("Bar Style:", options=['Unstacked (Grouped)', 'Stacked'], index=0, key="bar_plot_style") == 'Stacked'
+        plot_options['use_relative'] = st.radio("Y-axis:", options=['Frequency', 'Relative Frequency'], index=0, key="bar_plot_yaxis") == 'Relative Frequency'
+    elif plot_type == 'Scatter Plot':
+        col1, col2 = st.columns(2)
+        with col1:
+            x_axis_col = st.selectbox("Select X-axis Variable", options=numeric_cols_options, key="x_axis_select_scatter")
+        with col2:
+            y_axis_col = st.selectbox("Select Y-axis Variable", options=numeric_cols_options, key="y_axis_select_scatter")
+
+    if st.button("Generate Plot", key="generate_plot_button"):
+        st.subheader("Generated Plot")
+        try:
+            fig = None
+            boxplot_stats = None
+            labels = None
+            if plot_type == 'Histogram':
+                if not x_axis_col: raise ValueError("Please select a data column for the histogram.")
+                dataset = get_active_dataset()
+                if dataset is None: raise ValueError("No active dataframe found. Please load data first.")
+                if x_axis_col not in dataset.columns: raise ValueError(f"Column '{x_axis_col}' not found in active dataframe.")
+                data = get_sorted_numeric_values(dataset, x_axis_col)
+                if data.size == 0: raise ValueError(f"Selected column '{x_axis_col}' contains no valid numerical data.")
+                # Extract column name - handle both "key: value" format and plain column names
+                col_label = x_axis_col.split(": ", 1)[1] if ": " in x_axis_col else x_axis_col
+                fig = plot_histogram(data, bins=plot_options['bins'], title=f'Histogram of {col_label}', xlabel=col_label, use_relative=plot_options.get('use_relative', False), force_integer_bins=plot_options.get('force_integer_bins', False), presorted=True)
+            elif plot_type == 'Boxplot':
+                if not x_axis_col: raise ValueError("Please select at least one data column for the boxplot.")
+                if plot_options.get('multiple', False):
+                    # Multiple boxplots
+                    if isinstance(x_axis_col, list) and len(x_axis_col) > 0:
+                        data_list = [get_data_from_col_string(col) for col in x_axis_col]
+                        labels = [col.split(": ", 1)[1] if ": " in col else col for col in x_axis_col]
+                        boxplot_stats = get_boxplot_statistics(data_list)
+                        fig = plot_box_plot(data_list, title='Box Plots Comparison', ylabel='Value', horizontal=plot_options.get('horizontal', False), labels=labels, box_stats=boxplot_stats)
+                    else:
+                        raise ValueError("Please select at least one data column for the boxplot.")
+                else:
+                    # Single boxplot
+                    data = get_data_from_col_string(x_axis_col)
+                    col_label = x_axis_col.split(": ", 1)[1] if ": " in x_axis_col else x_axis_col
+                    boxplot_stats = get_boxplot_statistics(data)
+                    fig = plot_box_plot(data, title=f'Box Plot of {col_label}', ylabel=col_label, horizontal=plot_options.get('horizontal', False), box_stats=boxplot_stats)
+            elif plot_type == 'Bar Plot':
+                if not x_axis_col: raise ValueError("Please select a data column for the bar plot.")
+                # Get data using the active dataframe
+                dataset = get_active_dataset()
+                if dataset is None: raise ValueError("No active dataframe found. Please load data first.")
+                if x_axis_col not in dataset.columns: raise ValueError(f"Column '{x_axis_col}' not found in active dataframe.")
+                data = dataset.frame[x_axis_col].dropna() # Bar plot can use non-numeric directly
+                if data.empty: raise ValueError(f"Selected column '{x_axis_col}' is empty after dropping NaNs.")
+                fig = plot_bar_plot(data, title=f'Bar Plot of {x_axis_col}', xlabel=x_axis_col, stacked=plot_options.get('stacked', False), use_relative=plot_options.get('use_relative', False))
+            elif plot_type == 'Dot Plot':
+                if not x_axis_col: raise ValueError("Please select a data column for the dot plot.")
+                dataset = get_active_dataset()
+                if dataset is None: raise ValueError("No active dataframe found. Please load data first.")
+                if x_axis_col not in dataset.columns: raise ValueError(f"Column '{x_axis_col}' not found in active dataframe.")
+                data = get_sorted_numeric_values(dataset, x_axis_col)
+                if data.size == 0: raise ValueError(f"Selected column '{x_axis_col}' contains no valid numerical data.")
+                col_label = x_axis_col.split(": ", 1)[1] if ": " in x_axis_col else x_axis_col
+                fig = plot_dot_plot(data, title=f'Dot Plot of {col_label}', xlabel=col_label, presorted=True)
+            elif plot_type == 'Scatter Plot':
+                if not x_axis_col or not y_axis_col: raise ValueError("Please select both X and Y axis variables.")
+                
+                source_df = get_active_dataset()
+                if source_df is None: raise ValueError("No active dataframe found. Please load data first.")
+                
+                if x_axis_col not in source_df.columns: raise ValueError(f"Column '{x_axis_col}' not found in active dataframe.")
+                if y_axis_col not in source_df.columns: raise ValueError(f"Column '{y_axis_col}' not found in active dataframe.")
+
+                combined_series = pd.DataFrame({
+                    'x_val': source_df.numeric_series(x_axis_col),
+                    'y_val': source_df.numeric_series(y_axis_col)
+                }).dropna()
+
+                if combined_series.empty:
+                    raise ValueError("No common numeric data points found for X and Y axes after cleaning.")
+                
+                fig = plot_scatter_plot(combined_series['x_val'], combined_series['y_val'], title=f'Scatter Plot: {x_axis_col} vs {y_axis_col}', xlabel=x_axis_col, ylabel=y_axis_col)
+
+            if fig is not None:
+                st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
+                
+                # Display boxplot statistics if applicable
+                if plot_type == 'Boxplot' and boxplot_stats is not None:
+                    st.markdown("---")
+                    st.subheader("📊 Boxplot Statistics")
+                    
+                    if isinstance(boxplot_stats, list):
+                        # Multiple boxplots
+                        for i, stats in enumerate(boxplot_stats):
+                            label = labels[i] if labels and i < len(labels) else f"Dataset {i+1}"
+                            with st.expander(f"📈 {label}", expanded=(i==0)):
+                                metrics = [
+                                    (
+                                        "Outlier Min" if stats['outlier_min'] is not None else "Minimum",
+                                        stats['outlier_min'] if stats['outlier_min'] is not None else stats['min']
+                                    ),
+                                    ("Q1", stats['q1']),
+                                    ("Median", stats['median']),
+                                    ("Q3", stats['q3']),
+                                    (
+                                        "Outlier Max" if stats['outlier_max'] is not None else "Maximum",
+                                        stats['outlier_max'] if stats['outlier_max'] is not None else stats['max']
+                                    )
+                                ]
+                                cols = st.columns(len(metrics))
+                                for col, (metric_label, metric_value) in zip(cols, metrics):
+                                    with col:
+                                        st.metric(metric_label, format_decimal(metric_value))
+                    else:
+                        # Single boxplot
+                        metrics = [
+                            (
+                                "Outlier Min" if boxplot_stats['outlier_min'] is not None else "Minimum",
+                                boxplot_stats['outlier_min'] if boxplot_stats['outlier_min'] is not None else boxplot_stats['min']
+                            ),
+                            ("Q1", boxplot_stats['q1']),
+                            ("Median", boxplot_stats['median']),
+                            ("Q3", boxplot_stats['q3']),
+                            (
+                                "Outlier Max" if boxplot_stats['outlier_max'] is not None else "Maximum",
+                                boxplot_stats['outlier_max'] if boxplot_stats['outlier_max'] is not None else boxplot_stats['max']
+                            )
+                        ]
+                        cols = st.columns(len(metrics))
+                        for col, (metric_label, metric_value) in zip(cols, metrics):
+                            with col:
+                                st.metric(metric_label, format_decimal(metric_value))
+
+        except ValueError as ve:
+            st.error(f"Plotting Error: {ve}")
+        except Exception as e:
+            st.error(f"An unexpected error occurred during plotting: {e}")
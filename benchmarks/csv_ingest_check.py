@@ -0,0 +1,132 @@
+"""Check that chunked CSV ingest types a file exactly like the one-shot path.
+
+Large CSV uploads and Google Sheets are parsed by ``ingest_csv_in_chunks`` while small
+uploads go through ``pd.read_csv`` + ``build_active_dataset``. This script builds
+CSVs with boolean, numeric, text, mixed and blank columns and compares both paths
+(frames, dtypes, blank masks and numeric values) for several chunk sizes, reading from
+a seekable file and from the Sheets loader's non-seekable download stream.
+The definitions are read from streamlit_app.py without running the app.
+
+Usage::
+
+    python benchmarks/csv_ingest_check.py
+    python benchmarks/csv_ingest_check.py --files 500 --seed 7
+"""
+
+import argparse
+import ast
+import io
+import random
+import sys
+
+import numpy as np
+import pandas as pd
+
+from startup_benchmark import APP_FILE, top_level_imports
+
+FIXED_CSV = (
+    "flag,amount,mixed,flag_blank,label,empty,count\n"
+    "TRUE,1.50,x,True,a,,1\n"
+    "FALSE,2,3,,b,,2\n"
+    "true,,y,false,,,3\n"
+    "FALSE,4.25,1.50,TRUE,c,,4\n"
+    "TRUE,5,z,false,a,,\n"
+)
+CELL_KINDS = ['int', 'float', 'bool', 'text', 'mixed', 'late_text']
+
+
+def load_app_definitions():
+    """Execute the app's imports, constants, functions and classes without running the page."""
+    with open(APP_FILE, encoding='utf-8') as handle:
+        tree = ast.parse(handle.read(), filename=APP_FILE)
+    namespace = {'__name__': '__csv_ingest_check__'}
+    exec(top_level_imports(APP_FILE), namespace)
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+            exec(compile(ast.Module([node], type_ignores=[]), APP_FILE, 'exec'), namespace)
+        elif isinstance(node, ast.Assign) and all(
+                isinstance(target, ast.Name) and target.id.isupper() for target in node.targets):
+            try:
+                exec(compile(ast.Module([node], type_ignores=[]), APP_FILE, 'exec'), namespace)
+            except Exception:
+                pass  # Constants built from page state are not needed here
+    return namespace
+
+
+def random_cell(rng, kind):
+    roll = rng.random()
+    if roll < 0.1:
+        return ''
+    if roll < 0.13:
+        return rng.choice(['NA', ' ', 'nan'])
+    if kind == 'int':
+        return str(rng.randint(-1000, 1000))
+    if kind == 'float':
+        return rng.choice([f"{rng.uniform(-1e3, 1e3):.{rng.randint(0, 6)}f}", str(rng.random()), '1.50', '1e5', '-0', 'inf', ' 3'])
+    if kind == 'bool':
+        return rng.choice(['TRUE', 'FALSE', 'true', 'False'])
+    if kind == 'text':
+        return rng.choice(['a', 'b', 'c d', 'x'])
+    return random_cell(rng, rng.choice(['int', 'float', 'bool', 'text']))
+
+
+def random_csv(rng):
+    kinds = [rng.choice(CELL_KINDS) for _ in range(5)]
+    rows = rng.randint(1, 40)
+    lines = [','.join(f"c{i}" for i in range(len(kinds)))]
+    for row in range(rows):
+        cells = []
+        for kind in kinds:
+            if kind == 'late_text':
+                kind = 'text' if row == rows - 1 else 'float'
+            cells.append(random_cell(rng, kind))
+        lines.append(','.join(cells))
+    return '\n'.join(lines) + '\n'
+
+
+def differences(ns, text, chunk_rows, seekable):
+    """Return the columns whose chunked result differs from the one-shot result."""
+    expected = ns['build_active_dataset'](pd.read_csv(io.StringIO(text)))
+    data = text.encode('utf-8')
+    source = io.BytesIO(data) if seekable else ns['CancellableStream'](io.BytesIO(data))
+    actual = ns['ingest_csv_in_chunks'](source, chunk_rows=chunk_rows)
+    if list(expected.frame.columns) != list(actual.frame.columns):
+        return ['<columns>']
+    bad = []
+    for col in expected.frame.columns:
+        left, right = expected.frame[col], actual.frame[col]
+        same = (
+            left.dtype == right.dtype and left.equals(right)
+            and np.array_equal(expected.blank_mask[col], actual.blank_mask[col])
+            and (col in expected.numeric) == (col in actual.numeric)
+            and (col not in expected.numeric
+                 or np.array_equal(expected.numeric[col], actual.numeric[col], equal_nan=True))
+        )
+        if not same:
+            bad.append(col)
+    return bad
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--files', type=int, default=300, help='random CSVs to compare (default 300)')
+    parser.add_argument('--seed', type=int, default=1, help='random seed (default 1)')
+    args = parser.parse_args()
+
+    ns = load_app_definitions()
+    rng = random.Random(args.seed)
+    failures = 0
+    cases = [(FIXED_CSV, chunk_rows, seekable) for chunk_rows in (1, 2, 3) for seekable in (True, False)]
+    cases += [(random_csv(rng), rng.randint(1, 10), rng.random() < 0.5) for _ in range(args.files)]
+    for text, chunk_rows, seekable in cases:
+        bad = differences(ns, text, chunk_rows, seekable)
+        if bad:
+            failures += 1
+            if failures <= 5:
+                print(f"mismatch in {bad} (chunk_rows={chunk_rows}, seekable={seekable}):\n{text}")
+    print(f"{len(cases) - failures} of {len(cases)} CSVs ingest identically")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""Measure CueStat rerun latency per navigation tab.
+
+A synthetic dataset is loaded through the ``sheets_url`` auto-load path, then
+each tab is selected and rerun several times through Streamlit's AppTest
+harness. The median time the app script itself takes per rerun is reported; the
+first visit (which compiles the tab's page module) is excluded. The script is
+compiled once, the way a real Streamlit server caches it, and timed inside the
+script thread, because AppTest's own polling adds several milliseconds of noise
+to a wall-clock measurement around ``AppTest.run``.
+
+Usage::
+
+    python benchmarks/rerun_benchmark.py
+    python benchmarks/rerun_benchmark.py --baseline HEAD~1 --rows 20000
+
+``--baseline`` runs the given git revision of the app (streamlit_app.py and
+app_pages/) as well and prints both columns side by side.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from startup_benchmark import REPO_ROOT, APP_FILE
+
+TABS = [
+    "Data Input", "Visualizations", "Tables", "Descriptive Statistics", "Probability Distributions",
+    "Confidence Intervals", "Hypothesis Testing", "Linear Regression", "Simulations",
+]
+
+# Runs inside AppTest's script thread: execute the precompiled app and record how long it took
+TIMED_SCRIPT = """
+import builtins, time
+start = time.perf_counter()
+try:
+    exec(builtins.rerun_code, {'__name__': '__main__', '__file__': %r})
+finally:
+    builtins.rerun_times.append(time.perf_counter() - start)
+"""
+
+RERUN_PROBE = """
+import builtins, json, statistics, sys, time
+from streamlit.testing.v1 import AppTest
+app, data, tabs, reruns, timed_script = sys.argv[1], sys.argv[2], json.loads(sys.argv[3]), int(sys.argv[4]), sys.argv[5]
+with open(app, encoding='utf-8') as handle:
+    builtins.rerun_code = compile(handle.read(), app, 'exec')
+builtins.rerun_times = []
+at = AppTest.from_string(timed_script % app, default_timeout=300)
+at.query_params['sheets_url'] = data
+at.run()
+deadline = time.time() + 120
+while 'active_data' not in at.session_state['global_dataframes'] and time.time() < deadline:
+    time.sleep(0.1)
+    at.run()
+results = {}
+for tab in tabs:
+    at.sidebar.radio(key='navigation_radio').set_value(tab).run()
+    builtins.rerun_times.clear()
+    for _ in range(reruns):
+        at.run()
+    results[tab] = {'seconds': statistics.median(builtins.rerun_times), 'exceptions': len(at.exception)}
+print(json.dumps(results))
+"""
+
+
+def write_dataset(path, rows, seed=0):
+    rng = np.random.default_rng(seed)
+    pd.DataFrame({
+        'score': rng.normal(70, 10, rows).round(1),
+        'hours': rng.integers(0, 40, rows),
+        'group': rng.choice(['A', 'B', 'C'], rows),
+    }).to_csv(path, index=False)
+
+
+@contextlib.contextmanager
+def baseline_tree(revision):
+    """Export the repository at ``revision`` to a temporary directory and yield its path.
+
+    The whole tree is needed because the pages live in app_pages/ next to the script.
+    """
+    archive = subprocess.run(['git', 'archive', revision], cwd=REPO_ROOT, capture_output=True, check=True).stdout
+    with tempfile.TemporaryDirectory() as tmp:
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmp)
+        yield tmp
+
+
+def measure(app, data, reruns):
+    result = subprocess.run(
+        [sys.executable, '-c', RERUN_PROBE, app, data, json.dumps(TABS), str(reruns), TIMED_SCRIPT],
+        cwd=os.path.dirname(app), capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--rows', type=int, default=5000, help='rows in the synthetic dataset (default 5000)')
+    parser.add_argument('--reruns', type=int, default=5, help='timed reruns per tab (default 5)')
+    parser.add_argument('--baseline', help='git revision of the app to compare against')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data = os.path.join(tmp, 'benchmark.csv')
+        write_dataset(data, args.rows)
+        columns = []
+        if args.baseline:
+            with baseline_tree(args.baseline) as tree:
+                columns.append((args.baseline, measure(os.path.join(tree, 'streamlit_app.py'), data, args.reruns)))
+        columns.append(('current', measure(APP_FILE, data, args.reruns)))
+
+    print(f"{'Tab':<28}" + ''.join(f"{label:>14}" for label, _ in columns))
+    for tab in TABS:
+        cells = []
+        for _, result in columns:
+            entry = result[tab]
+            flag = '!' if entry['exceptions'] else ' '
+            cells.append(f"{entry['seconds'] * 1000:11.1f}ms{flag}")
+        print(f"{tab:<28}" + ''.join(cells))
+    if any(entry['exceptions'] for _, result in columns for entry in result.values()):
+        print("! the tab raised an exception during the run")
+
+
+if __name__ == '__main__':
+    main()
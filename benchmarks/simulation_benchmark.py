@@ -0,0 +1,97 @@
+"""Measure Monte Carlo engine throughput and check that results do not depend on workers.
+
+The engine's definitions are read from streamlit_app.py without running the app. Each
+simulation statistic is drawn for a fixed seed with one worker and with ``--workers``
+workers. The script reports the median wall time of each and whether both runs produced
+identical values.
+
+Usage::
+
+    python benchmarks/simulation_benchmark.py
+    python benchmarks/simulation_benchmark.py --replicates 1000000 --workers 8
+"""
+
+import argparse
+import ast
+import os
+import statistics
+import time
+
+import numpy as np
+
+from startup_benchmark import APP_FILE
+
+ENGINE_NAMES = {
+    'SIMULATION_MAX_REPLICATES', 'SIMULATION_CHUNK_SIZE', 'SIMULATION_CHUNK_ELEMENTS', 'lazy_cache_resource',
+    'parse_simulation_workers', 'simulation_chunk_plan', 'simulation_worker_count', 'get_simulation_pool',
+    'ordered_pool_map', 'monte_carlo_chunks', 'draw_matrix_means', 'draw_sample_means', 'draw_sample_proportions',
+    'draw_normal_mean_and_sd',
+}
+ENGINE_IMPORTS = """
+import functools
+import logging
+import os
+import concurrent.futures
+from collections import deque
+import numpy as np
+import streamlit as st
+"""
+
+CASES = [
+    ('Sample Means (Normal, n=30)', lambda ns: lambda rng, size: ns['draw_sample_means'](rng, "Normal", 30, size)),
+    ('Sample Means (Bimodal, n=30)', lambda ns: lambda rng, size: ns['draw_sample_means'](rng, "Bimodal", 30, size)),
+    ('Sample Means (Uniform, n=30)', lambda ns: lambda rng, size: ns['draw_sample_means'](rng, "Uniform", 30, size)),
+    ('Sample Means (Beta, n=30)', lambda ns: lambda rng, size: ns['draw_sample_means'](rng, "Left Skewed (Beta)", 30, size)),
+    ('Sample Proportions (n=50)', lambda ns: lambda rng, size: ns['draw_sample_proportions'](rng, 0.6, 50, size)),
+    ('Two Means (n=30, 30)', lambda ns: lambda rng, size: ns['draw_normal_mean_and_sd'](rng, 50, 10, 30, size)),
+]
+
+
+def load_engine():
+    """Execute the Monte Carlo engine section of streamlit_app.py in a fresh namespace."""
+    with open(APP_FILE, encoding='utf-8') as handle:
+        tree = ast.parse(handle.read(), filename=APP_FILE)
+    namespace = {}
+    exec(ENGINE_IMPORTS, namespace)
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef):
+            names = {node.name}
+        elif isinstance(node, ast.Assign):
+            names = {target.id for target in node.targets if isinstance(target, ast.Name)}
+        else:
+            continue
+        if names & ENGINE_NAMES:
+            exec(compile(ast.Module([node], type_ignores=[]), APP_FILE, 'exec'), namespace)
+    return namespace
+
+
+def run(ns, draw, replicates, workers, seed):
+    """Draw `replicates` statistics and return (seconds, concatenated first statistic)."""
+    start = time.perf_counter()
+    chunks = []
+    for _, _, result in ns['monte_carlo_chunks'](draw, replicates, seed=seed, workers=workers):
+        chunks.append(result[0] if isinstance(result, tuple) else result)
+    return time.perf_counter() - start, np.concatenate(chunks)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--replicates', type=int, default=1_000_000, help='replicates per run (default 1,000,000)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='parallel workers (default: CPU count)')
+    parser.add_argument('--runs', type=int, default=3, help='timed runs per setting (default 3)')
+    parser.add_argument('--seed', type=int, default=12345, help='SeedSequence entropy (default 12345)')
+    args = parser.parse_args()
+
+    ns = load_engine()
+    print(f"{'Statistic':<32}{'1 worker':>12}{f'{args.workers} workers':>14}   identical")
+    for label, make_draw in CASES:
+        draw = make_draw(ns)
+        serial = [run(ns, draw, args.replicates, 1, args.seed) for _ in range(args.runs)]
+        parallel = [run(ns, draw, args.replicates, args.workers, args.seed) for _ in range(args.runs)]
+        identical = np.array_equal(serial[0][1], parallel[0][1])
+        print(f"{label:<32}{statistics.median(t for t, _ in serial):11.3f}s"
+              f"{statistics.median(t for t, _ in parallel):13.3f}s   {'yes' if identical else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
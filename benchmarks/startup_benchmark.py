@@ -0,0 +1,133 @@
+"""Measure CueStat cold-start cost in fresh Python processes.
+
+Two numbers are reported per app file, each the median of several runs:
+
+* import   - time to execute the app's top-level import statements
+* first    - time from process start until the first page (Data Input) has
+             rendered through Streamlit's AppTest harness
+
+The heavy optional libraries that ended up in ``sys.modules`` after the first
+page are listed as well, which makes lazy-import regressions easy to spot.
+
+Usage::
+
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --baseline HEAD~1 --runs 7
+
+``--baseline`` checks the given git revision of streamlit_app.py out next to
+the working copy so both runs share the same static/ and .streamlit/ folders.
+"""
+
+import argparse
+import ast
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_FILE = os.path.join(REPO_ROOT, 'streamlit_app.py')
+HEAVY_MODULES = ['scipy.stats', 'matplotlib.pyplot', 'plotly.express', 'plotly.graph_objects', 'st_aggrid']
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile(sys.argv[2], sys.argv[1], 'exec'), {'__name__': '__bench__'})
+print(json.dumps({'seconds': time.perf_counter() - start}))
+"""
+
+FIRST_PAGE_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'seconds': elapsed,
+    'exceptions': len(at.exception),
+    'loaded': [name for name in json.loads(sys.argv[2]) if name in sys.modules],
+}))
+"""
+
+
+def top_level_imports(path):
+    """Return the source of the app's module-level import statements."""
+    with open(path, encoding='utf-8') as handle:
+        tree = ast.parse(handle.read(), filename=path)
+    nodes = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            nodes.append(node)
+        elif isinstance(node, ast.Try) and any(isinstance(n, (ast.Import, ast.ImportFrom)) for n in node.body):
+            nodes.append(node)
+    return '\n'.join(ast.unparse(node) for node in nodes)
+
+
+@contextlib.contextmanager
+def baseline_app(revision):
+    """Write streamlit_app.py at ``revision`` next to the working copy and yield its path."""
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:streamlit_app.py'],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    handle = tempfile.NamedTemporaryFile('w', suffix='.py', prefix='_baseline_', dir=REPO_ROOT, delete=False)
+    try:
+        with handle:
+            handle.write(source)
+        yield handle.name
+    finally:
+        os.unlink(handle.name)
+
+
+def run_probe(probe, *args):
+    result = subprocess.run(
+        [sys.executable, '-c', probe, *args],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def measure(path, runs):
+    imports = top_level_imports(path)
+    import_times = [run_probe(IMPORT_PROBE, path, imports)['seconds'] for _ in range(runs)]
+    first_pages = [run_probe(FIRST_PAGE_PROBE, path, json.dumps(HEAVY_MODULES)) for _ in range(runs)]
+    return {
+        'import': statistics.median(import_times),
+        'first': statistics.median(page['seconds'] for page in first_pages),
+        'exceptions': max(page['exceptions'] for page in first_pages),
+        'loaded': first_pages[-1]['loaded'],
+    }
+
+
+def report(label, result):
+    loaded = ', '.join(result['loaded']) or 'none'
+    print(f"{label:<10} import {result['import']:6.3f}s   first page {result['first']:6.3f}s   "
+          f"exceptions {result['exceptions']}   heavy modules loaded: {loaded}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5, help='fresh processes per measurement (default 5)')
+    parser.add_argument('--baseline', help='git revision of streamlit_app.py to compare against')
+    args = parser.parse_args()
+
+    results = []
+    if args.baseline:
+        with baseline_app(args.baseline) as path:
+            results.append((args.baseline, measure(path, args.runs)))
+    results.append(('current', measure(APP_FILE, args.runs)))
+
+    for label, result in results:
+        report(label, result)
+    if len(results) == 2:
+        before, after = results[0][1], results[1][1]
+        print(f"{'delta':<10} import {after['import'] - before['import']:+6.3f}s   "
+              f"first page {after['first'] - before['first']:+6.3f}s")
+
+
+if __name__ == '__main__':
+    main()
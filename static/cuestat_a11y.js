@@ -0,0 +1,911 @@
+// CueStat accessibility DOM fixes.
+//
+// Served from static/ and injected once per browser session by
+// inject_ui_assets() in streamlit_app.py.  Every fix is registered with a
+// single debounced MutationObserver instead of installing its own observer
+// and setTimeout burst, so Streamlit reruns no longer stack observers.
+(function() {
+    if (window.__cuestatA11y) {
+        return;
+    }
+    window.__cuestatA11y = { fixes: [] };
+
+    const ENABLE_A11Y_DOM_FIXES = false;
+    const FIX_DEBOUNCE_MS = 150;
+    const fixes = window.__cuestatA11y.fixes;
+
+    const registerFix = function(fix) {
+        fixes.push(fix);
+    };
+
+    const runFixes = function() {
+        fixes.forEach(function(fix) {
+            try {
+                fix();
+            } catch (error) {
+                console.warn('Accessibility fix failed:', error);
+            }
+        });
+    };
+
+    // Fix ARIA attributes on Streamlit iframes
+    (function() {
+        // Wait for DOM to be ready
+        const fixIframeAria = function() {
+            // Find all iframes in sidebar and main menu
+            const iframes = document.querySelectorAll('.stSidebar iframe, #MainMenu iframe');
+            iframes.forEach(function(iframe) {
+                // Remove invalid ARIA attributes from iframes
+                iframe.removeAttribute('aria-hidden');
+                iframe.removeAttribute('aria-label');
+                iframe.removeAttribute('aria-labelledby');
+                iframe.removeAttribute('aria-describedby');
+
+                // Add proper title if missing
+                if (!iframe.getAttribute('title')) {
+                    iframe.setAttribute('title', 'Streamlit component frame');
+                }
+
+                // If iframe is empty or about:blank, hide from accessibility tree
+                if (iframe.src === '' || iframe.src.includes('about:blank')) {
+                    iframe.setAttribute('aria-hidden', 'true');
+                    iframe.setAttribute('tabindex', '-1');
+                }
+            });
+        };
+
+        registerFix(fixIframeAria);
+    })();
+
+    // Fix accessible names for Streamlit toolbar and menu buttons
+    (function() {
+        const fixButtonNames = function() {
+            // Fix toolbar action buttons
+            const toolbarButtons = document.querySelectorAll('.stToolbarActionButton button, [data-testid="stToolbarActionButton"] button');
+            toolbarButtons.forEach(function(button, index) {
+                if (!button.getAttribute('aria-label') && !button.getAttribute('title')) {
+                    // Try to get text content
+                    const textContent = button.textContent.trim();
+                    if (textContent) {
+                        button.setAttribute('aria-label', textContent);
+                    } else {
+                        // Check for common toolbar buttons by their position/class
+                        const parentDiv = button.closest('[data-testid="stToolbarActionButton"]');
+                        if (parentDiv) {
+                            const svgIcon = button.querySelector('svg');
+                            if (svgIcon) {
+                                // Common Streamlit toolbar buttons
+                                if (index === 0) {
+                                    button.setAttribute('aria-label', 'Settings');
+                                } else if (index === 1) {
+                                    button.setAttribute('aria-label', 'Menu options');
+                                } else {
+                                    button.setAttribute('aria-label', 'Toolbar action ' + (index + 1));
+                                }
+                            }
+                        }
+                    }
+                }
+            });
+
+            // Fix main menu buttons
+            const menuButtons = document.querySelectorAll('#MainMenu button, [data-testid="stBaseButton-header"] button, [data-testid="stBaseButton-headerNoPadding"] button');
+            menuButtons.forEach(function(button) {
+                if (!button.getAttribute('aria-label') && !button.getAttribute('title')) {
+                    const textContent = button.textContent.trim();
+                    if (textContent) {
+                        button.setAttribute('aria-label', textContent);
+                    } else {
+                        // Check if it's the hamburger menu button
+                        const svgIcon = button.querySelector('svg');
+                        if (svgIcon) {
+                            const parent = button.closest('#MainMenu');
+                            if (parent) {
+                                button.setAttribute('aria-label', 'Open main menu');
+                            }
+                        }
+                    }
+                }
+
+                // Ensure button role is set
+                if (!button.getAttribute('role')) {
+                    button.setAttribute('role', 'button');
+                }
+            });
+
+            // Fix buttons with kind="header" or kind="headerNoPadding"
+            const headerButtons = document.querySelectorAll('[kind="header"] button, [kind="headerNoPadding"] button');
+            headerButtons.forEach(function(button) {
+                if (!button.getAttribute('aria-label') && !button.getAttribute('title')) {
+                    const textContent = button.textContent.trim();
+                    if (textContent) {
+                        button.setAttribute('aria-label', textContent);
+                    } else {
+                        button.setAttribute('aria-label', 'Menu button');
+                    }
+                }
+            });
+
+            // Fix any button within emotion-cache divs that don't have accessible names
+            const emotionButtons = document.querySelectorAll('[class*="emotion-cache"] button');
+            emotionButtons.forEach(function(button) {
+                if (!button.getAttribute('aria-label') && !button.textContent.trim() && !button.getAttribute('title')) {
+                    // Check for nearby text or icons
+                    const ariaLabel = button.getAttribute('data-testid') || 
+                                     button.closest('[data-testid]')?.getAttribute('data-testid') || 
+                                     'Button';
+                    button.setAttribute('aria-label', ariaLabel.replace(/([A-Z])/g, ' $1').trim());
+                }
+            });
+        };
+
+        registerFix(fixButtonNames);
+    })();
+
+    // Ensure every form element has a proper label
+    (function() {
+        const fixFormLabels = function() {
+            // Fix file uploader input
+            const fileInputs = document.querySelectorAll('input[data-testid="stFileUploaderDropzoneInput"]');
+            fileInputs.forEach(function(input) {
+                // Check if it already has a label
+                const inputId = input.id || 'file-upload-' + Math.random().toString(36).substr(2, 9);
+                input.id = inputId;
+
+                // Check if label exists
+                let label = document.querySelector('label[for="' + inputId + '"]');
+                if (!label) {
+                    // Look for nearby label text
+                    const container = input.closest('[data-testid="stFileUploader"]');
+                    if (container) {
+                        const labelText = container.querySelector('label, .stFileUploader label');
+                        if (labelText && labelText.textContent.trim()) {
+                            // Associate existing label with input
+                            labelText.setAttribute('for', inputId);
+                        } else {
+                            // Create a new label
+                            label = document.createElement('label');
+                            label.setAttribute('for', inputId);
+                            label.textContent = 'Choose a file to upload';
+                            label.style.position = 'absolute';
+                            label.style.left = '-10000px';
+                            label.style.width = '1px';
+                            label.style.height = '1px';
+                            label.style.overflow = 'hidden';
+                            input.parentNode.insertBefore(label, input);
+                        }
+                    }
+                }
+
+                // Ensure aria-label as backup
+                if (!input.getAttribute('aria-label') && !input.getAttribute('aria-labelledby')) {
+                    const container = input.closest('[data-testid="stFileUploader"]');
+                    if (container) {
+                        const headingText = container.querySelector('p, label, div');
+                        const labelText = headingText ? headingText.textContent.trim() : 'File upload';
+                        input.setAttribute('aria-label', labelText || 'Choose a file to upload');
+                    }
+                }
+            });
+
+            // Fix any other unlabeled inputs
+            const allInputs = document.querySelectorAll('input:not([type="hidden"])');
+            allInputs.forEach(function(input) {
+                // Skip if already has label association or aria-label
+                if (input.getAttribute('aria-label') || 
+                    input.getAttribute('aria-labelledby') || 
+                    document.querySelector('label[for="' + input.id + '"]')) {
+                    return;
+                }
+
+                // Try to find associated label by proximity
+                const parentLabel = input.closest('label');
+                if (parentLabel) {
+                    // Input is inside a label, which is valid
+                    return;
+                }
+
+                // Look for Streamlit's label structure
+                const stWidget = input.closest('[data-testid*="stText"], [data-testid*="stNumber"], [data-testid*="stSelect"]');
+                if (stWidget) {
+                    const widgetLabel = stWidget.querySelector('label');
+                    if (widgetLabel && widgetLabel.textContent.trim()) {
+                        // Create unique ID if needed
+                        if (!input.id) {
+                            input.id = 'input-' + Math.random().toString(36).substr(2, 9);
+                        }
+                        widgetLabel.setAttribute('for', input.id);
+                    } else if (!input.getAttribute('aria-label')) {
+                        // Fallback: add aria-label based on context
+                        const testId = stWidget.getAttribute('data-testid');
+                        input.setAttribute('aria-label', testId ? testId.replace(/^st/, '').replace(/([A-Z])/g, ' $1').trim() : 'Input field');
+                    }
+                }
+            });
+
+            // Fix textareas
+            const textareas = document.querySelectorAll('textarea');
+            textareas.forEach(function(textarea) {
+                if (!textarea.getAttribute('aria-label') && 
+                    !textarea.getAttribute('aria-labelledby') && 
+                    !document.querySelector('label[for="' + textarea.id + '"]')) {
+
+                    const stWidget = textarea.closest('[data-testid*="stText"]');
+                    if (stWidget) {
+                        const widgetLabel = stWidget.querySelector('label');
+                        if (widgetLabel && widgetLabel.textContent.trim()) {
+                            if (!textarea.id) {
+                                textarea.id = 'textarea-' + Math.random().toString(36).substr(2, 9);
+                            }
+                            widgetLabel.setAttribute('for', textarea.id);
+                        } else {
+                            textarea.setAttribute('aria-label', 'Text input area');
+                        }
+                    }
+                }
+            });
+
+            // Fix select elements
+            const selects = document.querySelectorAll('select');
+            selects.forEach(function(select) {
+                if (!select.getAttribute('aria-label') && 
+                    !select.getAttribute('aria-labelledby') && 
+                    !document.querySelector('label[for="' + select.id + '"]')) {
+
+                    const stWidget = select.closest('[data-testid*="stSelect"]');
+                    if (stWidget) {
+                        const widgetLabel = stWidget.querySelector('label');
+                        if (widgetLabel && widgetLabel.textContent.trim()) {
+                            if (!select.id) {
+                                select.id = 'select-' + Math.random().toString(36).substr(2, 9);
+                            }
+                            widgetLabel.setAttribute('for', select.id);
+                        } else {
+                            select.setAttribute('aria-label', 'Select option');
+                        }
+                    }
+                }
+            });
+        };
+
+        registerFix(fixFormLabels);
+    })();
+
+    // Ensure all links have discernible text
+    (function() {
+        const fixLinkText = function() {
+            // Find all links (a elements and elements with role="link")
+            const links = document.querySelectorAll('a, [role="link"]');
+
+            links.forEach(function(link) {
+                // Check if link has discernible text
+                const hasText = link.textContent && link.textContent.trim().length > 0;
+                const hasAriaLabel = link.getAttribute('aria-label') && link.getAttribute('aria-label').trim().length > 0;
+                const hasAriaLabelledby = link.getAttribute('aria-labelledby');
+                const hasTitle = link.getAttribute('title') && link.getAttribute('title').trim().length > 0;
+
+                // If no discernible text, add aria-label
+                if (!hasText && !hasAriaLabel && !hasAriaLabelledby && !hasTitle) {
+                    // Try to determine purpose from context
+                    let labelText = '';
+
+                    // Check for images inside the link
+                    const img = link.querySelector('img');
+                    if (img) {
+                        labelText = img.getAttribute('alt') || img.getAttribute('title') || '';
+                    }
+
+                    // Check for SVG icons
+                    if (!labelText) {
+                        const svg = link.querySelector('svg');
+                        if (svg) {
+                            const svgTitle = svg.querySelector('title');
+                            if (svgTitle) {
+                                labelText = svgTitle.textContent;
+                            } else {
+                                // Try to infer from SVG class or nearby text
+                                const svgClass = svg.getAttribute('class') || '';
+                                if (svgClass.includes('github')) labelText = 'GitHub';
+                                else if (svgClass.includes('twitter')) labelText = 'Twitter';
+                                else if (svgClass.includes('linkedin')) labelText = 'LinkedIn';
+                                else if (svgClass.includes('home')) labelText = 'Home';
+                                else if (svgClass.includes('menu')) labelText = 'Menu';
+                                else labelText = 'Link';
+                            }
+                        }
+                    }
+
+                    // Check for data attributes or class names
+                    if (!labelText) {
+                        const dataTestId = link.getAttribute('data-testid');
+                        if (dataTestId) {
+                            labelText = dataTestId.replace(/([A-Z])/g, ' $1').trim();
+                        }
+                    }
+
+                    // Check for container class (like _container_gzau3_1)
+                    if (!labelText) {
+                        const className = link.className;
+                        if (className && className.includes('container')) {
+                            // Check if there's a parent with text
+                            const parent = link.closest('[data-testid], [class*="st-"]');
+                            if (parent) {
+                                const parentText = parent.textContent.trim();
+                                if (parentText && parentText.length < 100) {
+                                    labelText = parentText;
+                                }
+                            }
+                        }
+                    }
+
+                    // Check href for clues
+                    if (!labelText) {
+                        const href = link.getAttribute('href');
+                        if (href) {
+                            if (href.includes('github')) labelText = 'GitHub link';
+                            else if (href.includes('twitter')) labelText = 'Twitter link';
+                            else if (href.includes('linkedin')) labelText = 'LinkedIn link';
+                            else if (href.includes('mailto:')) labelText = 'Email link';
+                            else if (href.includes('tel:')) labelText = 'Phone link';
+                            else if (href.startsWith('#')) labelText = 'Jump to section';
+                            else if (href === '/' || href === '') labelText = 'Home';
+                            else {
+                                // Extract domain or path
+                                try {
+                                    const url = new URL(href, window.location.origin);
+                                    labelText = 'Link to ' + (url.hostname || 'page');
+                                } catch (e) {
+                                    labelText = 'Link';
+                                }
+                            }
+                        }
+                    }
+
+                    // Fallback
+                    if (!labelText) {
+                        labelText = 'Link';
+                    }
+
+                    // Set aria-label
+                    link.setAttribute('aria-label', labelText);
+
+                    // Also add title for mouse users
+                    if (!link.getAttribute('title')) {
+                        link.setAttribute('title', labelText);
+                    }
+                }
+
+                // Ensure role="link" is set for non-anchor elements acting as links
+                if (link.tagName.toLowerCase() !== 'a' && !link.getAttribute('role')) {
+                    link.setAttribute('role', 'link');
+                }
+
+                // Ensure links are keyboard accessible
+                if (link.tagName.toLowerCase() !== 'a' && !link.hasAttribute('tabindex')) {
+                    link.setAttribute('tabindex', '0');
+                }
+            });
+
+            // Specifically fix container links that might be empty
+            const containerLinks = document.querySelectorAll('[class*="container"]');
+            containerLinks.forEach(function(container) {
+                if (container.tagName.toLowerCase() === 'a' || container.getAttribute('role') === 'link') {
+                    const hasText = container.textContent && container.textContent.trim().length > 0;
+                    const hasAriaLabel = container.getAttribute('aria-label');
+
+                    if (!hasText && !hasAriaLabel) {
+                        // Try to find context
+                        const parentSection = container.closest('section, div[data-testid], article');
+                        let contextText = 'Link';
+
+                        if (parentSection) {
+                            const heading = parentSection.querySelector('h1, h2, h3, h4, h5, h6');
+                            if (heading) {
+                                contextText = heading.textContent.trim() + ' link';
+                            }
+                        }
+
+                        container.setAttribute('aria-label', contextText);
+                        container.setAttribute('title', contextText);
+                    }
+                }
+            });
+        };
+
+        registerFix(fixLinkText);
+    })();
+
+    // Ensure viewport meta tag allows text scaling and zooming
+    (function() {
+        const fixViewport = function() {
+            // Find the viewport meta tag
+            let viewportMeta = document.querySelector('meta[name="viewport"]');
+
+            if (viewportMeta) {
+                // Get current content
+                let content = viewportMeta.getAttribute('content') || '';
+
+                // Remove any restrictions on scaling
+                // Remove user-scalable=no or user-scalable=0
+                content = content.replace(/user-scalable\s*=\s*(no|0)/gi, 'user-scalable=yes');
+
+                // Remove restrictive maximum-scale (anything less than 5.0)
+                content = content.replace(/maximum-scale\s*=\s*[0-4](\.\d+)?/gi, 'maximum-scale=5.0');
+
+                // Remove minimum-scale restrictions that are greater than 1.0
+                content = content.replace(/minimum-scale\s*=\s*[2-9](\.\d+)?/gi, 'minimum-scale=1.0');
+
+                // If user-scalable wasn't present, add it
+                if (!content.includes('user-scalable')) {
+                    content += ', user-scalable=yes';
+                }
+
+                // Ensure maximum-scale is at least 5.0 if not present
+                if (!content.includes('maximum-scale')) {
+                    content += ', maximum-scale=5.0';
+                }
+
+                // Clean up any double commas
+                content = content.replace(/,\s*,/g, ',').trim();
+
+                // Remove leading comma if present
+                if (content.startsWith(',')) {
+                    content = content.substring(1).trim();
+                }
+
+                // Update the viewport meta tag
+                viewportMeta.setAttribute('content', content);
+            } else {
+                // If no viewport meta tag exists, create one with proper settings
+                viewportMeta = document.createElement('meta');
+                viewportMeta.setAttribute('name', 'viewport');
+                viewportMeta.setAttribute('content', 'width=device-width, initial-scale=1.0, user-scalable=yes, maximum-scale=5.0');
+
+                // Insert into head
+                const head = document.head || document.getElementsByTagName('head')[0];
+                if (head) {
+                    head.appendChild(viewportMeta);
+                }
+            }
+        };
+
+        registerFix(fixViewport);
+    })();
+
+    // Ensure presentational elements don't have ARIA attributes or tabindex
+    (function() {
+        const fixPresentationalElements = function() {
+            // Find all elements with presentational roles
+            const presentationalElements = document.querySelectorAll('[role="presentation"], [role="none"]');
+
+            presentationalElements.forEach(function(element) {
+                // Remove global ARIA attributes
+                const ariaAttributes = [
+                    'aria-label', 'aria-labelledby', 'aria-describedby', 
+                    'aria-hidden', 'aria-live', 'aria-atomic', 'aria-relevant',
+                    'aria-busy', 'aria-controls', 'aria-current', 'aria-details',
+                    'aria-disabled', 'aria-dropeffect', 'aria-errormessage',
+                    'aria-flowto', 'aria-grabbed', 'aria-haspopup', 'aria-invalid',
+                    'aria-keyshortcuts', 'aria-owns', 'aria-roledescription'
+                ];
+
+                ariaAttributes.forEach(function(attr) {
+                    if (element.hasAttribute(attr)) {
+                        element.removeAttribute(attr);
+                    }
+                });
+
+                // Remove tabindex
+                if (element.hasAttribute('tabindex')) {
+                    element.removeAttribute('tabindex');
+                }
+            });
+
+            // Specifically fix .st-emotion-cache-15nprkh elements
+            const emotionElements = document.querySelectorAll('.st-emotion-cache-15nprkh, [class*="st-emotion-cache"]');
+
+            emotionElements.forEach(function(element) {
+                // Check if element has presentational role
+                const role = element.getAttribute('role');
+                if (role === 'presentation' || role === 'none') {
+                    // Remove ARIA attributes
+                    const attributes = element.attributes;
+                    for (let i = attributes.length - 1; i >= 0; i--) {
+                        const attrName = attributes[i].name;
+                        if (attrName.startsWith('aria-')) {
+                            element.removeAttribute(attrName);
+                        }
+                    }
+
+                    // Remove tabindex
+                    element.removeAttribute('tabindex');
+                }
+
+                // If element has ARIA attributes but is purely decorative, consider adding role="presentation"
+                // (but only if it's truly decorative - be conservative here)
+            });
+
+            // Fix any decorative images that might have incorrect ARIA
+            const decorativeImages = document.querySelectorAll('img[role="presentation"], img[role="none"], img[alt=""]');
+            decorativeImages.forEach(function(img) {
+                // Ensure presentational images don't have conflicting ARIA
+                if (img.getAttribute('role') === 'presentation' || img.getAttribute('role') === 'none' || img.getAttribute('alt') === '') {
+                    // Set role to presentation if alt is empty
+                    if (img.getAttribute('alt') === '' && !img.getAttribute('role')) {
+                        img.setAttribute('role', 'presentation');
+                    }
+
+                    // Remove ARIA attributes from decorative images
+                    const ariaAttrs = ['aria-label', 'aria-labelledby', 'aria-describedby'];
+                    ariaAttrs.forEach(function(attr) {
+                        if (img.hasAttribute(attr)) {
+                            img.removeAttribute(attr);
+                        }
+                    });
+
+                    // Remove tabindex from decorative images
+                    img.removeAttribute('tabindex');
+                }
+            });
+
+            // Fix SVG elements marked as presentational
+            const presentationalSvgs = document.querySelectorAll('svg[role="presentation"], svg[role="none"]');
+            presentationalSvgs.forEach(function(svg) {
+                // Remove ARIA attributes
+                const attributes = svg.attributes;
+                for (let i = attributes.length - 1; i >= 0; i--) {
+                    const attrName = attributes[i].name;
+                    if (attrName.startsWith('aria-')) {
+                        svg.removeAttribute(attrName);
+                    }
+                }
+
+                // Remove tabindex
+                svg.removeAttribute('tabindex');
+
+                // Ensure focusable is false for IE
+                svg.setAttribute('focusable', 'false');
+            });
+        };
+
+        registerFix(fixPresentationalElements);
+    })();
+
+    // Ensure all page content is contained by landmarks
+    (function() {
+        const ensureLandmarks = function() {
+            // First, ensure body has proper structure with explicit regions
+            const body = document.body;
+            if (body && !body.querySelector('[role="banner"]')) {
+                // Add banner role to header area
+                const appHeader = document.querySelector('header, [data-testid="stHeader"]');
+                if (appHeader) {
+                    appHeader.setAttribute('role', 'banner');
+                    appHeader.setAttribute('aria-label', 'Site header');
+                }
+            }
+
+            // Find or create main landmark for primary content
+            let mainElement = document.querySelector('main, [role="main"]');
+
+            if (!mainElement) {
+                // Create main landmark
+                mainElement = document.createElement('main');
+                mainElement.setAttribute('role', 'main');
+                mainElement.setAttribute('id', 'main-content');
+                mainElement.setAttribute('aria-label', 'Main content');
+
+                // Find the main content area (typically .stMainBlockContainer or .block-container)
+                const mainContainer = document.querySelector('.stMainBlockContainer, .main .block-container, [data-testid="stAppViewContainer"] > section > div');
+
+                if (mainContainer) {
+                    // Wrap main container in main element
+                    const parent = mainContainer.parentNode;
+                    parent.insertBefore(mainElement, mainContainer);
+                    mainElement.appendChild(mainContainer);
+                }
+            }
+
+            // Ensure sidebar is properly marked as navigation or complementary
+            const sidebar = document.querySelector('.stSidebar, [data-testid="stSidebar"]');
+            if (sidebar) {
+                if (!sidebar.getAttribute('role')) {
+                    sidebar.setAttribute('role', 'navigation');
+                }
+                if (!sidebar.getAttribute('aria-label')) {
+                    sidebar.setAttribute('aria-label', 'Main navigation');
+                }
+            }
+
+            // Create complementary region for any aside content
+            const asideContent = document.querySelector('aside:not([role])');
+            if (asideContent) {
+                asideContent.setAttribute('role', 'complementary');
+                if (!asideContent.getAttribute('aria-label')) {
+                    asideContent.setAttribute('aria-label', 'Supplementary content');
+                }
+            }
+
+            // Ensure footer has contentinfo role
+            const footerElement = document.querySelector('footer, [data-testid="stFooter"]');
+            if (footerElement) {
+                if (!footerElement.getAttribute('role')) {
+                    footerElement.setAttribute('role', 'contentinfo');
+                }
+                if (!footerElement.getAttribute('aria-label')) {
+                    footerElement.setAttribute('aria-label', 'Site footer');
+                }
+            }
+
+            // Wrap specific failing elements in landmarks if not already contained
+            const failingSelectors = [
+                '.st-bc',
+                '.st-key-use_interactive_tables',
+                '.st-emotion-cache-3pwa5w.stElementContainer',
+                'div[aria-label="Choose Data Input Method:"]',
+                '._profileContainer_gzau3_53'
+            ];
+
+            failingSelectors.forEach(function(selector) {
+                const elements = document.querySelectorAll(selector);
+                elements.forEach(function(element) {
+                    // Check if element is already within a landmark
+                    const isInLandmark = element.closest('main, nav, aside, header, footer, [role="main"], [role="navigation"], [role="complementary"], [role="banner"], [role="contentinfo"], [role="region"][aria-label], [role="region"][aria-labelledby]');
+
+                    if (!isInLandmark) {
+                        // Determine appropriate landmark based on context
+                        let landmark = null;
+
+                        // Check if in sidebar
+                        const isInSidebar = element.closest('.stSidebar, [data-testid="stSidebar"]');
+                        if (isInSidebar) {
+                            // Already handled by sidebar navigation landmark
+                            return;
+                        }
+
+                        // Check if it's a profile container (complementary content)
+                        if (element.classList.contains('_profileContainer_gzau3_53') || element.className.includes('profileContainer')) {
+                            landmark = document.createElement('aside');
+                            landmark.setAttribute('role', 'complementary');
+                            landmark.setAttribute('aria-label', 'User profile');
+                        } else {
+                            // Default to main content region
+                            // Check if main element exists and is accessible
+                            const main = document.querySelector('main, [role="main"]');
+                            if (main) {
+                                // Move element into main if it's not already there
+                                if (!main.contains(element)) {
+                                    main.appendChild(element);
+                                }
+                                return;
+                            } else {
+                                // Create a region landmark
+                                landmark = document.createElement('section');
+                                landmark.setAttribute('role', 'region');
+                                landmark.setAttribute('aria-label', 'Content section');
+                            }
+                        }
+
+                        // Wrap element in landmark
+                        if (landmark) {
+                            const parent = element.parentNode;
+                            parent.insertBefore(landmark, element);
+                            landmark.appendChild(element);
+                        }
+                    }
+                });
+            });
+
+            // Ensure any floating content is in a landmark
+            const allContentDivs = document.querySelectorAll('.stElementContainer, .element-container, [data-testid*="element"]');
+            allContentDivs.forEach(function(div) {
+                const isInLandmark = div.closest('main, nav, aside, header, footer, [role="main"], [role="navigation"], [role="complementary"], [role="banner"], [role="contentinfo"], [role="region"][aria-label], [role="region"][aria-labelledby]');
+
+                if (!isInLandmark && div.textContent.trim().length > 0) {
+                    // Check if it's in the main app view
+                    const isInMainView = div.closest('[data-testid="stAppViewContainer"]');
+                    if (isInMainView) {
+                        // Ensure main element exists
+                        let main = document.querySelector('main, [role="main"]');
+                        if (!main) {
+                            main = document.createElement('main');
+                            main.setAttribute('role', 'main');
+                            const appView = document.querySelector('[data-testid="stAppViewContainer"]');
+                            if (appView) {
+                                const firstChild = appView.firstChild;
+                                appView.insertBefore(main, firstChild);
+                            }
+                        }
+
+                        // Move to main if not already there
+                        if (main && !main.contains(div)) {
+                            main.appendChild(div);
+                        }
+                    }
+                }
+            });
+
+            // Add skip navigation link target
+            const skipTarget = document.getElementById('main-content');
+            if (!skipTarget && mainElement) {
+                mainElement.setAttribute('id', 'main-content');
+                mainElement.setAttribute('tabindex', '-1');
+            }
+
+            // Ensure header/banner landmark if Streamlit header exists
+            const header = document.querySelector('header, [data-testid="stHeader"]');
+            if (header && !header.getAttribute('role')) {
+                header.setAttribute('role', 'banner');
+            }
+
+            // Mark footer as contentinfo if it exists
+            const footer = document.querySelector('footer, [data-testid="stFooter"]');
+            if (footer && !footer.getAttribute('role')) {
+                footer.setAttribute('role', 'contentinfo');
+            }
+        };
+
+        registerFix(ensureLandmarks);
+    })();
+
+    // Ensure proper heading structure for screen readers
+    (function() {
+        const ensureHeadingStructure = function() {
+            // Convert Streamlit's title to h1
+            const titleElements = document.querySelectorAll('[data-testid="stTitle"], .stTitle');
+            titleElements.forEach(function(element) {
+                if (element.tagName.toLowerCase() !== 'h1') {
+                    const h1 = document.createElement('h1');
+                    h1.textContent = element.textContent;
+                    h1.className = element.className;
+                    h1.style.cssText = element.style.cssText;
+                    element.parentNode.replaceChild(h1, element);
+                }
+            });
+
+            // Convert Streamlit's st.header() to h2
+            const headerElements = document.querySelectorAll('[data-testid="stHeader"]:not(header), .stHeader:not(header)');
+            headerElements.forEach(function(element) {
+                if (element.tagName.toLowerCase() !== 'h2' && element.tagName.toLowerCase() !== 'header') {
+                    const h2 = document.createElement('h2');
+                    h2.textContent = element.textContent;
+                    h2.className = element.className;
+                    h2.style.cssText = element.style.cssText;
+                    element.parentNode.replaceChild(h2, element);
+                }
+            });
+
+            // Convert Streamlit's st.subheader() to h3
+            const subheaderElements = document.querySelectorAll('[data-testid="stSubheader"], .stSubheader');
+            subheaderElements.forEach(function(element) {
+                if (element.tagName.toLowerCase() !== 'h3') {
+                    const h3 = document.createElement('h3');
+                    h3.textContent = element.textContent;
+                    h3.className = element.className;
+                    h3.style.cssText = element.style.cssText;
+                    element.parentNode.replaceChild(h3, element);
+                }
+            });
+
+            // Find markdown headers and ensure they're using proper heading tags
+            const markdownElements = document.querySelectorAll('.stMarkdown, [data-testid="stMarkdown"]');
+            markdownElements.forEach(function(container) {
+                // Check for h1-h6 elements
+                const headings = container.querySelectorAll('h1, h2, h3, h4, h5, h6');
+                headings.forEach(function(heading) {
+                    // Ensure heading has proper role
+                    if (!heading.getAttribute('role')) {
+                        heading.setAttribute('role', 'heading');
+                        const level = parseInt(heading.tagName.substring(1));
+                        heading.setAttribute('aria-level', level.toString());
+                    }
+                });
+            });
+
+            // Ensure main title exists (CueStats app title)
+            let mainH1 = document.querySelector('h1');
+            if (!mainH1) {
+                // Check for the app title in various possible locations
+                const appTitle = document.querySelector('[data-testid="stAppViewContainer"] h1, .main h1, .stTitle');
+                if (!appTitle) {
+                    // Create h1 from title if it exists as text
+                    const possibleTitle = document.querySelector('div[data-testid*="Title"], .element-container:first-child');
+                    if (possibleTitle && possibleTitle.textContent.includes('CueStats')) {
+                        mainH1 = document.createElement('h1');
+                        mainH1.textContent = possibleTitle.textContent.trim();
+                        mainH1.style.fontSize = '2.5rem';
+                        mainH1.style.fontWeight = '700';
+                        mainH1.style.marginBottom = '1rem';
+
+                        // Insert at the beginning of main content
+                        const mainContent = document.querySelector('main, [role="main"], .stMainBlockContainer, .main');
+                        if (mainContent) {
+                            mainContent.insertBefore(mainH1, mainContent.firstChild);
+                        }
+                    }
+                }
+            }
+
+            // Ensure all section headings are properly tagged
+            const sectionLabels = document.querySelectorAll('[aria-label*="Tab"], [aria-label*="Section"]');
+            sectionLabels.forEach(function(section) {
+                const label = section.getAttribute('aria-label');
+                if (label && !section.querySelector('h2, h3')) {
+                    // Create heading for this section
+                    const heading = document.createElement('h2');
+                    heading.textContent = label;
+                    heading.className = 'visually-hidden'; // Hide visually but keep for screen readers
+                    heading.style.position = 'absolute';
+                    heading.style.left = '-10000px';
+                    heading.style.width = '1px';
+                    heading.style.height = '1px';
+                    heading.style.overflow = 'hidden';
+                    section.insertBefore(heading, section.firstChild);
+                }
+            });
+
+            // Add heading hierarchy validation and fix if needed
+            const allHeadings = document.querySelectorAll('h1, h2, h3, h4, h5, h6');
+            let lastLevel = 0;
+            allHeadings.forEach(function(heading) {
+                const level = parseInt(heading.tagName.substring(1));
+
+                // Ensure proper ARIA attributes
+                heading.setAttribute('role', 'heading');
+                heading.setAttribute('aria-level', level.toString());
+
+                // Check for proper hierarchy (optional - just ensure ARIA is correct)
+                if (level - lastLevel > 1) {
+                    // Skipped heading level - aria-level still reflects actual level
+                    // This is informational; the heading is still accessible
+                }
+                lastLevel = level;
+            });
+        };
+
+        registerFix(ensureHeadingStructure);
+    })();
+
+    if (!ENABLE_A11Y_DOM_FIXES) {
+        return;
+    }
+
+    let pending = null;
+    let observer = null;
+    const observeOptions = { childList: true, subtree: true };
+
+    // The fixes mutate the DOM themselves, so the observer is paused while
+    // they run to keep a pass from scheduling another one
+    const runObservedFixes = function() {
+        pending = null;
+        if (observer) {
+            observer.disconnect();
+        }
+        runFixes();
+        if (observer) {
+            observer.observe(document.body, observeOptions);
+        }
+    };
+
+    const scheduleFixes = function() {
+        if (pending !== null) {
+            clearTimeout(pending);
+        }
+        pending = setTimeout(runObservedFixes, FIX_DEBOUNCE_MS);
+    };
+    window.__cuestatA11y.schedule = scheduleFixes;
+
+    // One shared observer catches Streamlit reruns and dynamically added
+    // content; bursts of mutations collapse into a single pass
+    if (typeof MutationObserver !== 'undefined') {
+        observer = new MutationObserver(scheduleFixes);
+        window.__cuestatA11y.observer = observer;
+    }
+
+    // Run immediately, then once the DOM and page have finished loading
+    runObservedFixes();
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', scheduleFixes);
+    }
+    window.addEventListener('load', scheduleFixes);
+})();
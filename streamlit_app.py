@@ -1,108 +1,132 @@
 import streamlit as st
+import streamlit.components.v1 as components
 import pandas as pd
 import numpy as np
 import io
+import json
+import os
 import re
+import hashlib
 import time
+import tempfile
+import threading
+import concurrent.futures
+import urllib.error
 import urllib.parse
-from scipy import stats
-import matplotlib.pyplot as plt # Added for plotting
-import plotly.express as px
-import plotly.graph_objects as go
+import urllib.request
+from collections import OrderedDict, deque
+from pandas.api.types import union_categoricals
+from pandas.io.parsers import TextParser
+import functools
+import importlib
+import importlib.util
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    scipy.stats, matplotlib and plotly together add a couple of seconds to a
+    cold start, yet a student who only opens Data Input never touches them.
+    After the first access the import is served from sys.modules, so later
+    reruns pay only a dictionary lookup.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<LazyModule {self._name!r} ({state})>"
+
+
+stats = LazyModule('scipy.stats')
+plt = LazyModule('matplotlib.pyplot')  # Added for plotting
+px = LazyModule('plotly.express')
+go = LazyModule('plotly.graph_objects')
+plotly_subplots = LazyModule('plotly.subplots')
+
+
+def lazy_cache_resource(**options):
+    """`st.cache_resource` for helpers that most reruns never call.
+
+    st.cache_resource hashes the decorated function's source every time the script
+    defines it, which costs 0.4-1.8 ms per function on each rerun. This decorator
+    builds the cached wrapper on the function's first call in a run instead, so
+    reruns that do not use the helper skip that cost. The cache itself is the one
+    `st.cache_resource(**options)` keeps, shared across reruns and sessions.
+    """
+    def decorate(func):
+        cached = []
+
+        @functools.wraps(func)
+        def call(*args, **kwargs):
+            if not cached:
+                cached.append(st.cache_resource(**options)(func))
+            return cached[0](*args, **kwargs)
+        return call
+    return decorate
 
 PLOTLY_QUARTILE_METHOD = "hazen"
 PANDAS_QUARTILE_INTERPOLATION = "linear"
 
 
-def get_update_batches(num_batches, max_updates=12):
-    """Return evenly spaced batch indices to limit expensive redraws."""
-    if num_batches <= 0:
-        return set()
-    if num_batches <= max_updates:
-        return set(range(num_batches))
-    return set(np.linspace(0, num_batches - 1, num=max_updates, dtype=int).tolist())
-
-def compute_quartile(series, q):
-    values = pd.to_numeric(series, errors='coerce').dropna().to_numpy()
-    if values.size == 0:
-        return np.nan
-    values = np.sort(values)
+def batch_quantiles(data, qs, presorted=False):
+    """Return every quantile in `qs` using PLOTLY_QUARTILE_METHOD from a single sort.
 
-    def quantile_linear(vals, quantile):
-        try:
-            return float(np.quantile(vals, quantile, method="linear"))
-        except TypeError:
-            return float(np.quantile(vals, quantile, interpolation="linear"))
-
-    def quantile_exclusive(vals, quantile):
-        n = len(vals)
-        if n == 1:
-            return float(vals[0])
-        pos = quantile * (n + 1)
-        if pos <= 1:
-            return float(vals[0])
-        if pos >= n:
-            return float(vals[-1])
-        lower = int(np.floor(pos))
-        upper = int(np.ceil(pos))
-        if lower == upper:
-            return float(vals[lower - 1])
-        lower_val = vals[lower - 1]
-        upper_val = vals[upper - 1]
-        frac = pos - lower
-        return float(lower_val + frac * (upper_val - lower_val))
-
-    def quantile_inclusive(vals, quantile):
-        n = len(vals)
-        if n == 1:
-            return float(vals[0])
-        pos = quantile * (n - 1) + 1
-        if pos <= 1:
-            return float(vals[0])
-        if pos >= n:
-            return float(vals[-1])
-        lower = int(np.floor(pos))
-        upper = int(np.ceil(pos))
-        if lower == upper:
-            return float(vals[lower - 1])
-        lower_val = vals[lower - 1]
-        upper_val = vals[upper - 1]
-        frac = pos - lower
-        return float(lower_val + frac * (upper_val - lower_val))
+    `data` is a 1-D array; NaNs are ignored and an array without values yields NaN
+    for every quantile. Positions are 1-based as in the textbook definitions: hazen
+    ``n*q + 0.5`` (same as ``np.quantile(method="hazen")``), exclusive ``(n + 1)*q``
+    and inclusive/linear ``(n - 1)*q + 1``, clamped to [1, n].
+    """
+    values = np.asarray(data, dtype='float64')
+    q = np.atleast_1d(np.asarray(qs, dtype='float64'))
+    # NaNs sort to the end, so the first `n` values are valid
+    sorted_values = values if presorted else np.sort(values)
+    n = np.count_nonzero(~np.isnan(sorted_values))
+    if n == 0:
+        return np.full(q.shape, np.nan)
 
     if PLOTLY_QUARTILE_METHOD == "hazen":
-        try:
-            return float(np.quantile(values, q, method="hazen"))
-        except TypeError:
-            n = len(values)
-            if n == 1:
-                return float(values[0])
-            pos = q * (n + 0.5) + 0.5
-            if pos <= 1:
-                return float(values[0])
-            if pos >= n:
-                return float(values[-1])
-            lower = int(np.floor(pos))
-            upper = int(np.ceil(pos))
-            if lower == upper:
-                return float(values[lower - 1])
-            lower_val = values[lower - 1]
-            upper_val = values[upper - 1]
-            frac = pos - lower
-            return float(lower_val + frac * (upper_val - lower_val))
-    if PLOTLY_QUARTILE_METHOD == "exclusive":
-        return quantile_exclusive(values, q)
-    if PLOTLY_QUARTILE_METHOD == "inclusive":
-        return quantile_inclusive(values, q)
-    return quantile_linear(values, q)
+        pos = n * q + 0.5
+    elif PLOTLY_QUARTILE_METHOD == "exclusive":
+        pos = (n + 1) * q
+    else:
+        pos = (n - 1) * q + 1
+    pos = np.clip(pos, 1, n)
+    lower = np.floor(pos).astype(np.intp)
+    frac = pos - lower
+    upper = np.minimum(lower + 1, n)
+    lower_vals = sorted_values[lower - 1]
+    return lower_vals + frac * (sorted_values[upper - 1] - lower_vals)
 import logging
 # Toggle to enable AgGrid debug prints (set to True only when debugging)
 DEBUG_AGRID = False
+# Only probe for st_aggrid; importing it pulls in its frontend bundle on every cold start
 try:
-    from st_aggrid import AgGrid, GridOptionsBuilder, GridUpdateMode, DataReturnMode
-    ST_AGRID_AVAILABLE = True
+    ST_AGRID_AVAILABLE = importlib.util.find_spec('st_aggrid') is not None
 except Exception:
     ST_AGRID_AVAILABLE = False
+# pyarrow ships with Streamlit; Parquet/Feather support is disabled gracefully without it
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pa_compute
+    import pyarrow.feather as pa_feather
+    import pyarrow.parquet as pa_parquet
+    PYARROW_AVAILABLE = True
+except Exception:
+    PYARROW_AVAILABLE = False
+# python-calamine (optional) reads Excel files much faster than openpyxl
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except Exception:
+    CALAMINE_AVAILABLE = False
 # --- Streamlit App Configuration ---
 st.set_page_config(layout="wide", page_title="CUESTAt: STAT C1000 Analysis Tool")
 st.title("CUESTAt: STAT C1000 Analysis Tool")
@@ -135,1242 +159,98 @@ st.markdown("""
 </noscript>
 """, unsafe_allow_html=True)
 
-# Inject CSS to style tables globally: solid black borders, bold headers, auto-fit columns
-st.markdown("""
-<style>
-/* Apply to Streamlit-rendered tables and pandas Styler HTML tables */
-div[data-testid="stDataFrame"] table, div[data-testid="stTable"] table, .stMarkdown table {
-  border-collapse: collapse !important;
-  table-layout: auto !important;
-  width: auto !important;
-}
-.stMarkdown table th, div[data-testid="stDataFrame"] table th, div[data-testid="stTable"] table th {
-  border: 2px solid black !important;
-  padding: 6px !important;
-  font-weight: 700 !important;
-  white-space: nowrap !important;
-}
-.stMarkdown table td, div[data-testid="stDataFrame"] table td, div[data-testid="stTable"] table td {
-  border: 1px solid black !important;
-  padding: 6px !important;
-  white-space: nowrap !important;
-}
-/* Bold row and column labels in interactive tables (st.dataframe, st.data_editor) */
-div[data-testid="stDataFrame"] th, div[data-testid="stTable"] th {
-  font-weight: 700 !important;
-}
-/* Target Streamlit's ArrowTable and other table components */
-[data-testid="stDataFrame"] tbody tr th,
-[data-testid="stDataFrame"] thead tr th,
-[data-testid="stTable"] tbody tr th,
-[data-testid="stTable"] thead tr th {
-  font-weight: 700 !important;
-}
-
-/* Tighten metric typography while keeping readable sizes */
-[data-testid="stMetricValue"] {
-    font-size: 0.95rem !important;
-    line-height: 1.1 !important;
-}
-[data-testid="stMetricLabel"] {
-    font-size: 0.8rem !important;
-    line-height: 1.1 !important;
-}
-/* Style st.data_editor and st.dataframe cells with solid black borders */
-[data-testid="stDataFrame"] td, [data-testid="stDataFrame"] th,
-[data-testid="stTable"] td, [data-testid="stTable"] th {
-  border: 1px solid black !important;
-}
-/* Target all table elements in data editor container */
-[data-testid="stDataFrame"] table {
-  border: 2px solid black !important;
-  border-collapse: collapse !important;
-}
-[data-testid="stDataFrame"] tr {
-  border: 1px solid black !important;
-}
-[data-testid="stDataFrame"] td, 
-[data-testid="stDataFrame"] th {
-  border: 1px solid black !important;
-}
-/* Ensure borders appear on all interactive table elements */
-[role="table"] {
-  border: 1px solid black !important;
-}
-[role="rowgroup"] {
-  border: 1px solid black !important;
-}
-[role="row"] {
-  border: 1px solid black !important;
-}
-[role="gridcell"], 
-[role="columnheader"] {
-  border: 1px solid black !important;
-}
-/* Focus indicators for keyboard navigation */
-button:focus-visible,
-input:focus-visible,
-select:focus-visible,
-textarea:focus-visible {
-  outline: 3px solid #0173B2 !important;
-  outline-offset: 2px !important;
-  box-shadow: 0 0 0 3px rgba(1, 115, 178, 0.25) !important;
-}
-/* Skip to content link */
-.skip-link {
-  position: absolute;
-  top: -40px;
-  left: 0;
-  background: #0173B2;
-  color: white;
-  padding: 8px;
-  text-decoration: none;
-  z-index: 100;
-}
-.skip-link:focus {
-  top: 0;
-}
-/* Fix ARIA attributes on Streamlit-generated iframes */
-/* Remove invalid ARIA attributes from iframes in sidebar and main menu */
-.stSidebar iframe,
-#MainMenu iframe {
-  /* Ensure iframes have proper title for accessibility */
-}
-/* Add title attribute via CSS pseudo-elements won't work, so we ensure via JS */
-/* Hide iframes that don't need to be exposed to screen readers */
-.stSidebar iframe[src*="about:blank"],
-#MainMenu iframe[src*="about:blank"] {
-  display: none !important;
-}
-/* Fix contrast issues for Streamlit emotion-cache elements */
-/* Ensure WCAG 2 AA compliance (4.5:1 for normal text, 3:1 for large text) */
-.st-emotion-cache-1sct1q3,
-[class*="st-emotion-cache"] {
-  color: #000000 !important; /* Black text for maximum contrast */
-}
-/* If element is on dark background, ensure white text */
-.st-emotion-cache-1sct1q3[style*="background"],
-[class*="st-emotion-cache"][style*="background: rgb(14, 17, 23)"],
-[class*="st-emotion-cache"][style*="background:#0e1117"],
-[class*="st-emotion-cache"][style*="background-color:#0e1117"],
-[class*="st-emotion-cache"][style*="background-color: rgb(14, 17, 23)"] {
-  color: #FFFFFF !important; /* White text on dark backgrounds */
-}
-/* Ensure links and interactive elements have sufficient contrast */
-.st-emotion-cache-1sct1q3 a,
-[class*="st-emotion-cache"] a {
-  color: #0173B2 !important; /* Accessible blue - passes WCAG AA */
-  text-decoration: underline !important;
-}
-/* Ensure button text has proper contrast */
-.st-emotion-cache-1sct1q3 button,
-[class*="st-emotion-cache"] button {
-  color: #000000 !important;
-  background-color: #FFFFFF !important;
-  border: 2px solid #000000 !important;
-}
-.st-emotion-cache-1sct1q3 button:hover,
-[class*="st-emotion-cache"] button:hover {
-  background-color: #0173B2 !important;
-  color: #FFFFFF !important;
-  border-color: #0173B2 !important;
-}
-/* Fix any low contrast text in sidebar or main content */
-.stSidebar .st-emotion-cache-1sct1q3,
-.stSidebar [class*="st-emotion-cache"] {
-  color: #262730 !important; /* Dark gray on light background - 12.63:1 ratio */
-}
-/* Ensure proper contrast for all text elements */
-.st-emotion-cache-1sct1q3 p,
-.st-emotion-cache-1sct1q3 span,
-.st-emotion-cache-1sct1q3 div,
-[class*="st-emotion-cache"] p,
-[class*="st-emotion-cache"] span {
-  color: inherit !important;
-}
-/* Fix placeholder text contrast */
-.st-emotion-cache-1sct1q3 input::placeholder,
-[class*="st-emotion-cache"] input::placeholder {
-  color: #6c757d !important; /* Medium gray - 4.5:1 ratio */
-  opacity: 1 !important;
-}
-
-/* Darken Plotly modebar icons for better visibility */
-/* Target the modebar buttons and icons */
-.plotly .modebar {
-  background-color: #f8f9fa !important;
-}
-
-/* Style all modebar buttons - remove borders, center icons */
-.plotly .modebar-btn {
-  color: #1a1a1a !important;
-  opacity: 1 !important;
-  border: none !important;
-  border-radius: 0 !important;
-  padding: 3px 4px !important;
-  margin: 0 2px !important;
-  display: inline-flex !important;
-  align-items: center !important;
-  justify-content: center !important;
-}
-
-.plotly .modebar-btn:hover {
-  background-color: #e0e0e0 !important;
-  color: #000000 !important;
-  border: none !important;
-}
-
-/* Target SVG icons inside modebar buttons */
-.plotly .modebar-btn svg {
-  stroke: #1a1a1a !important;
-  fill: #1a1a1a !important;
-  opacity: 1 !important;
-  width: 20px !important;
-  height: 20px !important;
-  vertical-align: middle !important;
-}
-
-.plotly .modebar-btn:hover svg {
-  stroke: #000000 !important;
-  fill: #000000 !important;
-  opacity: 1 !important;
-}
-
-/* Style modebar group separators */
-.plotly .modebar-group {
-  border-right: 1px solid #d0d0d0 !important;
-}
-
-/* Improve button visibility in the modebar */
-.plotly .modebar-btn path {
-  stroke: #1a1a1a !important;
-  fill: #1a1a1a !important;
-}
-
-.plotly .modebar-btn:hover path {
-  stroke: #000000 !important;
-  fill: #000000 !important;
-}
-
-/* Darken icons for camera/download button - remove borders */
-.plotly .modebar-btn.active {
-  background-color: #e8e8e8 !important;
-  color: #000000 !important;
-  border: none !important;
-}
-
-.plotly .modebar-btn.active svg {
-  stroke: #000000 !important;
-  fill: #000000 !important;
-}
-</style>
-""", unsafe_allow_html=True)
-
-# Inject JavaScript for accessibility fixes
-st.markdown("""
+# --- Static UI Assets ---
+# The global table CSS and the accessibility DOM fixes live in static/ and are
+# served by Streamlit's static file handler (server.enableStaticServing). The
+# page only receives a small loader on each rerun; the browser fetches and
+# caches the assets once, and the loader's guard keeps them from being
+# re-injected on later reruns.
+UI_ASSET_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+UI_STYLESHEET = 'cuestat.css'
+UI_A11Y_SCRIPT = 'cuestat_a11y.js'
+
+UI_ASSET_LOADER = """
 <script>
-const ENABLE_A11Y_DOM_FIXES = false;
-if (ENABLE_A11Y_DOM_FIXES) {
-// Fix ARIA attributes on Streamlit iframes
 (function() {
-    // Wait for DOM to be ready
-    const fixIframeAria = function() {
-        // Find all iframes in sidebar and main menu
-        const iframes = document.querySelectorAll('.stSidebar iframe, #MainMenu iframe');
-        iframes.forEach(function(iframe) {
-            // Remove invalid ARIA attributes from iframes
-            iframe.removeAttribute('aria-hidden');
-            iframe.removeAttribute('aria-label');
-            iframe.removeAttribute('aria-labelledby');
-            iframe.removeAttribute('aria-describedby');
-            
-            // Add proper title if missing
-            if (!iframe.getAttribute('title')) {
-                iframe.setAttribute('title', 'Streamlit component frame');
-            }
-            
-            // If iframe is empty or about:blank, hide from accessibility tree
-            if (iframe.src === '' || iframe.src.includes('about:blank')) {
-                iframe.setAttribute('aria-hidden', 'true');
-                iframe.setAttribute('tabindex', '-1');
-            }
-        });
-    };
-    
-    // Run immediately
-    fixIframeAria();
-    
-    // Also run on Streamlit reruns
-    if (window.addEventListener) {
-        window.addEventListener('load', fixIframeAria);
-    }
-    
-    // Use MutationObserver to catch dynamically added iframes
-    if (typeof MutationObserver !== 'undefined') {
-        const observer = new MutationObserver(fixIframeAria);
-        observer.observe(document.body, { childList: true, subtree: true });
+    const w = window.parent || window;
+    const d = w.document;
+    const assets = %s;
+    if (w.__cuestatAssets === assets.version) {
+        return;
     }
-})();
-
-// Fix accessible names for Streamlit toolbar and menu buttons
-(function() {
-    const fixButtonNames = function() {
-        // Fix toolbar action buttons
-        const toolbarButtons = document.querySelectorAll('.stToolbarActionButton button, [data-testid="stToolbarActionButton"] button');
-        toolbarButtons.forEach(function(button, index) {
-            if (!button.getAttribute('aria-label') && !button.getAttribute('title')) {
-                // Try to get text content
-                const textContent = button.textContent.trim();
-                if (textContent) {
-                    button.setAttribute('aria-label', textContent);
-                } else {
-                    // Check for common toolbar buttons by their position/class
-                    const parentDiv = button.closest('[data-testid="stToolbarActionButton"]');
-                    if (parentDiv) {
-                        const svgIcon = button.querySelector('svg');
-                        if (svgIcon) {
-                            // Common Streamlit toolbar buttons
-                            if (index === 0) {
-                                button.setAttribute('aria-label', 'Settings');
-                            } else if (index === 1) {
-                                button.setAttribute('aria-label', 'Menu options');
-                            } else {
-                                button.setAttribute('aria-label', 'Toolbar action ' + (index + 1));
-                            }
-                        }
-                    }
-                }
-            }
-        });
-        
-        // Fix main menu buttons
-        const menuButtons = document.querySelectorAll('#MainMenu button, [data-testid="stBaseButton-header"] button, [data-testid="stBaseButton-headerNoPadding"] button');
-        menuButtons.forEach(function(button) {
-            if (!button.getAttribute('aria-label') && !button.getAttribute('title')) {
-                const textContent = button.textContent.trim();
-                if (textContent) {
-                    button.setAttribute('aria-label', textContent);
-                } else {
-                    // Check if it's the hamburger menu button
-                    const svgIcon = button.querySelector('svg');
-                    if (svgIcon) {
-                        const parent = button.closest('#MainMenu');
-                        if (parent) {
-                            button.setAttribute('aria-label', 'Open main menu');
-                        }
-                    }
-                }
-            }
-            
-            // Ensure button role is set
-            if (!button.getAttribute('role')) {
-                button.setAttribute('role', 'button');
-            }
-        });
-        
-        // Fix buttons with kind="header" or kind="headerNoPadding"
-        const headerButtons = document.querySelectorAll('[kind="header"] button, [kind="headerNoPadding"] button');
-        headerButtons.forEach(function(button) {
-            if (!button.getAttribute('aria-label') && !button.getAttribute('title')) {
-                const textContent = button.textContent.trim();
-                if (textContent) {
-                    button.setAttribute('aria-label', textContent);
-                } else {
-                    button.setAttribute('aria-label', 'Menu button');
-                }
-            }
-        });
-        
-        // Fix any button within emotion-cache divs that don't have accessible names
-        const emotionButtons = document.querySelectorAll('[class*="emotion-cache"] button');
-        emotionButtons.forEach(function(button) {
-            if (!button.getAttribute('aria-label') && !button.textContent.trim() && !button.getAttribute('title')) {
-                // Check for nearby text or icons
-                const ariaLabel = button.getAttribute('data-testid') || 
-                                 button.closest('[data-testid]')?.getAttribute('data-testid') || 
-                                 'Button';
-                button.setAttribute('aria-label', ariaLabel.replace(/([A-Z])/g, ' $1').trim());
-            }
-        });
-    };
-    
-    // Run immediately
-    fixButtonNames();
-    
-    // Run on load
-    if (window.addEventListener) {
-        window.addEventListener('load', fixButtonNames);
+    w.__cuestatAssets = assets.version;
+    let link = d.getElementById('cuestat-styles');
+    if (!link) {
+        link = d.createElement('link');
+        link.id = 'cuestat-styles';
+        link.rel = 'stylesheet';
+        d.head.appendChild(link);
     }
-    
-    // Monitor for dynamically added buttons
-    if (typeof MutationObserver !== 'undefined') {
-        const observer = new MutationObserver(fixButtonNames);
-        observer.observe(document.body, { childList: true, subtree: true, attributes: false });
+    link.href = assets.css;
+    if (!d.getElementById('cuestat-a11y')) {
+        const script = d.createElement('script');
+        script.id = 'cuestat-a11y';
+        script.src = assets.js;
+        d.head.appendChild(script);
     }
-    
-    // Also run on Streamlit reruns (after a short delay)
-    setTimeout(fixButtonNames, 500);
-    setTimeout(fixButtonNames, 1000);
 })();
+</script>
+"""
 
-// Ensure every form element has a proper label
-(function() {
-    const fixFormLabels = function() {
-        // Fix file uploader input
-        const fileInputs = document.querySelectorAll('input[data-testid="stFileUploaderDropzoneInput"]');
-        fileInputs.forEach(function(input) {
-            // Check if it already has a label
-            const inputId = input.id || 'file-upload-' + Math.random().toString(36).substr(2, 9);
-            input.id = inputId;
-            
-            // Check if label exists
-            let label = document.querySelector('label[for="' + inputId + '"]');
-            if (!label) {
-                // Look for nearby label text
-                const container = input.closest('[data-testid="stFileUploader"]');
-                if (container) {
-                    const labelText = container.querySelector('label, .stFileUploader label');
-                    if (labelText && labelText.textContent.trim()) {
-                        // Associate existing label with input
-                        labelText.setAttribute('for', inputId);
-                    } else {
-                        // Create a new label
-                        label = document.createElement('label');
-                        label.setAttribute('for', inputId);
-                        label.textContent = 'Choose a file to upload';
-                        label.style.position = 'absolute';
-                        label.style.left = '-10000px';
-                        label.style.width = '1px';
-                        label.style.height = '1px';
-                        label.style.overflow = 'hidden';
-                        input.parentNode.insertBefore(label, input);
-                    }
-                }
-            }
-            
-            // Ensure aria-label as backup
-            if (!input.getAttribute('aria-label') && !input.getAttribute('aria-labelledby')) {
-                const container = input.closest('[data-testid="stFileUploader"]');
-                if (container) {
-                    const headingText = container.querySelector('p, label, div');
-                    const labelText = headingText ? headingText.textContent.trim() : 'File upload';
-                    input.setAttribute('aria-label', labelText || 'Choose a file to upload');
-                }
-            }
-        });
-        
-        // Fix any other unlabeled inputs
-        const allInputs = document.querySelectorAll('input:not([type="hidden"])');
-        allInputs.forEach(function(input) {
-            // Skip if already has label association or aria-label
-            if (input.getAttribute('aria-label') || 
-                input.getAttribute('aria-labelledby') || 
-                document.querySelector('label[for="' + input.id + '"]')) {
-                return;
-            }
-            
-            // Try to find associated label by proximity
-            const parentLabel = input.closest('label');
-            if (parentLabel) {
-                // Input is inside a label, which is valid
-                return;
-            }
-            
-            // Look for Streamlit's label structure
-            const stWidget = input.closest('[data-testid*="stText"], [data-testid*="stNumber"], [data-testid*="stSelect"]');
-            if (stWidget) {
-                const widgetLabel = stWidget.querySelector('label');
-                if (widgetLabel && widgetLabel.textContent.trim()) {
-                    // Create unique ID if needed
-                    if (!input.id) {
-                        input.id = 'input-' + Math.random().toString(36).substr(2, 9);
-                    }
-                    widgetLabel.setAttribute('for', input.id);
-                } else if (!input.getAttribute('aria-label')) {
-                    // Fallback: add aria-label based on context
-                    const testId = stWidget.getAttribute('data-testid');
-                    input.setAttribute('aria-label', testId ? testId.replace(/^st/, '').replace(/([A-Z])/g, ' $1').trim() : 'Input field');
-                }
-            }
-        });
-        
-        // Fix textareas
-        const textareas = document.querySelectorAll('textarea');
-        textareas.forEach(function(textarea) {
-            if (!textarea.getAttribute('aria-label') && 
-                !textarea.getAttribute('aria-labelledby') && 
-                !document.querySelector('label[for="' + textarea.id + '"]')) {
-                
-                const stWidget = textarea.closest('[data-testid*="stText"]');
-                if (stWidget) {
-                    const widgetLabel = stWidget.querySelector('label');
-                    if (widgetLabel && widgetLabel.textContent.trim()) {
-                        if (!textarea.id) {
-                            textarea.id = 'textarea-' + Math.random().toString(36).substr(2, 9);
-                        }
-                        widgetLabel.setAttribute('for', textarea.id);
-                    } else {
-                        textarea.setAttribute('aria-label', 'Text input area');
-                    }
-                }
-            }
-        });
-        
-        // Fix select elements
-        const selects = document.querySelectorAll('select');
-        selects.forEach(function(select) {
-            if (!select.getAttribute('aria-label') && 
-                !select.getAttribute('aria-labelledby') && 
-                !document.querySelector('label[for="' + select.id + '"]')) {
-                
-                const stWidget = select.closest('[data-testid*="stSelect"]');
-                if (stWidget) {
-                    const widgetLabel = stWidget.querySelector('label');
-                    if (widgetLabel && widgetLabel.textContent.trim()) {
-                        if (!select.id) {
-                            select.id = 'select-' + Math.random().toString(36).substr(2, 9);
-                        }
-                        widgetLabel.setAttribute('for', select.id);
-                    } else {
-                        select.setAttribute('aria-label', 'Select option');
-                    }
-                }
-            }
-        });
-    };
-    
-    // Run immediately
-    fixFormLabels();
-    
-    // Run on load
-    if (window.addEventListener) {
-        window.addEventListener('load', fixFormLabels);
-    }
-    
-    // Monitor for dynamically added form elements
-    if (typeof MutationObserver !== 'undefined') {
-        const observer = new MutationObserver(fixFormLabels);
-        observer.observe(document.body, { childList: true, subtree: true });
-    }
-    
-    // Run on Streamlit reruns
-    setTimeout(fixFormLabels, 500);
-    setTimeout(fixFormLabels, 1000);
-    setTimeout(fixFormLabels, 2000);
-})();
 
-// Ensure all links have discernible text
-(function() {
-    const fixLinkText = function() {
-        // Find all links (a elements and elements with role="link")
-        const links = document.querySelectorAll('a, [role="link"]');
-        
-        links.forEach(function(link) {
-            // Check if link has discernible text
-            const hasText = link.textContent && link.textContent.trim().length > 0;
-            const hasAriaLabel = link.getAttribute('aria-label') && link.getAttribute('aria-label').trim().length > 0;
-            const hasAriaLabelledby = link.getAttribute('aria-labelledby');
-            const hasTitle = link.getAttribute('title') && link.getAttribute('title').trim().length > 0;
-            
-            // If no discernible text, add aria-label
-            if (!hasText && !hasAriaLabel && !hasAriaLabelledby && !hasTitle) {
-                // Try to determine purpose from context
-                let labelText = '';
-                
-                // Check for images inside the link
-                const img = link.querySelector('img');
-                if (img) {
-                    labelText = img.getAttribute('alt') || img.getAttribute('title') || '';
-                }
-                
-                // Check for SVG icons
-                if (!labelText) {
-                    const svg = link.querySelector('svg');
-                    if (svg) {
-                        const svgTitle = svg.querySelector('title');
-                        if (svgTitle) {
-                            labelText = svgTitle.textContent;
-                        } else {
-                            // Try to infer from SVG class or nearby text
-                            const svgClass = svg.getAttribute('class') || '';
-                            if (svgClass.includes('github')) labelText = 'GitHub';
-                            else if (svgClass.includes('twitter')) labelText = 'Twitter';
-                            else if (svgClass.includes('linkedin')) labelText = 'LinkedIn';
-                            else if (svgClass.includes('home')) labelText = 'Home';
-                            else if (svgClass.includes('menu')) labelText = 'Menu';
-                            else labelText = 'Link';
-                        }
-                    }
-                }
-                
-                // Check for data attributes or class names
-                if (!labelText) {
-                    const dataTestId = link.getAttribute('data-testid');
-                    if (dataTestId) {
-                        labelText = dataTestId.replace(/([A-Z])/g, ' $1').trim();
-                    }
-                }
-                
-                // Check for container class (like _container_gzau3_1)
-                if (!labelText) {
-                    const className = link.className;
-                    if (className && className.includes('container')) {
-                        // Check if there's a parent with text
-                        const parent = link.closest('[data-testid], [class*="st-"]');
-                        if (parent) {
-                            const parentText = parent.textContent.trim();
-                            if (parentText && parentText.length < 100) {
-                                labelText = parentText;
-                            }
-                        }
-                    }
-                }
-                
-                // Check href for clues
-                if (!labelText) {
-                    const href = link.getAttribute('href');
-                    if (href) {
-                        if (href.includes('github')) labelText = 'GitHub link';
-                        else if (href.includes('twitter')) labelText = 'Twitter link';
-                        else if (href.includes('linkedin')) labelText = 'LinkedIn link';
-                        else if (href.includes('mailto:')) labelText = 'Email link';
-                        else if (href.includes('tel:')) labelText = 'Phone link';
-                        else if (href.startsWith('#')) labelText = 'Jump to section';
-                        else if (href === '/' || href === '') labelText = 'Home';
-                        else {
-                            // Extract domain or path
-                            try {
-                                const url = new URL(href, window.location.origin);
-                                labelText = 'Link to ' + (url.hostname || 'page');
-                            } catch (e) {
-                                labelText = 'Link';
-                            }
-                        }
-                    }
-                }
-                
-                // Fallback
-                if (!labelText) {
-                    labelText = 'Link';
-                }
-                
-                // Set aria-label
-                link.setAttribute('aria-label', labelText);
-                
-                // Also add title for mouse users
-                if (!link.getAttribute('title')) {
-                    link.setAttribute('title', labelText);
-                }
-            }
-            
-            // Ensure role="link" is set for non-anchor elements acting as links
-            if (link.tagName.toLowerCase() !== 'a' && !link.getAttribute('role')) {
-                link.setAttribute('role', 'link');
-            }
-            
-            // Ensure links are keyboard accessible
-            if (link.tagName.toLowerCase() !== 'a' && !link.hasAttribute('tabindex')) {
-                link.setAttribute('tabindex', '0');
-            }
-        });
-        
-        // Specifically fix container links that might be empty
-        const containerLinks = document.querySelectorAll('[class*="container"]');
-        containerLinks.forEach(function(container) {
-            if (container.tagName.toLowerCase() === 'a' || container.getAttribute('role') === 'link') {
-                const hasText = container.textContent && container.textContent.trim().length > 0;
-                const hasAriaLabel = container.getAttribute('aria-label');
-                
-                if (!hasText && !hasAriaLabel) {
-                    // Try to find context
-                    const parentSection = container.closest('section, div[data-testid], article');
-                    let contextText = 'Link';
-                    
-                    if (parentSection) {
-                        const heading = parentSection.querySelector('h1, h2, h3, h4, h5, h6');
-                        if (heading) {
-                            contextText = heading.textContent.trim() + ' link';
-                        }
-                    }
-                    
-                    container.setAttribute('aria-label', contextText);
-                    container.setAttribute('title', contextText);
-                }
-            }
-        });
-    };
-    
-    // Run immediately
-    fixLinkText();
-    
-    // Run on load
-    if (window.addEventListener) {
-        window.addEventListener('load', fixLinkText);
-    }
-    
-    // Monitor for dynamically added links
-    if (typeof MutationObserver !== 'undefined') {
-        const observer = new MutationObserver(fixLinkText);
-        observer.observe(document.body, { childList: true, subtree: true });
-    }
-    
-    // Run on Streamlit reruns
-    setTimeout(fixLinkText, 500);
-    setTimeout(fixLinkText, 1000);
-    setTimeout(fixLinkText, 2000);
-})();
+@st.cache_resource(show_spinner=False)
+def get_ui_asset_versions():
+    """Return a short content hash per static asset for cache busting."""
+    versions = {}
+    for name in (UI_STYLESHEET, UI_A11Y_SCRIPT):
+        with open(os.path.join(UI_ASSET_DIR, name), 'rb') as handle:
+            versions[name] = hashlib.sha1(handle.read()).hexdigest()[:12]
+    return versions
 
-// Ensure viewport meta tag allows text scaling and zooming
-(function() {
-    const fixViewport = function() {
-        // Find the viewport meta tag
-        let viewportMeta = document.querySelector('meta[name="viewport"]');
-        
-        if (viewportMeta) {
-            // Get current content
-            let content = viewportMeta.getAttribute('content') || '';
-            
-            // Remove any restrictions on scaling
-            // Remove user-scalable=no or user-scalable=0
-            content = content.replace(/user-scalable\s*=\s*(no|0)/gi, 'user-scalable=yes');
-            
-            // Remove restrictive maximum-scale (anything less than 5.0)
-            content = content.replace(/maximum-scale\s*=\s*[0-4](\.\d+)?/gi, 'maximum-scale=5.0');
-            
-            // Remove minimum-scale restrictions that are greater than 1.0
-            content = content.replace(/minimum-scale\s*=\s*[2-9](\.\d+)?/gi, 'minimum-scale=1.0');
-            
-            // If user-scalable wasn't present, add it
-            if (!content.includes('user-scalable')) {
-                content += ', user-scalable=yes';
-            }
-            
-            // Ensure maximum-scale is at least 5.0 if not present
-            if (!content.includes('maximum-scale')) {
-                content += ', maximum-scale=5.0';
-            }
-            
-            // Clean up any double commas
-            content = content.replace(/,\s*,/g, ',').trim();
-            
-            // Remove leading comma if present
-            if (content.startsWith(',')) {
-                content = content.substring(1).trim();
-            }
-            
-            // Update the viewport meta tag
-            viewportMeta.setAttribute('content', content);
-        } else {
-            // If no viewport meta tag exists, create one with proper settings
-            viewportMeta = document.createElement('meta');
-            viewportMeta.setAttribute('name', 'viewport');
-            viewportMeta.setAttribute('content', 'width=device-width, initial-scale=1.0, user-scalable=yes, maximum-scale=5.0');
-            
-            // Insert into head
-            const head = document.head || document.getElementsByTagName('head')[0];
-            if (head) {
-                head.appendChild(viewportMeta);
-            }
-        }
-    };
-    
-    // Run immediately - viewport needs to be fixed as early as possible
-    fixViewport();
-    
-    // Also run on DOMContentLoaded to ensure it's applied
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', fixViewport);
-    } else {
-        fixViewport();
-    }
-})();
 
-// Ensure presentational elements don't have ARIA attributes or tabindex
-(function() {
-    const fixPresentationalElements = function() {
-        // Find all elements with presentational roles
-        const presentationalElements = document.querySelectorAll('[role="presentation"], [role="none"]');
-        
-        presentationalElements.forEach(function(element) {
-            // Remove global ARIA attributes
-            const ariaAttributes = [
-                'aria-label', 'aria-labelledby', 'aria-describedby', 
-                'aria-hidden', 'aria-live', 'aria-atomic', 'aria-relevant',
-                'aria-busy', 'aria-controls', 'aria-current', 'aria-details',
-                'aria-disabled', 'aria-dropeffect', 'aria-errormessage',
-                'aria-flowto', 'aria-grabbed', 'aria-haspopup', 'aria-invalid',
-                'aria-keyshortcuts', 'aria-owns', 'aria-roledescription'
-            ];
-            
-            ariaAttributes.forEach(function(attr) {
-                if (element.hasAttribute(attr)) {
-                    element.removeAttribute(attr);
-                }
-            });
-            
-            // Remove tabindex
-            if (element.hasAttribute('tabindex')) {
-                element.removeAttribute('tabindex');
-            }
-        });
-        
-        // Specifically fix .st-emotion-cache-15nprkh elements
-        const emotionElements = document.querySelectorAll('.st-emotion-cache-15nprkh, [class*="st-emotion-cache"]');
-        
-        emotionElements.forEach(function(element) {
-            // Check if element has presentational role
-            const role = element.getAttribute('role');
-            if (role === 'presentation' || role === 'none') {
-                // Remove ARIA attributes
-                const attributes = element.attributes;
-                for (let i = attributes.length - 1; i >= 0; i--) {
-                    const attrName = attributes[i].name;
-                    if (attrName.startsWith('aria-')) {
-                        element.removeAttribute(attrName);
-                    }
-                }
-                
-                // Remove tabindex
-                element.removeAttribute('tabindex');
-            }
-            
-            // If element has ARIA attributes but is purely decorative, consider adding role="presentation"
-            // (but only if it's truly decorative - be conservative here)
-        });
-        
-        // Fix any decorative images that might have incorrect ARIA
-        const decorativeImages = document.querySelectorAll('img[role="presentation"], img[role="none"], img[alt=""]');
-        decorativeImages.forEach(function(img) {
-            // Ensure presentational images don't have conflicting ARIA
-            if (img.getAttribute('role') === 'presentation' || img.getAttribute('role') === 'none' || img.getAttribute('alt') === '') {
-                // Set role to presentation if alt is empty
-                if (img.getAttribute('alt') === '' && !img.getAttribute('role')) {
-                    img.setAttribute('role', 'presentation');
-                }
-                
-                // Remove ARIA attributes from decorative images
-                const ariaAttrs = ['aria-label', 'aria-labelledby', 'aria-describedby'];
-                ariaAttrs.forEach(function(attr) {
-                    if (img.hasAttribute(attr)) {
-                        img.removeAttribute(attr);
-                    }
-                });
-                
-                // Remove tabindex from decorative images
-                img.removeAttribute('tabindex');
-            }
-        });
-        
-        // Fix SVG elements marked as presentational
-        const presentationalSvgs = document.querySelectorAll('svg[role="presentation"], svg[role="none"]');
-        presentationalSvgs.forEach(function(svg) {
-            // Remove ARIA attributes
-            const attributes = svg.attributes;
-            for (let i = attributes.length - 1; i >= 0; i--) {
-                const attrName = attributes[i].name;
-                if (attrName.startsWith('aria-')) {
-                    svg.removeAttribute(attrName);
-                }
-            }
-            
-            // Remove tabindex
-            svg.removeAttribute('tabindex');
-            
-            // Ensure focusable is false for IE
-            svg.setAttribute('focusable', 'false');
-        });
-    };
-    
-    // Run immediately
-    fixPresentationalElements();
-    
-    // Run on load
-    if (window.addEventListener) {
-        window.addEventListener('load', fixPresentationalElements);
-    }
-    
-    // Monitor for dynamically added elements
-    if (typeof MutationObserver !== 'undefined') {
-        const observer = new MutationObserver(fixPresentationalElements);
-        observer.observe(document.body, { 
-            childList: true, 
-            subtree: true,
-            attributes: true,
-            attributeFilter: ['role', 'class']
-        });
-    }
-    
-    // Run on Streamlit reruns
-    setTimeout(fixPresentationalElements, 500);
-    setTimeout(fixPresentationalElements, 1000);
-})();
+@st.cache_resource(show_spinner=False)
+def get_inline_stylesheet():
+    """Return the stylesheet as a <style> block for servers without static serving."""
+    with open(os.path.join(UI_ASSET_DIR, UI_STYLESHEET), encoding='utf-8') as handle:
+        return f"<style>\n{handle.read()}</style>"
 
-// Ensure all page content is contained by landmarks
-(function() {
-    const ensureLandmarks = function() {
-        // First, ensure body has proper structure with explicit regions
-        const body = document.body;
-        if (body && !body.querySelector('[role="banner"]')) {
-            // Add banner role to header area
-            const appHeader = document.querySelector('header, [data-testid="stHeader"]');
-            if (appHeader) {
-                appHeader.setAttribute('role', 'banner');
-                appHeader.setAttribute('aria-label', 'Site header');
-            }
-        }
-        
-        // Find or create main landmark for primary content
-        let mainElement = document.querySelector('main, [role="main"]');
-        
-        if (!mainElement) {
-            // Create main landmark
-            mainElement = document.createElement('main');
-            mainElement.setAttribute('role', 'main');
-            mainElement.setAttribute('id', 'main-content');
-            mainElement.setAttribute('aria-label', 'Main content');
-            
-            // Find the main content area (typically .stMainBlockContainer or .block-container)
-            const mainContainer = document.querySelector('.stMainBlockContainer, .main .block-container, [data-testid="stAppViewContainer"] > section > div');
-            
-            if (mainContainer) {
-                // Wrap main container in main element
-                const parent = mainContainer.parentNode;
-                parent.insertBefore(mainElement, mainContainer);
-                mainElement.appendChild(mainContainer);
-            }
-        }
-        
-        // Ensure sidebar is properly marked as navigation or complementary
-        const sidebar = document.querySelector('.stSidebar, [data-testid="stSidebar"]');
-        if (sidebar) {
-            if (!sidebar.getAttribute('role')) {
-                sidebar.setAttribute('role', 'navigation');
-            }
-            if (!sidebar.getAttribute('aria-label')) {
-                sidebar.setAttribute('aria-label', 'Main navigation');
-            }
-        }
-        
-        // Create complementary region for any aside content
-        const asideContent = document.querySelector('aside:not([role])');
-        if (asideContent) {
-            asideContent.setAttribute('role', 'complementary');
-            if (!asideContent.getAttribute('aria-label')) {
-                asideContent.setAttribute('aria-label', 'Supplementary content');
-            }
-        }
-        
-        // Ensure footer has contentinfo role
-        const footerElement = document.querySelector('footer, [data-testid="stFooter"]');
-        if (footerElement) {
-            if (!footerElement.getAttribute('role')) {
-                footerElement.setAttribute('role', 'contentinfo');
-            }
-            if (!footerElement.getAttribute('aria-label')) {
-                footerElement.setAttribute('aria-label', 'Site footer');
-            }
-        }
-        
-        // Wrap specific failing elements in landmarks if not already contained
-        const failingSelectors = [
-            '.st-bc',
-            '.st-key-use_interactive_tables',
-            '.st-emotion-cache-3pwa5w.stElementContainer',
-            'div[aria-label="Choose Data Input Method:"]',
-            '._profileContainer_gzau3_53'
-        ];
-        
-        failingSelectors.forEach(function(selector) {
-            const elements = document.querySelectorAll(selector);
-            elements.forEach(function(element) {
-                // Check if element is already within a landmark
-                const isInLandmark = element.closest('main, nav, aside, header, footer, [role="main"], [role="navigation"], [role="complementary"], [role="banner"], [role="contentinfo"], [role="region"][aria-label], [role="region"][aria-labelledby]');
-                
-                if (!isInLandmark) {
-                    // Determine appropriate landmark based on context
-                    let landmark = null;
-                    
-                    // Check if in sidebar
-                    const isInSidebar = element.closest('.stSidebar, [data-testid="stSidebar"]');
-                    if (isInSidebar) {
-                        // Already handled by sidebar navigation landmark
-                        return;
-                    }
-                    
-                    // Check if it's a profile container (complementary content)
-                    if (element.classList.contains('_profileContainer_gzau3_53') || element.className.includes('profileContainer')) {
-                        landmark = document.createElement('aside');
-                        landmark.setAttribute('role', 'complementary');
-                        landmark.setAttribute('aria-label', 'User profile');
-                    } else {
-                        // Default to main content region
-                        // Check if main element exists and is accessible
-                        const main = document.querySelector('main, [role="main"]');
-                        if (main) {
-                            // Move element into main if it's not already there
-                            if (!main.contains(element)) {
-                                main.appendChild(element);
-                            }
-                            return;
-                        } else {
-                            // Create a region landmark
-                            landmark = document.createElement('section');
-                            landmark.setAttribute('role', 'region');
-                            landmark.setAttribute('aria-label', 'Content section');
-                        }
-                    }
-                    
-                    // Wrap element in landmark
-                    if (landmark) {
-                        const parent = element.parentNode;
-                        parent.insertBefore(landmark, element);
-                        landmark.appendChild(element);
-                    }
-                }
-            });
-        });
-        
-        // Ensure any floating content is in a landmark
-        const allContentDivs = document.querySelectorAll('.stElementContainer, .element-container, [data-testid*="element"]');
-        allContentDivs.forEach(function(div) {
-            const isInLandmark = div.closest('main, nav, aside, header, footer, [role="main"], [role="navigation"], [role="complementary"], [role="banner"], [role="contentinfo"], [role="region"][aria-label], [role="region"][aria-labelledby]');
-            
-            if (!isInLandmark && div.textContent.trim().length > 0) {
-                // Check if it's in the main app view
-                const isInMainView = div.closest('[data-testid="stAppViewContainer"]');
-                if (isInMainView) {
-                    // Ensure main element exists
-                    let main = document.querySelector('main, [role="main"]');
-                    if (!main) {
-                        main = document.createElement('main');
-                        main.setAttribute('role', 'main');
-                        const appView = document.querySelector('[data-testid="stAppViewContainer"]');
-                        if (appView) {
-                            const firstChild = appView.firstChild;
-                            appView.insertBefore(main, firstChild);
-                        }
-                    }
-                    
-                    // Move to main if not already there
-                    if (main && !main.contains(div)) {
-                        main.appendChild(div);
-                    }
-                }
-            }
-        });
-        
-        // Add skip navigation link target
-        const skipTarget = document.getElementById('main-content');
-        if (!skipTarget && mainElement) {
-            mainElement.setAttribute('id', 'main-content');
-            mainElement.setAttribute('tabindex', '-1');
-        }
-        
-        // Ensure header/banner landmark if Streamlit header exists
-        const header = document.querySelector('header, [data-testid="stHeader"]');
-        if (header && !header.getAttribute('role')) {
-            header.setAttribute('role', 'banner');
-        }
-        
-        // Mark footer as contentinfo if it exists
-        const footer = document.querySelector('footer, [data-testid="stFooter"]');
-        if (footer && !footer.getAttribute('role')) {
-            footer.setAttribute('role', 'contentinfo');
-        }
-    };
-    
-    // Run immediately
-    ensureLandmarks();
-    
-    // Run after DOM is fully loaded
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', ensureLandmarks);
-    } else {
-        ensureLandmarks();
-    }
-    
-    // Run on load
-    if (window.addEventListener) {
-        window.addEventListener('load', ensureLandmarks);
-    }
-    
-    // Monitor for dynamically added content
-    if (typeof MutationObserver !== 'undefined') {
-        const observer = new MutationObserver(function(mutations) {
-            // Only run if significant changes occurred
-            let shouldRun = false;
-            mutations.forEach(function(mutation) {
-                if (mutation.addedNodes.length > 0) {
-                    shouldRun = true;
-                }
-            });
-            if (shouldRun) {
-                ensureLandmarks();
-            }
-        });
-        observer.observe(document.body, { childList: true, subtree: true });
-    }
-    
-    // Run on Streamlit reruns
-    setTimeout(ensureLandmarks, 500);
-    setTimeout(ensureLandmarks, 1000);
-    setTimeout(ensureLandmarks, 2000);
-    
-    // Verification: Log landmark status
-    setTimeout(function() {
-        const landmarks = document.querySelectorAll('main, nav, aside, header, footer, [role="main"], [role="navigation"], [role="complementary"], [role="banner"], [role="contentinfo"], [role="region"][aria-label]');
-        console.log('Accessibility: Found ' + landmarks.length + ' landmarks on page');
-        landmarks.forEach(function(landmark) {
-            const role = landmark.getAttribute('role') || landmark.tagName.toLowerCase();
-            const label = landmark.getAttribute('aria-label') || 'no label';
-            console.log('  - ' + role + ': ' + label);
-        });
-    }, 3000);
-})();
 
-// Ensure proper heading structure for screen readers
-(function() {
-    const ensureHeadingStructure = function() {
-        // Convert Streamlit's title to h1
-        const titleElements = document.querySelectorAll('[data-testid="stTitle"], .stTitle');
-        titleElements.forEach(function(element) {
-            if (element.tagName.toLowerCase() !== 'h1') {
-                const h1 = document.createElement('h1');
-                h1.textContent = element.textContent;
-                h1.className = element.className;
-                h1.style.cssText = element.style.cssText;
-                element.parentNode.replaceChild(h1, element);
-            }
-        });
-        
-        // Convert Streamlit's st.header() to h2
-        const headerElements = document.querySelectorAll('[data-testid="stHeader"]:not(header), .stHeader:not(header)');
-        headerElements.forEach(function(element) {
-            if (element.tagName.toLowerCase() !== 'h2' && element.tagName.toLowerCase() !== 'header') {
-                const h2 = document.createElement('h2');
-                h2.textContent = element.textContent;
-                h2.className = element.className;
-                h2.style.cssText = element.style.cssText;
-                element.parentNode.replaceChild(h2, element);
-            }
-        });
-        
-        // Convert Streamlit's st.subheader() to h3
-        const subheaderElements = document.querySelectorAll('[data-testid="stSubheader"], .stSubheader');
-        subheaderElements.forEach(function(element) {
-            if (element.tagName.toLowerCase() !== 'h3') {
-                const h3 = document.createElement('h3');
-                h3.textContent = element.textContent;
-                h3.className = element.className;
-                h3.style.cssText = element.style.cssText;
-                element.parentNode.replaceChild(h3, element);
-            }
-        });
-        
-        // Find markdown headers and ensure they're using proper heading tags
-        const markdownElements = document.querySelectorAll('.stMarkdown, [data-testid="stMarkdown"]');
-        markdownElements.forEach(function(container) {
-            // Check for h1-h6 elements
-            const headings = container.querySelectorAll('h1, h2, h3, h4, h5, h6');
-            headings.forEach(function(heading) {
-                // Ensure heading has proper role
-                if (!heading.getAttribute('role')) {
-                    heading.setAttribute('role', 'heading');
-                    const level = parseInt(heading.tagName.substring(1));
-                    heading.setAttribute('aria-level', level.toString());
-                }
-            });
-        });
-        
-        // Ensure main title exists (CueStats app title)
-        let mainH1 = document.querySelector('h1');
-        if (!mainH1) {
-            // Check for the app title in various possible locations
-            const appTitle = document.querySelector('[data-testid="stAppViewContainer"] h1, .main h1, .stTitle');
-            if (!appTitle) {
-                // Create h1 from title if it exists as text
-                const possibleTitle = document.querySelector('div[data-testid*="Title"], .element-container:first-child');
-                if (possibleTitle && possibleTitle.textContent.includes('CueStats')) {
-                    mainH1 = document.createElement('h1');
-                    mainH1.textContent = possibleTitle.textContent.trim();
-                    mainH1.style.fontSize = '2.5rem';
-                    mainH1.style.fontWeight = '700';
-                    mainH1.style.marginBottom = '1rem';
-                    
-                    // Insert at the beginning of main content
-                    const mainContent = document.querySelector('main, [role="main"], .stMainBlockContainer, .main');
-                    if (mainContent) {
-                        mainContent.insertBefore(mainH1, mainContent.firstChild);
-                    }
-                }
-            }
-        }
-        
-        // Ensure all section headings are properly tagged
-        const sectionLabels = document.querySelectorAll('[aria-label*="Tab"], [aria-label*="Section"]');
-        sectionLabels.forEach(function(section) {
-            const label = section.getAttribute('aria-label');
-            if (label && !section.querySelector('h2, h3')) {
-                // Create heading for this section
-                const heading = document.createElement('h2');
-                heading.textContent = label;
-                heading.className = 'visually-hidden'; // Hide visually but keep for screen readers
-                heading.style.position = 'absolute';
-                heading.style.left = '-10000px';
-                heading.style.width = '1px';
-                heading.style.height = '1px';
-                heading.style.overflow = 'hidden';
-                section.insertBefore(heading, section.firstChild);
-            }
-        });
-        
-        // Add heading hierarchy validation and fix if needed
-        const allHeadings = document.querySelectorAll('h1, h2, h3, h4, h5, h6');
-        let lastLevel = 0;
-        allHeadings.forEach(function(heading) {
-            const level = parseInt(heading.tagName.substring(1));
-            
-            // Ensure proper ARIA attributes
-            heading.setAttribute('role', 'heading');
-            heading.setAttribute('aria-level', level.toString());
-            
-            // Check for proper hierarchy (optional - just ensure ARIA is correct)
-            if (level - lastLevel > 1) {
-                // Skipped heading level - aria-level still reflects actual level
-                // This is informational; the heading is still accessible
-            }
-            lastLevel = level;
-        });
-    };
-    
-    // Run immediately
-    ensureHeadingStructure();
-    
-    // Run after DOM is fully loaded
-    if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', ensureHeadingStructure);
-    }
-    
-    // Run on load
-    if (window.addEventListener) {
-        window.addEventListener('load', ensureHeadingStructure);
-    }
-    
-    // Monitor for dynamically added content
-    if (typeof MutationObserver !== 'undefined') {
-        const observer = new MutationObserver(ensureHeadingStructure);
-        observer.observe(document.body, { childList: true, subtree: true });
+def static_asset_url(name, version):
+    """Build the URL Streamlit serves a static/ file under, honouring baseUrlPath."""
+    base = (st.get_option('server.baseUrlPath') or '').strip('/')
+    prefix = f"/{base}" if base else ''
+    return f"{prefix}/app/static/{name}?v={version}"
+
+
+def inject_ui_assets():
+    """Load the global CSS and accessibility script once per browser session.
+
+    The loader markup is identical on every rerun, so Streamlit keeps the
+    existing element instead of remounting it. When static serving is turned
+    off the stylesheet is inlined as before and the script is skipped.
+    """
+    if not st.get_option('server.enableStaticServing'):
+        st.markdown(get_inline_stylesheet(), unsafe_allow_html=True)
+        return
+    versions = get_ui_asset_versions()
+    assets = {
+        'version': '-'.join(versions[name] for name in (UI_STYLESHEET, UI_A11Y_SCRIPT)),
+        'css': static_asset_url(UI_STYLESHEET, versions[UI_STYLESHEET]),
+        'js': static_asset_url(UI_A11Y_SCRIPT, versions[UI_A11Y_SCRIPT]),
     }
-    
-    // Run multiple times for Streamlit reruns
-    setTimeout(ensureHeadingStructure, 100);
-    setTimeout(ensureHeadingStructure, 500);
-    setTimeout(ensureHeadingStructure, 1000);
-    setTimeout(ensureHeadingStructure, 2000);
-})();
-}
-</script>
-""", unsafe_allow_html=True)
+    loader = UI_ASSET_LOADER % json.dumps(assets)
+    # st.html only exists from Streamlit 1.33 and runs scripts only in newer releases
+    st_html = getattr(st, 'html', None)
+    if st_html is not None:
+        try:
+            st_html(loader, unsafe_allow_javascript=True)
+            return
+        except TypeError:
+            pass
+    components.html(loader, height=0)
+
+
+inject_ui_assets()
 
 
 # --- Global Variables/Session State ---
@@ -1393,145 +273,947 @@ def create_default_manual_entry_table(rows=30):
     """Create the default manual-entry table with blank rows."""
     return pd.DataFrame({'Column 1': [''] * rows})
 
-# --- Helper Functions ---
-def process_manual_entry_data(df):
-    # Remove ALL auto-generated/internal columns (those with :: prefix)
-    if isinstance(df, pd.DataFrame):
-        internal_cols = [col for col in df.columns if str(col).startswith('::')]
-        if internal_cols:
-            df = df.drop(columns=internal_cols)
 
-    # Convert columns to numeric where possible
-    processed_df = df.copy()
-    for col in processed_df.columns:
-        converted_col = pd.to_numeric(processed_df[col], errors='coerce')
-        # If at least some values could be converted, use the converted column
-        if not converted_col.isna().all():
-            processed_df[col] = converted_col.fillna(processed_df[col]) # Fill non-numeric back with original string
-    return processed_df
+class ActiveDataset:
+    """Typed, load-once representation of the data shown in every analysis tab.
 
-def has_meaningful_dataframe_data(df):
-    """Return True only when a DataFrame has at least one non-blank data row."""
-    if not isinstance(df, pd.DataFrame) or df.empty:
-        return False
-    normalized_df = df.replace(r'^\s*$', np.nan, regex=True)
-    return not normalized_df.dropna(how='all').empty
+    `frame` holds float64/Int64 columns for numeric data, categorical columns for
+    text and object columns for mixed content, with real missing values instead of ''.
+    `blank_mask` marks the cells that were empty in the source and `numeric` keeps the
+    float64 coercion of every column that has numeric values, so the tabs never need
+    to call `pd.to_numeric` on a rerun. `profiles` is the column profile index for this
+    `version` of the data (see `build_column_profiles`). `source_key` identifies the
+    upload the dataset was parsed from (see `get_upload_cache_key`), if any.
 
-def sanitize_manual_entry_df_state():
-    """Remove any internal columns (starting with '::') from the session manual_entry_df.
+    Streamlit re-executes this script on every interaction, so instances stored in
+    session state may belong to an earlier definition of this class; callers should
+    rely on the attributes below rather than `isinstance` checks.
+    """
 
-    This helps prevent UI components (AgGrid / Arrow) from exposing internal ID columns.
+    def __init__(self, frame, blank_mask, numeric, version=None, profiles=None, source_key=None):
+        self.frame = frame
+        self.blank_mask = blank_mask
+        self.numeric = numeric
+        self.version = version if version is not None else _dataset_version(frame)
+        self.profiles = profiles if profiles is not None else build_column_profiles(frame, numeric)
+        self.source_key = source_key
+
+    @property
+    def columns(self):
+        return list(self.frame.columns)
+
+    @property
+    def shape(self):
+        return self.frame.shape
+
+    @property
+    def empty(self):
+        return self.frame.empty
+
+    def has_data(self):
+        """Return True when at least one cell is not blank."""
+        return not self.frame.empty and not bool(self.blank_mask.to_numpy().all())
+
+    def is_numeric(self, col):
+        """Return True when the column has at least one numeric value."""
+        return self.numeric.get(col) is not None
+
+    def is_categorical(self, col):
+        """Return True when the column can be used as a categorical variable."""
+        profile = self.profiles.get(col)
+        return bool(profile and profile['categorical'])
+
+    def numeric_series(self, col):
+        """Return the numeric values of a column (blanks and text dropped) as a float Series."""
+        values = self.numeric.get(col)
+        if values is None:
+            return pd.Series([], dtype='float64', name=col)
+        valid = ~np.isnan(values)
+        return pd.Series(values[valid], index=self.frame.index[valid], name=col)
+
+    def display_frame(self, rows=None):
+        """Return a copy of the data (or of a `rows` slice) with blank cells rendered as empty strings."""
+        if rows is None:
+            return self.frame.astype(object).mask(self.blank_mask, '')
+        return self.frame.iloc[rows].astype(object).mask(self.blank_mask.iloc[rows], '')
+
+    def rename(self, rename_map):
+        """Return a dataset with renamed columns without re-typing any values."""
+        numeric = {rename_map.get(col, col): values for col, values in self.numeric.items()}
+        profiles = {rename_map.get(col, col): profile for col, profile in self.profiles.items()}
+        return ActiveDataset(
+            self.frame.rename(columns=rename_map),
+            self.blank_mask.rename(columns=rename_map),
+            numeric,
+            profiles=profiles,
+            source_key=self.source_key
+        )
+
+
+# Numeric columns with at most this many distinct values are offered as categorical
+CATEGORICAL_MAX_UNIQUE = 15
+
+
+def build_column_profiles(frame, numeric):
+    """Return the column profile index for a typed frame.
+
+    Each profile records whether the column has numeric values, whether its dtype is
+    numeric, non-null and unique counts, numeric min/max, and whether it qualifies as
+    categorical (non-numeric, or numeric with at most CATEGORICAL_MAX_UNIQUE values; a
+    column with no non-missing values never does).
+    Selectbox builders read these instead of scanning the data on every rerun.
     """
-    try:
-        df = st.session_state.get('manual_entry_df')
-        if isinstance(df, pd.DataFrame):
-            internal = [c for c in df.columns if str(c).startswith('::')]
-            if internal:
-                st.session_state.manual_entry_df = df.drop(columns=internal)
-    except Exception:
-        pass
+    profiles = {}
+    for col in frame.columns:
+        series = frame[col]
+        values = numeric.get(col)
+        numeric_dtype = pd.api.types.is_numeric_dtype(series)
+        unique_count = int(series.nunique(dropna=True))
+        non_null = int(series.notna().sum())
+        profiles[col] = {
+            'numeric': values is not None,
+            'numeric_dtype': numeric_dtype,
+            'non_null': non_null,
+            'unique': unique_count,
+            'min': float(np.nanmin(values)) if values is not None else None,
+            'max': float(np.nanmax(values)) if values is not None else None,
+            'categorical': non_null > 0 and ((not numeric_dtype) or unique_count <= CATEGORICAL_MAX_UNIQUE),
+        }
+    return profiles
 
-def styled_dataframe_html(df, hide_index=False):
-    """Return HTML for a pandas DataFrame with solid black borders and auto column widths.
 
-    This uses pandas Styler and is intended to be rendered with
-    `st.markdown(html, unsafe_allow_html=True)` so columns size to their contents
-    and table cells have solid black borders.
+def _dataset_version(frame):
+    """Return a content hash identifying a typed frame (column names included)."""
+    digest = hashlib.sha1(repr([str(c) for c in frame.columns]).encode('utf-8'))
+    if not frame.empty:
+        digest.update(pd.util.hash_pandas_object(frame, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _whitespace_only(series):
+    """Return a bool array marking text cells that are empty or contain only whitespace.
+
+    The test is one vectorized string operation over the column (pyarrow compute
+    for pandas string columns); non-text columns have no such cells.
     """
+    if not (pd.api.types.is_string_dtype(series.dtype) or pd.api.types.is_object_dtype(series.dtype)):
+        return np.zeros(len(series), dtype=bool)
+    if PYARROW_AVAILABLE and pd.api.types.is_object_dtype(series.dtype):
+        try:
+            text = pa.array(series, from_pandas=True, type=pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # Mixed text/number column: use the pandas string methods below
+        else:
+            blank = pa_compute.equal(pa_compute.utf8_trim_whitespace(text), '')
+            return blank.fill_null(False).to_numpy(zero_copy_only=False)
     try:
-        # Ensure we have a DataFrame
-        if not isinstance(df, (pd.DataFrame, pd.Series)):
-            return str(df)
-        # Convert Series to DataFrame
-        if isinstance(df, pd.Series):
-            df = df.to_frame()
+        stripped = series.str.strip()
+    except AttributeError:
+        # Object column without any strings (e.g. only numbers)
+        return np.zeros(len(series), dtype=bool)
+    return stripped.eq('').to_numpy(dtype=bool, na_value=False)
 
-        styler = df.style
-        # Hide index if requested
-        if hide_index:
-            styler = styler.hide(axis='index')
-        # Table attributes: allow automatic layout so columns fit their contents
-        styler = styler.set_table_attributes('style="border-collapse:collapse; width:auto; table-layout:auto;"')
 
-        # Apply consistent cell/heading styles: solid black borders and no wrapping
-        table_styles = [
-            {"selector": "th", "props": [("border", "2px solid black"), ("padding", "6px"), ("white-space", "nowrap"), ("font-weight", "700")]},
-            {"selector": "td", "props": [("border", "1px solid black"), ("padding", "6px"), ("white-space", "nowrap")]},
-        ]
-        styler = styler.set_table_styles(table_styles)
+def blank_cell_mask(df):
+    """Return a (rows x columns) bool array marking missing or whitespace-only cells.
 
-        # Also set cell properties generically (fallback)
-        styler = styler.set_properties(**{"border": "1px solid black", "padding": "6px", "white-space": "nowrap"})
+    Compute it once and derive row filters (`~mask.all(axis=1)`) and has-data
+    checks (`not mask.all()`) from it instead of rescanning the frame.
+    """
+    mask = df.isna().to_numpy(dtype=bool, copy=True)
+    for j in range(df.shape[1]):
+        mask[:, j] |= _whitespace_only(df.iloc[:, j])
+    return mask
+
+
+def _split_column(raw):
+    """Return (source with blanks masked, blank mask, float64 coercion) for one loaded column."""
+    if pd.api.types.is_numeric_dtype(raw) and not pd.api.types.is_bool_dtype(raw):
+        blank = raw.isna().to_numpy(dtype=bool)
+        return raw, blank, raw.to_numpy(dtype='float64', na_value=np.nan)
+    blank = raw.isna().to_numpy(dtype=bool) | _whitespace_only(raw)
+    source = raw.mask(blank)
+    # Coerce each distinct value once; text columns usually repeat a few categories
+    codes, uniques = pd.factorize(source)
+    unique_values = pd.to_numeric(pd.Series(uniques, dtype=object), errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    values = np.append(unique_values, np.nan)[codes]
+    return source, blank, values
+
+
+def _typed_numeric_column(values, index, name):
+    """Return an Int64 column when every value is a whole number, else a float64 column."""
+    is_number = ~np.isnan(values)
+    finite = values[is_number]
+    if np.all(np.isfinite(finite)) and np.all(finite == np.round(finite)) and np.all(np.abs(finite) < 2 ** 53):
+        ints = np.where(is_number, values, 0).astype('int64')
+        return pd.Series(pd.arrays.IntegerArray(ints, ~is_number), index=index, name=name)
+    return pd.Series(values, index=index, name=name)
+
+
+def _type_column(raw):
+    """Return (typed column, blank mask, float64 values or None) for one loaded column."""
+    if pd.api.types.is_bool_dtype(raw):
+        return raw, raw.isna().to_numpy(dtype=bool), raw.to_numpy(dtype='float64', na_value=np.nan)
+    if isinstance(raw.dtype, pd.CategoricalDtype):
+        # Text categoricals (e.g. from a Parquet export) are already typed; only
+        # categories that hold numbers need the regular coercion below
+        categories = pd.to_numeric(pd.Series(raw.cat.categories, dtype=object), errors='coerce')
+        if categories.isna().all():
+            return raw, raw.isna().to_numpy(dtype=bool), None
+        raw = raw.astype(object)
+    if not (pd.api.types.is_numeric_dtype(raw) or pd.api.types.is_object_dtype(raw)
+            or pd.api.types.is_string_dtype(raw)):
+        # Datetimes and other special dtypes are kept as-is and treated as non-numeric
+        return raw, raw.isna().to_numpy(dtype=bool), None
+
+    source, blank, values = _split_column(raw)
+    return _typed_split_column(source, blank, values, pd.api.types.is_numeric_dtype(raw))
+
+
+def _typed_split_column(source, blank, values, numeric_dtype=False):
+    """Return (typed column, blank mask, float64 values or None) from `_split_column` output."""
+    is_number = ~np.isnan(values)
+    if not is_number.any():
+        if numeric_dtype:
+            return source.astype('float64'), blank, None
+        return source.astype('category'), blank, None
+    if not (is_number | blank).all():
+        # Mixed text/number column: keep the original values for display and categories
+        return source.astype(object), blank, values
+    return _typed_numeric_column(values, source.index, source.name), blank, values
+
+
+def build_active_dataset(df):
+    """Type every column of a freshly loaded DataFrame once and wrap it as an ActiveDataset.
+
+    Blank or whitespace-only cells become missing values, columns are re-indexed from 1
+    to match the display convention, and numeric coercion happens here only.
+    """
+    df = df.reset_index(drop=True)
+    df.index = range(1, len(df) + 1)
+    typed_cols = {}
+    blank_cols = {}
+    numeric = {}
+    for col in df.columns:
+        typed, blank, values = _type_column(df[col])
+        typed_cols[col] = typed
+        blank_cols[col] = blank
+        if values is not None:
+            numeric[col] = values
+    frame = pd.DataFrame(typed_cols, index=df.index, columns=df.columns)
+    frame.index.name = None
+    blank_mask = pd.DataFrame(blank_cols, index=df.index, columns=df.columns)
+    return ActiveDataset(frame, blank_mask, numeric)
 
-        return styler.to_html()
-    except Exception:
-        try:
-            return df.to_html(border=1, index=not hide_index)
-        except Exception:
-            return str(df)
 
-def get_numeric_columns():
-    numeric_columns = []
-    if 'active_data' in st.session_state.global_dataframes:
-        df = st.session_state.global_dataframes['active_data']
-        for col in df.columns:
-            # Check if the column can be coerced to numeric and has at least one non-NaN numeric value
-            if pd.to_numeric(df[col], errors='coerce').notna().any():
-                numeric_columns.append(col)
-    return sorted(list(set(numeric_columns)))
+# CSV uploads at least this large are parsed in chunks with progress and an early preview
+CHUNKED_CSV_MIN_BYTES = 20 * 1024 * 1024
+CSV_CHUNK_ROWS = 50000
+CSV_PREVIEW_ROWS = 20
 
-def get_all_columns():
-    all_cols = []
-    if 'active_data' in st.session_state.global_dataframes:
-        df = st.session_state.global_dataframes['active_data']
-        all_cols = list(df.columns)
-    return sorted(list(set(all_cols)))
 
-def get_data_from_col_string(col_string):
-    if not col_string: raise ValueError("Column string cannot be empty.")
-    df = st.session_state.global_dataframes.get('active_data')
-    if df is None: raise ValueError("No active dataframe found. Please load data first.")
-    if col_string not in df.columns: raise ValueError(f"Column '{col_string}' not found in active dataframe.")
-    data = pd.to_numeric(df[col_string], errors='coerce').dropna()
-    if data.empty: raise ValueError(f"Selected column '{col_string}' contains no valid numerical data.")
-    return data
+# Non-seekable CSV streams are copied as they are read so mixed columns can be re-read;
+# the copy spills to a temporary file beyond this size
+CSV_SPOOL_MEMORY_BYTES = 16 * 1024 * 1024
 
-def is_numeric_column(df, col):
-    """Check if a column is numeric or can be converted to numeric (handles blank cells)."""
-    try:
-        # First check if it's already numeric type
-        if pd.api.types.is_numeric_dtype(df[col]):
-            return True
-        # Otherwise, try converting to numeric and see if we get valid values after removing blanks
-        converted = pd.to_numeric(df[col], errors='coerce')
+
+class _SpooledReader:
+    """Read-through wrapper that keeps a copy of everything read from a non-seekable stream."""
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.copy = tempfile.SpooledTemporaryFile(max_size=CSV_SPOOL_MEMORY_BYTES)
+
+    def readable(self):
+        return True
+
+    def tell(self):
+        return self.raw.tell()
+
+    def read(self, size=-1):
+        data = self.raw.read(size)
+        self.copy.write(data)
+        return data
+
+
+def _csv_chunk_part(raw):
+    """Reduce one parsed chunk of a column to (kind, payload).
+
+    `kind` is how read_csv typed the chunk on its own: 'empty' (payload: row count),
+    'numeric' (float64 values), 'bool' (object array of True/False/NaN) or 'text'
+    (a compact categorical of the cells).
+    """
+    if pd.api.types.is_bool_dtype(raw):
+        return 'bool', raw.to_numpy(dtype=object)
+    if pd.api.types.is_numeric_dtype(raw):
+        values = raw.to_numpy(dtype='float64', na_value=np.nan)
+        if np.isnan(values).all():
+            return 'empty', len(values)
+        return 'numeric', values
+    present = raw.dropna()
+    if len(present) and present.map(type).eq(bool).all():
+        # Booleans with missing cells come back as an object column
+        return 'bool', raw.to_numpy(dtype=object, na_value=np.nan)
+    return 'text', pd.Categorical(raw)
+
+
+def _csv_column_source(parts):
+    """Rebuild the column a one-shot `pd.read_csv` would return from its chunk parts.
+
+    Returns None for mixed columns (e.g. numbers in one chunk, text in another), whose
+    original cell text has to be read again.
+    """
+    kinds = {kind for kind, _ in parts} - {'empty'}
+    if kinds <= {'numeric'}:
+        return pd.Series(np.concatenate([
+            payload if kind == 'numeric' else np.full(payload, np.nan) for kind, payload in parts
+        ]))
+    if kinds == {'bool'}:
+        cells = np.concatenate([
+            payload if kind == 'bool' else np.full(payload, np.nan, dtype=object) for kind, payload in parts
+        ])
+        if pd.isna(cells).any():
+            return pd.Series(cells, dtype=object)
+        return pd.Series(cells.astype(bool))
+    if kinds == {'text'}:
+        text_dtype = next(payload.categories.dtype for kind, payload in parts if kind == 'text')
+        no_categories = pd.CategoricalDtype(pd.Index([], dtype=text_dtype))
+        categoricals = [payload if kind == 'text' else pd.Categorical.from_codes(np.full(payload, -1), dtype=no_categories)
+                        for kind, payload in parts]
+        return pd.Series(union_categoricals(categoricals, ignore_order=True)).astype(text_dtype)
+    return None
+
+
+def _read_csv_text_columns(source, positions, chunk_rows):
+    """Read the given column positions of a CSV as text, as read_csv keeps mixed columns."""
+    pieces = {position: [] for position in positions}
+    for chunk in pd.read_csv(source, chunksize=chunk_rows, usecols=positions, dtype=str):
+        for position, col in zip(sorted(positions), chunk.columns):
+            pieces[position].append(chunk[col])
+    return {position: pd.concat(parts, ignore_index=True) for position, parts in pieces.items()}
+
+
+def ingest_csv_in_chunks(source, chunk_rows=CSV_CHUNK_ROWS, total_bytes=None, on_progress=None, on_preview=None):
+    """Parse a CSV in row chunks and build the ActiveDataset column by column.
+
+    Only one parsed chunk is alive at a time: each chunk is reduced to float64 values or
+    a compact categorical before the next one is read, so peak memory stays near one
+    chunk plus the final typed arrays. Each column is then rebuilt as a one-shot
+    `pd.read_csv` would have read it and typed with `_type_column`, so a file gives the
+    same dataset whether or not it was chunked. Columns whose chunks were typed
+    differently (numbers in one, text in another) lost their original cell text and are
+    read a second time as text; non-seekable streams are spooled for that.
+    `on_preview(first_rows)` is called once with the start of the file and
+    `on_progress(fraction, rows_read)` after every chunk.
+    """
+    seekable = callable(getattr(source, 'seekable', None)) and source.seekable()
+    start = source.tell() if seekable else None
+    reader = source if seekable else _SpooledReader(source)
+    try:
+        columns = None
+        pieces = {}
+        rows_read = 0
+        for chunk in pd.read_csv(reader, chunksize=chunk_rows):
+            if columns is None:
+                columns = list(chunk.columns)
+                pieces = {col: [] for col in columns}
+                if on_preview is not None:
+                    on_preview(chunk.head(CSV_PREVIEW_ROWS))
+            for col in columns:
+                pieces[col].append(_csv_chunk_part(chunk[col]))
+            rows_read += len(chunk)
+            if on_progress is not None:
+                fraction = min(source.tell() / total_bytes, 1.0) if total_bytes else 0.0
+                on_progress(fraction, rows_read)
+        if columns is None:
+            raise pd.errors.EmptyDataError("No columns to parse from file")
+
+        sources = {}
+        for col in columns:
+            # Release each column's chunk pieces as soon as its source column exists
+            sources[col] = _csv_column_source(pieces.pop(col))
+        mixed = [position for position, col in enumerate(columns) if sources[col] is None]
+        if mixed:
+            if seekable:
+                source.seek(start)
+                replay = source
+            else:
+                reader.copy.seek(0)
+                replay = reader.copy
+            for position, text in _read_csv_text_columns(replay, mixed, chunk_rows).items():
+                sources[columns[position]] = text
+    finally:
+        if not seekable:
+            reader.copy.close()
+
+    index = pd.RangeIndex(1, rows_read + 1)
+    typed_cols = {}
+    blank_cols = {}
+    numeric = {}
+    for col in columns:
+        raw = sources.pop(col)
+        raw.index = index
+        raw.name = col
+        typed, blank, values = _type_column(raw)
+        typed_cols[col] = typed
+        blank_cols[col] = blank
+        if values is not None:
+            numeric[col] = values
+    frame = pd.DataFrame(typed_cols, index=index, columns=columns)
+    blank_mask = pd.DataFrame(blank_cols, index=index, columns=columns)
+    return ActiveDataset(frame, blank_mask, numeric)
+
+
+# Upload extensions read through pyarrow
+COLUMNAR_FILE_EXTENSIONS = ['parquet', 'feather', 'arrow', 'ipc']
+
+
+def read_columnar_file(data, file_extension):
+    """Read Parquet or Arrow IPC/Feather bytes into a DataFrame with pyarrow.
+
+    The bytes are wrapped as an Arrow buffer without copying and Arrow memory is
+    released column by column during the pandas conversion.
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("pyarrow is required to read Parquet and Feather files.")
+    reader = pa.BufferReader(pa.py_buffer(data))
+    if file_extension == 'parquet':
+        table = pa_parquet.read_table(reader)
+    else:
+        try:
+            table = pa_feather.read_table(reader)
+        except pa.ArrowInvalid:
+            # Arrow IPC stream format (as opposed to the Feather/IPC file format)
+            table = pa.ipc.open_stream(pa.py_buffer(data)).read_all()
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+# Upload extensions read as Excel workbooks
+EXCEL_FILE_EXTENSIONS = ['xlsx', 'xlsm', 'xls']
+EXCEL_PROGRESS_ROWS = 5000
+
+
+def get_excel_engine(file_extension):
+    """Return the Excel engine to use: calamine when installed, else openpyxl (None lets pandas pick for .xls)."""
+    if CALAMINE_AVAILABLE:
+        return 'calamine'
+    return None if file_extension == 'xls' else 'openpyxl'
+
+
+def list_excel_sheets(data, file_extension):
+    """Return the sheet names of an Excel workbook without reading any cells."""
+    engine = get_excel_engine(file_extension)
+    if engine == 'calamine':
+        return list(CalamineWorkbook.from_filelike(io.BytesIO(data)).sheet_names)
+    if engine == 'openpyxl':
+        from openpyxl import load_workbook
+        workbook = load_workbook(io.BytesIO(data), read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+    return list(pd.ExcelFile(io.BytesIO(data)).sheet_names)
+
+
+def read_excel_sheet(data, file_extension, sheet_name, on_progress=None):
+    """Read one sheet of an Excel workbook into a DataFrame laid out like `pd.read_excel`.
+
+    With openpyxl the sheet is streamed in read-only, values-only mode, so no cell
+    objects are built, and `on_progress(fraction, rows_read)` is called every
+    EXCEL_PROGRESS_ROWS rows. Trailing blank cells and rows are dropped, and the
+    rows go through the same TextParser as `pd.read_excel`, so header names, the
+    default NA strings ('NA', '#N/A', '' ...) and inferred dtypes match it.
+    Returns (DataFrame, engine name).
+    """
+    engine = get_excel_engine(file_extension)
+    if engine != 'openpyxl':
+        df = pd.read_excel(io.BytesIO(data), sheet_name=sheet_name, engine=engine)
+        return df, engine or 'xlrd'
+
+    from openpyxl import load_workbook
+    workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet_name]
+        # Taken from the sheet's dimension record; missing in some generated files
+        total_rows = worksheet.max_row
+        rows = []
+        rows_read = 0
+        last_data_row = 0
+        for values in worksheet.iter_rows(values_only=True):
+            rows_read += 1
+            end = len(values)
+            while end and (values[end - 1] is None or values[end - 1] == ''):
+                end -= 1
+            # Empty cells are '' as in pandas' openpyxl reader (NA, and 'Unnamed: i' in the header)
+            rows.append(['' if value is None else value for value in values[:end]])
+            if end:
+                last_data_row = rows_read
+            if on_progress is not None and rows_read % EXCEL_PROGRESS_ROWS == 0:
+                on_progress(min(rows_read / total_rows, 1.0) if total_rows else 0.0, rows_read)
+    finally:
+        workbook.close()
+
+    # Formatted but empty rows below the data
+    del rows[last_data_row:]
+    if not rows:
+        return pd.DataFrame(), engine
+    width = max(len(row) for row in rows)
+    # Pad short rows with empty cells like pandas' own openpyxl reader
+    rows = [row + [''] * (width - len(row)) for row in rows]
+    return TextParser(rows, header=0, skip_blank_lines=False).read(), engine
+
+
+def dataset_to_parquet_bytes(dataset, prepare=True):
+    """Return the typed dataset as Parquet bytes, cached in session state per dataset version.
+
+    With prepare=False only bytes already built for this version are returned (None
+    otherwise), so pages can offer the download without serializing on every rerun.
+    """
+    if not PYARROW_AVAILABLE:
+        return None
+    cached = st.session_state.get('parquet_export')
+    if cached and cached[0] == dataset.version:
+        return cached[1]
+    if not prepare:
+        return None
+    export_df = dataset.frame.reset_index(drop=True)
+    export_df.columns = [str(col) for col in export_df.columns]
+    for col in export_df.columns:
+        if pd.api.types.is_object_dtype(export_df[col]):
+            # Mixed columns may hold numbers and text; store them as text
+            export_df[col] = export_df[col].map(lambda v: v if pd.isna(v) else str(v))
+    buffer = io.BytesIO()
+    export_df.to_parquet(buffer, index=False)
+    st.session_state['parquet_export'] = (dataset.version, buffer.getvalue())
+    return st.session_state['parquet_export'][1]
+
+
+# Memory budget for parsed uploads shared by all sessions of this server process
+INGEST_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+class IngestCache:
+    """Thread-safe LRU store of parsed uploads keyed by content hash, bounded by memory.
+
+    Datasets are shared between sessions, so they must be treated as read-only
+    (`ActiveDataset.rename` already returns a new object).
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, dataset):
+        size = dataset_memory_bytes(dataset)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (dataset, size)
+            self.total_bytes += size
+            while self.total_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.total_bytes -= evicted_size
+
+
+def dataset_memory_bytes(dataset):
+    """Return the approximate memory held by a dataset's typed frame, mask and numeric arrays.
+
+    Text and object columns are measured deeply (their string contents, not just the
+    pointers); `IngestCache.put` calls this once per inserted dataset.
+    """
+    return int(dataset.frame.memory_usage(index=False, deep=True).sum()
+               + dataset.blank_mask.memory_usage(index=False).sum()
+               + sum(values.nbytes for values in dataset.numeric.values()))
+
+
+@lazy_cache_resource()
+def get_ingest_cache():
+    """Return the process-wide cache of parsed uploads."""
+    return IngestCache(INGEST_CACHE_MAX_BYTES)
+
+
+def get_upload_cache_key(uploaded_file, parse_options=''):
+    """Return the content-addressed cache key for an upload plus its parse options.
+
+    The SHA-256 of the bytes is computed once per uploaded file and remembered in
+    session state, so reruns with the same file selected do not re-hash it.
+    """
+    digests = st.session_state.setdefault('upload_digests', {})
+    file_id = getattr(uploaded_file, 'file_id', None) or uploaded_file.name
+    digest = digests.get(file_id)
+    if digest is None:
+        digest = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+        digests.clear()
+        digests[file_id] = digest
+    return f"{digest}:{parse_options}"
+
+
+def get_active_dataset_name():
+    """Return the name of the loaded dataset the analysis tabs work on."""
+    datasets = st.session_state.global_dataframes
+    name = st.session_state.get('active_dataset_name')
+    if name not in datasets:
+        name = next(iter(datasets), 'active_data')
+    return name
+
+
+def get_active_dataset():
+    """Return the ActiveDataset currently loaded in session state, or None."""
+    return st.session_state.global_dataframes.get(get_active_dataset_name())
+
+
+def set_loaded_datasets(datasets, active_name=None):
+    """Replace the loaded datasets (name -> ActiveDataset) and activate `active_name` or the first one."""
+    st.session_state.global_dataframes = dict(datasets)
+    st.session_state.active_dataset_name = active_name or next(iter(datasets), 'active_data')
+
+# --- Helper Functions ---
+def manual_entry_text_column(column):
+    """Return a manual-entry text column as object dtype, the form the editor hands back.
+
+    `st.data_editor` returns str columns for cell edits but object columns once rows
+    are added, so both typing paths start from object to give the same dtypes.
+    """
+    if isinstance(column.dtype, pd.StringDtype):
+        return column.astype(object)
+    return column
+
+
+def process_manual_entry_data(df):
+    """Drop internal columns from manual-entry data and return it as a typed ActiveDataset."""
+    # Remove ALL auto-generated/internal columns (those with :: prefix)
+    if isinstance(df, pd.DataFrame):
+        internal_cols = [col for col in df.columns if str(col).startswith('::')]
+        if internal_cols:
+            df = df.drop(columns=internal_cols)
+        df = df.copy()
+        for j in range(df.shape[1]):
+            df.isetitem(j, manual_entry_text_column(df.iloc[:, j]))
+
+    # Numeric conversion happens once here; numeric columns keep float/Int64 dtypes
+    return build_active_dataset(df)
+
+
+class ManualEntryCells:
+    """Typed cells of the manual-entry table, kept up to date from the data editor's edit deltas.
+
+    `st.data_editor` reports its changes relative to the table it was given as
+    `edited_rows`, `added_rows` and `deleted_rows`. `update` compares them with the
+    deltas applied last time, re-coerces only the cells that changed and re-types
+    only the columns that contain them, so the cost of an edit does not grow with
+    the size of the table. The result matches `process_manual_entry_data` on the
+    edited frame with its blank rows removed.
+    """
+
+    def __init__(self, base):
+        self.base = base
+        self.columns = [col for col in base.columns if not str(col).startswith('::')]
+        self.base_rows = len(base)
+        self.source = {}
+        self.blank = {}
+        self.values = {}
+        for col in self.columns:
+            source, blank, values = _split_column(base[col])
+            # Writable copies: cells are updated in place as edits arrive
+            self.source[col] = np.array(source, dtype=object)
+            self.blank[col] = np.array(blank, dtype=bool)
+            self.values[col] = np.array(values, dtype='float64')
+        self.applied = {'edited_rows': {}, 'added_rows': [], 'deleted_rows': []}
+        self.kept = None
+        self.typed = {}
+        self.dataset = None
+
+    @property
+    def row_count(self):
+        """Number of rows the editor currently shows (deleted rows excluded)."""
+        return self.base_rows + len(self.applied['added_rows']) - len(self.applied['deleted_rows'])
+
+    def _set_cell(self, col, pos, value):
+        # The editor hands text columns back as str, like its own STRING parsing
+        value = None if value is None else str(value)
+        if value is None or not value.strip():
+            self.source[col][pos] = np.nan
+            self.blank[col][pos] = True
+            self.values[col][pos] = np.nan
+        else:
+            self.source[col][pos] = value
+            self.blank[col][pos] = False
+            self.values[col][pos] = pd.to_numeric(pd.Series([value], dtype=object), errors='coerce').to_numpy(dtype='float64', na_value=np.nan)[0]
+
+    def _resize(self, rows):
+        for col in self.columns:
+            extra = rows - len(self.values[col])
+            if extra > 0:
+                self.source[col] = np.concatenate([self.source[col], np.full(extra, np.nan, dtype=object)])
+                self.blank[col] = np.concatenate([self.blank[col], np.ones(extra, dtype=bool)])
+                self.values[col] = np.concatenate([self.values[col], np.full(extra, np.nan)])
+            elif extra < 0:
+                self.source[col] = self.source[col][:rows]
+                self.blank[col] = self.blank[col][:rows]
+                self.values[col] = self.values[col][:rows]
+
+    def update(self, editor_state):
+        """Apply the editor's current deltas; return the typed ActiveDataset, or None when every row is blank."""
+        edited = {int(row): cells for row, cells in (editor_state.get('edited_rows') or {}).items()}
+        added = list(editor_state.get('added_rows') or [])
+        deleted = sorted(int(row) for row in (editor_state.get('deleted_rows') or []))
+        dirty = set()
+
+        previous_edits = self.applied['edited_rows']
+        for row in set(previous_edits) | set(edited):
+            old_cells = previous_edits.get(row, {})
+            new_cells = edited.get(row, {})
+            for col in set(old_cells) | set(new_cells):
+                if col not in self.source or (col in old_cells and col in new_cells and old_cells[col] == new_cells[col]):
+                    continue
+                # A cell dropped from the deltas is back to its original value
+                value = new_cells[col] if col in new_cells else self.base[col].iat[row]
+                self._set_cell(col, row, value)
+                dirty.add(col)
+
+        previous_added = self.applied['added_rows']
+        self._resize(self.base_rows + len(added))
+        for i, row in enumerate(added):
+            old_row = previous_added[i] if i < len(previous_added) else {}
+            for col in self.columns:
+                if i >= len(previous_added) or row.get(col) != old_row.get(col):
+                    self._set_cell(col, self.base_rows + i, row.get(col))
+                    dirty.add(col)
+        self.applied = {'edited_rows': {row: dict(cells) for row, cells in edited.items()},
+                        'added_rows': [dict(row) for row in added], 'deleted_rows': deleted}
+
+        # Rows that are still shown and have at least one non-blank cell
+        kept = np.ones(self.base_rows + len(added), dtype=bool)
+        kept[[row for row in deleted if row < self.base_rows]] = False
+        if self.columns:
+            kept &= ~np.logical_and.reduce([self.blank[col] for col in self.columns])
+        if self.kept is None or not np.array_equal(kept, self.kept):
+            dirty = set(self.columns)
+            self.kept = kept
+        if not dirty and self.dataset is not None:
+            return self.dataset
+        if not kept.any():
+            self.dataset = None
+            return None
+
+        index = pd.RangeIndex(1, int(kept.sum()) + 1)
+        for col in dirty:
+            source = manual_entry_text_column(pd.Series(self.source[col][kept], index=index, name=col, dtype=self.base[col].dtype))
+            self.typed[col] = _typed_split_column(source, self.blank[col][kept], self.values[col][kept])
+        frame = pd.DataFrame({col: self.typed[col][0] for col in self.columns}, index=index, columns=self.columns)
+        blank_mask = pd.DataFrame({col: self.typed[col][1] for col in self.columns}, index=index, columns=self.columns)
+        numeric = {col: self.typed[col][2] for col in self.columns if self.typed[col][2] is not None}
+        # Profiles of untouched columns carry over from the previous dataset
+        profiles = dict(self.dataset.profiles) if self.dataset is not None else {}
+        profiles.update(build_column_profiles(frame[[col for col in self.columns if col in dirty]], numeric))
+        self.dataset = ActiveDataset(frame, blank_mask, numeric, profiles={col: profiles[col] for col in self.columns})
+        return self.dataset
+
+
+def get_manual_entry_dataset(table_data, edited_df, non_empty_rows):
+    """Return the typed dataset for the manual-entry table including the editor's pending edits.
+
+    Edits are applied incrementally through `ManualEntryCells`; a table whose
+    columns the editor does not treat as text is processed in full instead, keeping
+    the `non_empty_rows` of `edited_df`.
+    """
+    text_columns = all(pd.api.types.is_object_dtype(table_data[col]) or pd.api.types.is_string_dtype(table_data[col])
+                       for col in table_data.columns)
+    if text_columns:
+        cells = st.session_state.get('manual_entry_cells')
+        if cells is None or cells.base is not table_data:
+            cells = ManualEntryCells(table_data)
+            st.session_state.manual_entry_cells = cells
+        dataset = cells.update(st.session_state.get('data_editor') or {})
+        if cells.row_count == len(edited_df):
+            return dataset
+    # Fallback: clean and type the whole edited frame
+    cleaned_data = edited_df.loc[non_empty_rows].copy()
+    return process_manual_entry_data(cleaned_data) if not cleaned_data.empty else None
+
+def has_meaningful_dataframe_data(df):
+    """Return True only when a DataFrame has at least one non-blank data row."""
+    if hasattr(df, 'has_data'):
+        return df.has_data()
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return False
+    return not blank_cell_mask(df).all()
+
+def sanitize_manual_entry_df_state():
+    """Remove any internal columns (starting with '::') from the session manual_entry_df.
+
+    This helps prevent UI components (AgGrid / Arrow) from exposing internal ID columns.
+    """
+    try:
+        df = st.session_state.get('manual_entry_df')
+        if isinstance(df, pd.DataFrame):
+            internal = [c for c in df.columns if str(c).startswith('::')]
+            if internal:
+                st.session_state.manual_entry_df = df.drop(columns=internal)
+    except Exception:
+        pass
+
+def styled_dataframe_html(df, hide_index=False):
+    """Return HTML for a pandas DataFrame styled by the shared `cuestat-table` CSS class.
+
+    Solid black borders and auto column widths come from the class in the global
+    stylesheet, so the markup carries no per-cell inline styles. Render it with
+    `st.markdown(html, unsafe_allow_html=True)`.
+    """
+    try:
+        # Ensure we have a DataFrame
+        if not isinstance(df, (pd.DataFrame, pd.Series)):
+            return str(df)
+        # Convert Series to DataFrame
+        if isinstance(df, pd.Series):
+            df = df.to_frame()
+        return df.to_html(classes='cuestat-table', border=0, index=not hide_index)
+    except Exception:
+        return str(df)
+
+def get_numeric_columns():
+    numeric_columns = []
+    dataset = get_active_dataset()
+    if dataset is not None:
+        # Numeric-ness was decided once when the dataset was built
+        numeric_columns = [col for col in dataset.columns if dataset.is_numeric(col)]
+    return sorted(list(set(numeric_columns)))
+
+def get_categorical_columns(dataset=None):
+    """Return columns of the active (or given) dataset that qualify as categorical, in column order."""
+    if dataset is None:
+        dataset = get_active_dataset()
+    if dataset is None:
+        return []
+    return [col for col in dataset.columns if dataset.is_categorical(col)]
+
+def get_all_columns():
+    all_cols = []
+    dataset = get_active_dataset()
+    if dataset is not None:
+        all_cols = dataset.columns
+    return sorted(list(set(all_cols)))
+
+def get_data_from_col_string(col_string):
+    if not col_string: raise ValueError("Column string cannot be empty.")
+    dataset = get_active_dataset()
+    if dataset is None: raise ValueError("No active dataframe found. Please load data first.")
+    if col_string not in dataset.columns: raise ValueError(f"Column '{col_string}' not found in active dataframe.")
+    data = dataset.numeric_series(col_string)
+    if data.empty: raise ValueError(f"Selected column '{col_string}' contains no valid numerical data.")
+    return data
+
+def is_numeric_column(df, col):
+    """Check if a column is numeric or can be converted to numeric (handles blank cells)."""
+    try:
+        # Typed datasets already know which columns hold numeric values
+        if hasattr(df, 'numeric'):
+            return df.is_numeric(col)
+        # First check if it's already numeric type
+        if pd.api.types.is_numeric_dtype(df[col]):
+            return True
+        # Otherwise, try converting to numeric and see if we get valid values after removing blanks
+        converted = pd.to_numeric(df[col], errors='coerce')
         return not converted.dropna().empty
     except Exception:
         return False
 
-def calculate_descriptive_statistics(data):
+def _sample_moments(values):
+    """Return mean, sample variance, skewness and excess kurtosis from one pass over the deviations.
+
+    Skewness and kurtosis use the bias-adjusted estimators of `Series.skew()` and
+    `Series.kurtosis()` so results match the previous pandas-based output.
+    """
+    n = values.size
+    mean = values.mean()
+    deviations = values - mean
+    squared = deviations * deviations
+    m2 = squared.sum()
+    m3 = (squared * deviations).sum()
+    m4 = (squared * squared).sum()
+
+    variance = m2 / (n - 1) if n > 1 else np.nan
+    if n < 3:
+        skewness = np.nan
+    elif m2 == 0:
+        skewness = 0.0
+    else:
+        g1 = (m3 / n) / (m2 / n) ** 1.5
+        skewness = np.sqrt(n * (n - 1)) / (n - 2) * g1
+    if n < 4:
+        kurtosis = np.nan
+    elif m2 == 0:
+        kurtosis = 0.0
+    else:
+        g2 = (m4 / n) / (m2 / n) ** 2 - 3
+        kurtosis = ((n + 1) * g2 + 6) * (n - 1) / ((n - 2) * (n - 3))
+    return mean, variance, skewness, kurtosis
+
+def calculate_descriptive_statistics(data, cache_key=None):
+    """Return the descriptive statistics table for a numeric column.
+
+    The values are sorted once; min, max, quartiles, median and mode are read from
+    the sorted array and the moments come from a single vectorized pass. When
+    `cache_key` (e.g. `(dataset.version, column)`) is given the result is memoized in
+    session state for the lifetime of that dataset version.
+    """
+    cache = None
+    if cache_key is not None:
+        cache = st.session_state.setdefault('descriptive_stats_cache', {})
+        if cache_key in cache:
+            return cache[cache_key]
     if not isinstance(data, pd.Series): data = pd.Series(data)
-    data = pd.to_numeric(data, errors='coerce').dropna()
-    if data.empty: return {"Error": "Input data contains no valid numerical values after cleaning."}
-    def q_value(series, q):
-        return compute_quartile(series, q)
+    if not pd.api.types.is_float_dtype(data):
+        data = pd.to_numeric(data, errors='coerce')
+    values = data.to_numpy(dtype='float64', na_value=np.nan)
+    values = np.sort(values[~np.isnan(values)])
+    if values.size == 0: return {"Error": "Input data contains no valid numerical values after cleaning."}
+
+    n = values.size
+    # The hazen median coincides with the usual midpoint median, so one call covers all three
+    q1, median, q3 = batch_quantiles(values, [0.25, 0.5, 0.75], presorted=True)
+    # Smallest most frequent value, matching scipy.stats.mode
+    run_starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    run_lengths = np.diff(np.r_[run_starts, n])
+    mode = values[run_starts[np.argmax(run_lengths)]]
+    mean, variance, skewness, kurtosis = _sample_moments(values)
+
     # Use OrderedDict to maintain specific order: five-number summary first
     from collections import OrderedDict
     stats_dict = OrderedDict([
-        ('Min Value', data.min()),
-        ('Q1', q_value(data, 0.25)),
-        ('Median', data.median()),
-        ('Q3', q_value(data, 0.75)),
-        ('Max Value', data.max()),
-        ('n', data.count()),
-        ('Mean', data.mean()),
-        ('Mode', list(stats.mode(data, keepdims=True).mode) if len(stats.mode(data, keepdims=True).mode) > 1 else stats.mode(data, keepdims=True).mode[0]),
-        ('Sample Standard Deviation', data.std()),
-        ('Variance', data.var()),
-        ('Range', data.max() - data.min()),
-        ('IQR', q_value(data, 0.75) - q_value(data, 0.25)),
-        ('Skewness', data.skew()),
-        ('Kurtosis', data.kurtosis())
+        ('Min Value', values[0]),
+        ('Q1', q1),
+        ('Median', median),
+        ('Q3', q3),
+        ('Max Value', values[-1]),
+        ('n', n),
+        ('Mean', mean),
+        ('Mode', mode),
+        ('Sample Standard Deviation', np.sqrt(variance)),
+        ('Variance', variance),
+        ('Range', values[-1] - values[0]),
+        ('IQR', q3 - q1),
+        ('Skewness', skewness),
+        ('Kurtosis', kurtosis)
     ])
+    if cache is not None:
+        # Only keep results for the dataset version being analysed
+        version = cache_key[0]
+        for key in [k for k in cache if k[0] != version]:
+            del cache[key]
+        cache[cache_key] = stats_dict
     return stats_dict
 
 def calculate_normal_distribution(mean, std_dev, x=None, a=None, b=None, calc_type='pdf'):
@@ -1838,30 +1520,72 @@ def plot_f_distribution(dfn, dfd, x_max_factor=5, num_points=500, shade_x=None,
     plt.tight_layout()
     return fig
 
-def plot_histogram(data, bins='auto', title='Histogram', xlabel='Value', ylabel='Frequency', use_relative=False, force_integer_bins=False):
-    if data.size == 0: raise ValueError("Input data is empty.")
-    if not isinstance(data, pd.Series): data = pd.Series(data)
-    numeric_data = pd.to_numeric(data, errors='coerce').dropna()
-    if numeric_data.empty: raise ValueError("Input data contains no valid numerical data for histogram.")
+def get_sorted_numeric_values(dataset, col):
+    """Return the sorted, NaN-free float64 values of a dataset column.
 
-    # If force_integer_bins is True, create integer bin edges while maintaining the number of bins
+    Sorted arrays are kept in session state for the current dataset version only, so
+    re-plotting a column with a different bin spec never re-scans or re-sorts it.
+    """
+    cache = st.session_state.get('sorted_values_cache')
+    if cache is None or cache['version'] != dataset.version:
+        cache = {'version': dataset.version, 'columns': {}}
+        st.session_state['sorted_values_cache'] = cache
+    values = cache['columns'].get(col)
+    if values is None:
+        raw = dataset.numeric.get(col)
+        values = np.sort(raw[~np.isnan(raw)]) if raw is not None else np.empty(0, dtype='float64')
+        cache['columns'][col] = values
+    return values
+
+def sturges_bin_count(n):
+    """Sturges' rule: k = ceil(log2(n) + 1)."""
+    return int(np.ceil(np.log2(n) + 1))
+
+def histogram_bin_edges_sorted(sorted_values, bins='auto', force_integer_bins=False):
+    """Return histogram bin edges for sorted, NaN-free values.
+
+    Integer bin counts only need the range, which is read from the ends of the array;
+    string rules such as 'auto' fall back to `np.histogram_bin_edges`.
+    """
     if force_integer_bins and isinstance(bins, int):
-        data_min, data_max = numeric_data.min(), numeric_data.max()
+        data_min, data_max = sorted_values[0], sorted_values[-1]
         # Create integer bin edges that span the data range with approximately the requested number of bins
         bin_width = max(1, int(np.ceil((data_max - data_min) / bins)))
         bin_start = int(np.floor(data_min))
         bin_end = int(np.ceil(data_max))
         # Extend by one bin width to ensure max value gets its own bin with [,) rule
-        bins = np.arange(bin_start, bin_end + bin_width + 1, bin_width)
-    
-    if isinstance(bins, str) and bins == 'auto':
-        bin_edges = np.histogram_bin_edges(numeric_data.to_numpy(), bins='auto')
+        return np.arange(bin_start, bin_end + bin_width + 1, bin_width)
+    if isinstance(bins, int):
+        return np.histogram_bin_edges(sorted_values, bins=bins, range=(sorted_values[0], sorted_values[-1]))
+    return np.histogram_bin_edges(sorted_values, bins=bins)
+
+def histogram_counts_sorted(sorted_values, bin_edges):
+    """Count sorted values per bin with `searchsorted`, matching `np.histogram` (last bin closed)."""
+    positions = np.searchsorted(sorted_values, bin_edges, side='left')
+    positions[-1] = np.searchsorted(sorted_values, bin_edges[-1], side='right')
+    return np.diff(positions)
+
+def plot_histogram(data, bins='auto', title='Histogram', xlabel='Value', ylabel='Frequency', use_relative=False, force_integer_bins=False, presorted=False):
+    """Build the histogram figure.
+
+    With `presorted=True`, `data` must be the sorted, NaN-free float array from
+    `get_sorted_numeric_values`; bin edges and counts are then computed with binary
+    searches, so changing the bin spec costs O(bins * log n) instead of a full pass.
+    """
+    if presorted:
+        sorted_values = np.asarray(data, dtype='float64')
+        if sorted_values.size == 0: raise ValueError("Input data contains no valid numerical data for histogram.")
     else:
-        bin_edges = np.histogram_bin_edges(numeric_data.to_numpy(), bins=bins)
+        if data.size == 0: raise ValueError("Input data is empty.")
+        if not isinstance(data, pd.Series): data = pd.Series(data)
+        numeric_data = pd.to_numeric(data, errors='coerce').dropna()
+        if numeric_data.empty: raise ValueError("Input data contains no valid numerical data for histogram.")
+        sorted_values = np.sort(numeric_data.to_numpy(dtype='float64'))
 
-    counts, _ = np.histogram(numeric_data.to_numpy(), bins=bin_edges)
+    bin_edges = histogram_bin_edges_sorted(sorted_values, bins, force_integer_bins)
+    counts = histogram_counts_sorted(sorted_values, bin_edges)
     if use_relative:
-        counts = counts / len(numeric_data)
+        counts = counts / sorted_values.size
         ylabel = 'Relative Frequency'
     else:
         ylabel = 'Frequency'
@@ -1911,6 +1635,46 @@ def plot_histogram(data, bins='auto', title='Histogram', xlabel='Value', ylabel=
     fig.update_yaxes(showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
     return fig
 
+def compute_whisker_statistics(series):
+    """Return five-number summary, whisker and outlier statistics for one boxplot.
+
+    The data is sorted once: Q1, median and Q3 come from a single `batch_quantiles`
+    call and the 1.5*IQR whisker positions from `searchsorted` on the sorted values.
+    Returns None when the series has no numeric values.
+    """
+    numeric_data = pd.to_numeric(series, errors='coerce').dropna()
+    if numeric_data.empty:
+        return None
+    sorted_values = np.sort(numeric_data.to_numpy(dtype='float64'))
+    n = sorted_values.size
+    q1, median, q3 = batch_quantiles(sorted_values, [0.25, 0.5, 0.75], presorted=True)
+    iqr = q3 - q1
+    lower_bound = q1 - 1.5 * iqr
+    upper_bound = q3 + 1.5 * iqr
+    # Inliers occupy sorted_values[first_inlier:end_inlier]
+    first_inlier = int(np.searchsorted(sorted_values, lower_bound, side='left'))
+    end_inlier = int(np.searchsorted(sorted_values, upper_bound, side='right'))
+    if first_inlier >= end_inlier:
+        whisker_low = sorted_values[0]
+        whisker_high = sorted_values[-1]
+    else:
+        whisker_low = sorted_values[first_inlier]
+        whisker_high = sorted_values[end_inlier - 1]
+    outliers = numeric_data[(numeric_data < lower_bound) | (numeric_data > upper_bound)]
+    return {
+        'min': sorted_values[0],
+        'q1': q1,
+        'median': median,
+        'q3': q3,
+        'max': sorted_values[-1],
+        'whisker_low': whisker_low,
+        'whisker_high': whisker_high,
+        'outlier_min': sorted_values[0] if first_inlier > 0 else None,
+        'outlier_max': sorted_values[-1] if end_inlier < n else None,
+        'outlier_count': first_inlier + (n - end_inlier),
+        'outliers': outliers
+    }
+
 def get_boxplot_statistics(data):
     """Calculate boxplot statistics (min, q1, median, q3, max) from data.
     
@@ -1918,58 +1682,22 @@ def get_boxplot_statistics(data):
         data: Single Series or list of Series
         
     Returns:
-        Dict or list of dicts with boxplot statistics
+        Dict or list of dicts with boxplot statistics. The dicts can be passed to
+        `plot_box_plot(..., box_stats=...)` so the plot reuses the same pass.
     """
-    def q_value(series, q):
-        return compute_quartile(series, q)
-
-    def compute_whisker_stats(series):
-        numeric_data = pd.to_numeric(series, errors='coerce').dropna()
-        if numeric_data.empty:
-            return None
-        q1 = q_value(numeric_data, 0.25)
-        median = q_value(numeric_data, 0.5)
-        q3 = q_value(numeric_data, 0.75)
-        iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        inliers = numeric_data[(numeric_data >= lower_bound) & (numeric_data <= upper_bound)]
-        if inliers.empty:
-            whisker_low = numeric_data.min()
-            whisker_high = numeric_data.max()
-        else:
-            whisker_low = inliers.min()
-            whisker_high = inliers.max()
-        outliers_low = numeric_data[numeric_data < lower_bound]
-        outliers_high = numeric_data[numeric_data > upper_bound]
-        outlier_min = outliers_low.min() if not outliers_low.empty else None
-        outlier_max = outliers_high.max() if not outliers_high.empty else None
-        return {
-            'min': numeric_data.min(),
-            'q1': q1,
-            'median': median,
-            'q3': q3,
-            'max': numeric_data.max(),
-            'whisker_low': whisker_low,
-            'whisker_high': whisker_high,
-            'outlier_min': outlier_min,
-            'outlier_max': outlier_max,
-            'outlier_count': int(outliers_low.shape[0] + outliers_high.shape[0])
-        }
-
     if isinstance(data, list):
         stats_list = []
         for d in data:
             if not isinstance(d, pd.Series):
                 d = pd.Series(d)
-            stats = compute_whisker_stats(d)
+            stats = compute_whisker_statistics(d)
             if stats:
                 stats_list.append(stats)
         return stats_list
     else:
         if not isinstance(data, pd.Series):
             data = pd.Series(data)
-        stats = compute_whisker_stats(data)
+        stats = compute_whisker_statistics(data)
         if not stats:
             return {}
         return stats
@@ -1983,7 +1711,7 @@ def format_decimal(value, max_decimals=10):
         return str(value)
 
 
-def plot_box_plot(data, title='Box Plot', ylabel='Value', horizontal=False, labels=None):
+def plot_box_plot(data, title='Box Plot', ylabel='Value', horizontal=False, labels=None, box_stats=None):
     """Plot one or more boxplots on the same grid using Plotly Express.
     
     Args:
@@ -1992,34 +1720,8 @@ def plot_box_plot(data, title='Box Plot', ylabel='Value', horizontal=False, labe
         ylabel: Label for value axis
         horizontal: If True, plot horizontally
         labels: List of labels for multiple boxplots (optional)
+        box_stats: Statistics from `get_boxplot_statistics(data)` to reuse (optional)
     """
-    def compute_whisker_stats(series):
-        numeric_data = pd.to_numeric(series, errors='coerce').dropna()
-        if numeric_data.empty:
-            return None
-        q1 = compute_quartile(numeric_data, 0.25)
-        median = compute_quartile(numeric_data, 0.5)
-        q3 = compute_quartile(numeric_data, 0.75)
-        iqr = q3 - q1
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
-        inliers = numeric_data[(numeric_data >= lower_bound) & (numeric_data <= upper_bound)]
-        if inliers.empty:
-            whisker_low = numeric_data.min()
-            whisker_high = numeric_data.max()
-        else:
-            whisker_low = inliers.min()
-            whisker_high = inliers.max()
-        outliers = numeric_data[(numeric_data < lower_bound) | (numeric_data > upper_bound)]
-        return {
-            'q1': q1,
-            'median': median,
-            'q3': q3,
-            'whisker_low': whisker_low,
-            'whisker_high': whisker_high,
-            'outliers': outliers
-        }
-
     max_outlier_markers = 2000
 
     if isinstance(data, list):
@@ -2043,9 +1745,11 @@ def plot_box_plot(data, title='Box Plot', ylabel='Value', horizontal=False, labe
         else:
             labels = [f"Series {i + 1}" for i in range(len(series_list))]
 
+        if box_stats is None or len(box_stats) != len(series_list):
+            box_stats = [compute_whisker_statistics(series_data) for series_data in series_list]
+
         fig = go.Figure()
-        for series_label, series_data in zip(labels, series_list):
-            stats = compute_whisker_stats(series_data)
+        for series_label, stats in zip(labels, box_stats):
             if not stats:
                 continue
             hovertext = (
@@ -2124,7 +1828,7 @@ def plot_box_plot(data, title='Box Plot', ylabel='Value', horizontal=False, labe
         if numeric_data.empty:
             raise ValueError("Input data contains no valid numerical data for boxplot.")
         label = labels[0] if labels else 'Data'
-        stats = compute_whisker_stats(numeric_data)
+        stats = box_stats if box_stats else compute_whisker_statistics(numeric_data)
         if not stats:
             raise ValueError("Input data contains no valid numerical data for boxplot.")
         hovertext = (
@@ -2244,33 +1948,66 @@ def plot_bar_plot(data, title='Bar Plot of Categories', xlabel='Category', ylabe
     fig.update_yaxes(showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
     return fig
 
-def plot_dot_plot(data, title='Dot Plot', xlabel='Value', ylabel='', dot_spacing=0.1):
-    if data.size == 0: raise ValueError("Input data is empty.")
-    if not isinstance(data, pd.Series): data = pd.Series(data)
-    numeric_data = pd.to_numeric(data, errors='coerce').dropna()
-    if numeric_data.empty: raise ValueError("Input data contains no valid numerical values after cleaning.")
-
-    # Sort data to ensure consistent stacking order for identical values
-    sorted_values = np.sort(numeric_data.to_numpy())
-
-    # Cap rendered points to keep large plots responsive.
-    max_render_points = 12000
-    if len(sorted_values) > max_render_points:
-        sample_idx = np.linspace(0, len(sorted_values) - 1, max_render_points, dtype=int)
-        sorted_values = sorted_values[sample_idx]
-
-    # Prepare x and y coordinates for scatter plot
-    plot_x = []
-    plot_y = []
-    # Dictionary to keep track of counts for each unique value, for stacking
-    value_counts = {}
-
-    for val in sorted_values:
-        if val not in value_counts:
-            value_counts[val] = 0
-        plot_x.append(val)
-        plot_y.append(value_counts[val] * dot_spacing)
-        value_counts[val] += 1
+# Dot plots draw one marker per observation up to this many points; larger columns
+# are drawn with each marker standing for a fixed number of observations
+DOT_PLOT_MAX_POINTS = 12000
+# Continuous columns with more distinct values than this are grouped into equal-width dot columns
+DOT_PLOT_MAX_COLUMNS = 200
+
+def stack_positions(counts):
+    """Return 0, 1, ..., count-1 for every group in `counts`, concatenated (a vectorized group cumcount)."""
+    total = int(counts.sum())
+    group_starts = np.cumsum(counts) - counts
+    return np.arange(total) - np.repeat(group_starts, counts)
+
+def plot_dot_plot(data, title='Dot Plot', xlabel='Value', ylabel='', dot_spacing=0.1, presorted=False):
+    """Build the dot plot figure.
+
+    Identical values are stacked with a vectorized run-length cumcount. Columns with
+    more than DOT_PLOT_MAX_POINTS values are aggregated instead of decimated: every
+    distinct value (or, for continuous data, every one of DOT_PLOT_MAX_COLUMNS
+    equal-width columns) keeps its exact count, and each marker represents
+    `per_dot` observations. With `presorted=True`, `data` is the sorted, NaN-free
+    array from `get_sorted_numeric_values`.
+    """
+    if presorted:
+        sorted_values = np.asarray(data, dtype='float64')
+        if sorted_values.size == 0: raise ValueError("Input data contains no valid numerical values after cleaning.")
+    else:
+        if data.size == 0: raise ValueError("Input data is empty.")
+        if not isinstance(data, pd.Series): data = pd.Series(data)
+        numeric_data = pd.to_numeric(data, errors='coerce').dropna()
+        if numeric_data.empty: raise ValueError("Input data contains no valid numerical values after cleaning.")
+        # Sort data to ensure consistent stacking order for identical values
+        sorted_values = np.sort(numeric_data.to_numpy(dtype='float64'))
+
+    n = sorted_values.size
+    # Distinct values and their counts from the runs of the sorted array
+    run_starts = np.flatnonzero(np.r_[True, sorted_values[1:] != sorted_values[:-1]])
+    positions = sorted_values[run_starts]
+    counts = np.diff(np.r_[run_starts, n])
+    hover_labels = None
+    per_dot = 1
+    if n > DOT_PLOT_MAX_POINTS:
+        if positions.size > DOT_PLOT_MAX_COLUMNS:
+            edges = np.linspace(sorted_values[0], sorted_values[-1], DOT_PLOT_MAX_COLUMNS + 1)
+            counts = histogram_counts_sorted(sorted_values, edges)
+            occupied = counts > 0
+            hover_labels = np.array([f"{low:.4g} to {high:.4g}" for low, high in zip(edges[:-1], edges[1:])])[occupied]
+            positions = ((edges[:-1] + edges[1:]) / 2)[occupied]
+            counts = counts[occupied]
+        per_dot = int(np.ceil(n / DOT_PLOT_MAX_POINTS))
+    dots = -(-counts // per_dot)  # ceil division: a partly filled marker still shows
+    if hover_labels is None:
+        hover_labels = np.array([f"{value:.6g}" for value in positions])
+
+    plot_x = np.repeat(positions, dots)
+    plot_y = stack_positions(dots) * dot_spacing
+    hover_counts = np.repeat(counts, dots)
+    hover_text = np.repeat(hover_labels, dots)
+
+    if per_dot > 1:
+        title = f"{title}<br><sup>{n:,} values; each dot represents up to {per_dot:,} observations</sup>"
 
     fig = go.Figure()
     fig.add_trace(
@@ -2278,7 +2015,9 @@ def plot_dot_plot(data, title='Dot Plot', xlabel='Value', ylabel='', dot_spacing
             x=plot_x,
             y=plot_y,
             mode='markers',
-            marker=dict(size=10, color='#0173B2', line=dict(color='white', width=0.5))
+            marker=dict(size=10, color='#0173B2', line=dict(color='white', width=0.5)),
+            customdata=np.column_stack([hover_text, hover_counts]),
+            hovertemplate="Value: %{customdata[0]}<br>Count: %{customdata[1]}<extra></extra>"
         )
     )
     fig.update_layout(title=title, xaxis_title=xlabel, yaxis_title=ylabel)
@@ -2286,6 +2025,71 @@ def plot_dot_plot(data, title='Dot Plot', xlabel='Value', ylabel='', dot_spacing
     fig.update_xaxes(showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
     return fig
 
+# Scatter plots with more points than this are drawn as a density heatmap
+SCATTER_DENSITY_THRESHOLD = 15000
+# Cells per axis of the density grid
+SCATTER_DENSITY_GRID = 150
+# Points in grid cells holding at most this many points are drawn individually
+SCATTER_SPARSE_CELL_COUNT = 3
+# Upper bound on individually drawn points over the heatmap
+SCATTER_MAX_OVERLAY_POINTS = 3000
+
+def scatter_overlay_indices(x_values, y_values, counts, x_edges, y_edges):
+    """Return indices of the points to draw on top of a density heatmap.
+
+    These are the points in sparse grid cells (at most SCATTER_SPARSE_CELL_COUNT
+    points) plus the points holding the minimum and maximum of each axis. When
+    there are more than SCATTER_MAX_OVERLAY_POINTS of them, the ones farthest
+    from the centre in standardized units are kept.
+    """
+    grid_x, grid_y = counts.shape
+    ix = np.clip(np.searchsorted(x_edges, x_values, side='right') - 1, 0, grid_x - 1)
+    iy = np.clip(np.searchsorted(y_edges, y_values, side='right') - 1, 0, grid_y - 1)
+    sparse = np.flatnonzero(counts[ix, iy] <= SCATTER_SPARSE_CELL_COUNT)
+    if sparse.size > SCATTER_MAX_OVERLAY_POINTS:
+        x_std = x_values.std() or 1.0
+        y_std = y_values.std() or 1.0
+        distance = (((x_values[sparse] - x_values.mean()) / x_std) ** 2
+                    + ((y_values[sparse] - y_values.mean()) / y_std) ** 2)
+        keep = np.argpartition(distance, -SCATTER_MAX_OVERLAY_POINTS)[-SCATTER_MAX_OVERLAY_POINTS:]
+        sparse = sparse[keep]
+    extremes = [np.argmin(x_values), np.argmax(x_values), np.argmin(y_values), np.argmax(y_values)]
+    return np.union1d(sparse, extremes)
+
+def plot_density_scatter(x_values, y_values, title, xlabel, ylabel):
+    """Draw a large scatter plot as a 2-D count heatmap with sparse and extreme points on top."""
+    counts, x_edges, y_edges = np.histogram2d(x_values, y_values, bins=SCATTER_DENSITY_GRID)
+    overlay = scatter_overlay_indices(x_values, y_values, counts, x_edges, y_edges)
+    density = np.where(counts > 0, counts, np.nan).T
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Heatmap(
+            x=(x_edges[:-1] + x_edges[1:]) / 2,
+            y=(y_edges[:-1] + y_edges[1:]) / 2,
+            z=density,
+            colorscale='Blues',
+            colorbar=dict(title='Points'),
+            hovertemplate="x≈%{x:.4g}<br>y≈%{y:.4g}<br>Points: %{z}<extra></extra>",
+            name='Density'
+        )
+    )
+    fig.add_trace(
+        go.Scatter(
+            x=x_values[overlay],
+            y=y_values[overlay],
+            mode='markers',
+            marker=dict(size=6, color='#D55E00', line=dict(color='white', width=0.5)),
+            name='Sparse and extreme points'
+        )
+    )
+    subtitle = (f"{x_values.size:,} points shown as density; "
+                f"{overlay.size:,} sparse or extreme points drawn individually")
+    fig.update_layout(title=f"{title}<br><sup>{subtitle}</sup>", xaxis_title=xlabel, yaxis_title=ylabel, showlegend=False)
+    fig.update_xaxes(showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
+    fig.update_yaxes(showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
+    return fig
+
 def plot_scatter_plot(x_data, y_data, title='Scatter Plot', xlabel='X-axis', ylabel='Y-axis'):
     if not isinstance(x_data, pd.Series): x_data = pd.Series(x_data)
     if not isinstance(y_data, pd.Series): y_data = pd.Series(y_data)
@@ -2293,15 +2097,12 @@ def plot_scatter_plot(x_data, y_data, title='Scatter Plot', xlabel='X-axis', yla
     if x_data.empty or y_data.empty: raise ValueError("Input data (after cleaning) is empty.")
     if len(x_data) != len(y_data): raise ValueError("x_data and y_data must have the same length.")
 
-    x_values = x_data.to_numpy()
-    y_values = y_data.to_numpy()
+    x_values = x_data.to_numpy(dtype='float64')
+    y_values = y_data.to_numpy(dtype='float64')
 
-    # Cap rendered points to avoid browser slowdowns/timeouts on very large datasets.
-    max_render_points = 15000
-    if len(x_values) > max_render_points:
-        sample_idx = np.linspace(0, len(x_values) - 1, max_render_points, dtype=int)
-        x_values = x_values[sample_idx]
-        y_values = y_values[sample_idx]
+    # Large scatter plots are aggregated server-side instead of sending every marker to the browser
+    if len(x_values) > SCATTER_DENSITY_THRESHOLD:
+        return plot_density_scatter(x_values, y_values, title, xlabel, ylabel)
 
     fig = go.Figure()
     fig.add_trace(
@@ -2316,6 +2117,407 @@ def plot_scatter_plot(x_data, y_data, title='Scatter Plot', xlabel='X-axis', yla
     fig.update_xaxes(showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
     fig.update_yaxes(showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)')
     return fig
+
+# --- Simulation Accumulators ---
+# Width of the fixed histogram range for simulated statistics, in theoretical standard errors
+SIMULATION_RANGE_SES = 4.5
+
+
+def theoretical_bin_edges(center, standard_error, bins, lower=None, upper=None):
+    """Return `bins` equal-width edges spanning center ± SIMULATION_RANGE_SES standard errors.
+
+    `lower`/`upper` clip the range to the statistic's natural bounds (e.g. 0 and 1
+    for a proportion). The edges are known before the first sample is drawn, so a
+    simulation can bin each batch as it arrives.
+    """
+    low = center - SIMULATION_RANGE_SES * standard_error
+    high = center + SIMULATION_RANGE_SES * standard_error
+    if lower is not None:
+        low = max(low, lower)
+    if upper is not None:
+        high = min(high, upper)
+    if not high > low:
+        low, high = center - 0.5, center + 0.5
+    return np.linspace(low, high, bins + 1)
+
+
+class HistogramAccumulator:
+    """Streaming histogram of simulated values with fixed bin edges and running moments.
+
+    Each batch is binned against the fixed `edges` and merged into a running mean and
+    sum of squared deviations (Welford's update, combined per batch with Chan et al.'s
+    formula). Taking a progress frame therefore costs O(batch) instead of
+    re-histogramming everything accumulated so far. Values outside the edges are
+    counted in `outside`. The raw values are only retained, in a preallocated buffer,
+    when a `capacity` is given; without one memory stays constant however many
+    values are added.
+    """
+
+    def __init__(self, edges, capacity=None):
+        self.edges = np.asarray(edges, dtype='float64')
+        self.counts = np.zeros(self.edges.size - 1, dtype=np.int64)
+        self._buffer = np.empty(int(capacity), dtype='float64') if capacity is not None else None
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.outside = 0
+
+    def add(self, batch):
+        batch = np.asarray(batch, dtype='float64').ravel()
+        size = batch.size
+        if size == 0:
+            return
+        if self._buffer is not None:
+            self._buffer[self.count:self.count + size] = batch
+        batch_counts, _ = np.histogram(batch, bins=self.edges)
+        self.counts += batch_counts
+        self.outside += size - int(batch_counts.sum())
+        batch_mean = float(batch.mean())
+        batch_m2 = float(np.square(batch - batch_mean).sum())
+        total = self.count + size
+        delta = batch_mean - self.mean
+        self.mean += delta * size / total
+        self._m2 += batch_m2 + delta * delta * self.count * size / total
+        self.count = total
+
+    @property
+    def values(self):
+        """The values added so far (a view into the preallocated buffer)."""
+        if self._buffer is None:
+            raise ValueError("HistogramAccumulator was created without a capacity; values are not retained")
+        return self._buffer[:self.count]
+
+    def variance(self, ddof=1):
+        return self._m2 / (self.count - ddof) if self.count > ddof else float('nan')
+
+    def std(self, ddof=1):
+        return float(np.sqrt(self.variance(ddof)))
+
+
+# Populations for the Sample Means simulation: analytic mean/std, natural bounds and panel colour
+SAMPLE_MEANS_POPULATIONS = {
+    "Normal": {'mean': 50.0, 'std': 15.0, 'bounds': (None, None), 'color': 'steelblue'},
+    "Right Skewed (Exponential)": {'mean': 20.0, 'std': 20.0, 'bounds': (0, None), 'color': 'coral'},
+    "Left Skewed (Beta)": {'mean': 80.0, 'std': 100 * np.sqrt(16 / 1100), 'bounds': (0, 100), 'color': 'mediumpurple'},
+    "Uniform": {'mean': 50.0, 'std': 100 / np.sqrt(12), 'bounds': (0, 100), 'color': 'lightgreen'},
+    "Bimodal": {'mean': 50.0, 'std': np.sqrt(8**2 + 20**2), 'bounds': (None, None), 'color': 'gold'},
+}
+SAMPLE_MEANS_POPULATION_SIZE = 100000
+SAMPLE_MEANS_POPULATION_SEED = 2024
+
+
+@lazy_cache_resource(show_spinner=False, max_entries=32)
+def population_histogram(dist_type, seed, size=SAMPLE_MEANS_POPULATION_SIZE, bins=60):
+    """Return (density, edges) of a drawn Sample Means population, cached per (distribution, seed).
+
+    The population is only displayed, so the array itself is discarded once binned and
+    the returned arrays are read-only.
+    """
+    rng = np.random.default_rng(seed)
+    if dist_type == "Normal":
+        population = rng.normal(loc=50, scale=15, size=size)
+    elif dist_type == "Right Skewed (Exponential)":
+        population = rng.exponential(scale=20, size=size)
+    elif dist_type == "Left Skewed (Beta)":
+        population = rng.beta(a=8, b=2, size=size) * 100
+    elif dist_type == "Uniform":
+        population = rng.uniform(low=0, high=100, size=size)
+    else:  # Bimodal
+        population = np.concatenate([
+            rng.normal(loc=30, scale=8, size=size // 2),
+            rng.normal(loc=70, scale=8, size=size - size // 2),
+        ])
+    density, edges = np.histogram(population, bins=bins, density=True)
+    density.setflags(write=False)
+    edges.setflags(write=False)
+    return density, edges
+
+
+# --- Monte Carlo Engine ---
+# Simulations draw each replicate's sufficient statistic directly where its distribution
+# has a closed form (a binomial count instead of n Bernoulli draws, a normal sample mean
+# instead of n normals) and process replicates in fixed-size chunks, so memory stays
+# constant and a million replicates take about a second.
+#
+# Every chunk gets its own generator spawned from one SeedSequence, so a run with a fixed
+# seed gives the same results whatever the number of workers (the app's simulations pass
+# no seed and draw fresh entropy on every run). With CUESTAT_SIMULATION_WORKERS > 1
+# ('auto' = one per CPU) chunks are drawn on a thread pool; NumPy's generators release
+# the GIL while drawing, and chunk results are consumed in order as they complete.
+SIMULATION_MAX_REPLICATES = 1_000_000
+SIMULATION_CHUNK_SIZE = 65_536
+# Upper bound on values in one per-observation draw matrix (distributions without a closed form)
+SIMULATION_CHUNK_ELEMENTS = 1 << 21
+
+
+@lazy_cache_resource(show_spinner=False)
+def parse_simulation_workers(value):
+    """Parse a CUESTAT_SIMULATION_WORKERS value: a positive integer or 'auto' (one per CPU).
+
+    Missing values mean 1; anything else invalid falls back to 1 with a warning, logged
+    once per process rather than on every rerun.
+    """
+    text = (value or '1').strip().lower()
+    if text == 'auto':
+        return os.cpu_count() or 1
+    try:
+        workers = int(text)
+    except ValueError:
+        logging.warning("Ignoring CUESTAT_SIMULATION_WORKERS=%r: expected a positive integer or 'auto'", value)
+        return 1
+    if workers < 1:
+        logging.warning("Ignoring CUESTAT_SIMULATION_WORKERS=%r: at least one worker is required", value)
+        return 1
+    return workers
+
+
+
+def simulation_chunk_plan(total, max_frames=12, chunk_size=SIMULATION_CHUNK_SIZE):
+    """Split `total` replicates into chunks of at most `chunk_size`.
+
+    Returns a list of (size, is_frame) pairs. Chunk boundaries fall on up to `max_frames`
+    evenly spaced frame points, the last of which is the final replicate, so callers can
+    record an animation frame whenever `is_frame` is set.
+    """
+    total = int(total)
+    if total <= 0:
+        return []
+    frame_ends = np.unique(np.linspace(0, total, min(max_frames, total) + 1).round().astype(int)[1:])
+    plan = []
+    done = 0
+    for frame_end in frame_ends.tolist():
+        while done < frame_end:
+            size = min(chunk_size, frame_end - done)
+            done += size
+            plan.append((size, done == frame_end))
+    return plan
+
+
+def simulation_worker_count(workers=None):
+    """Resolve a worker setting (None = CUESTAT_SIMULATION_WORKERS), clamped to at least one."""
+    if workers is None:
+        return parse_simulation_workers(os.getenv('CUESTAT_SIMULATION_WORKERS'))
+    return max(1, int(workers))
+
+
+@lazy_cache_resource()
+def get_simulation_pool(workers):
+    """Return the process-wide thread pool that draws simulation chunks."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="simulation")
+
+
+def ordered_pool_map(pool, func, count, window):
+    """Yield func(0) ... func(count - 1) from `pool` in order, with at most `window` in flight."""
+    pending = deque()
+    next_index = 0
+    try:
+        while pending or next_index < count:
+            while next_index < count and len(pending) < window:
+                pending.append(pool.submit(func, next_index))
+                next_index += 1
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def monte_carlo_chunks(draw, total, seed=None, max_frames=12, chunk_size=SIMULATION_CHUNK_SIZE, workers=None):
+    """Yield (replicates done, is_frame, statistics) for `total` replicates of `draw(rng, size)`.
+
+    `draw` returns the statistics of `size` replicates (an array, or a tuple of arrays).
+    Chunk i is drawn with a generator seeded by the i-th child of SeedSequence(seed). For a
+    fixed `seed` the results depend on `chunk_size` but not on `workers`; with the default
+    seed=None every call draws fresh OS entropy and is not reproducible.
+    """
+    plan = simulation_chunk_plan(total, max_frames, chunk_size)
+    child_seeds = np.random.SeedSequence(seed).spawn(len(plan))
+
+    def draw_chunk(index):
+        return draw(np.random.default_rng(child_seeds[index]), plan[index][0])
+
+    workers = simulation_worker_count(workers)
+    if workers > 1 and len(plan) > 1:
+        results = ordered_pool_map(get_simulation_pool(workers), draw_chunk, len(plan), window=2 * workers)
+    else:
+        results = (draw_chunk(index) for index in range(len(plan)))
+    done = 0
+    for (size, is_frame), statistics in zip(plan, results):
+        done += size
+        yield done, is_frame, statistics
+
+
+def draw_matrix_means(rng, sampler, n, size):
+    """Row means of `size` x `n` draws of `sampler(shape)`, built in bounded blocks."""
+    means = np.empty(size, dtype='float64')
+    rows = max(1, SIMULATION_CHUNK_ELEMENTS // n)
+    for start in range(0, size, rows):
+        stop = min(size, start + rows)
+        means[start:stop] = sampler((stop - start, n)).mean(axis=1)
+    return means
+
+
+def draw_sample_means(rng, dist_type, n, size):
+    """Means of `size` samples of `n` values from a SAMPLE_MEANS_POPULATIONS population.
+
+    Normal means are normal, exponential sums are gamma and a bimodal sample is a
+    binomial split between its two normal components; beta and uniform samples have no
+    convenient closed form and are drawn per observation.
+    """
+    if dist_type == "Normal":
+        return rng.normal(loc=50, scale=15 / np.sqrt(n), size=size)
+    if dist_type == "Right Skewed (Exponential)":
+        return rng.gamma(shape=n, scale=20, size=size) / n
+    if dist_type == "Left Skewed (Beta)":
+        return draw_matrix_means(rng, lambda shape: rng.beta(a=8, b=2, size=shape), n, size) * 100
+    if dist_type == "Uniform":
+        return draw_matrix_means(rng, lambda shape: rng.uniform(low=0, high=100, size=shape), n, size)
+    low_component = rng.binomial(n, 0.5, size=size)
+    totals = rng.normal(loc=30 * low_component + 70 * (n - low_component), scale=8 * np.sqrt(n))
+    return totals / n
+
+
+def draw_sample_proportions(rng, p, n, size):
+    """Proportions of successes in `size` samples of `n` Bernoulli(p) trials."""
+    return rng.binomial(n, p, size=size) / n
+
+
+def draw_normal_mean_and_sd(rng, mu, sigma, n, size):
+    """Sample means and standard deviations of `size` normal samples of `n` values.
+
+    For normal data x̄ ~ N(μ, σ²/n) and (n-1)s²/σ² ~ χ²(n-1), independently.
+    """
+    means = rng.normal(loc=mu, scale=sigma / np.sqrt(n), size=size)
+    sds = sigma * np.sqrt(rng.chisquare(n - 1, size=size) / (n - 1))
+    return means, sds
+
+
+# --- Simulation Animations ---
+# Simulation progress is sent as a single Plotly figure holding one frame per progress
+# update. Plotly plays the frames in the browser, so a run ships a few KB of histogram
+# counts instead of re-rendering and sending a matplotlib PNG for every update.
+SIMULATION_FRAME_MS = 400
+
+
+def add_animation_controls(fig, frame_names):
+    """Add a Replay button and a frame slider for `fig.frames`, positioned on the last frame."""
+    fig.update_layout(
+        updatemenus=[dict(
+            type='buttons',
+            showactive=False,
+            x=0, xanchor='left', y=1.12, yanchor='bottom',
+            buttons=[dict(
+                label='▶ Replay',
+                method='animate',
+                args=[None, {'frame': {'duration': SIMULATION_FRAME_MS, 'redraw': True},
+                             'transition': {'duration': 0}, 'fromcurrent': False, 'mode': 'immediate'}]
+            )]
+        )],
+        sliders=[dict(
+            active=len(frame_names) - 1,
+            currentvalue={'prefix': 'Progress: '},
+            pad={'t': 40},
+            steps=[dict(
+                label=name,
+                method='animate',
+                args=[[name], {'frame': {'duration': 0, 'redraw': True}, 'transition': {'duration': 0}, 'mode': 'immediate'}]
+            ) for name in frame_names]
+        )]
+    )
+
+
+def histogram_animation_figure(edges, frames, title, xlabel, ylabel='Density', bar_name='Simulated values',
+                               bar_color='steelblue', static_curves=(), static_lines=()):
+    """Build an animated density histogram of a simulation's accumulated results.
+
+    `edges` are fixed bin edges shared by every frame. Each frame is a dict with a
+    slider `label`, the cumulative bin `counts`, and optional `curves`
+    (x, y, color, name) and vertical `lines` (x, color, dash, name) that change
+    between frames. A frame may also carry a `strip` (x values, 0/1 outcomes,
+    title) drawn in a narrow panel above the histogram, green for 1 and red for 0. `static_curves` and
+    `static_lines` are drawn once. The figure opens on the last frame.
+    """
+    widths = np.diff(edges)
+    centers = (edges[:-1] + edges[1:]) / 2
+    densities = []
+    for frame in frames:
+        total = frame['counts'].sum()
+        densities.append(frame['counts'] / (total * widths) if total else np.zeros_like(widths))
+    curve_peaks = [np.max(curve[1]) for frame in frames for curve in frame.get('curves', ())]
+    curve_peaks += [np.max(curve[1]) for curve in static_curves]
+    y_max = 1.1 * max([float(np.max(density)) for density in densities] + curve_peaks + [1e-12])
+
+    has_strip = 'strip' in frames[-1]
+    # Histogram traces go in the lower panel when a strip is drawn above it
+    target = dict(row=2, col=1) if has_strip else {}
+
+    def line_trace(x, color, dash, name):
+        return go.Scatter(x=[x, x], y=[0, y_max], mode='lines', line=dict(color=color, dash=dash, width=2), name=name)
+
+    def frame_traces(frame, density, full):
+        # Animation frames only carry what changes between frames; float32 halves the payload
+        traces = []
+        if has_strip:
+            strip_x, outcomes, _ = frame['strip']
+            outcomes = np.asarray(outcomes, dtype='int8')
+            if full:
+                traces.append(go.Scatter(
+                    x=strip_x, y=np.full(len(strip_x), 0.5), mode='markers',
+                    marker=dict(color=outcomes, colorscale=[[0, 'red'], [1, 'green']], cmin=0, cmax=1,
+                                size=9, opacity=0.7),
+                    showlegend=False, hovertemplate="Observation %{x}<extra></extra>"
+                ))
+            else:
+                traces.append(go.Scatter(marker=dict(color=outcomes)))
+        if full:
+            traces.append(go.Bar(
+                x=centers, y=density, width=widths, name=bar_name, opacity=0.7,
+                marker=dict(color=bar_color, line=dict(color='black', width=1))
+            ))
+            traces += [go.Scatter(x=x, y=y, mode='lines', line=dict(color=color, width=2), name=name)
+                       for x, y, color, name in frame.get('curves', ())]
+            traces += [line_trace(*line) for line in frame.get('lines', ())]
+        else:
+            traces.append(go.Bar(y=density.astype('float32')))
+            traces += [go.Scatter(y=np.asarray(y, dtype='float32'), name=name) for _, y, _, name in frame.get('curves', ())]
+            traces += [go.Scatter(x=[x, x], name=name) for x, _, _, name in frame.get('lines', ())]
+        return traces
+
+    if has_strip:
+        fig = plotly_subplots.make_subplots(rows=2, cols=1, row_heights=[0.2, 0.8], vertical_spacing=0.12,
+                                            subplot_titles=(frames[-1]['strip'][2], title))
+    else:
+        fig = go.Figure()
+    base_traces = frame_traces(frames[-1], densities[-1], full=True)
+    for index, trace in enumerate(base_traces):
+        fig.add_trace(trace, **(dict(row=1, col=1) if has_strip and index == 0 else target))
+    for x, y, color, name in static_curves:
+        fig.add_trace(go.Scatter(x=x, y=y, mode='lines', line=dict(color=color, width=2), name=name), **target)
+    for line in static_lines:
+        fig.add_trace(line_trace(*line), **target)
+
+    frame_trace_ids = list(range(len(base_traces)))
+    fig.frames = [
+        go.Frame(
+            data=frame_traces(frame, density, full=False), traces=frame_trace_ids, name=frame['label'],
+            layout=({'annotations': [dict(fig.layout.annotations[0].to_plotly_json(), text=frame['strip'][2]),
+                                     fig.layout.annotations[1].to_plotly_json()]}
+                    if has_strip else {})
+        )
+        for frame, density in zip(frames, densities)
+    ]
+    add_animation_controls(fig, [frame['label'] for frame in frames])
+    fig.update_layout(barmode='overlay', bargap=0, legend=dict(orientation='h', yanchor='top', y=-0.35),
+                      margin=dict(t=110), height=620 if has_strip else 520)
+    if not has_strip:
+        fig.update_layout(title=title)
+    fig.update_xaxes(title_text=xlabel, showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)', **target)
+    fig.update_yaxes(title_text=ylabel, range=[0, y_max], showgrid=True, gridcolor='rgba(0, 0, 0, 0.2)', **target)
+    if has_strip:
+        fig.update_xaxes(title_text='Observation Number', row=1, col=1)
+        fig.update_yaxes(range=[0, 1], showticklabels=False, showgrid=False, row=1, col=1)
+    return fig
+
+
 def perform_linear_regression_analysis(x_data, y_data, title='Linear Regression Analysis', xlabel='X-axis', ylabel='Y-axis'):
     if x_data.empty or y_data.empty: raise ValueError("Input data is empty after cleaning.")
     if len(x_data) != len(y_data): raise ValueError("X and Y data must have the same length after cleaning.")
@@ -2588,6 +2790,44 @@ def anova_f_test(*sample_data_groups):
 # --- Sidebar for Navigation ---
 nav_options = ["Data Input", "Visualizations", "Tables", "Descriptive Statistics", "Probability Distributions", "Confidence Intervals", "Hypothesis Testing", "Linear Regression", "Simulations", "Start New Session"]
 
+# Each navigation entry lives in app_pages/<module>.py. A page's code is
+# compiled the first time the tab is opened (and again only when the file
+# changes) and executed in this script's namespace, so pages keep using the
+# helpers above unqualified while reruns only run the selected tab.
+PAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app_pages')
+PAGE_MODULES = {
+    "Data Input": "data_input",
+    "Visualizations": "visualizations",
+    "Tables": "tables",
+    "Descriptive Statistics": "descriptive_statistics",
+    "Probability Distributions": "probability_distributions",
+    "Confidence Intervals": "confidence_intervals",
+    "Hypothesis Testing": "hypothesis_testing",
+    "Linear Regression": "linear_regression",
+    "Simulations": "simulations",
+    "Start New Session": "start_new_session",
+}
+
+
+@st.cache_resource(show_spinner=False)
+def load_page_code(module_name, modified):
+    """Compile app_pages/<module_name>.py; ``modified`` keys the cache on the file's mtime."""
+    path = os.path.join(PAGE_DIR, f"{module_name}.py")
+    with open(path, encoding='utf-8') as handle:
+        return compile(handle.read(), path, 'exec')
+
+
+def run_page(tab):
+    """Execute the page module for a navigation entry in the app namespace."""
+    module_name = PAGE_MODULES.get(tab)
+    if module_name is None:
+        st.header(tab)
+        st.info("This tab is under construction. Please use the 'Data Input' tab first to load or enter data.")
+        return
+    path = os.path.join(PAGE_DIR, f"{module_name}.py")
+    exec(load_page_code(module_name, os.path.getmtime(path)), globals())
+
+
 # Check if we need to force navigation to Data Input
 if st.session_state.get('_force_data_input', False):
     # Clear the flag and force navigation
@@ -2603,53 +2843,65 @@ else:
 
 # Handle Start New Session
 if selected_tab == "Start New Session":
-    st.header("Start New Session")
-    st.warning("⚠️ This will clear all data and reset the application to its initial state.")
-    st.write("**The following will be cleared:**")
-    st.write("- All uploaded and manually entered data")
-    st.write("- All session state and saved inputs")
-    st.write("- All analysis results")
-    
-    col1, col2, col3 = st.columns([1, 1, 2])
-    with col1:
-        if st.button("🔄 Reset Everything", type="primary", use_container_width=True):
-            # Clear all session state
-            for key in list(st.session_state.keys()):
-                del st.session_state[key]
-            # Reinitialize essential session state
-            st.session_state.global_dataframes = {}
-            st.session_state.manual_entry_df = pd.DataFrame({'Column A': ['']})
-            # Set flag to force navigation to Data Input
-            st.session_state._force_data_input = True
-            st.rerun()
-    with col2:
-        if st.button("❌ Cancel", use_container_width=True):
-            # Set flag to force navigation to Data Input without clearing data
-            st.session_state._force_data_input = True
-            st.rerun()
-    
-    st.stop()  # Stop execution so no other tab content is shown
+    run_page(selected_tab)
 
 # Toggle: choose between interactive Streamlit tables or styled HTML tables
 use_interactive_tables = st.sidebar.checkbox("Use interactive tables (st.dataframe)", value=False, key="use_interactive_tables")
 
 
-def show_table(df, hide_index=False):
+# Rows per page in show_table; only the current page is sent to the browser
+TABLE_PAGE_ROWS = 100
+INTERACTIVE_TABLE_PAGE_ROWS = 1000
+# Default page selector keys handed out during this script run (the namespace is fresh on every rerun)
+_table_page_keys = set()
+
+
+def show_table(df, hide_index=False, key=None, paged=True):
     """Display a DataFrame using either `st.dataframe` (interactive) or styled HTML.
 
-    Respects the `use_interactive_tables` sidebar checkbox.
+    Respects the `use_interactive_tables` sidebar checkbox. Tables longer than one
+    page get a page selector and only that window of rows is rendered, so the cost
+    does not depend on the row count. `df` may also be an ActiveDataset, in which
+    case only the shown rows are converted for display. `key` names the page
+    selector; without one it is derived from the columns and row count, with a
+    suffix when an identical table was already shown in this run.
+
+    Pass `paged=False` for tables shown inside an `st.button` branch: changing the
+    page reruns the script with the button False, which would clear the table, so
+    those tables are rendered whole.
     """
+    page_rows = INTERACTIVE_TABLE_PAGE_ROWS if use_interactive_tables else TABLE_PAGE_ROWS
+    total_rows = len(df.frame) if hasattr(df, 'display_frame') else len(df)
+    start = 0
+    if not paged:
+        page_rows = max(total_rows, 1)
+    elif total_rows > page_rows:
+        page_count = -(-total_rows // page_rows)
+        if key is None:
+            columns = [str(c) for c in df.columns] if hasattr(df, 'columns') else [str(df.name)]
+            base_key = f"table_page_{hashlib.sha1(repr(columns).encode('utf-8')).hexdigest()[:10]}_{total_rows}"
+            key = base_key
+            duplicate = 1
+            while key in _table_page_keys:
+                duplicate += 1
+                key = f"{base_key}_{duplicate}"
+            _table_page_keys.add(key)
+        page = st.number_input(f"Page (of {page_count:,})", min_value=1, max_value=page_count, value=1, step=1, key=key)
+        start = (int(page) - 1) * page_rows
+        st.caption(f"Showing rows {start + 1:,}–{min(start + page_rows, total_rows):,} of {total_rows:,}")
+    rows = slice(start, start + page_rows)
+    window = df.display_frame(rows) if hasattr(df, 'display_frame') else df.iloc[rows]
     try:
         if use_interactive_tables:
-            st.dataframe(df, hide_index=hide_index)
+            st.dataframe(window, hide_index=hide_index)
         else:
-            st.markdown(styled_dataframe_html(df, hide_index=hide_index), unsafe_allow_html=True)
+            st.markdown(styled_dataframe_html(window, hide_index=hide_index), unsafe_allow_html=True)
     except Exception:
         # Fallback to a simple write if both methods fail
         try:
-            st.dataframe(df, hide_index=hide_index)
+            st.dataframe(window, hide_index=hide_index)
         except Exception:
-            st.write(df)
+            st.write(window)
 
 
 # Compatibility helper: some Streamlit versions expose `experimental_rerun`,
@@ -2717,4787 +2969,425 @@ def clear_query_param(name):
         pass
 
 # --- Helper Function for Auto-Loading Google Sheets ---
-def load_google_sheets_from_url(sheets_url):
-    """Attempt to load a Google Sheets CSV from a URL."""
-    try:
-        # Handle regular Google Sheets share links and convert them to CSV export URLs
-        url_to_use = sheets_url
-        
-        # If it's a regular share link, convert it to CSV export URL
-        if '/edit' in sheets_url and '/spreadsheets/d/' in sheets_url:
-            # Extract the sheet ID from regular share links
-            match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', sheets_url)
-            if match:
-                sheet_id = match.group(1)
-                # Convert to CSV export URL
-                url_to_use = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
-        
-        with st.spinner("Loading data from Google Sheets..."):
-            df = pd.read_csv(url_to_use)
-            
-            if df is not None and not df.empty:
-                # Replace NaN values with blank cells for visual purposes
-                df = df.fillna('')
-                # Reset index to start at 1 instead of 0
-                df.index = range(1, len(df) + 1)
-                df.index.name = None
-                # Replace any existing dataframe with the new one
-                st.session_state.global_dataframes = {'active_data': df}
-                return df, None
-            else:
-                return None, "The Google Sheet appears to be empty. Please check that your sheet contains data and try again."
-    except pd.errors.ParserError as pe:
-        return None, f"Unable to parse the data from Google Sheets. {pe}"
-    except Exception as e:
-        return None, f"Error loading Google Sheets: {e}"
-
-# --- Main Content Area ---
-
-if selected_tab == "Data Input":
-    st.header("Data Input")
-
-    # Instructor authentication for auto-loading feature
-    with st.sidebar:
-        if not st.session_state.is_instructor:
-            st.divider()
-            instructor_password = st.text_input(
-                "Instructor Options",
-                type="password",
-                placeholder="Enter password if you're an instructor",
-                help="Optional: Instructors can authenticate to use the auto-loading link feature"
-            )
-            if instructor_password:
-                # Simple password check - using CUESTAT_INSTRUCTOR_PASSWORD environment variable
-                import os
-                correct_password = os.getenv('CUESTAT_INSTRUCTOR_PASSWORD', 'instructor')
-                if instructor_password == correct_password:
-                    st.session_state.is_instructor = True
-                    st.success("✅ Authenticated as instructor")
-                    st.rerun()
-                else:
-                    st.error("❌ Incorrect password")
-        else:
-            st.divider()
-            st.success("✅ Instructor mode enabled")
-            if st.button("Logout", key="instructor_logout"):
-                st.session_state.is_instructor = False
-                st.rerun()
-
-    # Check for auto-load Google Sheets URL in query parameters.
-    # Note: creating auto-load links remains an instructor-only action,
-    # but students should be able to *use* a link posted by an instructor.
-    auto_load_url = get_query_param('sheets_url')
-
-    # FIRST: If a dataset was previously auto-loaded but sheets_url param is now missing,
-    # immediately clear the auto-loaded data and remove the query param from the URL.
-    if st.session_state.get('auto_loaded_sheets') and (not auto_load_url or (isinstance(auto_load_url, (list, tuple)) and len(auto_load_url) == 0)):
-        try:
-            # Clear auto-loaded dataset
-            st.session_state.global_dataframes = {}
-            st.session_state.manual_entry_df = pd.DataFrame({'Column A': ['']})
-            st.session_state['auto_loaded_sheets'] = False
-            # Remove the sheets_url param from the URL to show clean state
-            clear_query_param('sheets_url')
-        except Exception:
-            pass
-
-    # SECOND: Check if sheets_url param exists and try to auto-load
-    if auto_load_url:
-        # st.query_params values are lists when present in URL; handle both cases
-        sheets_param = auto_load_url[0] if isinstance(auto_load_url, (list, tuple)) and len(auto_load_url) > 0 else auto_load_url
-        if sheets_param:
-            df, error = load_google_sheets_from_url(sheets_param)
-
-            if df is not None and not df.empty:
-                st.markdown("---")
-                st.write("You can now proceed to analyze this data using the CueStat tools, or load different data below.")
-                # Mark that this dataset was auto-loaded from a query parameter so
-                # it can be cleared automatically on subsequent refreshes/new sessions
-                try:
-                    st.session_state['auto_loaded_sheets'] = True
-                    # Clear the sheets_url from the URL so "Start New Session" starts with a clean URL
-                    clear_query_param('sheets_url')
-                except Exception:
-                    pass
-                if not st.session_state.is_instructor:
-                    st.info("ℹ️ This dataset was loaded from a link provided by your instructor. If you have concerns about the data source, please contact them.")
-            else:
-                st.error(f"❌ {error}")
-                st.info("""
-                💡 **Troubleshooting steps:**
-                - Verify the sheet is published to the web (File → Share → Publish to web)
-                - Ensure you selected 'Comma-separated values (.csv)' as the format
-                - Check that the URL starts with https://docs.google.com/spreadsheets/
-                - Make sure the sheet is not restricted or private
-                - Try copying the publish link again
-                """)
-
-    # Create tabs for different input methods
-    input_method = st.radio(
-        "Choose Data Input Method:",
-        options=["Upload File", "Google Sheets", "Manual Entry"],
-        horizontal=True,
-        key="data_input_method"
-    )
+# Fetched sheets are shared by every session of this server process
+SHEETS_CACHE_TTL_SECONDS = 60
+SHEETS_CACHE_MAX_ENTRIES = 32
+# Connect covers opening the connection and receiving the response headers;
+# read is the longest pause allowed between two chunks of the CSV body
+SHEETS_CONNECT_TIMEOUT_SECONDS = float(os.getenv('CUESTAT_SHEETS_CONNECT_TIMEOUT', '10'))
+SHEETS_READ_TIMEOUT_SECONDS = float(os.getenv('CUESTAT_SHEETS_READ_TIMEOUT', '30'))
+SHEETS_STREAM_CHUNK_BYTES = 64 * 1024
+# Small pool shared by every session; the tabs of one workbook download side by side
+SHEETS_LOADER_WORKERS = 8
+SHEETS_STATUS_POLL_SECONDS = 0.5
+
+
+def normalize_sheets_url(sheets_url):
+    """Return the CSV export URL for a Google Sheets share link; other URLs are returned stripped."""
+    url = sheets_url.strip()
+    # If it's a regular share link, convert it to CSV export URL
+    if '/edit' in url and '/spreadsheets/d/' in url:
+        # Extract the sheet ID from regular share links
+        sheet_id = get_google_sheet_id(url)
+        if sheet_id:
+            url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/export?format=csv"
+            # Keep the tab the link points at instead of always exporting the first one
+            gid_match = re.search(r'[#?&]gid=(\d+)', sheets_url)
+            if gid_match:
+                url += f"&gid={gid_match.group(1)}"
+    return url
+
+
+def get_google_sheet_id(sheets_url):
+    """Return the spreadsheet ID of a Google Sheets link, or None for other URLs."""
+    match = re.search(r'/spreadsheets/d/([a-zA-Z0-9-_]+)', sheets_url or '')
+    return match.group(1) if match else None
+
+
+def parse_sheet_tab_specs(text):
+    """Parse a comma-separated list of tabs such as "Lab 1, Lab 2!A1:D50, gid=123".
+
+    Each entry is a tab name or `gid=<number>`, optionally followed by `!range`.
+    Returns a list of dicts with the entry's label, gid, sheet name and range.
+    """
+    specs = []
+    seen = set()
+    for token in re.split(r'[,\n]', text or ''):
+        label = token.strip()
+        if not label or label in seen:
+            continue
+        seen.add(label)
+        name, _, cell_range = label.partition('!')
+        name = name.strip().strip("'")
+        gid_match = re.fullmatch(r'gid\s*=\s*(\d+)', name)
+        specs.append({
+            'label': label,
+            'gid': gid_match.group(1) if gid_match else None,
+            'sheet': None if gid_match else name,
+            'range': cell_range.strip() or None,
+        })
+    return specs
+
+
+def sheet_tab_export_url(sheet_id, spec):
+    """Return the CSV URL for one tab (and optional range) of a spreadsheet."""
+    base = f"https://docs.google.com/spreadsheets/d/{sheet_id}"
+    if spec['gid'] is not None:
+        query = {'format': 'csv', 'gid': spec['gid']}
+        if spec['range']:
+            query['range'] = spec['range']
+        return f"{base}/export?{urllib.parse.urlencode(query)}"
+    # The export endpoint only addresses tabs by gid; the visualization endpoint accepts names
+    query = {'tqx': 'out:csv', 'sheet': spec['sheet']}
+    if spec['range']:
+        query['range'] = spec['range']
+    return f"{base}/gviz/tq?{urllib.parse.urlencode(query)}"
+
+
+class SheetsFetchCache:
+    """Process-wide cache of downloaded and parsed Google Sheets CSV exports.
+
+    Entries are served for `ttl` seconds; after that they are revalidated with
+    If-None-Match/If-Modified-Since so an unchanged sheet is neither downloaded nor
+    parsed again. Concurrent requests for the same URL are coalesced: the first
+    caller's download runs on the worker pool and the others receive futures that
+    complete with its result, without holding a worker while they wait.
+    """
 
-    if input_method == "Upload File":
-        st.subheader("Upload Data File")
-        uploaded_file = st.file_uploader("Choose a CSV or Excel file", type=None)
-    elif input_method == "Google Sheets":
-        st.subheader("Import from Google Sheets")
-        st.markdown("""
-        <div role="region" aria-label="Google Sheets Import Instructions">
-        <strong>Instructions:</strong>
-        <ol>
-        <li>Open your Google Sheet in a web browser</li>
-        <li>Click the <strong>Share</strong> button (top right)</li>
-        <li>Under "General access", select <strong>Anyone with the link</strong> (Viewer access is sufficient)</li>
-        <li>Click <strong>Copy link</strong></li>
-        <li>Paste the link in the field below</li>
-        </ol>
-        <p><strong>Note:</strong> The app will automatically convert your share link to the proper format.</p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        sheets_url = st.text_input(
-            "Google Sheets URL * (Required)",
-            placeholder="Example: https://docs.google.com/spreadsheets/d/abc123.../edit?usp=sharing",
-            help="Paste your Google Sheets share link. Works with regular share links or published CSV links.",
-            key="google_sheets_url_input"
-        )
-        
-        if st.button("Load from Google Sheets", key="load_sheets_btn", help="Click to import data from the URL above"):
-            if sheets_url:
-                df, error = load_google_sheets_from_url(sheets_url)
-                
-                if df is not None:
-                    # Reset manual entry if Google Sheets is loaded
-                    st.session_state.manual_entry_df = pd.DataFrame({'Column A': ['']})
-                else:
-                    st.error(f"❌ Error: {error}")
-                    st.info("""
-                    💡 **Troubleshooting steps:**
-                    - Make sure the sheet is shared with "Anyone with the link" (click Share button → General access)
-                    - Check that the URL starts with https://docs.google.com/spreadsheets/
-                    - Verify the sheet contains data and is not empty
-                    - Try copying the share link again
-                    - If using a regular share link, ensure the sheet has public or link-sharing enabled
-                    """)
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, url, pool, cancel=None, progress=None):
+        """Return a Future for the ActiveDataset of an export URL (None for an empty sheet).
+
+        Only the caller that starts a download takes a `pool` worker. A fresh entry
+        comes back as a finished future, and callers that find the URL already being
+        fetched get a future resolved from that download, so waiting on a slow sheet
+        never occupies a worker. Setting the `cancel` event stops the download with
+        concurrent.futures.CancelledError if this caller started it. `progress` is a
+        dict that receives the number of bytes read so far and the expected total.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None and time.monotonic() - entry['fetched_at'] < self.ttl:
+                self._entries.move_to_end(url)
+                cached = concurrent.futures.Future()
+                cached.set_result(entry['dataset'])
+                return cached
+            leader = self._inflight.get(url)
+            if leader is None:
+                leader = pool.submit(self._load, url, entry, cancel, progress)
+                self._inflight[url] = leader
+                return leader
+
+        follower = concurrent.futures.Future()
+
+        def resolve(finished):
+            error = finished.exception()
+            if isinstance(error, concurrent.futures.CancelledError) and not (cancel is not None and cancel.is_set()):
+                # A download cancelled by another session is restarted rather than reported here
+                self.submit(url, pool, cancel, progress).add_done_callback(resolve)
+            elif error is not None:
+                follower.set_exception(error)
             else:
-                st.warning("⚠️ Required field: Please enter a Google Sheets URL in the field above before clicking Load.")
-        
-        # Auto-loading link section (Instructor only)
-        if st.session_state.is_instructor:
-            st.divider()
-            st.subheader("📤 Create an Auto-Loading Link (Instructor Feature)")
-            st.markdown("""
-            Want to share your Google Sheet so students can load it with one click? Create an auto-loading link:
-            
-            1. First, get your Google Sheets share link from above
-            2. Then, create a link in this format and share it with your students:
-            """)
-            
-            if sheets_url:
-                # Generate the auto-loading URL
-                encoded_sheets_url = urllib.parse.quote(sheets_url, safe='')
-                
-                st.markdown(f"""
-                **Example auto-loading link format:**
-                ```
-                https://your-cuestat-url.com?sheets_url={encoded_sheets_url}
-                ```
-                
-                To create your auto-loading link:
-                1. Replace `https://your-cuestat-url.com` with your actual CueStat app URL
-                2. The URL above includes your Google Sheets link
-                3. Share this complete link with students - they'll load your data with one click!
-                
-                **Quick example:**
-                If your CueStat app is at `https://cuestat.streamlit.app`:
-                ```
-                https://cuestat.streamlit.app?sheets_url={encoded_sheets_url}
-                ```
-                """)
-                st.success("✅ Copy your custom URL from above and test it!")
-            else:
-                st.info("📝 Enter a Google Sheets URL above to see the auto-loading link option.")
-        
-        uploaded_file = None  # Set to None so file upload logic doesn't run
-    else:  # Manual Entry
-        uploaded_file = None  # Set to None so file upload logic doesn't run
+                follower.set_result(finished.result())
 
-    if input_method == "Upload File":
-        uploaded_file_original = uploaded_file  # Store for later reference
-    else:
-        uploaded_file = None
+        leader.add_done_callback(resolve)
+        return follower
 
-    if uploaded_file is not None:
+    def _load(self, url, entry, cancel=None, progress=None):
+        """Worker side of `submit`: fetch one URL, store its entry and return the dataset."""
+        try:
+            entry = self._fetch(url, entry, cancel, progress)
+            with self._lock:
+                self._entries[url] = entry
+                self._entries.move_to_end(url)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return entry['dataset']
+        finally:
+            with self._lock:
+                self._inflight.pop(url, None)
+
+    def _fetch(self, url, entry, cancel=None, progress=None):
+        """Download (or revalidate) one URL and return its cache entry."""
+        headers = {}
+        if entry is not None:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        request = urllib.request.Request(url, headers=headers)
         try:
-            file_name = uploaded_file.name
-            file_extension = file_name.split('.')[-1].lower().strip()
-            df = None
-
-            if file_extension == 'csv':
-                df = pd.read_csv(uploaded_file)
-                # Replace NaN values with blank cells for visual purposes
-                df = df.fillna('')
-            elif file_extension in ['xlsx', 'xls']:
+            with urllib.request.urlopen(request, timeout=SHEETS_CONNECT_TIMEOUT_SECONDS) as response:
+                set_response_read_timeout(response, SHEETS_READ_TIMEOUT_SECONDS)
+                etag = response.headers.get('ETag')
+                last_modified = response.headers.get('Last-Modified')
+                total_bytes = int(response.headers.get('Content-Length') or 0) or None
+                # Parse the CSV while it downloads instead of buffering the whole body first
+                stream = CancellableStream(response, cancel, progress, total_bytes)
                 try:
-                    uploaded_file.seek(0)  # Reset file pointer to beginning
-                    df = pd.read_excel(uploaded_file, engine='openpyxl')
-                    # Replace NaN values with blank cells for visual purposes
-                    df = df.fillna('')
-                except ImportError as ie:
-                    st.error(f"Error: openpyxl is not installed. Details: {str(ie)}")
-                    df = None
-                except Exception as e:
-                    st.error(f"Error reading Excel file: {str(e)}")
-                    df = None
-            else:
-                st.error(f"Unsupported file type: '{file_extension}'. Please upload a CSV or Excel (.xlsx/.xls) file.")
-                df = None
+                    dataset = ingest_csv_in_chunks(stream, total_bytes=total_bytes)
+                except pd.errors.EmptyDataError:
+                    dataset = None
+        except urllib.error.HTTPError as error:
+            if error.code == 304 and entry is not None:
+                # Unchanged since the last download: keep the parsed dataset
+                return dict(entry, fetched_at=time.monotonic())
+            raise
+        if dataset is not None and dataset.empty:
+            dataset = None
+        return {'dataset': dataset, 'etag': etag, 'last_modified': last_modified, 'fetched_at': time.monotonic()}
+
+
+def set_response_read_timeout(response, timeout):
+    """Switch an open urllib response from the connect timeout to the read timeout."""
+    sock = getattr(getattr(getattr(response, 'fp', None), 'raw', None), '_sock', None)
+    if sock is not None:
+        sock.settimeout(timeout)
+
+
+class CancellableStream:
+    """Read-only file object over an HTTP response that honours a cancel event.
+
+    The event is checked before every chunk, so a cancelled download stops within
+    one read timeout, and the bytes read so far are published to `progress`.
+    """
 
-            if df is not None:
-                # Reset index to start at 1 instead of 0
-                df.index = range(1, len(df) + 1)
-                df.index.name = None  # Set to None to avoid showing "None" header
-                # Replace any existing dataframe with the new one
-                st.session_state.global_dataframes = {'active_data': df}
+    def __init__(self, raw, cancel=None, progress=None, total_bytes=None):
+        self.raw = raw
+        self.cancel = cancel
+        self.progress = progress if progress is not None else {}
+        self.bytes_read = 0
+        self.progress.update(bytes=0, total=total_bytes)
 
-                # --- Allow inline header renaming for the uploaded DataFrame ---
-                try:
-                    st.markdown("**Edit Column Names for Uploaded Data**")
-                    header_valid = True
-                    new_header_names = []
-                    if df is not None and not df.empty:
-                        header_cols = st.columns(len(df.columns))
-                        for i, col in enumerate(df.columns):
-                            with header_cols[i]:
-                                new_name = st.text_input(f"Column {i+1}", value=col, key=f"upload_header_input_active_{i}", label_visibility="collapsed")
-                            new_header_names.append(new_name.strip())
-
-                        # Validate header names
-                        empty_headers = [i+1 for i, n in enumerate(new_header_names) if n == ""]
-                        seen = {}
-                        duplicate_headers = []
-                        for i, n in enumerate(new_header_names):
-                            if n in seen:
-                                duplicate_headers.extend([seen[n]+1, i+1])
-                            else:
-                                seen[n] = i
-                        duplicate_headers = sorted(list(set(duplicate_headers)))
-
-                        if empty_headers or duplicate_headers:
-                            header_valid = False
-                            if empty_headers:
-                                st.error(f"Column name(s) cannot be empty. Check column(s): {', '.join(map(str, empty_headers))}.")
-                            if duplicate_headers:
-                                st.error(f"Duplicate column name(s) detected for columns: {', '.join(map(str, duplicate_headers))}. Please use unique names.")
-                        else:
-                            if new_header_names != list(df.columns):
-                                rename_map = {old: new for old, new in zip(df.columns, new_header_names) if new and new != old}
-                                if rename_map:
-                                    try:
-                                        st.session_state.global_dataframes['active_data'] = df.rename(columns=rename_map)
-                                        df = st.session_state.global_dataframes['active_data']
-                                        st.success("Applied column name changes to uploaded data.")
-                                    except Exception:
-                                        st.warning("Could not apply header rename changes.")
-                    else:
-                        df = st.session_state.global_dataframes.get('active_data', df)
-
-                    # Persist header validity flag for this uploaded dataset
-                    st.session_state['header_valid_active'] = header_valid
-                except Exception:
-                    st.warning("Header rename UI unavailable for this upload.")
-
-                # Reset manual entry if a file is uploaded, as it's separate data
-                st.session_state.manual_entry_df = pd.DataFrame({'Column A': ['']})
-            else:
-                st.error(f"Unsupported file type: {file_extension}")
-        except Exception as e:
-            st.error(f"Error processing file: {e}")
+    def readable(self):
+        return True
 
-    if input_method == "Manual Entry":
-        st.subheader("Manual Data Entry")
-        
-        # Initialize with 30 rows if empty
-        if 'table_data' not in st.session_state:
-            st.session_state.table_data = create_default_manual_entry_table()
-        
-        # This is our working copy that persists across reruns
-        table_data = st.session_state.table_data
-    
-        # Editable column headers
-        st.markdown("**Click column name to edit:**")
-        header_cols = st.columns(len(table_data.columns))
-        new_header_names = []
-        for i, col in enumerate(table_data.columns):
-            with header_cols[i]:
-                if f'editing_col_{i}' not in st.session_state:
-                    st.session_state[f'editing_col_{i}'] = False
-            
-                if st.session_state[f'editing_col_{i}']:
-                    new_name = st.text_input(f"Edit Column {i+1} Name", value=col, key=f"header_input_{i}", label_visibility="collapsed")
-                    if st.button("✓", key=f"save_header_{i}"):
-                        st.session_state[f'editing_col_{i}'] = False
-                        if new_name.strip() and new_name.strip() not in [c for j, c in enumerate(table_data.columns) if j != i]:
-                            new_header_names.append(new_name.strip())
-                        else:
-                            new_header_names.append(col)
-                            if not new_name.strip():
-                                st.warning("Column name cannot be empty.")
-                            else:
-                                st.warning("Column name must be unique.")
-                    else:
-                        new_header_names.append(col)
-                else:
-                    if st.button(col, key=f"edit_header_{i}"):
-                        st.session_state[f'editing_col_{i}'] = True
-                    new_header_names.append(col)
-    
-        # Apply renamed headers if changed
-        if new_header_names != list(table_data.columns) and len(new_header_names) == len(table_data.columns):
-            rename_map = {old: new for old, new in zip(table_data.columns, new_header_names) if new != old}
-            if rename_map:
-                table_data = table_data.rename(columns=rename_map)
-                st.session_state.table_data = table_data
-                safe_rerun()
-    
-        # Data editor with automatic new row on Enter
-        st.markdown("**Enter data below:**")
-        st.markdown("""
-        <div role="region" aria-label="Manual Data Entry Grid">
-        <p id="data-editor-help">💡 Tip: Type in the table and use Tab to navigate between cells. 
-        Click the '+' icon at the bottom of the table to add rows. Use the trash icon to delete rows.</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-        # Use data editor with dynamic rows - this allows adding/removing rows
-        # Reset index to avoid warnings with hide_index
-        # Create a copy with 1-based index for display
-        display_df = table_data.copy()
-        display_df.index = range(1, len(display_df) + 1)
-    
-        edited_df = st.data_editor(
-            display_df,
-            num_rows="dynamic",
-            width="stretch",
-            height=390,
-            key="data_editor",
-            hide_index=True,  # Hide index to avoid "None" issue when adding rows
-        )
-    
-        # Keep 1-based index for consistency with uploaded data
-        if edited_df is not None and len(edited_df) > 0:
-            edited_df.index = range(1, len(edited_df) + 1)
-            edited_df.index.name = None  # Set to None to avoid showing "None" header
-
-        # DO NOT update session state here - it causes reruns that erase data
-        # The data_editor widget manages its own state via the key
-        # We'll only sync to session state when needed (buttons) or when processing
-    
-        # Auto-process toggle
-        st.markdown("---")
-        col_toggle1, col_toggle2 = st.columns([3, 1])
-        with col_toggle1:
-            auto_process_enabled = st.checkbox(
-                "⚡ Auto-process data as you type",
-                value=True,
-                key="manual_auto_process_toggle",
-                help="Data will be automatically processed and stored in real-time as you type. Disable this if you want to enter all data first before processing."
-            )
-        with col_toggle2:
-            st.markdown("**ON by default**")
-        
-        # Auto-process logic: if enabled, process data with debouncing (500ms)
-        current_time = time.time()
-        # Debounce: only process if 0.5+ seconds have passed since last processing
-        if auto_process_enabled and edited_df is not None and not edited_df.empty:
-            if current_time - st.session_state.last_manual_process_time >= 0.5:
-                try:
-                    # Remove rows that are empty or only whitespace across all columns
-                    non_empty_mask = ~edited_df.replace(r'^\s*$', np.nan, regex=True).isna().all(axis=1)
-                    cleaned_data = edited_df.loc[non_empty_mask].copy()
-                    if not cleaned_data.empty:
-                        processed_manual_df = process_manual_entry_data(cleaned_data)
-                        # Keep 1-based index for consistency with uploaded data
-                        processed_manual_df.index = range(1, len(processed_manual_df) + 1)
-                        processed_manual_df.index.name = None
-                        # Update session state automatically
-                        st.session_state.global_dataframes = {'active_data': processed_manual_df}
-                        st.session_state.last_manual_process_time = current_time
-                        st.success(f"✨ Data auto-processed! {len(processed_manual_df)} rows, {len(processed_manual_df.columns)} columns")
-                except Exception as e:
-                    st.warning(f"Auto-processing error: {e}")
-            elif current_time - st.session_state.last_manual_process_time < 0.5:
-                st.info("⏳ Processing your changes...")
-    
-        # Action buttons
-        col1, col2 = st.columns([1, 1])
-        with col1:
-            if st.button("➕ Add Column", key="add_col_btn"):
-                new_col_num = len(edited_df.columns) + 1
-                new_col_name = f"Column {new_col_num}"
-                while new_col_name in edited_df.columns:
-                    new_col_num += 1
-                    new_col_name = f"Column {new_col_num}"
-                edited_df[new_col_name] = ""
-                # Update our persistent table_data
-                st.session_state.table_data = edited_df
-                st.rerun()
-    
-        with col2:
-            if st.button("🗑️ Clear All", key="clear_all_btn_unique"):
-                # Clear all manual entry data and state
-                st.session_state.table_data = create_default_manual_entry_table()
-                st.session_state.global_dataframes = {}
-                st.session_state.edited_data = pd.DataFrame()
-                # Clear the data_editor widget's internal state
-                if 'data_editor' in st.session_state:
-                    del st.session_state['data_editor']
-                st.rerun()
-
-        # Save/export options for manual entry data
-        st.markdown("---")
-        st.markdown("**Save Manual Data**")
-        non_empty_save_mask = ~edited_df.replace(r'^\s*$', np.nan, regex=True).isna().all(axis=1)
-        data_to_save = edited_df.loc[non_empty_save_mask].copy()
-
-        if data_to_save.empty:
-            st.caption("Enter at least one non-empty row to enable saving.")
-        else:
-            data_to_save.index = range(1, len(data_to_save) + 1)
-            data_to_save.index.name = None
-
-            csv_bytes = data_to_save.to_csv(index=False).encode('utf-8')
-            st.download_button(
-                label="💾 Save as CSV",
-                data=csv_bytes,
-                file_name="manual_entry_data.csv",
-                mime="text/csv",
-                key="manual_save_csv_btn"
-            )
+    def seekable(self):
+        # The body can only be read once; ingest_csv_in_chunks spools it for a second pass
+        return False
 
-    # Display currently loaded dataframe only when meaningful data exists
-    if st.session_state.global_dataframes and 'active_data' in st.session_state.global_dataframes and has_meaningful_dataframe_data(st.session_state.global_dataframes['active_data']):
-        st.subheader("Current Data:")
-        df = st.session_state.global_dataframes['active_data']
-        st.write(f"**Active Dataset** ({df.shape[0]} rows, {df.shape[1]} columns)")
-        show_table(df)
+    def tell(self):
+        return self.bytes_read
 
-elif selected_tab == "Tables":
-    st.header("Tables")
+    def read(self, size=-1):
+        if size is None or size < 0:
+            return b''.join(iter(lambda: self.read(SHEETS_STREAM_CHUNK_BYTES), b''))
+        if self.cancel is not None and self.cancel.is_set():
+            raise concurrent.futures.CancelledError("Google Sheets loading was cancelled.")
+        data = self.raw.read(size)
+        self.bytes_read += len(data)
+        self.progress['bytes'] = self.bytes_read
+        return data
 
-    if not st.session_state.global_dataframes or 'active_data' not in st.session_state.global_dataframes:
-        st.info("Please load or enter data in the 'Data Input' tab first.")
-    else:
-        df = st.session_state.global_dataframes['active_data']
-        
-        table_type = st.selectbox(
-            "Select Table Type",
-            ["Frequency Table", "Relative Frequency Table", "Two-Way Table"],
-            key="table_type_select"
-        )
 
-        if table_type in ["Frequency Table", "Relative Frequency Table"]:
-            st.subheader(table_type)
-            
-            # Get only categorical columns (non-numeric or numeric with few unique values)
-            categorical_cols_options = ['']
-            for col in df.columns:
-                # Consider a column categorical if it's non-numeric or has 15 or fewer unique values
-                try:
-                    pd.to_numeric(df[col], errors='raise')
-                    # It's numeric - check unique count
-                    if df[col].nunique() <= 15:
-                        categorical_cols_options.append(col)
-                except (ValueError, TypeError):
-                    # It's non-numeric (categorical)
-                    categorical_cols_options.append(col)
-            
-            selected_col = st.selectbox(
-                "Select Categorical Column for Table",
-                options=categorical_cols_options,
-                key="table_column_select"
-            )
+@lazy_cache_resource()
+def get_sheets_fetch_cache():
+    """Return the process-wide Google Sheets fetch cache."""
+    return SheetsFetchCache(SHEETS_CACHE_TTL_SECONDS, SHEETS_CACHE_MAX_ENTRIES)
 
-            if selected_col and st.button("Generate Table", key="generate_freq_table"):
-                try:
-                    # Get the column data and drop NaN values
-                    data = df[selected_col].dropna()
-                    
-                    if data.empty:
-                        raise ValueError(f"Column '{selected_col}' is empty after removing missing values.")
-                    
-                    # Count frequencies
-                    frequency_counts = data.value_counts().sort_index()
-                    total_count = len(data)
-                    
-                    if table_type == "Frequency Table":
-                        # Create frequency table without cumulative column
-                        freq_table = pd.DataFrame({
-                            'Category': frequency_counts.index,
-                            'Frequency': frequency_counts.values
-                        })
-                        # Add total row
-                        total_row = pd.DataFrame({'Category': ['Total'], 'Frequency': [total_count]})
-                        freq_table = pd.concat([freq_table, total_row], ignore_index=True)
-                        
-                        st.write(f"**Frequency Table for '{selected_col}'**")
-                        show_table(freq_table, hide_index=True)
-                        st.caption(f"Frequency table showing counts for each category in {selected_col}. Total observations: {total_count}.")
-                        
-                    else:  # Relative Frequency Table
-                        # Create relative frequency table without cumulative column
-                        rel_freq_table = pd.DataFrame({
-                            'Category': frequency_counts.index,
-                            'Frequency': frequency_counts.values,
-                            'Relative Frequency': (frequency_counts.values / total_count).round(4),
-                            'Percentage': ((frequency_counts.values / total_count) * 100).round(2)
-                        })
-                        # Add total row
-                        total_row = pd.DataFrame({
-                            'Category': ['Total'], 
-                            'Frequency': [total_count],
-                            'Relative Frequency': [1.0000],
-                            'Percentage': [100.00]
-                        })
-                        rel_freq_table = pd.concat([rel_freq_table, total_row], ignore_index=True)
-                        
-                        st.write(f"**Relative Frequency Table for '{selected_col}'**")
-                        show_table(rel_freq_table, hide_index=True)
-                        st.caption(f"Relative frequency table showing proportions and percentages for each category in {selected_col}. Total observations: {total_count}.")
-
-                except ValueError as ve:
-                    st.error(f"⚠️ Error: {ve}. Please check that you've selected a valid column with data.")
-                except Exception as e:
-                    st.error(f"❌ An unexpected error occurred: {e}. Please try selecting a different column or reloading your data.")
-
-        elif table_type == "Two-Way Table":
-            st.subheader("Two-Way Contingency Table")
-            
-            # Get only categorical columns
-            categorical_cols_options = ['']
-            for col in df.columns:
-                try:
-                    pd.to_numeric(df[col], errors='raise')
-                    if df[col].nunique() <= 15:
-                        categorical_cols_options.append(col)
-                except (ValueError, TypeError):
-                    categorical_cols_options.append(col)
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                row_col = st.selectbox("Select Row Variable", options=categorical_cols_options, key="twoway_row_select")
-            with col2:
-                col_col = st.selectbox("Select Column Variable", options=categorical_cols_options, key="twoway_col_select")
-
-            if row_col and col_col and st.button("Generate Two-Way Table", key="generate_twoway_table"):
-                try:
-                    # Create contingency table
-                    contingency_table = pd.crosstab(
-                        df[row_col], 
-                        df[col_col], 
-                        margins=True, 
-                        margins_name='Total'
-                    )
-                    
-                    # Remove variable names from index and columns
-                    contingency_table.index.name = None
-                    contingency_table.columns.name = None
-                    
-                    st.write(f"**Two-Way Frequency Table**")
-                    show_table(contingency_table)
-                    st.caption(f"Two-way frequency table showing counts for combinations of {row_col} (rows) and {col_col} (columns).")
-
-                except ValueError as ve:
-                    st.error(f"⚠️ Error: {ve}. Please ensure both variables are selected and contain valid categorical data.")
-                except Exception as e:
-                    st.error(f"❌ An unexpected error occurred: {e}. Please verify your column selections and data format.")
-
-elif selected_tab == "Descriptive Statistics":
-    st.header("Descriptive Statistics")
-
-    if not st.session_state.global_dataframes or 'active_data' not in st.session_state.global_dataframes:
-        st.info("Please load or enter data in the 'Data Input' tab first.")
-    else:
-        selected_df = st.session_state.global_dataframes['active_data']
 
-        # Filter for numeric columns or columns that can be converted to numeric (handles blanks)
-        numeric_cols = [col for col in selected_df.columns if is_numeric_column(selected_df, col)]
+@lazy_cache_resource()
+def get_sheets_loader_pool():
+    """Return the process-wide worker pool that downloads Google Sheets off the script thread."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=SHEETS_LOADER_WORKERS, thread_name_prefix="sheets-loader")
 
-        if not numeric_cols:
-            st.warning("No numeric columns found in the active dataset. Please ensure your data contains numeric values.")
-        else:
-            multiple_columns = st.checkbox("Select multiple columns", value=False, key="descriptive_multiple_cols")
-            
-            if multiple_columns:
-                selected_columns = st.multiselect(
-                    "Select Columns * (Required)", 
-                    options=numeric_cols, 
-                    key="descriptive_col_multiselect",
-                    help="Choose one or more numeric columns to analyze"
-                )
-            else:
-                selected_column = st.selectbox(
-                    "Select a Column * (Required)", 
-                    options=[''] + numeric_cols, 
-                    key="descriptive_col_select",
-                    help="Choose a numeric column to analyze"
-                )
-                selected_columns = [selected_column] if selected_column else []
-
-            if not selected_columns:
-                st.info("👆 Please select at least one column above to begin analysis")
-            
-            if selected_columns:
-                # Define all available statistics
-                all_stats = [
-                    'n', 'Mean', 'Median', 'Mode',
-                    'Sample Standard Deviation', 'Variance', 'Range',
-                    'Min Value', 'Max Value',
-                    'Q1', 'Q3', 'IQR',
-                    'Skewness', 'Kurtosis'
-                ]
-                
-                # Let users select which statistics to display using checkboxes
-                st.markdown("**Select Statistics to Display:**")
-                
-                # Create checkboxes in a compact grid layout
-                cols = st.columns(3)
-                selected_stats = []
-                
-                for idx, stat in enumerate(all_stats):
-                    col_idx = idx % 3
-                    with cols[col_idx]:
-                        if st.checkbox(stat, value=False, key=f"stat_checkbox_{stat}"):
-                            selected_stats.append(stat)
-                
-                if st.button("Calculate Descriptive Statistics", key="calc_descriptive_stats"):
-                    if not selected_stats:
-                        st.warning("⚠️ Please select at least one statistic from the checkboxes above to display results.")
-                    else:
-                        # Create a dictionary to store all columns' statistics
-                        all_columns_stats = {}
-                        has_error = False
-                        
-                        # Process each selected column
-                        for column in selected_columns:
-                            data_for_analysis = selected_df[column].dropna()
-                            if data_for_analysis.empty:
-                                st.warning(f"Column '{column}' is empty or contains no valid numeric data after dropping NaNs.")
-                                has_error = True
-                            else:
-                                stats_results = calculate_descriptive_statistics(data_for_analysis)
-                                if "Error" in stats_results:
-                                    st.error(f"Error in column '{column}': {stats_results['Error']}")
-                                    has_error = True
-                                else:
-                                    # Filter results based on selected statistics
-                                    filtered_stats = {k: v for k, v in stats_results.items() if k in selected_stats}
-                                    all_columns_stats[column] = filtered_stats
-                        
-                        # If we have valid statistics for at least one column, display the combined table
-                        if all_columns_stats:
-                            st.subheader("Descriptive Statistics Results")
-                            
-                            # Create a combined DataFrame with statistics as rows and columns as columns
-                            # Start with the statistic names as the index
-                            combined_df = pd.DataFrame(index=selected_stats)
-                            combined_df.index.name = None
-                            
-                            # Add each column's statistics
-                            for column_name, stats_dict in all_columns_stats.items():
-                                # Create a column with the statistics values
-                                column_values = [stats_dict.get(stat, '') for stat in selected_stats]
-                                # Format float values to 4 decimal places
-                                formatted_values = [f'{v:.4f}' if isinstance(v, (float, np.float32, np.float64)) else str(v) for v in column_values]
-                                combined_df[column_name] = formatted_values
-                            
-                            # Display the combined table
-                            show_table(combined_df)
-
-elif selected_tab == "Probability Distributions":
-    st.header("Probability Distributions")
-
-    # Float inputs in this section support up to 10 decimal places.
-    PROB_INPUT_STEP = 1e-10
-    PROB_INPUT_FORMAT = "%.10g"
-
-    selected_dist_type = st.selectbox(
-        "Select Distribution Type",
-        options=['Normal', 'Binomial', 'Chi-square', 'Student-t', 'F-Distribution'],
-        key="dist_type_select"
-    )
 
-    st.subheader("Distribution Inputs")
-    params = {}
-    if selected_dist_type == 'Normal':
-        params['mean'] = st.number_input('Mean (μ):', value=0.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="normal_mean")
-        params['std_dev'] = st.number_input('Std Dev (σ):', value=1.0, min_value=PROB_INPUT_STEP, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="normal_std_dev")
-    elif selected_dist_type == 'Binomial':
-        params['n'] = st.number_input('Trials (n):', value=10, min_value=1, step=1, key="binomial_n")
-        params['p'] = st.number_input('Prob. of Success (p):', value=0.5, min_value=0.0, max_value=1.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="binomial_p")
-    elif selected_dist_type == 'Chi-square':
-        params['df'] = st.number_input('Degrees of Freedom (df):', value=5, min_value=1, step=1, key="chi2_df")
-    elif selected_dist_type == 'Student-t':
-        params['df'] = st.number_input('Degrees of Freedom (df):', value=10, min_value=1, step=1, key="t_df")
-    elif selected_dist_type == 'F-Distribution':
-        params['dfn'] = st.number_input('Numerator df (df1):', value=5, min_value=1, step=1, key="f_dfn")
-        params['dfd'] = st.number_input('Denominator df (df2):', value=10, min_value=1, step=1, key="f_dfd")
-
-    st.subheader("Probability Calculation")
-    
-    # Different options for binomial (discrete) vs continuous distributions
-    if selected_dist_type == 'Binomial':
-        selected_calc_type = st.selectbox(
-            "Calculation Type",
-            options=['P(X = k)', 'P(X ≤ k)', 'P(X ≥ k)', 'P(X < k)', 'P(X > k)', 'P(a ≤ X ≤ b)'],
-            key="prob_calc_type"
-        )
-    elif selected_dist_type == 'Chi-square':
-        selected_calc_type = st.selectbox(
-            "Calculation Type",
-            options=['P(X > a)'],
-            key="prob_calc_type"
-        )
-    else:
-        inverse_normal_options = [
-            'Inverse Normal (find x from left-tail p)',
-            'Inverse Normal (find x from right-tail p)',
-            'Inverse Normal (find two values for in-between probability p)'
-        ]
-        selected_calc_type = st.selectbox(
-            "Calculation Type",
-            options=['P(X < a)', 'P(X > a)', 'P(a < X < b)'] + (inverse_normal_options if selected_dist_type == 'Normal' else []),
-            key="prob_calc_type"
-        )
+def read_local_sheets_csv(url):
+    """Worker-side load of a local CSV path; returns an ActiveDataset or None when empty."""
+    df = pd.read_csv(url)
+    return build_active_dataset(df) if df is not None and not df.empty else None
 
-    x_val, a_val, b_val, p_val = None, None, None, None
-    if selected_calc_type in ['P(X < a)', 'P(X > a)', 'P(X = k)', 'P(X ≤ k)', 'P(X ≥ k)', 'P(X < k)', 'P(X > k)']:
-        if selected_dist_type == 'Binomial':
-            x_val = st.number_input('Value of k:', value=0, min_value=0, step=1, key="prob_x_input")
-        else:
-            x_val = st.number_input('Value of a:', value=0.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_x_input")
-    elif selected_calc_type in ['P(a < X < b)', 'P(a ≤ X ≤ b)']:
-        col1, col2 = st.columns(2)
-        with col1:
-            if selected_dist_type == 'Binomial':
-                a_val = st.number_input('Value of a:', value=0, min_value=0, step=1, key="prob_a_input")
-            else:
-                a_val = st.number_input('Value of a:', value=0.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_a_input")
-        with col2:
-            if selected_dist_type == 'Binomial':
-                b_val = st.number_input('Value of b:', value=1, min_value=0, step=1, key="prob_b_input")
-            else:
-                b_val = st.number_input('Value of b:', value=1.0, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_b_input")
-    elif selected_calc_type == 'Inverse Normal (find x from left-tail p)':
-        p_val = st.number_input('Left-tail probability p = P(X < x):', value=0.95, min_value=PROB_INPUT_STEP, max_value=1.0 - PROB_INPUT_STEP, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_inverse_p_input")
-    elif selected_calc_type == 'Inverse Normal (find x from right-tail p)':
-        p_val = st.number_input('Right-tail probability p = P(X > x):', value=0.05, min_value=PROB_INPUT_STEP, max_value=1.0 - PROB_INPUT_STEP, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_inverse_right_p_input")
-    elif selected_calc_type == 'Inverse Normal (find two values for in-between probability p)':
-        p_val = st.number_input('In-between probability p = P(lower < X < upper):', value=0.95, min_value=PROB_INPUT_STEP, max_value=1.0 - PROB_INPUT_STEP, step=PROB_INPUT_STEP, format=PROB_INPUT_FORMAT, key="prob_inverse_middle_p_input")
-
-    if st.button("Calculate Probability and Plot", key="calc_prob_button"):
-        st.subheader("Calculation Results")
-        try:
-            result = None
-            fig = None
-            calc_kwargs = {}
-
-            calc_type_mapping = {
-                'P(X < a)': 'cdf_strict',
-                'P(X > a)': 'survival_strict',
-                'P(a < X < b)': 'interval',
-                'P(X = k)': 'pmf',
-                'P(X ≤ k)': 'cdf',
-                'P(X ≥ k)': 'survival',
-                'P(X < k)': 'cdf_strict',
-                'P(X > k)': 'survival_strict',
-                'P(a ≤ X ≤ b)': 'interval_inclusive'
-            }
-            calc_kwargs['calc_type'] = calc_type_mapping.get(selected_calc_type)
-
-            if selected_calc_type in ['P(X < a)', 'P(X > a)', 'P(X = k)', 'P(X ≤ k)', 'P(X ≥ k)', 'P(X < k)', 'P(X > k)']:
-                if selected_dist_type == 'Binomial':
-                    calc_kwargs['k'] = int(x_val) if x_val is not None else None
-                else:
-                    calc_kwargs['x'] = x_val
-            elif selected_calc_type in ['P(a < X < b)', 'P(a ≤ X ≤ b)']:
-                if selected_dist_type == 'Binomial':
-                    calc_kwargs['a'] = int(a_val) if a_val is not None else None
-                    calc_kwargs['b'] = int(b_val) if b_val is not None else None
-                else:
-                    calc_kwargs['a'] = a_val
-                    calc_kwargs['b'] = b_val
-            elif selected_calc_type in [
-                'Inverse Normal (find x from left-tail p)',
-                'Inverse Normal (find x from right-tail p)',
-                'Inverse Normal (find two values for in-between probability p)'
-            ]:
-                calc_kwargs['p'] = p_val
-
-            if selected_dist_type == 'Normal':
-                if selected_calc_type == 'Inverse Normal (find x from left-tail p)':
-                    result = stats.norm.ppf(calc_kwargs['p'], loc=params['mean'], scale=params['std_dev'])
-                    fig = plot_normal_distribution(**params, shade_x=result, shade_a=None, shade_b=None, calc_type='cdf')
-                elif selected_calc_type == 'Inverse Normal (find x from right-tail p)':
-                    result = stats.norm.ppf(1 - calc_kwargs['p'], loc=params['mean'], scale=params['std_dev'])
-                    fig = plot_normal_distribution(**params, shade_x=result, shade_a=None, shade_b=None, calc_type='survival')
-                elif selected_calc_type == 'Inverse Normal (find two values for in-between probability p)':
-                    lower_result = stats.norm.ppf((1 - calc_kwargs['p']) / 2, loc=params['mean'], scale=params['std_dev'])
-                    upper_result = stats.norm.ppf((1 + calc_kwargs['p']) / 2, loc=params['mean'], scale=params['std_dev'])
-                    result = (lower_result, upper_result)
-                    fig = plot_normal_distribution(**params, shade_x=None, shade_a=lower_result, shade_b=upper_result, calc_type='interval')
-                else:
-                    result = calculate_normal_distribution(**params, **calc_kwargs)
-                    fig = plot_normal_distribution(**params, shade_x=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
-            elif selected_dist_type == 'Binomial':
-                result = calculate_binomial_distribution(**params, **calc_kwargs)
-                fig = plot_binomial_distribution(**params, shade_k=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
-            elif selected_dist_type == 'Chi-square':
-                result = calculate_chi_square_distribution(**params, **calc_kwargs)
-                fig = plot_chi_square_distribution(**params, shade_x=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
-            elif selected_dist_type == 'Student-t':
-                result = calculate_student_t_distribution(**params, **calc_kwargs)
-                fig = plot_student_t_distribution(**params, shade_x=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
-            elif selected_dist_type == 'F-Distribution':
-                result = calculate_f_distribution(**params, **calc_kwargs)
-                fig = plot_f_distribution(**params, shade_x=x_val, shade_a=a_val, shade_b=b_val, calc_type=calc_kwargs['calc_type'])
-
-            if result is not None:
-                st.write(f"--- **{selected_dist_type} Distribution Calculation** ---")
-                st.write(f"**Inputs**: {params}")
-                st.write(f"**Calculation Type**: {selected_calc_type}")
-                if x_val is not None:
-                    value_label = 'x'
-                    if selected_dist_type == 'Binomial':
-                        value_label = 'k'
-                    elif selected_calc_type in ['P(X < a)', 'P(X > a)']:
-                        value_label = 'a'
-                    st.write(f"**{value_label}** = {x_val}")
-                if a_val is not None:
-                    st.write(f"**a** = {a_val}")
-                if b_val is not None:
-                    st.write(f"**b** = {b_val}")
-                if selected_calc_type in [
-                    'Inverse Normal (find x from left-tail p)',
-                    'Inverse Normal (find x from right-tail p)',
-                    'Inverse Normal (find two values for in-between probability p)'
-                ]:
-                    st.write(f"**p** = {p_val}")
-                    if selected_calc_type == 'Inverse Normal (find two values for in-between probability p)':
-                        st.markdown(
-                            f"<p style='color: black; font-size: 18px;'><b>Inverse Normal values: lower = {result[0]:.6f}, upper = {result[1]:.6f}</b></p>",
-                            unsafe_allow_html=True
-                        )
-                    else:
-                        st.markdown(f"<p style='color: black; font-size: 18px;'><b>Inverse Normal x-value: {result:.6f}</b></p>", unsafe_allow_html=True)
-                else:
-                    st.markdown(f"<p style='color: black; font-size: 18px;'><b>Calculated Probability: {result:.6f}</b></p>", unsafe_allow_html=True)
-                if fig is not None:
-                    st.pyplot(fig)
-                    # Accessibility: Add text alternative for screen readers
-                    caption_text = f"{selected_dist_type} distribution plot. Inputs: {', '.join([f'{k}={v}' for k,v in params.items()])}. "
-                    if selected_calc_type == 'Inverse Normal (find x from left-tail p)':
-                        caption_text += f"Shows inverse normal result x={result:.6f} such that P(X < x) = {p_val:.6f}."
-                    elif selected_calc_type == 'Inverse Normal (find x from right-tail p)':
-                        caption_text += f"Shows inverse normal result x={result:.6f} such that P(X > x) = {p_val:.6f}."
-                    elif selected_calc_type == 'Inverse Normal (find two values for in-between probability p)':
-                        caption_text += f"Shows inverse normal values lower={result[0]:.6f} and upper={result[1]:.6f} such that P(lower < X < upper) = {p_val:.6f}."
-                    elif calc_kwargs['calc_type'] == 'cdf':
-                        caption_text += f"Shows cumulative probability P(X ≤ {x_val}) = {result:.6f}. Shaded area represents probability."
-                    elif calc_kwargs['calc_type'] == 'survival':
-                        caption_text += f"Shows survival probability P(X ≥ {x_val}) = {result:.6f}. Shaded area represents probability."
-                    elif calc_kwargs['calc_type'] == 'interval':
-                        caption_text += f"Shows interval probability P({a_val} < X < {b_val}) = {result:.6f}. Shaded area represents probability."
-                    elif calc_kwargs['calc_type'] == 'pmf':
-                        caption_text += f"Shows probability mass function. P(X = {x_val}) = {result:.6f}. Highlighted bar shows probability."
-                    st.caption(caption_text)
-            else:
-                st.warning("No calculation performed.")
 
-        except ValueError as ve:
-            st.error(f"Input Error: {ve}")
-        except Exception as e:
-            st.error(f"An unexpected error occurred: {e}")
-
-elif selected_tab == "Confidence Intervals":
-    st.header("Confidence Intervals")
-
-    if not st.session_state.global_dataframes:
-        st.info("Please load or enter data in the 'Data Input' tab first to use raw data input.")
-
-    ci_type_options = [
-        'Mean (sigma unknown) - t-interval',
-        'One Proportion',
-        'Difference Between Two Means (Independent, sigma known)',
-        'Difference Between Two Means (Independent, sigma unknown, equal variances)',
-        'Difference Between Two Means (Independent, sigma unknown, unequal variances)',
-        'Difference Between Two Proportions',
-        'Paired Differences'
-    ]
-    selected_ci_type = st.selectbox("Select CI Type", options=ci_type_options, key="ci_type_select")
+def submit_google_sheets_fetch(url, pool, fetch_cache, cancel, progress):
+    """Return a Future for one normalized URL's ActiveDataset (None when empty)."""
+    if url.lower().startswith(('http://', 'https://')):
+        # Shared across sessions: a whole class opening the same link triggers one download
+        return fetch_cache.submit(url, pool, cancel, progress)
+    return pool.submit(read_local_sheets_csv, url)
 
-    # Determine input method options based on selected CI type
-    input_method_options = []
-    if selected_ci_type in ['One Proportion', 'Difference Between Two Proportions']:
-        input_method_options = ['Summary Statistics Input']
-    else:
-        input_method_options = ['Raw Data', 'Summary Statistics Input']
-
-    input_method = st.radio("Input Method", options=input_method_options, key="ci_input_method")
-
-    st.subheader("Inputs")
-
-    # Dynamic parameter inputs based on CI type and input method
-    params = {}
-    numeric_cols = [''] + get_numeric_columns()
-
-    # Helper to get the value from session state if available, else a default
-    def get_state_value(key, default):
-        return st.session_state.get(key, default)
-
-
-    if selected_ci_type == 'Mean (sigma unknown) - t-interval':
-        if input_method == 'Raw Data':
-            params['data_column'] = st.selectbox('Select Data Column', options=numeric_cols, key="ci_mean_suk_raw_data_col")
-        else: # Summary Statistics Input
-            params['sample_mean'] = st.number_input('Sample Mean (x̄):', value=get_state_value('ci_mean_suk_sum_mean', 0.0), key="ci_mean_suk_sum_mean")
-            params['sample_std_dev'] = st.number_input('Sample Std Dev (s):', value=get_state_value('ci_mean_suk_sum_std_dev', 1.0), min_value=0.001, key="ci_mean_suk_sum_std_dev")
-            params['sample_size'] = st.number_input('Sample Size (n):', value=get_state_value('ci_mean_suk_sum_size', 30), min_value=2, step=1, key="ci_mean_suk_sum_size")
-
-    elif selected_ci_type == 'One Proportion':
-        # Only Summary Statistics Input
-        params['num_successes'] = st.number_input('Number of Observed Successes (x):', value=get_state_value('ci_prop_sum_succ', 10), min_value=0, step=1, key="ci_prop_sum_succ")
-        params['num_trials'] = st.number_input('Number of Trials (n):', value=get_state_value('ci_prop_sum_trials', 20), min_value=1, step=1, key="ci_prop_sum_trials")
-
-    elif selected_ci_type == 'Difference Between Two Means (Independent, sigma known)':
-        if input_method == 'Raw Data':
-            col1, col2 = st.columns(2)
-            with col1:
-                params['data_column1'] = st.selectbox('Select Sample 1 Data', options=numeric_cols, key="ci_diff_mean_sk_raw_data_col1")
-                params['pop_std_dev1'] = st.number_input('Pop. Std Dev 1 (σ1):', value=get_state_value('ci_diff_mean_sk_pop_std_dev1', 1.0), min_value=0.001, key="ci_diff_mean_sk_pop_std_dev1")
-            with col2:
-                params['data_column2'] = st.selectbox('Select Sample 2 Data', options=numeric_cols, key="ci_diff_mean_sk_raw_data_col2")
-                params['pop_std_dev2'] = st.number_input('Pop. Std Dev 2 (σ2):', value=get_state_value('ci_diff_mean_sk_pop_std_dev2', 1.0), min_value=0.001, key="ci_diff_mean_sk_pop_std_dev2")
-        else: # Summary Statistics Input
-            col1, col2 = st.columns(2)
-            with col1:
-                params['sample_mean1'] = st.number_input('Sample 1 Mean (x̄1):', value=get_state_value('ci_diff_mean_sk_sum_mean1', 0.0), key="ci_diff_mean_sk_sum_mean1")
-                params['pop_std_dev1'] = st.number_input('Pop. Std Dev 1 (σ1):', value=get_state_value('ci_diff_mean_sk_sum_pop_std_dev1', 1.0), min_value=0.001, key="ci_diff_mean_sk_sum_pop_std_dev1")
-                params['sample_size1'] = st.number_input('Sample 1 Size (n1):', value=get_state_value('ci_diff_mean_sk_sum_size1', 30), min_value=1, step=1, key="ci_diff_mean_sk_sum_size1")
-            with col2:
-                params['sample_mean2'] = st.number_input('Sample 2 Mean (x̄2):', value=get_state_value('ci_diff_mean_sk_sum_mean2', 0.0), key="ci_diff_mean_sk_sum_mean2")
-                params['pop_std_dev2'] = st.number_input('Pop. Std Dev 2 (σ2):', value=get_state_value('ci_diff_mean_sk_sum_pop_std_dev2', 1.0), min_value=0.001, key="ci_diff_mean_sk_sum_pop_std_dev2")
-                params['sample_size2'] = st.number_input('Sample 2 Size (n2):', value=get_state_value('ci_diff_mean_sk_sum_size2', 30), min_value=1, step=1, key="ci_diff_mean_sk_sum_size2")
-
-    elif selected_ci_type == 'Difference Between Two Means (Independent, sigma unknown, equal variances)':
-        if input_method == 'Raw Data':
-            col1, col2 = st.columns(2)
-            with col1:
-                params['data_column1'] = st.selectbox('Select Sample 1 Data', options=numeric_cols, key="ci_diff_mean_suev_raw_data_col1")
-            with col2:
-                params['data_column2'] = st.selectbox('Select Sample 2 Data', options=numeric_cols, key="ci_diff_mean_suev_raw_data_col2")
-        else: # Summary Statistics Input
-            col1, col2 = st.columns(2)
-            with col1:
-                params['sample_mean1'] = st.number_input('Sample 1 Mean (x̄1):', value=get_state_value('ci_diff_mean_suev_sum_mean1', 0.0), key="ci_diff_mean_suev_sum_mean1")
-                params['sample_std_dev1'] = st.number_input('Sample 1 Std Dev (s1):', value=get_state_value('ci_diff_mean_suev_sum_std_dev1', 1.0), min_value=0.001, key="ci_diff_mean_suev_sum_std_dev1")
-                params['sample_size1'] = st.number_input('Sample 1 Size (n1):', value=get_state_value('ci_diff_mean_suev_sum_size1', 30), min_value=2, step=1, key="ci_diff_mean_suev_sum_size1")
-            with col2:
-                params['sample_mean2'] = st.number_input('Sample 2 Mean (x̄2):', value=get_state_value('ci_diff_mean_suev_sum_mean2', 0.0), key="ci_diff_mean_suev_sum_mean2")
-                params['sample_std_dev2'] = st.number_input('Sample 2 Std Dev (s2):', value=get_state_value('ci_diff_mean_suev_sum_std_dev2', 1.0), min_value=0.001, key="ci_diff_mean_suev_sum_std_dev2")
-                params['sample_size2'] = st.number_input('Sample 2 Size (n2):', value=get_state_value('ci_diff_mean_suev_sum_size2', 30), min_value=2, step=1, key="ci_diff_mean_suev_sum_size2")
-
-    elif selected_ci_type == 'Difference Between Two Means (Independent, sigma unknown, unequal variances)':
-        if input_method == 'Raw Data':
-            col1, col2 = st.columns(2)
-            with col1:
-                params['data_column1'] = st.selectbox('Select Sample 1 Data', options=numeric_cols, key="ci_diff_mean_suuv_raw_data_col1")
-            with col2:
-                params['data_column2'] = st.selectbox('Select Sample 2 Data', options=numeric_cols, key="ci_diff_mean_suuv_raw_data_col2")
-        else: # Summary Statistics Input
-            col1, col2 = st.columns(2)
-            with col1:
-                params['sample_mean1'] = st.number_input('Sample 1 Mean (x̄1):', value=get_state_value('ci_diff_mean_suuv_sum_mean1', 0.0), key="ci_diff_mean_suuv_sum_mean1")
-                params['sample_std_dev1'] = st.number_input('Sample 1 Std Dev (s1):', value=get_state_value('ci_diff_mean_suuv_sum_std_dev1', 1.0), min_value=0.001, key="ci_diff_mean_suuv_sum_std_dev1")
-                params['sample_size1'] = st.number_input('Sample 1 Size (n1):', value=get_state_value('ci_diff_mean_suuv_sum_size1', 30), min_value=2, step=1, key="ci_diff_mean_suuv_sum_size1")
-            with col2:
-                params['sample_mean2'] = st.number_input('Sample 2 Mean (x̄2):', value=get_state_value('ci_diff_mean_suuv_sum_mean2', 0.0), key="ci_diff_mean_suuv_sum_mean2")
-                params['sample_std_dev2'] = st.number_input('Sample 2 Std Dev (s2):', value=get_state_value('ci_diff_mean_suuv_sum_std_dev2', 1.0), min_value=0.001, key="ci_diff_mean_suuv_sum_std_dev2")
-                params['sample_size2'] = st.number_input('Sample 2 Size (n2):', value=get_state_value('ci_diff_mean_suuv_sum_size2', 30), min_value=2, step=1, key="ci_diff_mean_suuv_sum_size2")
-
-    elif selected_ci_type == 'Difference Between Two Proportions':
-        col1, col2 = st.columns(2)
-        with col1:
-            params['num_successes1'] = st.number_input('Observed Successes 1 (x1):', value=get_state_value('ci_diff_prop_sum_succ1', 10), min_value=0, step=1, key="ci_diff_prop_sum_succ1")
-            params['num_trials1'] = st.number_input('Trials 1 (n1):', value=get_state_value('ci_diff_prop_sum_trials1', 20), min_value=1, step=1, key="ci_diff_prop_sum_trials1")
-        with col2:
-            params['num_successes2'] = st.number_input('Observed Successes 2 (x2):', value=get_state_value('ci_diff_prop_sum_succ2', 8), min_value=0, step=1, key="ci_diff_prop_sum_succ2")
-            params['num_trials2'] = st.number_input('Trials 2 (n2):', value=get_state_value('ci_diff_prop_sum_trials2', 15), min_value=1, step=1, key="ci_diff_prop_sum_trials2")
-
-    elif selected_ci_type == 'Paired Differences':
-        if input_method == 'Raw Data':
-            col1, col2 = st.columns(2)
-            with col1:
-                params['data_column1'] = st.selectbox('Select Sample 1 (Before)', options=numeric_cols, key="ci_paired_raw_data_col1")
-            with col2:
-                params['data_column2'] = st.selectbox('Select Sample 2 (After)', options=numeric_cols, key="ci_paired_raw_data_col2")
-        else: # Summary Statistics Input
-            params['mean_difference'] = st.number_input('Mean of Differences (d̄):', value=get_state_value('ci_paired_sum_mean_diff', 0.0), key="ci_paired_sum_mean_diff")
-            params['std_dev_difference'] = st.number_input('Std Dev of Differences (sd):', value=get_state_value('ci_paired_sum_std_diff', 1.0), min_value=0.001, key="ci_paired_sum_std_diff")
-            params['sample_size_difference'] = st.number_input('Number of Pairs (n):', value=get_state_value('ci_paired_sum_size_diff', 20), min_value=2, step=1, key="ci_paired_sum_size_diff")
-
-    confidence_level = st.number_input('Confidence Level (e.g., 0.95):', value=get_state_value('ci_confidence_level', 0.95), min_value=0.01, max_value=0.99, step=0.01, format="%.2f", key="ci_confidence_level_input")
-
-    if st.button("Calculate Confidence Interval", key="calc_ci_button"):
-        st.subheader("Calculation Results")
-        try:
-            lower_bound, upper_bound = None, None
-            sample_statistic, std_error, margin_of_error = None, None, None
-
-            if selected_ci_type == 'Mean (sigma unknown) - t-interval':
-                if input_method == 'Raw Data':
-                    data = get_data_from_col_string(params['data_column'])
-                    sample_mean = data.mean()
-                    sample_std_dev = data.std()
-                    sample_size = len(data)
-                    lower_bound, upper_bound = ci_mean_sigma_unknown(sample_mean, sample_std_dev, sample_size, confidence_level)
-                else:
-                    sample_mean = params['sample_mean']
-                    sample_std_dev = params['sample_std_dev']
-                    sample_size = params['sample_size']
-                    lower_bound, upper_bound = ci_mean_sigma_unknown(sample_mean, sample_std_dev, sample_size, confidence_level)
-
-                alpha = 1 - confidence_level
-                t_critical = stats.t.ppf(1 - alpha / 2, df=sample_size - 1)
-                sample_statistic = sample_mean
-                std_error = sample_std_dev / np.sqrt(sample_size)
-                margin_of_error = t_critical * std_error
-
-            elif selected_ci_type == 'One Proportion':
-                lower_bound, upper_bound = ci_proportion(params['num_successes'], params['num_trials'], confidence_level)
-                sample_statistic = params['num_successes'] / params['num_trials']
-                alpha = 1 - confidence_level
-                z_critical = stats.norm.ppf(1 - alpha / 2)
-                std_error = np.sqrt((sample_statistic * (1 - sample_statistic)) / params['num_trials'])
-                margin_of_error = z_critical * std_error
-
-            elif selected_ci_type == 'Difference Between Two Means (Independent, sigma known)':
-                if input_method == 'Raw Data':
-                    data1 = get_data_from_col_string(params['data_column1'])
-                    data2 = get_data_from_col_string(params['data_column2'])
-                    sample_mean1, sample_size1 = data1.mean(), len(data1)
-                    sample_mean2, sample_size2 = data2.mean(), len(data2)
-                    lower_bound, upper_bound = ci_diff_means_sigma_known(sample_mean1, params['pop_std_dev1'], sample_size1, sample_mean2, params['pop_std_dev2'], sample_size2, confidence_level)
-                else:
-                    sample_mean1, sample_size1 = params['sample_mean1'], params['sample_size1']
-                    sample_mean2, sample_size2 = params['sample_mean2'], params['sample_size2']
-                    lower_bound, upper_bound = ci_diff_means_sigma_known(sample_mean1, params['pop_std_dev1'], sample_size1, sample_mean2, params['pop_std_dev2'], sample_size2, confidence_level)
-
-                alpha = 1 - confidence_level
-                z_critical = stats.norm.ppf(1 - alpha / 2)
-                sample_statistic = sample_mean1 - sample_mean2
-                std_error = np.sqrt((params['pop_std_dev1']**2 / sample_size1) + (params['pop_std_dev2']**2 / sample_size2))
-                margin_of_error = z_critical * std_error
-
-            elif selected_ci_type == 'Difference Between Two Means (Independent, sigma unknown, equal variances)':
-                if input_method == 'Raw Data':
-                    data1 = get_data_from_col_string(params['data_column1'])
-                    data2 = get_data_from_col_string(params['data_column2'])
-                    sample_mean1, sample_std_dev1, sample_size1 = data1.mean(), data1.std(), len(data1)
-                    sample_mean2, sample_std_dev2, sample_size2 = data2.mean(), data2.std(), len(data2)
-                    lower_bound, upper_bound = ci_diff_means_sigma_unknown_equal_var(sample_mean1, sample_std_dev1, sample_size1, sample_mean2, sample_std_dev2, sample_size2, confidence_level)
-                else:
-                    sample_mean1, sample_std_dev1, sample_size1 = params['sample_mean1'], params['sample_std_dev1'], params['sample_size1']
-                    sample_mean2, sample_std_dev2, sample_size2 = params['sample_mean2'], params['sample_std_dev2'], params['sample_size2']
-                    lower_bound, upper_bound = ci_diff_means_sigma_unknown_equal_var(sample_mean1, sample_std_dev1, sample_size1, sample_mean2, sample_std_dev2, sample_size2, confidence_level)
-
-                alpha = 1 - confidence_level
-                pooled_std_dev = np.sqrt(((sample_size1 - 1) * sample_std_dev1**2 + (sample_size2 - 1) * sample_std_dev2**2) / (sample_size1 + sample_size2 - 2))
-                t_critical = stats.t.ppf(1 - alpha / 2, df=sample_size1 + sample_size2 - 2)
-                sample_statistic = sample_mean1 - sample_mean2
-                std_error = pooled_std_dev * np.sqrt((1 / sample_size1) + (1 / sample_size2))
-                margin_of_error = t_critical * std_error
-
-            elif selected_ci_type == 'Difference Between Two Means (Independent, sigma unknown, unequal variances)':
-                if input_method == 'Raw Data':
-                    data1 = get_data_from_col_string(params['data_column1'])
-                    data2 = get_data_from_col_string(params['data_column2'])
-                    sample_mean1, sample_std_dev1, sample_size1 = data1.mean(), data1.std(), len(data1)
-                    sample_mean2, sample_std_dev2, sample_size2 = data2.mean(), data2.std(), len(data2)
-                    lower_bound, upper_bound = ci_diff_means_sigma_unknown_unequal_var(sample_mean1, sample_std_dev1, sample_size1, sample_mean2, sample_std_dev2, sample_size2, confidence_level)
-                else:
-                    sample_mean1, sample_std_dev1, sample_size1 = params['sample_mean1'], params['sample_std_dev1'], params['sample_size1']
-                    sample_mean2, sample_std_dev2, sample_size2 = params['sample_mean2'], params['sample_std_dev2'], params['sample_size2']
-                    lower_bound, upper_bound = ci_diff_means_sigma_unknown_unequal_var(sample_mean1, sample_std_dev1, sample_size1, sample_mean2, sample_std_dev2, sample_size2, confidence_level)
-
-                alpha = 1 - confidence_level
-                sample_statistic = sample_mean1 - sample_mean2
-                se1_sq = (sample_std_dev1**2) / sample_size1
-                se2_sq = (sample_std_dev2**2) / sample_size2
-                std_error = np.sqrt(se1_sq + se2_sq)
-                welch_df = ((se1_sq + se2_sq)**2) / ((se1_sq**2 / (sample_size1 - 1)) + (se2_sq**2 / (sample_size2 - 1)))
-                t_critical = stats.t.ppf(1 - alpha / 2, df=welch_df)
-                margin_of_error = t_critical * std_error
-
-            elif selected_ci_type == 'Difference Between Two Proportions':
-                lower_bound, upper_bound = ci_diff_proportions(params['num_successes1'], params['num_trials1'], params['num_successes2'], params['num_trials2'], confidence_level)
-                prop1 = params['num_successes1'] / params['num_trials1']
-                prop2 = params['num_successes2'] / params['num_trials2']
-                sample_statistic = prop1 - prop2
-                alpha = 1 - confidence_level
-                z_critical = stats.norm.ppf(1 - alpha / 2)
-                std_error = np.sqrt((prop1 * (1 - prop1) / params['num_trials1']) + (prop2 * (1 - prop2) / params['num_trials2']))
-                margin_of_error = z_critical * std_error
-
-            elif selected_ci_type == 'Paired Differences':
-                if input_method == 'Raw Data':
-                    data1 = get_data_from_col_string(params['data_column1'])
-                    data2 = get_data_from_col_string(params['data_column2'])
-                    differences = np.array(data1) - np.array(data2)
-                    mean_difference = np.mean(differences)
-                    std_dev_difference = np.std(differences, ddof=1)
-                    sample_size_difference = len(differences)
-                    lower_bound, upper_bound = ci_paired_differences(data1, data2, confidence_level)
-                else:
-                    mean_difference = params['mean_difference']
-                    std_dev_difference = params['std_dev_difference']
-                    sample_size_difference = params['sample_size_difference']
-                    lower_bound, upper_bound = ci_paired_differences_summary(
-                        mean_difference,
-                        std_dev_difference,
-                        sample_size_difference,
-                        confidence_level
-                    )
 
-                alpha = 1 - confidence_level
-                t_critical = stats.t.ppf(1 - alpha / 2, df=sample_size_difference - 1)
-                sample_statistic = mean_difference
-                std_error = std_dev_difference / np.sqrt(sample_size_difference)
-                margin_of_error = t_critical * std_error
-
-            st.success(f"Confidence Interval ({confidence_level*100:.0f}%): ({lower_bound:.4f}, {upper_bound:.4f})")
-            if sample_statistic is not None and std_error is not None and margin_of_error is not None:
-                sample_stat_symbol_map = {
-                    'Mean (sigma unknown) - t-interval': 'x̄',
-                    'One Proportion': 'p̂',
-                    'Difference Between Two Means (Independent, sigma known)': 'x̄₁ - x̄₂',
-                    'Difference Between Two Means (Independent, sigma unknown, equal variances)': 'x̄₁ - x̄₂',
-                    'Difference Between Two Means (Independent, sigma unknown, unequal variances)': 'x̄₁ - x̄₂',
-                    'Difference Between Two Proportions': 'p̂₁ - p̂₂',
-                    'Paired Differences': 'd̄'
-                }
-                sample_stat_symbol = sample_stat_symbol_map.get(selected_ci_type, 'Statistic')
-                summary_df = pd.DataFrame(
-                    {
-                        'Metric': ['Sample Statistic', 'Standard Error', 'Margin of Error'],
-                        'Symbol': [sample_stat_symbol, 'SE', 'ME'],
-                        'Value': [sample_statistic, std_error, margin_of_error]
-                    }
-                )
-                st.write("Summary")
-                summary_display_df = summary_df.copy()
-                summary_display_df['Value'] = summary_display_df['Value'].map(lambda v: f"{v:.6f}")
-                st.markdown(summary_display_df.to_html(index=False), unsafe_allow_html=True)
+def start_google_sheets_load(sheets_url, origin, tabs=''):
+    """Start loading a Google Sheet on the worker pool; `origin` names the caller that collects it.
 
-        except ValueError as ve:
-            st.error(f"Input Error: {ve}")
-        except Exception as e:
-            st.error(f"An unexpected error occurred: {e}")
-
-elif selected_tab == "Hypothesis Testing":
-    st.header("Hypothesis Testing")
-
-    if not st.session_state.global_dataframes:
-        st.info("Please load or enter data in the 'Data Input' tab first to use raw data input.")
-
-    ht_type_options = [
-        'One-Sample t-test',
-        'Two-Sample t-test (Independent Samples)',
-        'Paired t-test',
-        'One-Sample Z-test for Proportions',
-        'Two-Sample Z-test for Proportions',
-        'Chi-Square Goodness-of-Fit Test',
-        'Chi-Square Test of Independence',
-        'ANOVA (Analysis of Variance) F-test'
-    ]
-    selected_ht_type = st.selectbox("Select Hypothesis Test Type", options=ht_type_options, key="ht_type_select")
-
-    # Determine input method options based on selected HT type
-    ht_input_method_options = []
-    if selected_ht_type in ['One-Sample Z-test for Proportions', 'Two-Sample Z-test for Proportions', 'Chi-Square Goodness-of-Fit Test']:
-        ht_input_method_options = ['Summary Statistics']
-    elif selected_ht_type == 'Chi-Square Test of Independence':
-        ht_input_method_options = ['Raw Data', 'Summary Statistics (Contingency Table)']
-    elif selected_ht_type == 'ANOVA (Analysis of Variance) F-test':
-        ht_input_method_options = ['Raw Data'] # ANOVA typically uses raw data groups
+    `tabs` is an optional list of tab names/gids (see `parse_sheet_tab_specs`); the
+    tabs are fetched concurrently and each becomes its own named dataset. Starting
+    the same load again while it is running keeps the running downloads.
+    """
+    specs = parse_sheet_tab_specs(tabs)
+    sheet_id = get_google_sheet_id(sheets_url)
+    if not specs:
+        # Handle regular Google Sheets share links and convert them to CSV export URLs
+        targets = {'active_data': normalize_sheets_url(sheets_url)}
+    elif sheet_id:
+        targets = {spec['label']: sheet_tab_export_url(sheet_id, spec) for spec in specs}
     else:
-        ht_input_method_options = ['Raw Data', 'Summary Statistics']
-
-    st.subheader("Inputs")
-    
-    input_method = st.radio("Input Type:", options=ht_input_method_options, key="ht_input_method")
-
-    params = {}
-    numeric_cols = [''] + get_numeric_columns()
-    all_cols = [''] + get_all_columns() # For categorical variables if needed
-
-    # Helper to get the value from session state if available, else a default
-    def get_state_value(key, default):
-        return st.session_state.get(key, default)
+        targets = {}
 
-    alternative_options = {
-        'Two-sided (≠)': 'two-sided',
-        'Greater Than (>)': 'greater',
-        'Less Than (<)': 'less'
+    job = st.session_state.get('sheets_load_job')
+    if job is not None:
+        running = not all(future.done() for future in job['futures'].values())
+        if running and job['targets'] == targets:
+            job['origin'] = origin
+            return
+        job['cancel'].set()
+
+    cancel = threading.Event()
+    futures = {}
+    progress = []
+    if targets:
+        pool = get_sheets_loader_pool()
+        fetch_cache = get_sheets_fetch_cache()
+        for label, url in targets.items():
+            tab_progress = {'bytes': 0, 'total': None}
+            progress.append(tab_progress)
+            futures[label] = submit_google_sheets_fetch(url, pool, fetch_cache, cancel, tab_progress)
+    else:
+        failed = concurrent.futures.Future()
+        failed.set_exception(ValueError("Sheet tabs can only be selected for Google Sheets links (https://docs.google.com/spreadsheets/...)."))
+        futures['active_data'] = failed
+    st.session_state.sheets_load_job = {
+        'targets': targets, 'origin': origin, 'futures': futures,
+        'cancel': cancel, 'progress': progress, 'started': time.monotonic(),
     }
 
-    # Dynamic parameter inputs based on HT type and input method
-    if selected_ht_type == 'One-Sample t-test':
-        st.write("**Hypotheses**")
-        # Create columns for hypothesis display with input box
-        col_h0_1, col_h0_input, col_h0_2 = st.columns([1, 2, 4])
-        with col_h0_1:
-            st.write("H₀: μ =")
-        with col_h0_input:
-            if input_method == 'Raw Data':
-                params['hypothesized_mean'] = st.number_input('μ₀', value=get_state_value('ht_os_t_hypo_mean_raw', 0.0), key="ht_os_t_hypo_mean_raw", label_visibility="collapsed")
-            else:
-                params['hypothesized_mean'] = st.number_input('μ₀', value=get_state_value('ht_os_t_hypo_mean_sum', 0.0), key="ht_os_t_hypo_mean_sum", label_visibility="collapsed")
-        
-        alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
-        selected_alternative_display = st.selectbox(
-            "Alternative Hypothesis (HA):",
-            options=list(alternative_options.keys()),
-            format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
-            key=alt_hypothesis_key
-        )
-        params['alternative'] = alternative_options[selected_alternative_display]
-        
-        # Display HA based on selection
-        if params['alternative'] == 'two-sided':
-            st.write(f"Hₐ: μ ≠ {params['hypothesized_mean']}")
-        elif params['alternative'] == 'greater':
-            st.write(f"Hₐ: μ > {params['hypothesized_mean']}")
-        elif params['alternative'] == 'less':
-            st.write(f"Hₐ: μ < {params['hypothesized_mean']}")
-
-        if input_method == 'Raw Data':
-            params['sample_data'] = st.selectbox('Select Sample Data Column', options=numeric_cols, key="ht_os_t_raw_data_col")
-        else: # Summary Statistics Input
-            params['sample_mean'] = st.number_input('Sample Mean (x̄):', value=get_state_value('ht_os_t_sum_mean', 0.0), key="ht_os_t_sum_mean")
-            params['sample_std_dev'] = st.number_input('Sample Std Dev (s):', value=get_state_value('ht_os_t_sum_std_dev', 1.0), min_value=0.001, key="ht_os_t_sum_std_dev")
-            params['sample_size'] = st.number_input('Sample Size (n):', value=get_state_value('ht_os_t_sum_size', 30), min_value=2, step=1, key="ht_os_t_sum_size")
-
-    elif selected_ht_type == 'Two-Sample t-test (Independent Samples)':
-        st.write("**Hypotheses**")
-        st.write("H₀: μ₁ = μ₂")
-        
-        alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
-        selected_alternative_display = st.selectbox(
-            "Alternative Hypothesis (HA):",
-            options=list(alternative_options.keys()),
-            format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
-            key=alt_hypothesis_key
-        )
-        params['alternative'] = alternative_options[selected_alternative_display]
-        
-        # Display HA based on selection
-        if params['alternative'] == 'two-sided':
-            st.write("Hₐ: μ₁ ≠ μ₂")
-        elif params['alternative'] == 'greater':
-            st.write("Hₐ: μ₁ > μ₂")
-        elif params['alternative'] == 'less':
-            st.write("Hₐ: μ₁ < μ₂")
-
-        params['equal_variances'] = st.checkbox('Assume Equal Variances', value=True, key="ht_ts_t_equal_var")
-        if input_method == 'Raw Data':
-            col1, col2 = st.columns(2)
-            with col1:
-                params['sample_data1'] = st.selectbox('Select Sample 1 Data Column', options=numeric_cols, key="ht_ts_t_raw_data_col1")
-            with col2:
-                params['sample_data2'] = st.selectbox('Select Sample 2 Data Column', options=numeric_cols, key="ht_ts_t_raw_data_col2")
-        else: # Summary Statistics Input
-            col1, col2 = st.columns(2)
-            with col1:
-                st.write("**Sample 1**")
-                params['sample1_mean'] = st.number_input('Sample 1 Mean (x̄1):', value=get_state_value('ht_ts_t_sum_mean1', 0.0), key="ht_ts_t_sum_mean1")
-                params['sample1_std_dev'] = st.number_input('Sample 1 Std Dev (s1):', value=get_state_value('ht_ts_t_sum_std_dev1', 1.0), min_value=0.001, key="ht_ts_t_sum_std_dev1")
-                params['sample1_size'] = st.number_input('Sample 1 Size (n1):', value=get_state_value('ht_ts_t_sum_size1', 30), min_value=2, step=1, key="ht_ts_t_sum_size1")
-            with col2:
-                st.write("**Sample 2**")
-                params['sample2_mean'] = st.number_input('Sample 2 Mean (x̄2):', value=get_state_value('ht_ts_t_sum_mean2', 0.0), key="ht_ts_t_sum_mean2")
-                params['sample2_std_dev'] = st.number_input('Sample 2 Std Dev (s2):', value=get_state_value('ht_ts_t_sum_std_dev2', 1.0), min_value=0.001, key="ht_ts_t_sum_std_dev2")
-                params['sample2_size'] = st.number_input('Sample 2 Size (n2):', value=get_state_value('ht_ts_t_sum_size2', 30), min_value=2, step=1, key="ht_ts_t_sum_size2")
-
-    elif selected_ht_type == 'Paired t-test':
-        st.write("**Hypotheses**")
-        st.write("H₀: μd = 0")
-        
-        alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
-        selected_alternative_display = st.selectbox(
-            "Alternative Hypothesis (HA):",
-            options=list(alternative_options.keys()),
-            format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
-            key=alt_hypothesis_key
-        )
-        params['alternative'] = alternative_options[selected_alternative_display]
-        
-        # Display HA based on selection
-        if params['alternative'] == 'two-sided':
-            st.write("Hₐ: μd ≠ 0")
-        elif params['alternative'] == 'greater':
-            st.write("Hₐ: μd > 0")
-        elif params['alternative'] == 'less':
-            st.write("Hₐ: μd < 0")
-
-        if input_method == 'Raw Data':
-            col1, col2 = st.columns(2)
-            with col1:
-                params['sample_data1'] = st.selectbox('Select Sample 1 Data (Before)', options=numeric_cols, key="ht_paired_t_raw_data_col1")
-            with col2:
-                params['sample_data2'] = st.selectbox('Select Sample 2 Data (After)', options=numeric_cols, key="ht_paired_t_raw_data_col2")
-        else: # Summary Statistics Input
-            params['mean_difference'] = st.number_input('Mean of Differences (d̄):', value=get_state_value('ht_paired_t_sum_mean_diff', 0.0), key="ht_paired_t_sum_mean_diff")
-            params['std_dev_difference'] = st.number_input('Std Dev of Differences (sd):', value=get_state_value('ht_paired_t_sum_std_diff', 1.0), min_value=0.001, key="ht_paired_t_sum_std_diff")
-            params['sample_size_difference'] = st.number_input('Number of Pairs (n):', value=get_state_value('ht_paired_t_sum_size_diff', 20), min_value=2, step=1, key="ht_paired_t_sum_size_diff")
-
-    elif selected_ht_type == 'One-Sample Z-test for Proportions':
-        st.write("**Hypotheses**")
-        # Create columns for hypothesis display with input box
-        col_h0_1, col_h0_input, col_h0_2 = st.columns([1, 2, 4])
-        with col_h0_1:
-            st.write("H₀: p =")
-        with col_h0_input:
-            params['hypothesized_proportion'] = st.number_input('p₀', value=get_state_value('ht_os_z_prop_sum_hypo_prop', 0.5), min_value=0.0, max_value=1.0, step=0.01, key="ht_os_z_prop_sum_hypo_prop", label_visibility="collapsed")
-        
-        alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
-        selected_alternative_display = st.selectbox(
-            "Alternative Hypothesis (HA):",
-            options=list(alternative_options.keys()),
-            format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
-            key=alt_hypothesis_key
-        )
-        params['alternative'] = alternative_options[selected_alternative_display]
-        
-        # Display HA based on selection
-        if params['alternative'] == 'two-sided':
-            st.write(f"Hₐ: p ≠ {params['hypothesized_proportion']}")
-        elif params['alternative'] == 'greater':
-            st.write(f"Hₐ: p > {params['hypothesized_proportion']}")
-        elif params['alternative'] == 'less':
-            st.write(f"Hₐ: p < {params['hypothesized_proportion']}")
-
-        # Only Summary Statistics Input
-        params['num_successes'] = st.number_input('Number of Observed Successes (x):', value=get_state_value('ht_os_z_prop_sum_succ', 10), min_value=0, step=1, key="ht_os_z_prop_sum_succ")
-        params['num_trials'] = st.number_input('Number of Trials (n):', value=get_state_value('ht_os_z_prop_sum_trials', 20), min_value=1, step=1, key="ht_os_z_prop_sum_trials")
-
-    elif selected_ht_type == 'Two-Sample Z-test for Proportions':
-        st.write("**Hypotheses**")
-        st.write("H₀: p₁ = p₂")
-        
-        alt_hypothesis_key = f"ht_{selected_ht_type.replace(' ', '_').replace('-', '_')}_alt"
-        selected_alternative_display = st.selectbox(
-            "Alternative Hypothesis (HA):",
-            options=list(alternative_options.keys()),
-            format_func=lambda x: x.split(' ')[0], # Display only 'Two-sided', 'Greater', 'Less'
-            key=alt_hypothesis_key
-        )
-        params['alternative'] = alternative_options[selected_alternative_display]
-        
-        # Display HA based on selection
-        if params['alternative'] == 'two-sided':
-            st.write("Hₐ: p₁ ≠ p₂")
-        elif params['alternative'] == 'greater':
-            st.write("Hₐ: p₁ > p₂")
-        elif params['alternative'] == 'less':
-            st.write("Hₐ: p₁ < p₂")
-
-        # Only Summary Statistics Input
-        col1, col2 = st.columns(2)
-        with col1:
-            st.write("**Sample 1**")
-            params['num_successes1'] = st.number_input('Observed Successes 1 (x1):', value=get_state_value('ht_ts_z_prop_sum_succ1', 10), min_value=0, step=1, key="ht_ts_z_prop_sum_succ1")
-            params['num_trials1'] = st.number_input('Trials 1 (n1):', value=get_state_value('ht_ts_z_prop_sum_trials1', 20), min_value=1, step=1, key="ht_ts_z_prop_sum_trials1")
-        with col2:
-            st.write("**Sample 2**")
-            params['num_successes2'] = st.number_input('Observed Successes 2 (x2):', value=get_state_value('ht_ts_z_prop_sum_succ2', 8), min_value=0, step=1, key="ht_ts_z_prop_sum_succ2")
-            params['num_trials2'] = st.number_input('Trials 2 (n2):', value=get_state_value('ht_ts_z_prop_sum_trials2', 15), min_value=1, step=1, key="ht_ts_z_prop_sum_trials2")
-
-    elif selected_ht_type == 'Chi-Square Goodness-of-Fit Test':
-        # Only Summary Statistics Input
-        st.write("**Frequencies Table**")
-        num_categories = st.number_input('Number of Categories:', value=get_state_value('ht_chi2_gof_num_cat', 3), min_value=2, max_value=20, step=1, key="ht_chi2_gof_num_cat")
-        
-        # Input category names
-        st.write("**Category Names:**")
-        cat_cols = st.columns(min(int(num_categories), 5))  # Max 5 columns per row
-        category_names = []
-        for i in range(int(num_categories)):
-            col_idx = i % 5
-            with cat_cols[col_idx]:
-                cat_key = f"ht_chi2_gof_cat_name_{i}"
-                default_name = get_state_value(cat_key, f"Cat {i+1}")
-                name = st.text_input(f'Category {i+1}', value=default_name, key=cat_key, label_visibility="collapsed")
-                category_names.append(name)
-        
-        # Create table input with borders
-        st.write("**Enter frequencies:**")
-        
-        with st.container(border=True):
-            # Header row
-            header_cols = st.columns([2, 1.5, 1.5])
-            with header_cols[0]:
-                st.markdown("**Category**")
-            with header_cols[1]:
-                st.markdown("**Observed**")
-            with header_cols[2]:
-                st.markdown("**Expected**")
-            
-            st.markdown('<hr style="margin: 5px 0; border: 1px solid #4a4a4a;">', unsafe_allow_html=True)
-            
-            # Data rows
-            observed_values = []
-            expected_values = []
-            for i in range(int(num_categories)):
-                cols = st.columns([2, 1.5, 1.5])
-                with cols[0]:
-                    st.markdown(f"**{category_names[i]}**")
-                with cols[1]:
-                    obs_key = f"ht_chi2_gof_obs_{i}"
-                    obs_val = st.number_input(f'Obs {i}', value=get_state_value(obs_key, 10.0), min_value=0.0, step=1.0, key=obs_key, label_visibility="collapsed")
-                    observed_values.append(obs_val)
-                with cols[2]:
-                    exp_key = f"ht_chi2_gof_exp_{i}"
-                    exp_val = st.number_input(f'Exp {i}', value=get_state_value(exp_key, 0.0), min_value=0.0, step=1.0, key=exp_key, label_visibility="collapsed")
-                    expected_values.append(exp_val)
-                
-                # Add horizontal line between rows (except after last row)
-                if i < int(num_categories) - 1:
-                    st.markdown('<hr style="margin: 5px 0; border: 0.5px solid #ddd;">', unsafe_allow_html=True)
-        
-        # Convert to comma-separated strings for compatibility
-        params['observed_frequencies'] = ','.join([str(v) for v in observed_values])
-        # Store category names for output display
-        params['category_names'] = category_names
-        # If all expected values are 0, leave empty string for equal distribution
-        if all(v == 0.0 for v in expected_values):
-            params['expected_frequencies'] = ''
-        else:
-            params['expected_frequencies'] = ','.join([str(v) for v in expected_values])
-
-    elif selected_ht_type == 'Chi-Square Test of Independence':
-        if input_method == "Raw Data":
-            st.write("**Select Two Categorical Variables**")
-            
-            # Get categorical columns only
-            categorical_cols_options = ['']
-            for df_name, df in st.session_state.global_dataframes.items():
-                for col in df.columns:
-                    try:
-                        pd.to_numeric(df[col], errors='raise')
-                        if df[col].nunique() <= 15:
-                            categorical_cols_options.append(f"{df_name}: {col}")
-                    except (ValueError, TypeError):
-                        categorical_cols_options.append(f"{df_name}: {col}")
-            
-            col1, col2 = st.columns(2)
-            with col1:
-                row_var = st.selectbox("Row Variable", options=categorical_cols_options, key="chi2_ind_row_var")
-            with col2:
-                col_var = st.selectbox("Column Variable", options=categorical_cols_options, key="chi2_ind_col_var")
-            
-            params['chi2_ind_input_type'] = 'raw_data'
-            params['row_variable'] = row_var
-            params['col_variable'] = col_var
-            
-        else:  # Summary Statistics
-            st.write("**Contingency Table**")
-            num_rows = st.number_input('Number of Rows:', value=int(get_state_value('ht_chi2_ind_num_rows', 2)), min_value=2, max_value=10, step=1, key="ht_chi2_ind_num_rows", format="%d")
-            num_cols = st.number_input('Number of Columns:', value=int(get_state_value('ht_chi2_ind_num_cols', 2)), min_value=2, max_value=10, step=1, key="ht_chi2_ind_num_cols", format="%d")
-            params['chi2_ind_input_type'] = 'summary'
-            
-            # Input category names for rows
-            st.write("**Row Categories:**")
-            row_cols = st.columns(int(num_rows))
-            row_names = []
-            for i in range(int(num_rows)):
-                with row_cols[i]:
-                    row_key = f"ht_chi2_ind_row_name_{i}"
-                    default_name = get_state_value(row_key, f"Row {i+1}")
-                    name = st.text_input(f'Row {i+1} Name', value=default_name, key=row_key, label_visibility="collapsed")
-                    row_names.append(name)
-            
-            # Input category names for columns
-            st.write("**Column Categories:**")
-            col_cols = st.columns(int(num_cols))
-            col_names = []
-            for j in range(int(num_cols)):
-                with col_cols[j]:
-                    col_key = f"ht_chi2_ind_col_name_{j}"
-                    default_name = get_state_value(col_key, f"Col {j+1}")
-                    name = st.text_input(f'Col {j+1} Name', value=default_name, key=col_key, label_visibility="collapsed")
-                    col_names.append(name)
-            
-            # Create table input with category labels and borders
-            st.write("**Enter values for each cell:**")
-            
-            # Add CSS for better table styling with column borders
-            st.markdown("""
-            <style>
-            .chi2-table-cell {
-                border-right: 1px solid #ddd;
-                padding: 5px;
-            }
-            .chi2-table-header {
-                border-right: 1px solid #ddd;
-                border-bottom: 2px solid #4a4a4a;
-                padding: 5px;
-                text-align: center;
-                font-weight: bold;
-            }
-            .chi2-table-row-header {
-                border-right: 2px solid #4a4a4a;
-                padding: 5px;
-                font-weight: bold;
-            }
-            </style>
-            """, unsafe_allow_html=True)
-            
-            # Container with border styling
-            with st.container(border=True):
-                # Header row with column names
-                header_cols = st.columns([1.5] + [1] * int(num_cols))
-                with header_cols[0]:
-                    st.markdown('<div class="chi2-table-row-header">&nbsp;</div>', unsafe_allow_html=True)  # Empty corner cell
-                for j in range(int(num_cols)):
-                    with header_cols[j + 1]:
-                        st.markdown(f'<div class="chi2-table-header">{col_names[j]}</div>', unsafe_allow_html=True)
-                
-                st.markdown('<hr style="margin: 5px 0; border: 1px solid #4a4a4a;">', unsafe_allow_html=True)
-                
-                # Data rows
-                table_data = []
-                for i in range(int(num_rows)):
-                    # Create header column for row name plus data columns
-                    cols = st.columns([1.5] + [1] * int(num_cols))
-                    with cols[0]:
-                        st.markdown(f'<div class="chi2-table-row-header">{row_names[i]}</div>', unsafe_allow_html=True)
-                    
-                    row_data = []
-                    for j in range(int(num_cols)):
-                        with cols[j + 1]:
-                            cell_key = f"ht_chi2_ind_cell_{i}_{j}"
-                            default_val = get_state_value(cell_key, 10.0)
-                            val = st.number_input(f'{row_names[i]}-{col_names[j]}', value=default_val, min_value=0.0, step=1.0, key=cell_key, label_visibility="collapsed")
-                            row_data.append(val)
-                    table_data.append(row_data)
-                    
-                    # Add horizontal line between rows (except after last row)
-                    if i < int(num_rows) - 1:
-                        st.markdown('<hr style="margin: 5px 0; border: 0.5px solid #ddd;">', unsafe_allow_html=True)
-            
-            # Convert table to string format for compatibility with existing code
-            params['contingency_table'] = ';'.join([','.join([str(val) for val in row]) for row in table_data])
-            # Store row and column names for labeled output
-            params['row_names'] = row_names
-            params['col_names'] = col_names
-
-    elif selected_ht_type == 'ANOVA (Analysis of Variance) F-test':
-        # Only Raw Data Input
-        if not numeric_cols:
-            st.warning("No numeric columns available. Please upload or enter data first.")
-        else:
-            num_groups = st.number_input('Number of Groups:', value=get_state_value('ht_anova_num_groups', 2), min_value=2, step=1, key="ht_anova_num_groups")
 
-            group_data_cols = []
-            for i in range(int(num_groups)):
-                col_key = f"ht_anova_group_data_col_{i+1}"
-                # Default to empty selection (index 0 is the empty string '')
-                selected_col = st.selectbox(f'Select Group {i+1} Data Column', options=numeric_cols, index=0, key=col_key)
-                group_data_cols.append(selected_col)
-            params['group_data_cols'] = group_data_cols
-
-    alpha_level = st.number_input('Significance Level (α) for visualization:', value=get_state_value('ht_alpha_level', 0.05), min_value=0.001, max_value=0.999, step=0.01, key="ht_alpha_level")
-
-    if st.button("Perform Hypothesis Test", key="perform_ht_button"):
-        st.subheader("Test Results")
-        try:
-            test_statistic, p_value, degrees_freedom, expected_frequencies = None, None, None, None
-            st.write(f"--- **{selected_ht_type}** ---")
-
-            # Execute the selected test
-            if selected_ht_type == 'One-Sample t-test':
-                if input_method == 'Raw Data':
-                    data = get_data_from_col_string(params['sample_data'])
-                    test_statistic, p_value = one_sample_t_test(data, params['hypothesized_mean'], alternative=params['alternative'])
-                    st.write(f"Sample Mean: {np.mean(data):.4f}")
-                else:
-                    test_statistic, p_value = one_sample_t_test_summary(params['sample_mean'], params['sample_std_dev'], params['sample_size'], params['hypothesized_mean'], alternative=params['alternative'])
-                    st.write(f"Sample Mean: {params['sample_mean']:.4f}, Sample Std Dev: {params['sample_std_dev']:.4f}, Sample Size: {params['sample_size']}")
-                st.write(f"Hypothesized Mean (μ0): {params['hypothesized_mean']}")
-
-            elif selected_ht_type == 'Two-Sample t-test (Independent Samples)':
-                if input_method == 'Raw Data':
-                    data1 = get_data_from_col_string(params['sample_data1'])
-                    data2 = get_data_from_col_string(params['sample_data2'])
-                    test_statistic, p_value = two_sample_t_test_independent(data1, data2, equal_variances=params['equal_variances'], alternative=params['alternative'])
-                    st.write(f"Sample 1 Mean: {np.mean(data1):.4f} (N={len(data1)}) ")
-                    st.write(f"Sample 2 Mean: {np.mean(data2):.4f} (N={len(data2)}) ")
-                else:
-                    test_statistic, p_value = two_sample_t_test_independent_summary(params['sample1_mean'], params['sample1_std_dev'], params['sample1_size'], params['sample2_mean'], params['sample2_std_dev'], params['sample2_size'], equal_variances=params['equal_variances'], alternative=params['alternative'])
-                    st.write(f"Sample 1: Mean={params['sample1_mean']:.4f}, Std Dev={params['sample1_std_dev']:.4f}, Size={params['sample1_size']}")
-                    st.write(f"Sample 2: Mean={params['sample2_mean']:.4f}, Std Dev={params['sample2_std_dev']:.4f}, Size={params['sample2_size']}")
-                st.write(f"Assumed Equal Variances: {params['equal_variances']}")
-
-            elif selected_ht_type == 'Paired t-test':
-                if input_method == 'Raw Data':
-                    data1 = get_data_from_col_string(params['sample_data1'])
-                    data2 = get_data_from_col_string(params['sample_data2'])
-                    test_statistic, p_value = paired_t_test(data1, data2, alternative=params['alternative'])
-                    st.write(f"Sample 1 (Before) Mean: {np.mean(data1):.4f}")
-                    st.write(f"Sample 2 (After) Mean: {np.mean(data2):.4f}")
-                else:
-                    test_statistic, p_value = paired_t_test_summary(params['mean_difference'], params['std_dev_difference'], params['sample_size_difference'], alternative=params['alternative'])
-                    st.write(f"Mean Difference: {params['mean_difference']:.4f}, Std Dev of Differences: {params['std_dev_difference']:.4f}, Number of Pairs: {params['sample_size_difference']}")
-
-            elif selected_ht_type == 'One-Sample Z-test for Proportions':
-                test_statistic, p_value = one_sample_z_test_proportion(params['num_successes'], params['num_trials'], params['hypothesized_proportion'], alternative=params['alternative'])
-                st.write(f"Sample Proportion: {(params['num_successes']/params['num_trials']):.4f} (x={params['num_successes']}, n={params['num_trials']})")
-                st.write(f"Hypothesized Proportion (p0): {params['hypothesized_proportion']}")
-
-            elif selected_ht_type == 'Two-Sample Z-test for Proportions':
-                test_statistic, p_value = two_sample_z_test_proportion(params['num_successes1'], params['num_trials1'], params['num_successes2'], params['num_trials2'], alternative=params['alternative'])
-                st.write(f"Sample 1 Proportion: {(params['num_successes1']/params['num_trials1']):.4f} (x1={params['num_successes1']}, n1={params['num_trials1']})")
-                st.write(f"Sample 2 Proportion: {(params['num_successes2']/params['num_trials2']):.4f} (x2={params['num_successes2']}, n2={params['num_trials2']})")
-
-            elif selected_ht_type == 'Chi-Square Goodness-of-Fit Test':
-                observed = [float(x.strip()) for x in params['observed_frequencies'].split(',') if x.strip()]
-                expected = []
-                if params['expected_frequencies']:
-                    expected = [float(x.strip()) for x in params['expected_frequencies'].split(',') if x.strip()]
-                else:
-                    # Use equal distribution
-                    expected = [np.mean(observed)] * len(observed)
-                
-                test_statistic, p_value = chi_square_goodness_of_fit_test(observed, expected_frequencies=expected if params['expected_frequencies'] else None)
-                
-                # Get category names
-                category_names = params.get('category_names', [f"Category {i+1}" for i in range(len(observed))])
-                
-                # Create HTML table with black borders
-                table_html = """
-                <style>
-                .gof-table {
-                    border-collapse: collapse;
-                    width: 100%;
-                    margin: 10px 0;
-                }
-                .gof-table th, .gof-table td {
-                    border: 1px solid black;
-                    padding: 8px;
-                    text-align: center;
-                }
-                .gof-table th {
-                    background-color: #f0f0f0;
-                    font-weight: bold;
-                }
-                </style>
-                <table class="gof-table">
-                <tr>
-                    <th>Category</th>
-                    <th>Observed</th>
-                    <th>Expected</th>
-                </tr>
-                """
-                
-                for i, (cat_name, obs_val, exp_val) in enumerate(zip(category_names, observed, expected)):
-                    table_html += f"""
-                <tr>
-                    <td>{cat_name}</td>
-                    <td>{obs_val:.2f}</td>
-                    <td>{exp_val:.2f}</td>
-                </tr>
-                """
-                
-                table_html += "</table>"
-                st.markdown(table_html, unsafe_allow_html=True)
-
-            elif selected_ht_type == 'Chi-Square Test of Independence':
-                if params.get('chi2_ind_input_type') == 'raw_data':
-                    # Process raw data
-                    if not params.get('row_variable') or not params.get('col_variable'):
-                        raise ValueError("Please select both row and column variables.")
-                    
-                    df_name_row, col_name_row = params['row_variable'].split(': ', 1)
-                    df_name_col, col_name_col = params['col_variable'].split(': ', 1)
-                    
-                    if df_name_row != df_name_col:
-                        raise ValueError("Both variables must come from the same DataFrame.")
-                    
-                    df = st.session_state.global_dataframes.get(df_name_row)
-                    if df is None:
-                        raise ValueError(f"DataFrame '{df_name_row}' not found.")
-                    
-                    # Create contingency table from raw data
-                    contingency_table = pd.crosstab(df[col_name_row], df[col_name_col])
-                    table = contingency_table.values.tolist()
-                    
-                    test_statistic, p_value, degrees_freedom, expected_frequencies = chi_square_test_of_independence(table)
-                    
-                    st.write(f"**Observed Frequencies:**")
-                    contingency_table.index.name = None
-                    contingency_table.columns.name = None
-                    show_table(contingency_table)
-                    
-                    expected_df = pd.DataFrame(
-                        expected_frequencies, 
-                        index=contingency_table.index, 
-                        columns=contingency_table.columns
-                    )
-                    expected_df.index.name = None
-                    expected_df.columns.name = None
-                    st.write(f"**Expected Frequencies:**")
-                    show_table(expected_df.round(2))
-                    st.write(f"**Degrees of Freedom:** {degrees_freedom}")
-                    
-                else:
-                    # Process summary statistics (contingency table input)
-                    rows = params['contingency_table'].split(';')
-                    table = []
-                    for row in rows:
-                        table.append([float(val.strip()) for val in row.split(',')])
-                    test_statistic, p_value, degrees_freedom, expected_frequencies = chi_square_test_of_independence(table)
-                    
-                    # Create labeled DataFrames using user-provided row and column names
-                    row_names = params.get('row_names', [f"Row {i+1}" for i in range(len(table))])
-                    col_names = params.get('col_names', [f"Col {j+1}" for j in range(len(table[0]))])
-                    
-                    observed_df = pd.DataFrame(table, index=row_names, columns=col_names)
-                    expected_df = pd.DataFrame(expected_frequencies, index=row_names, columns=col_names)
-                    
-                    st.write(f"**Observed Frequencies:**")
-                    show_table(observed_df)
-                    st.write(f"**Expected Frequencies:**")
-                    show_table(expected_df.round(2))
-                    st.write(f"**Degrees of Freedom:** {degrees_freedom}")
-
-            elif selected_ht_type == 'ANOVA (Analysis of Variance) F-test':
-                group_data = []
-                for i, col_string in enumerate(params['group_data_cols']):
-                    if col_string:
-                        try:
-                            data = get_data_from_col_string(col_string)
-                            if len(data) < 2:
-                                raise ValueError(f"Group {i+1} has only {len(data)} observation(s). At least 2 observations are required.")
-                            group_data.append(data)
-                        except Exception as e:
-                            raise ValueError(f"Error loading Group {i+1} data: {str(e)}")
-                
-                if len(group_data) < 2:
-                    raise ValueError("ANOVA requires at least two groups with data.")
-                test_statistic, p_value = anova_f_test(*group_data)
-                for i, data in enumerate(group_data):
-                    st.write(f"Group {i+1} Mean: {np.mean(data):.4f} (N={len(data)}) ")
-
-            if test_statistic is not None and p_value is not None:
-                st.write(f"**Test Statistic**: {test_statistic:.4f}")
-                if p_value < 0.0001:
-                    st.write(f"**P-value**: <.0001")
-                else:
-                    st.write(f"**P-value**: {p_value:.4f}")
-                
-                # Create visualization
-                st.write("**Visualization**")
-                fig, ax = plt.subplots(figsize=(10, 6))
-                
-                # Determine the distribution and plot accordingly
-                if selected_ht_type in ['One-Sample t-test', 'Two-Sample t-test (Independent Samples)', 'Paired t-test']:
-                    # t-distribution - convert to original scale
-                    if selected_ht_type == 'One-Sample t-test':
-                        if input_method == 'Raw Data':
-                            data = get_data_from_col_string(params['sample_data'])
-                            df = len(data) - 1
-                            sample_mean = np.mean(data)
-                            se = np.std(data, ddof=1) / np.sqrt(len(data))
-                        else:
-                            df = params['sample_size'] - 1
-                            sample_mean = params['sample_mean']
-                            se = params['sample_std_dev'] / np.sqrt(params['sample_size'])
-                        
-                        mu0 = params['hypothesized_mean']
-                        # Convert t-scores to original scale
-                        t_range = np.linspace(-4, 4, 1000)
-                        x_original = mu0 + t_range * se
-                        # Scale the density appropriately
-                        y = stats.t.pdf(t_range, df) / se
-                        ax.plot(x_original, y, 'b-', linewidth=2, label=f't-distribution (df={df})')
-                        
-                        # Get actual sample mean value
-                        actual_value = sample_mean
-                        
-                    elif selected_ht_type == 'Two-Sample t-test (Independent Samples)':
-                        if input_method == 'Raw Data':
-                            data1 = get_data_from_col_string(params['sample_data1'])
-                            data2 = get_data_from_col_string(params['sample_data2'])
-                            n1, n2 = len(data1), len(data2)
-                            df = n1 + n2 - 2
-                            mean1, mean2 = np.mean(data1), np.mean(data2)
-                            if params['equal_variances']:
-                                s1, s2 = np.std(data1, ddof=1), np.std(data2, ddof=1)
-                                sp = np.sqrt(((n1-1)*s1**2 + (n2-1)*s2**2) / df)
-                                se = sp * np.sqrt(1/n1 + 1/n2)
-                            else:
-                                se = np.sqrt(np.var(data1, ddof=1)/n1 + np.var(data2, ddof=1)/n2)
-                        else:
-                            df = params['sample1_size'] + params['sample2_size'] - 2
-                            mean1, mean2 = params['sample1_mean'], params['sample2_mean']
-                            n1, n2 = params['sample1_size'], params['sample2_size']
-                            if params['equal_variances']:
-                                sp = np.sqrt(((n1-1)*params['sample1_std_dev']**2 + (n2-1)*params['sample2_std_dev']**2) / df)
-                                se = sp * np.sqrt(1/n1 + 1/n2)
-                            else:
-                                se = np.sqrt(params['sample1_std_dev']**2/n1 + params['sample2_std_dev']**2/n2)
-                        
-                        # Convert t-scores to difference in means scale
-                        t_range = np.linspace(-4, 4, 1000)
-                        x_original = t_range * se  # centered at 0 for H0: μ1 - μ2 = 0
-                        y = stats.t.pdf(t_range, df) / se
-                        ax.plot(x_original, y, 'b-', linewidth=2, label=f't-distribution (df={df})')
-                        
-                        actual_value = mean1 - mean2
-                        
-                    else:  # Paired t-test
-                        if input_method == 'Raw Data':
-                            data1 = get_data_from_col_string(params['sample_data1'])
-                            data2 = get_data_from_col_string(params['sample_data2'])
-                            differences = np.array(data1) - np.array(data2)
-                            df = len(differences) - 1
-                            mean_diff = np.mean(differences)
-                            se = np.std(differences, ddof=1) / np.sqrt(len(differences))
-                        else:
-                            df = params['sample_size_difference'] - 1
-                            mean_diff = params['mean_difference']
-                            se = params['std_dev_difference'] / np.sqrt(params['sample_size_difference'])
-                        
-                        # Convert t-scores to difference scale
-                        t_range = np.linspace(-4, 4, 1000)
-                        x_original = t_range * se  # centered at 0 for H0: μd = 0
-                        y = stats.t.pdf(t_range, df) / se
-                        ax.plot(x_original, y, 'b-', linewidth=2, label=f't-distribution (df={df})')
-                        
-                        actual_value = mean_diff
-                    
-                    # Determine critical values and shade regions on original scale
-                    if params['alternative'] == 'two-sided':
-                        critical_low_t = stats.t.ppf(alpha_level/2, df)
-                        critical_high_t = stats.t.ppf(1 - alpha_level/2, df)
-                        
-                        if selected_ht_type == 'One-Sample t-test':
-                            critical_low = mu0 + critical_low_t * se
-                            critical_high = mu0 + critical_high_t * se
-                            x_left = np.linspace(x_original.min(), critical_low, 100)
-                            x_right = np.linspace(critical_high, x_original.max(), 100)
-                        else:
-                            critical_low = critical_low_t * se
-                            critical_high = critical_high_t * se
-                            x_left = np.linspace(x_original.min(), critical_low, 100)
-                            x_right = np.linspace(critical_high, x_original.max(), 100)
-                        
-                        t_left = (x_left - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                        t_right = (x_right - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                        ax.fill_between(x_left, stats.t.pdf(t_left, df) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
-                        ax.fill_between(x_right, stats.t.pdf(t_right, df) / se, alpha=0.3, color='red')
-                        
-                        # Shade p-value region
-                        if actual_value < (mu0 if selected_ht_type == 'One-Sample t-test' else 0):
-                            x_pval_left = np.linspace(x_original.min(), actual_value, 100)
-                            t_pval_left = (x_pval_left - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                            ax.fill_between(x_pval_left, stats.t.pdf(t_pval_left, df) / se, alpha=0.5, color='yellow', label=f'p-value region')
-                            
-                            mirror_value = 2*(mu0 if selected_ht_type == 'One-Sample t-test' else 0) - actual_value
-                            x_pval_right = np.linspace(mirror_value, x_original.max(), 100)
-                            t_pval_right = (x_pval_right - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                            ax.fill_between(x_pval_right, stats.t.pdf(t_pval_right, df) / se, alpha=0.5, color='yellow')
-                        else:
-                            mirror_value = 2*(mu0 if selected_ht_type == 'One-Sample t-test' else 0) - actual_value
-                            x_pval_left = np.linspace(x_original.min(), mirror_value, 100)
-                            t_pval_left = (x_pval_left - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                            ax.fill_between(x_pval_left, stats.t.pdf(t_pval_left, df) / se, alpha=0.5, color='yellow', label=f'p-value region')
-                            
-                            x_pval_right = np.linspace(actual_value, x_original.max(), 100)
-                            t_pval_right = (x_pval_right - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                            ax.fill_between(x_pval_right, stats.t.pdf(t_pval_right, df) / se, alpha=0.5, color='yellow')
-                            
-                    elif params['alternative'] == 'greater':
-                        critical_val_t = stats.t.ppf(1 - alpha_level, df)
-                        if selected_ht_type == 'One-Sample t-test':
-                            critical_val = mu0 + critical_val_t * se
-                        else:
-                            critical_val = critical_val_t * se
-                        
-                        x_crit = np.linspace(critical_val, x_original.max(), 100)
-                        t_crit = (x_crit - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                        ax.fill_between(x_crit, stats.t.pdf(t_crit, df) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
-                        
-                        x_pval = np.linspace(actual_value, x_original.max(), 100)
-                        t_pval = (x_pval - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                        ax.fill_between(x_pval, stats.t.pdf(t_pval, df) / se, alpha=0.5, color='yellow', label=f'p-value region')
-                        
-                    else:  # less
-                        critical_val_t = stats.t.ppf(alpha_level, df)
-                        if selected_ht_type == 'One-Sample t-test':
-                            critical_val = mu0 + critical_val_t * se
-                        else:
-                            critical_val = critical_val_t * se
-                        
-                        x_crit = np.linspace(x_original.min(), critical_val, 100)
-                        t_crit = (x_crit - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                        ax.fill_between(x_crit, stats.t.pdf(t_crit, df) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
-                        
-                        x_pval = np.linspace(x_original.min(), actual_value, 100)
-                        t_pval = (x_pval - (mu0 if selected_ht_type == 'One-Sample t-test' else 0)) / se
-                        ax.fill_between(x_pval, stats.t.pdf(t_pval, df) / se, alpha=0.5, color='yellow', label=f'p-value region')
-                    
-                    # Mark test statistic on original scale
-                    ax.axvline(actual_value, color='green', linestyle='--', linewidth=2, label=f'Sample statistic = {actual_value:.3f}')
-                    
-                    if selected_ht_type == 'One-Sample t-test':
-                        ax.set_xlabel('Mean (μ)')
-                        ax.axvline(mu0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label=f'H₀: μ = {mu0}')
-                    elif selected_ht_type == 'Two-Sample t-test (Independent Samples)':
-                        ax.set_xlabel('Difference in Means (μ₁ - μ₂)')
-                        ax.axvline(0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label='H₀: μ₁ - μ₂ = 0')
-                    else:
-                        ax.set_xlabel('Mean Difference (μd)')
-                        ax.axvline(0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label='H₀: μd = 0')
-                    
-                    ax.set_ylabel('Probability Density')
-                    ax.set_title(f'{selected_ht_type} Visualization')
-                    
-                elif selected_ht_type in ['One-Sample Z-test for Proportions', 'Two-Sample Z-test for Proportions']:
-                    # Standard normal distribution - convert to proportion scale
-                    if selected_ht_type == 'One-Sample Z-test for Proportions':
-                        p0 = params['hypothesized_proportion']
-                        n = params['num_trials']
-                        p_hat = params['num_successes'] / n
-                        se = np.sqrt(p0 * (1 - p0) / n)
-                        
-                        # Convert z-scores to proportion scale
-                        z_range = np.linspace(-4, 4, 1000)
-                        x_original = p0 + z_range * se
-                        # Clip to valid proportion range [0, 1]
-                        x_original = np.clip(x_original, 0, 1)
-                        y = stats.norm.pdf(z_range) / se
-                        ax.plot(x_original, y, 'b-', linewidth=2, label='Normal Approximation')
-                        
-                        actual_value = p_hat
-                        center = p0
-                        
-                    else:  # Two-Sample Z-test for Proportions
-                        p1_hat = params['num_successes1'] / params['num_trials1']
-                        p2_hat = params['num_successes2'] / params['num_trials2']
-                        n1, n2 = params['num_trials1'], params['num_trials2']
-                        
-                        # Pooled proportion under H0
-                        p_pool = (params['num_successes1'] + params['num_successes2']) / (n1 + n2)
-                        se = np.sqrt(p_pool * (1 - p_pool) * (1/n1 + 1/n2))
-                        
-                        # Convert z-scores to difference in proportions scale
-                        z_range = np.linspace(-4, 4, 1000)
-                        x_original = z_range * se  # centered at 0 for H0: p1 - p2 = 0
-                        # Clip to valid range [-1, 1]
-                        x_original = np.clip(x_original, -1, 1)
-                        y = stats.norm.pdf(z_range) / se
-                        ax.plot(x_original, y, 'b-', linewidth=2, label='Normal Approximation')
-                        
-                        actual_value = p1_hat - p2_hat
-                        center = 0
-                    
-                    # Determine critical values and shade regions on original scale
-                    if params['alternative'] == 'two-sided':
-                        critical_low_z = stats.norm.ppf(alpha_level/2)
-                        critical_high_z = stats.norm.ppf(1 - alpha_level/2)
-                        
-                        critical_low = center + critical_low_z * se
-                        critical_high = center + critical_high_z * se
-                        
-                        x_left = np.linspace(x_original.min(), critical_low, 100)
-                        x_right = np.linspace(critical_high, x_original.max(), 100)
-                        
-                        z_left = (x_left - center) / se
-                        z_right = (x_right - center) / se
-                        ax.fill_between(x_left, stats.norm.pdf(z_left) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
-                        ax.fill_between(x_right, stats.norm.pdf(z_right) / se, alpha=0.3, color='red')
-                        
-                        # Shade p-value region
-                        if actual_value < center:
-                            x_pval_left = np.linspace(x_original.min(), actual_value, 100)
-                            z_pval_left = (x_pval_left - center) / se
-                            ax.fill_between(x_pval_left, stats.norm.pdf(z_pval_left) / se, alpha=0.5, color='yellow', label=f'p-value region')
-                            
-                            mirror_value = 2*center - actual_value
-                            x_pval_right = np.linspace(mirror_value, x_original.max(), 100)
-                            z_pval_right = (x_pval_right - center) / se
-                            ax.fill_between(x_pval_right, stats.norm.pdf(z_pval_right) / se, alpha=0.5, color='yellow')
-                        else:
-                            mirror_value = 2*center - actual_value
-                            x_pval_left = np.linspace(x_original.min(), mirror_value, 100)
-                            z_pval_left = (x_pval_left - center) / se
-                            ax.fill_between(x_pval_left, stats.norm.pdf(z_pval_left) / se, alpha=0.5, color='yellow', label=f'p-value region')
-                            
-                            x_pval_right = np.linspace(actual_value, x_original.max(), 100)
-                            z_pval_right = (x_pval_right - center) / se
-                            ax.fill_between(x_pval_right, stats.norm.pdf(z_pval_right) / se, alpha=0.5, color='yellow')
-                            
-                    elif params['alternative'] == 'greater':
-                        critical_val_z = stats.norm.ppf(1 - alpha_level)
-                        critical_val = center + critical_val_z * se
-                        
-                        x_crit = np.linspace(critical_val, x_original.max(), 100)
-                        z_crit = (x_crit - center) / se
-                        ax.fill_between(x_crit, stats.norm.pdf(z_crit) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
-                        
-                        x_pval = np.linspace(actual_value, x_original.max(), 100)
-                        z_pval = (x_pval - center) / se
-                        ax.fill_between(x_pval, stats.norm.pdf(z_pval) / se, alpha=0.5, color='yellow', label=f'p-value region')
-                        
-                    else:  # less
-                        critical_val_z = stats.norm.ppf(alpha_level)
-                        critical_val = center + critical_val_z * se
-                        
-                        x_crit = np.linspace(x_original.min(), critical_val, 100)
-                        z_crit = (x_crit - center) / se
-                        ax.fill_between(x_crit, stats.norm.pdf(z_crit) / se, alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
-                        
-                        x_pval = np.linspace(x_original.min(), actual_value, 100)
-                        z_pval = (x_pval - center) / se
-                        ax.fill_between(x_pval, stats.norm.pdf(z_pval) / se, alpha=0.5, color='yellow', label=f'p-value region')
-                    
-                    # Mark test statistic on original scale
-                    ax.axvline(actual_value, color='green', linestyle='--', linewidth=2, label=f'Sample statistic = {actual_value:.4f}')
-                    
-                    if selected_ht_type == 'One-Sample Z-test for Proportions':
-                        ax.set_xlabel('Proportion (p)')
-                        ax.axvline(p0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label=f'H₀: p = {p0}')
-                    else:
-                        ax.set_xlabel('Difference in Proportions (p₁ - p₂)')
-                        ax.axvline(0, color='gray', linestyle=':', linewidth=1.5, alpha=0.7, label='H₀: p₁ - p₂ = 0')
-                    
-                    ax.set_ylabel('Probability Density')
-                    ax.set_title(f'{selected_ht_type} Visualization')
-                    
-                elif selected_ht_type == 'Chi-Square Goodness-of-Fit Test' or selected_ht_type == 'Chi-Square Test of Independence':
-                    # Chi-square distribution
-                    if selected_ht_type == 'Chi-Square Goodness-of-Fit Test':
-                        df = len([float(x.strip()) for x in params['observed_frequencies'].split(',') if x.strip()]) - 1
-                    else:
-                        df = degrees_freedom
-                    
-                    x = np.linspace(0, max(test_statistic * 1.5, stats.chi2.ppf(0.999, df)), 1000)
-                    y = stats.chi2.pdf(x, df)
-                    ax.plot(x, y, 'b-', linewidth=2, label=f'Chi-square distribution (df={df})')
-                    
-                    # Critical value (always right-tailed for chi-square)
-                    critical_val = stats.chi2.ppf(1 - alpha_level, df)
-                    x_crit = np.linspace(critical_val, max(test_statistic * 1.5, stats.chi2.ppf(0.999, df)), 100)
-                    ax.fill_between(x_crit, stats.chi2.pdf(x_crit, df), alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
-                    
-                    # Shade p-value region
-                    x_pval = np.linspace(test_statistic, max(test_statistic * 1.5, stats.chi2.ppf(0.999, df)), 100)
-                    ax.fill_between(x_pval, stats.chi2.pdf(x_pval, df), alpha=0.5, color='yellow', label=f'p-value region')
-                    
-                    ax.axvline(test_statistic, color='green', linestyle='--', linewidth=2, label=f'Test statistic = {test_statistic:.3f}')
-                    ax.set_xlabel('χ² value')
-                    ax.set_ylabel('Probability Density')
-                    ax.set_title(f'{selected_ht_type} Visualization')
-                    
-                elif selected_ht_type == 'ANOVA (Analysis of Variance) F-test':
-                    # F-distribution
-                    k = len(params['group_data_cols'])  # number of groups
-                    n = sum(len(get_data_from_col_string(col)) for col in params['group_data_cols'] if col)
-                    df1 = k - 1  # between groups
-                    df2 = n - k  # within groups
-                    
-                    x = np.linspace(0, max(test_statistic * 1.5, stats.f.ppf(0.999, df1, df2)), 1000)
-                    y = stats.f.pdf(x, df1, df2)
-                    ax.plot(x, y, 'b-', linewidth=2, label=f'F-distribution (df1={df1}, df2={df2})')
-                    
-                    # Critical value (always right-tailed for F-test)
-                    critical_val = stats.f.ppf(1 - alpha_level, df1, df2)
-                    x_crit = np.linspace(critical_val, max(test_statistic * 1.5, stats.f.ppf(0.999, df1, df2)), 100)
-                    ax.fill_between(x_crit, stats.f.pdf(x_crit, df1, df2), alpha=0.3, color='red', label=f'Rejection region (α={alpha_level})')
-                    
-                    # Shade p-value region
-                    x_pval = np.linspace(test_statistic, max(test_statistic * 1.5, stats.f.ppf(0.999, df1, df2)), 100)
-                    ax.fill_between(x_pval, stats.f.pdf(x_pval, df1, df2), alpha=0.5, color='yellow', label=f'p-value region')
-                    
-                    ax.axvline(test_statistic, color='green', linestyle='--', linewidth=2, label=f'Test statistic = {test_statistic:.3f}')
-                    ax.set_xlabel('F-value')
-                    ax.set_ylabel('Probability Density')
-                    ax.set_title(f'{selected_ht_type} Visualization')
-                
-                ax.legend(loc='best')
-                ax.grid(True, alpha=0.3)
-                st.pyplot(fig)
-                plt.close()
-            else:
-                st.warning("Could not complete the hypothesis test. Check inputs and test type.")
+def render_sheets_load_status(job):
+    """Show a running load with a Cancel button, rerunning the page once it finishes."""
+    @st.fragment(run_every=SHEETS_STATUS_POLL_SECONDS)
+    def sheets_load_status():
+        futures = job['futures']
+        if all(future.done() for future in futures.values()):
+            st.rerun()
+        received_bytes = sum(tab['bytes'] for tab in job['progress'])
+        totals = [tab['total'] for tab in job['progress']]
+        elapsed = time.monotonic() - job['started']
+        received = f"{received_bytes / 1e6:.1f} MB" if received_bytes else "waiting for response"
+        if all(totals):
+            st.progress(min(received_bytes / sum(totals), 1.0))
+        if len(futures) > 1:
+            finished = sum(future.done() for future in futures.values())
+            received = f"{finished} of {len(futures)} tabs, {received}"
+        st.info(f"⏳ Loading data from Google Sheets... ({received}, {elapsed:.0f}s)")
+        if st.button("Cancel loading", key="cancel_sheets_load"):
+            job['cancel'].set()
+            st.session_state.pop('sheets_load_job', None)
+            st.session_state.sheets_load_cancelled = job['origin']
+            st.rerun()
 
-        except ValueError as ve:
-            st.error(f"Input Error: {ve}")
-        except Exception as e:
-            st.error(f"An unexpected error occurred: {e}")
+    sheets_load_status()
 
-elif selected_tab == "Visualizations":
-    st.header("Visualizations")
 
-    if not st.session_state.global_dataframes:
-        st.info("Please load or enter data in the 'Data Input' tab first to generate visualizations.")
-    else:
-        plot_type = st.selectbox(
-            "Select Plot Type",
-            options=['Histogram', 'Boxplot', 'Bar Plot', 'Dot Plot', 'Scatter Plot'],
-            key="plot_type_select"
-        )
+def describe_sheets_load_error(error):
+    """Return the message shown for a failed Google Sheets download."""
+    if isinstance(error, pd.errors.ParserError):
+        return f"Unable to parse the data from Google Sheets. {error}"
+    if isinstance(error, TimeoutError) or isinstance(getattr(error, 'reason', None), TimeoutError):
+        return (f"Google Sheets did not respond in time (connect timeout {SHEETS_CONNECT_TIMEOUT_SECONDS:g}s, "
+                f"read timeout {SHEETS_READ_TIMEOUT_SECONDS:g}s). Please try again.")
+    return f"Error loading Google Sheets: {error}"
 
-        numeric_cols_options = [''] + get_numeric_columns()
-        all_cols_options = [''] + get_all_columns()
 
-        x_axis_col = None
-        y_axis_col = None
-        plot_options = {}
+def poll_google_sheets_load(origin):
+    """Return (datasets, error) once a load started from `origin` has finished.
 
-        if plot_type in ['Histogram', 'Boxplot', 'Dot Plot']:
-            if plot_type == 'Boxplot':
-                plot_options['multiple'] = st.checkbox("Plot multiple boxplots", value=False, key="boxplot_multiple")
-                if plot_options['multiple']:
-                    x_axis_col = st.multiselect("Select Data Columns", options=numeric_cols_options[1:], key="x_axis_select_multiple_numeric")
-                else:
-                    x_axis_col = st.selectbox("Select Data Column", options=numeric_cols_options, key="x_axis_select_single_numeric")
-                plot_options['horizontal'] = st.radio("Orientation:", options=['Vertical', 'Horizontal'], index=0, key="boxplot_orientation") == 'Horizontal'
-            else:
-                x_axis_col = st.selectbox("Select Data Column", options=numeric_cols_options, key="x_axis_select_single_numeric")
-            if plot_type == 'Histogram':
-                # Calculate optimal number of bins using Sturges' rule
-                optimal_bins = 'auto'  # Default to matplotlib's auto binning
-                if x_axis_col:
-                    try:
-                        data_for_bins = get_data_from_col_string(x_axis_col)
-                        n = len(data_for_bins)
-                        # Sturges' rule: k = ceil(log2(n) + 1)
-                        optimal_bins = int(np.ceil(np.log2(n) + 1))
-                    except:
-                        optimal_bins = 'auto'
-                
-                # Allow user to override with manual bin count or use 'auto'
-                if isinstance(optimal_bins, int):
-                    plot_options['bins'] = st.number_input("Number of Bins", min_value=1, max_value=100, value=optimal_bins, step=1, key="hist_bins")
-                else:
-                    # Use auto as default, but provide option to manually specify
-                    manual_bins = st.checkbox("Manually specify number of bins", value=False, key="manual_bins_checkbox")
-                    if manual_bins:
-                        plot_options['bins'] = st.number_input("Number of Bins", min_value=1, max_value=100, value=10, step=1, key="hist_bins")
-                    else:
-                        plot_options['bins'] = 'auto'
-                        st.caption("Using automatic bin selection (Sturges' rule)")
-                
-                plot_options['force_integer_bins'] = st.checkbox("Use integer bin boundaries", value=False, key="force_integer_bins")
-                plot_options['use_relative'] = st.radio("Y-axis:", options=['Frequency', 'Relative Frequency'], index=0, key="hist_yaxis") == 'Relative Frequency'
-        elif plot_type == 'Bar Plot':
-            x_axis_col = st.selectbox("Select Data Column (Categorical/Numeric)", options=all_cols_options, key="x_axis_select_single_all")
-            plot_options['stacked'] = st.radio("Bar Style:", options=['Unstacked (Grouped)', 'Stacked'], index=0, key="bar_plot_style") == 'Stacked'
-            plot_options['use_relative'] = st.radio("Y-axis:", options=['Frequency', 'Relative Frequency'], index=0, key="bar_plot_yaxis") == 'Relative Frequency'
-        elif plot_type == 'Scatter Plot':
-            col1, col2 = st.columns(2)
-            with col1:
-                x_axis_col = st.selectbox("Select X-axis Variable", options=numeric_cols_options, key="x_axis_select_scatter")
-            with col2:
-                y_axis_col = st.selectbox("Select Y-axis Variable", options=numeric_cols_options, key="y_axis_select_scatter")
-
-        if st.button("Generate Plot", key="generate_plot_button"):
-            st.subheader("Generated Plot")
-            try:
-                fig = None
-                boxplot_stats = None
-                labels = None
-                if plot_type == 'Histogram':
-                    if not x_axis_col: raise ValueError("Please select a data column for the histogram.")
-                    data = get_data_from_col_string(x_axis_col)
-                    # Extract column name - handle both "key: value" format and plain column names
-                    col_label = x_axis_col.split(": ", 1)[1] if ": " in x_axis_col else x_axis_col
-                    fig = plot_histogram(data, bins=plot_options['bins'], title=f'Histogram of {col_label}', xlabel=col_label, use_relative=plot_options.get('use_relative', False), force_integer_bins=plot_options.get('force_integer_bins', False))
-                elif plot_type == 'Boxplot':
-                    if not x_axis_col: raise ValueError("Please select at least one data column for the boxplot.")
-                    if plot_options.get('multiple', False):
-                        # Multiple boxplots
-                        if isinstance(x_axis_col, list) and len(x_axis_col) > 0:
-                            data_list = [get_data_from_col_string(col) for col in x_axis_col]
-                            labels = [col.split(": ", 1)[1] if ": " in col else col for col in x_axis_col]
-                            fig = plot_box_plot(data_list, title='Box Plots Comparison', ylabel='Value', horizontal=plot_options.get('horizontal', False), labels=labels)
-                            boxplot_stats = get_boxplot_statistics(data_list)
-                        else:
-                            raise ValueError("Please select at least one data column for the boxplot.")
-                    else:
-                        # Single boxplot
-                        data = get_data_from_col_string(x_axis_col)
-                        col_label = x_axis_col.split(": ", 1)[1] if ": " in x_axis_col else x_axis_col
-                        fig = plot_box_plot(data, title=f'Box Plot of {col_label}', ylabel=col_label, horizontal=plot_options.get('horizontal', False))
-                        boxplot_stats = get_boxplot_statistics(data)
-                elif plot_type == 'Bar Plot':
-                    if not x_axis_col: raise ValueError("Please select a data column for the bar plot.")
-                    # Get data using the active dataframe
-                    df = st.session_state.global_dataframes.get('active_data')
-                    if df is None: raise ValueError("No active dataframe found. Please load data first.")
-                    if x_axis_col not in df.columns: raise ValueError(f"Column '{x_axis_col}' not found in active dataframe.")
-                    data = df[x_axis_col].dropna() # Bar plot can use non-numeric directly
-                    if data.empty: raise ValueError(f"Selected column '{x_axis_col}' is empty after dropping NaNs.")
-                    fig = plot_bar_plot(data, title=f'Bar Plot of {x_axis_col}', xlabel=x_axis_col, stacked=plot_options.get('stacked', False), use_relative=plot_options.get('use_relative', False))
-                elif plot_type == 'Dot Plot':
-                    if not x_axis_col: raise ValueError("Please select a data column for the dot plot.")
-                    data = get_data_from_col_string(x_axis_col)
-                    col_label = x_axis_col.split(": ", 1)[1] if ": " in x_axis_col else x_axis_col
-                    fig = plot_dot_plot(data, title=f'Dot Plot of {col_label}', xlabel=col_label)
-                elif plot_type == 'Scatter Plot':
-                    if not x_axis_col or not y_axis_col: raise ValueError("Please select both X and Y axis variables.")
-                    
-                    source_df = st.session_state.global_dataframes.get('active_data')
-                    if source_df is None: raise ValueError("No active dataframe found. Please load data first.")
-                    
-                    if x_axis_col not in source_df.columns: raise ValueError(f"Column '{x_axis_col}' not found in active dataframe.")
-                    if y_axis_col not in source_df.columns: raise ValueError(f"Column '{y_axis_col}' not found in active dataframe.")
-
-                    combined_series = pd.DataFrame({
-                        'x_val': pd.to_numeric(source_df[x_axis_col], errors='coerce'),
-                        'y_val': pd.to_numeric(source_df[y_axis_col], errors='coerce')
-                    }).dropna()
-
-                    if combined_series.empty:
-                        raise ValueError("No common numeric data points found for X and Y axes after cleaning.")
-                    
-                    fig = plot_scatter_plot(combined_series['x_val'], combined_series['y_val'], title=f'Scatter Plot: {x_axis_col} vs {y_axis_col}', xlabel=x_axis_col, ylabel=y_axis_col)
-
-                if fig is not None:
-                    st.plotly_chart(fig, use_container_width=True, config=PLOTLY_CONFIG)
-                    
-                    # Display boxplot statistics if applicable
-                    if plot_type == 'Boxplot' and boxplot_stats is not None:
-                        st.markdown("---")
-                        st.subheader("📊 Boxplot Statistics")
-                        
-                        if isinstance(boxplot_stats, list):
-                            # Multiple boxplots
-                            for i, stats in enumerate(boxplot_stats):
-                                label = labels[i] if labels and i < len(labels) else f"Dataset {i+1}"
-                                with st.expander(f"📈 {label}", expanded=(i==0)):
-                                    metrics = [
-                                        (
-                                            "Outlier Min" if stats['outlier_min'] is not None else "Minimum",
-                                            stats['outlier_min'] if stats['outlier_min'] is not None else stats['min']
-                                        ),
-                                        ("Q1", stats['q1']),
-                                        ("Median", stats['median']),
-                                        ("Q3", stats['q3']),
-                                        (
-                                            "Outlier Max" if stats['outlier_max'] is not None else "Maximum",
-                                            stats['outlier_max'] if stats['outlier_max'] is not None else stats['max']
-                                        )
-                                    ]
-                                    cols = st.columns(len(metrics))
-                                    for col, (metric_label, metric_value) in zip(cols, metrics):
-                                        with col:
-                                            st.metric(metric_label, format_decimal(metric_value))
-                        else:
-                            # Single boxplot
-                            metrics = [
-                                (
-                                    "Outlier Min" if boxplot_stats['outlier_min'] is not None else "Minimum",
-                                    boxplot_stats['outlier_min'] if boxplot_stats['outlier_min'] is not None else boxplot_stats['min']
-                                ),
-                                ("Q1", boxplot_stats['q1']),
-                                ("Median", boxplot_stats['median']),
-                                ("Q3", boxplot_stats['q3']),
-                                (
-                                    "Outlier Max" if boxplot_stats['outlier_max'] is not None else "Maximum",
-                                    boxplot_stats['outlier_max'] if boxplot_stats['outlier_max'] is not None else boxplot_stats['max']
-                                )
-                            ]
-                            cols = st.columns(len(metrics))
-                            for col, (metric_label, metric_value) in zip(cols, metrics):
-                                with col:
-                                    st.metric(metric_label, format_decimal(metric_value))
-
-            except ValueError as ve:
-                st.error(f"Plotting Error: {ve}")
-            except Exception as e:
-                st.error(f"An unexpected error occurred during plotting: {e}")
-
-elif selected_tab == "Linear Regression":
-    st.header("Linear Regression")
-
-    if not st.session_state.global_dataframes:
-        st.info("Please load or enter data in the 'Data Input' tab first to perform linear regression.")
-    else:
-        numeric_cols_options = [''] + get_numeric_columns()
-
-        col1, col2 = st.columns(2)
-        with col1:
-            lr_x_axis_selector = st.selectbox("Select X-axis Variable (Independent)", options=numeric_cols_options, key="lr_x_axis_select")
-        with col2:
-            lr_y_axis_selector = st.selectbox("Select Y-axis Variable (Dependent)", options=numeric_cols_options, key="lr_y_axis_select")
-
-        if st.button("Calculate Linear Regression", key="calc_lr_button"):
-            st.subheader("Linear Regression Results")
-            try:
-                if not lr_x_axis_selector: raise ValueError("Please select an X-axis variable.")
-                if not lr_y_axis_selector: raise ValueError("Please select a Y-axis variable.")
-
-                source_df = st.session_state.global_dataframes.get('active_data')
-                if source_df is None: raise ValueError("No active dataframe found. Please load data first.")
-
-                if lr_x_axis_selector not in source_df.columns: raise ValueError(f"Column '{lr_x_axis_selector}' not found in active dataframe.")
-                if lr_y_axis_selector not in source_df.columns: raise ValueError(f"Column '{lr_y_axis_selector}' not found in active dataframe.")
-
-                # Ensure that x_data and y_data correspond to the same rows after cleaning
-                # This is important if original DataFrame had NaNs at different positions.
-                # Re-create a temporary DataFrame to align indices and drop NaNs commonly.
-                combined_data = pd.DataFrame({'x': pd.to_numeric(source_df[lr_x_axis_selector], errors='coerce'),
-                                              'y': pd.to_numeric(source_df[lr_y_axis_selector], errors='coerce')}).dropna()
-                if combined_data.empty:
-                    raise ValueError("No common numeric data points found for X and Y axes after cleaning.")
-
-                cleaned_x = combined_data['x']
-                cleaned_y = combined_data['y']
-
-                r_value, r_squared, regression_equation, fig = perform_linear_regression_analysis(
-                    cleaned_x, cleaned_y,
-                    title=f'Linear Regression: {lr_y_axis_selector} vs {lr_x_axis_selector}',
-                    xlabel=lr_x_axis_selector, ylabel=lr_y_axis_selector
-                )
+    `datasets` maps dataset names to the loaded ActiveDatasets, which also become
+    the session's datasets. Returns (None, None) when there is nothing to collect
+    yet; while the load runs, its status is shown in place and the rest of the page
+    keeps rendering.
+    """
+    if st.session_state.get('sheets_load_cancelled') == origin:
+        del st.session_state['sheets_load_cancelled']
+        st.info("Loading from Google Sheets was cancelled.")
+        return None, None
+    job = st.session_state.get('sheets_load_job')
+    if job is None or job['origin'] != origin:
+        return None, None
+    futures = job['futures']
+    if not all(future.done() for future in futures.values()):
+        if hasattr(st, 'fragment'):
+            render_sheets_load_status(job)
+            return None, None
+        # Streamlit without fragments cannot poll, so wait for the workers here
+        with st.spinner("Loading data from Google Sheets..."):
+            concurrent.futures.wait(list(futures.values()))
+    del st.session_state['sheets_load_job']
 
-                st.write(f"**Correlation Coefficient (r)**: {r_value:.4f}")
-                st.write(f"**Coefficient of Determination (R²)**: {r_squared:.4f}")
-                st.write(f"**Regression Equation**: {regression_equation}")
-                st.pyplot(fig)
-                # Accessibility: Add text alternative for screen readers
-                st.caption(f"Linear regression scatter plot with fitted line. X-axis: {lr_x_axis_selector}, Y-axis: {lr_y_axis_selector}. "
-                          f"Correlation r={r_value:.4f}, R²={r_squared:.4f}. {regression_equation}")
-            except ValueError as ve:
-                st.error(f"Input Error: {ve}")
-            except Exception as e:
-                st.error(f"An unexpected error occurred: {e}")
-
-elif selected_tab == "Simulations":
-    st.header("Simulations")
-    
-    # Create tabs for different simulations
-    sim_tabs = st.tabs(["Binomial Approximation", "Sample Means", "Sample Proportions", "Unusual Proportions", "Confidence Intervals", "Hypothesis Testing", "Two Proportions", "Two Means", "t vs Normal", "F-Statistic Explorer"])
-    
-    with sim_tabs[0]:
-        st.subheader("Normal Approximation of the Binomial Distribution")
-        st.write("""
-        This simulation helps you explore how the binomial distribution approaches a normal distribution 
-        as the sample size increases. This is a key concept in statistics known as the **Central Limit Theorem**.
-        """)
-        
-        # Create input columns
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            n_trials = st.number_input(
-                "Number of Trials (n)", 
-                min_value=0, 
-                max_value=500, 
-                value=0,
-                step=1,
-                help="Type the sample size to see how the number of trials affects the approximation"
-            )
-        
-        with col2:
-            p_prob = st.number_input(
-                "Probability of Success (p)", 
-                min_value=0.01, 
-                max_value=0.99, 
-                value=0.5, 
-                step=0.01,
-                format="%.2f",
-                help="The probability of success on each trial"
-            )
-        
-        # Plot updates automatically (no button needed)
-        try:
-            # Calculate binomial distribution
-            x_values = np.arange(0, n_trials + 1)
-            binomial_pmf = stats.binom.pmf(x_values, n=n_trials, p=p_prob)
-            
-            # Calculate normal approximation
-            mean = n_trials * p_prob
-            std_dev = np.sqrt(n_trials * p_prob * (1 - p_prob))
-            
-            # Create continuous x values for normal curve
-            x_continuous = np.linspace(0, n_trials, 1000)
-            if std_dev > 0:
-                normal_pdf = stats.norm.pdf(x_continuous, loc=mean, scale=std_dev)
-            else:
-                normal_pdf = None
-            
-            # Create the plot
-            fig, ax = plt.subplots(figsize=(12, 6))
-            
-            # Plot binomial distribution as vertical lines
-            markerline, stemlines, baseline = ax.stem(x_values, binomial_pmf, linefmt='steelblue', 
-                                                       markerfmt='o', basefmt=' ',
-                                                       label=f'Binomial(n={n_trials}, p={p_prob})')
-            plt.setp(stemlines, 'linewidth', 2)
-            plt.setp(markerline, 'markersize', 6, 'markerfacecolor', 'steelblue', 'markeredgecolor', 'steelblue')
-            
-            # Plot normal approximation as a curve when variance is positive
-            if normal_pdf is not None:
-                ax.plot(x_continuous, normal_pdf, 'r-', linewidth=2, 
-                        label=f'Normal(μ={mean:.2f}, σ={std_dev:.2f})')
-            
-            # Add labels and title
-            ax.set_xlabel('Number of Successes', fontsize=12)
-            ax.set_ylabel('Probability', fontsize=12)
-            ax.set_title(f'Binomial Distribution vs Normal Approximation\n(n={n_trials}, p={p_prob})', 
-                        fontsize=14, fontweight='bold')
-            ax.legend(fontsize=10)
-            ax.grid(True, alpha=0.3)
-            
-            # Display the plot
-            st.pyplot(fig)
-            
-            # Add interpretation
-            st.write("---")
-            st.subheader("Interpretation")
-            st.write(f"**Mean (μ)**: {mean:.2f}")
-            st.write(f"**Standard Deviation (σ)**: {std_dev:.2f}")
-            
-            # Check if normal approximation is appropriate
-            np_value = n_trials * p_prob
-            nq_value = n_trials * (1 - p_prob)
-            
-            if np_value >= 10 and nq_value >= 10:
-                st.success(f"✓ Normal approximation is appropriate: np = {np_value:.2f} ≥ 10 and n(1-p) = {nq_value:.2f} ≥ 10")
-            else:
-                st.warning(f"⚠ Normal approximation may not be accurate: np = {np_value:.2f} and n(1-p) = {nq_value:.2f}")
-                st.write("**Rule of thumb**: The normal approximation works well when both np ≥ 10 and n(1-p) ≥ 10")
-
-            if n_trials == 0:
-                st.info("When n = 0, the binomial distribution is degenerate at X = 0 and a normal approximation is not meaningful.")
-            
-            st.write("""
-            **What to observe:**
-            - As the number of trials increases, the binomial distribution becomes more symmetric and bell-shaped
-            - The normal curve (red line) approximates the binomial bars more closely with larger sample sizes
-            - When p is close to 0.5, the approximation works better for smaller sample sizes
-            """)
-            
-        except Exception as e:
-            st.error(f"An error occurred while generating the plot: {e}")
-    
-    with sim_tabs[1]:
-        st.subheader("Sampling Distribution of Sample Means")
-        st.write("""
-        This simulation demonstrates the **Central Limit Theorem** for sample means. It shows how the 
-        sampling distribution of sample means becomes approximately normal, regardless of the shape of 
-        the population distribution, as the sample size increases.
-        """)
-        
-        # Create input columns
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            pop_dist_type = st.selectbox(
-                "Population Distribution",
-                options=["Normal", "Right Skewed (Exponential)", "Left Skewed (Beta)", "Uniform", "Bimodal"],
-                help="Choose the shape of the population distribution"
-            )
-        
-        with col2:
-            sample_size_means = st.slider(
-                "Sample Size (n)", 
-                min_value=2, 
-                max_value=100, 
-                value=30,
-                help="The size of each random sample"
-            )
-        
-        with col3:
-            num_samples_means = st.number_input(
-                "Number of Samples", 
-                min_value=100, 
-                max_value=5000, 
-                value=1000,
-                step=100,
-                help="How many samples to draw from the population"
-            )
-        
-        if st.button("Run Simulation", key="sampling_means_button"):
-            try:
-                rng = np.random.default_rng()
-                # Generate population based on selected distribution
-                pop_size = 100000
-                
-                if pop_dist_type == "Normal":
-                    population = rng.normal(loc=50, scale=15, size=pop_size)
-                    pop_color = 'steelblue'
-                elif pop_dist_type == "Right Skewed (Exponential)":
-                    population = rng.exponential(scale=20, size=pop_size)
-                    pop_color = 'coral'
-                elif pop_dist_type == "Left Skewed (Beta)":
-                    population = rng.beta(a=8, b=2, size=pop_size) * 100
-                    pop_color = 'mediumpurple'
-                elif pop_dist_type == "Uniform":
-                    population = rng.uniform(low=0, high=100, size=pop_size)
-                    pop_color = 'lightgreen'
-                else:  # Bimodal
-                    pop1 = rng.normal(loc=30, scale=8, size=pop_size//2)
-                    pop2 = rng.normal(loc=70, scale=8, size=pop_size//2)
-                    population = np.concatenate([pop1, pop2])
-                    pop_color = 'gold'
-                
-                # Calculate population parameters
-                pop_mean = np.mean(population)
-                pop_std = np.std(population)
-                
-                # Create placeholders for progressive updates
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                plot_placeholder = st.empty()
-                stats_placeholder = st.empty()
-                
-                # Store sample means
-                sample_means = []
-                
-                # Generate samples in batches
-                batch_size = 100
-                num_batches = int(np.ceil(num_samples_means / batch_size))
-                update_batches = get_update_batches(num_batches, max_updates=12)
-                
-                for batch in range(num_batches):
-                    # Update progress
-                    progress = (batch + 1) / num_batches
-                    progress_bar.progress(progress)
-                    status_text.text(f"Generating samples... {int(progress * 100)}%")
-                    
-                    # Generate batch of samples
-                    samples_in_batch = min(batch_size, num_samples_means - batch * batch_size)
-
-                    # Vectorized sampling per distribution to reduce Python-loop overhead.
-                    if pop_dist_type == "Normal":
-                        sample_matrix = rng.normal(loc=50, scale=15, size=(samples_in_batch, sample_size_means))
-                    elif pop_dist_type == "Right Skewed (Exponential)":
-                        sample_matrix = rng.exponential(scale=20, size=(samples_in_batch, sample_size_means))
-                    elif pop_dist_type == "Left Skewed (Beta)":
-                        sample_matrix = rng.beta(a=8, b=2, size=(samples_in_batch, sample_size_means)) * 100
-                    elif pop_dist_type == "Uniform":
-                        sample_matrix = rng.uniform(low=0, high=100, size=(samples_in_batch, sample_size_means))
-                    else:
-                        mix_mask = rng.random((samples_in_batch, sample_size_means)) < 0.5
-                        sample_a = rng.normal(loc=30, scale=8, size=(samples_in_batch, sample_size_means))
-                        sample_b = rng.normal(loc=70, scale=8, size=(samples_in_batch, sample_size_means))
-                        sample_matrix = np.where(mix_mask, sample_a, sample_b)
-
-                    sample_means.extend(np.mean(sample_matrix, axis=1).tolist())
-                    
-                    # Update plot every few batches
-                    if batch in update_batches or batch == num_batches - 1:
-                        with plot_placeholder.container():
-                            # Create figure with two subplots
-                            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
-                            
-                            # Plot 1: Population Distribution
-                            ax1.hist(population, bins=60, density=True, alpha=0.7, color=pop_color, 
-                                    edgecolor='black', label='Population Distribution')
-                            ax1.axvline(pop_mean, color='darkred', linestyle='--', linewidth=2, 
-                                       label=f'Population Mean = {pop_mean:.2f}')
-                            ax1.set_xlabel('Value', fontsize=11)
-                            ax1.set_ylabel('Density', fontsize=11)
-                            ax1.set_title(f'Population Distribution: {pop_dist_type}', fontsize=12, fontweight='bold')
-                            ax1.legend(loc='best')
-                            ax1.grid(True, alpha=0.3)
-                            
-                            # Plot 2: Sampling Distribution of Sample Means
-                            ax2.hist(sample_means, bins=40, density=True, alpha=0.7, color='steelblue', 
-                                    edgecolor='black', label='Sample Means')
-                            
-                            # Overlay theoretical normal distribution
-                            theoretical_mean = pop_mean
-                            theoretical_std = pop_std / np.sqrt(sample_size_means)
-                            x_range = np.linspace(min(sample_means), max(sample_means), 200)
-                            normal_curve = stats.norm.pdf(x_range, loc=theoretical_mean, scale=theoretical_std)
-                            ax2.plot(x_range, normal_curve, 'r-', linewidth=2, 
-                                    label=f'Normal(μ={theoretical_mean:.2f}, σ={theoretical_std:.2f})')
-                            
-                            # Mark the mean
-                            mean_of_means = np.mean(sample_means)
-                            ax2.axvline(mean_of_means, color='orange', linestyle=':', linewidth=2, 
-                                       label=f'Mean of Sample Means = {mean_of_means:.2f}')
-                            ax2.axvline(pop_mean, color='darkred', linestyle='--', linewidth=2, 
-                                       label=f'Population Mean = {pop_mean:.2f}')
-                            
-                            ax2.set_xlabel('Sample Mean', fontsize=11)
-                            ax2.set_ylabel('Density', fontsize=11)
-                            ax2.set_title(f'Sampling Distribution of Sample Means (n={sample_size_means})', 
-                                         fontsize=12, fontweight='bold')
-                            ax2.legend(loc='best', fontsize=9)
-                            ax2.grid(True, alpha=0.3)
-                            
-                            plt.tight_layout()
-                            st.pyplot(fig)
-                            plt.close()
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
-                
-                # Display final statistics
-                with stats_placeholder.container():
-                    st.write("---")
-                    st.subheader("Summary Statistics")
-                    
-                    col_a, col_b, col_c = st.columns(3)
-                    
-                    with col_a:
-                        st.metric("Population Mean (μ)", f"{pop_mean:.2f}")
-                        st.metric("Population Std Dev (σ)", f"{pop_std:.2f}")
-                    
-                    with col_b:
-                        mean_of_means = np.mean(sample_means)
-                        std_of_means = np.std(sample_means, ddof=1)
-                        st.metric("Mean of Sample Means", f"{mean_of_means:.2f}")
-                        st.metric("Std Dev of Sample Means", f"{std_of_means:.2f}")
-                    
-                    with col_c:
-                        theoretical_mean = pop_mean
-                        theoretical_std = pop_std / np.sqrt(sample_size_means)
-                        st.metric("Expected Mean", f"{theoretical_mean:.2f}")
-                        st.metric("Expected Std Dev (σ/√n)", f"{theoretical_std:.2f}")
-                    
-                    st.write("---")
-                    st.write("**Central Limit Theorem Observations:**")
-                    st.write(f"- The mean of sample means ({mean_of_means:.2f}) is approximately equal to the population mean ({pop_mean:.2f})")
-                    st.write(f"- The standard deviation of sample means ({std_of_means:.2f}) is approximately σ/√n = {theoretical_std:.2f}")
-                    st.write(f"- Even though the population distribution is **{pop_dist_type}**, the sampling distribution")
-                    st.write(f"  of sample means appears approximately **normal** (especially with larger sample sizes)")
-                    st.write(f"- Larger sample sizes (n) → narrower sampling distribution → more precise estimates")
-                    
-                    st.write("---")
-                    st.info("""
-                    **Key Insight**: The Central Limit Theorem states that the sampling distribution of sample means 
-                    will be approximately normal, regardless of the population distribution shape, when the sample 
-                    size is sufficiently large (typically n ≥ 30). Try different distributions and sample sizes 
-                    to see this in action!
-                    """)
-                
-            except Exception as e:
-                st.error(f"An error occurred while running the simulation: {e}")
-    
-    with sim_tabs[2]:
-        st.subheader("Sampling Distribution of Sample Proportions")
-        st.write("""
-        This simulation demonstrates how sample proportions from repeated random samples form a distribution 
-        centered around the true population proportion. This illustrates the **Central Limit Theorem for Proportions**.
-        """)
-        
-        # Create input columns
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            pop_proportion = st.number_input(
-                "Population Proportion (p)", 
-                min_value=0.01, 
-                max_value=0.99, 
-                value=0.6, 
-                step=0.01,
-                format="%.2f",
-                help="The true proportion in the population"
-            )
-        
-        with col2:
-            sample_size = st.slider(
-                "Sample Size (n)", 
-                min_value=10, 
-                max_value=500, 
-                value=50,
-                help="The size of each random sample"
-            )
-        
-        with col3:
-            num_samples = st.slider(
-                "Number of Samples", 
-                min_value=10, 
-                max_value=1000, 
-                value=100,
-                step=10,
-                help="How many samples to draw from the population"
-            )
-        
-        # Add a button to run the simulation
-        if st.button("Run Simulation", key="sampling_dist_button"):
-            try:
-                rng = np.random.default_rng()
-                # Initialize session state for animation if not exists
-                if 'sample_proportions' not in st.session_state:
-                    st.session_state.sample_proportions = []
-                
-                # Create placeholders for dynamic updates
-                sample_viz_placeholder = st.empty()
-                dist_plot_placeholder = st.empty()
-                stats_placeholder = st.empty()
-                
-                # Store all sample proportions
-                sample_matrix = rng.binomial(1, pop_proportion, size=(num_samples, sample_size))
-                sample_proportions = np.mean(sample_matrix, axis=1)
-                
-                # Progress bar
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
-                # Limit redraw count to keep UI responsive.
-                update_points = np.linspace(0, num_samples - 1, num=min(20, num_samples), dtype=int)
-                update_points = sorted(set(update_points.tolist()))
-                
-                # Simulate drawing samples
-                for i in update_points:
-                    # Update progress
-                    progress = (i + 1) / num_samples
-                    progress_bar.progress(progress)
-                    status_text.text(f"Drawing sample {i+1} of {num_samples}...")
-
-                    sample = sample_matrix[i]
-                    sample_prop = sample_proportions[i]
-                    current_props = sample_proportions[:i + 1]
-
-                    # Visualize the current sample
-                    with sample_viz_placeholder.container():
-                        st.write("---")
-                        st.write(f"**Current Sample #{i+1}**: Sample Proportion = {sample_prop:.4f}")
-
-                        # Create a visual representation of the sample
-                        fig_sample, ax_sample = plt.subplots(figsize=(12, 2))
-
-                        # Show first 100 observations max for visualization
-                        display_sample = sample[:min(100, len(sample))]
-                        colors = ['green' if x == 1 else 'red' for x in display_sample]
-                        x_pos = np.arange(len(display_sample))
-
-                        ax_sample.scatter(x_pos, [0.5] * len(display_sample), c=colors, s=50, alpha=0.7)
-                        ax_sample.set_ylim(0, 1)
-                        ax_sample.set_xlim(-1, len(display_sample))
-                        ax_sample.set_yticks([])
-                        ax_sample.set_xlabel('Observation Number', fontsize=10)
-                        ax_sample.set_title(f'Sample Visualization (Green = Success, Red = Failure) - Showing {len(display_sample)} of {sample_size} observations',
-                                          fontsize=11, fontweight='bold')
-                        ax_sample.grid(True, alpha=0.3, axis='x')
-
-                        st.pyplot(fig_sample)
-                        plt.close(fig_sample)
-
-                    # Update sampling distribution plot
-                    with dist_plot_placeholder.container():
-                        st.write("---")
-                        st.write("**Sampling Distribution of Sample Proportions**")
-
-                        fig_dist, ax_dist = plt.subplots(figsize=(12, 6))
-
-                        # Plot histogram of sample proportions
-                        ax_dist.hist(current_props, bins=min(30, max(10, len(current_props)//5)),
-                                    color='steelblue', alpha=0.7, edgecolor='black', density=True,
-                                    label=f'Sample Proportions (n={len(current_props)})')
-
-                        # Overlay theoretical normal distribution
-                        if len(current_props) > 1:
-                            mean_prop = pop_proportion
-                            std_prop = np.sqrt(pop_proportion * (1 - pop_proportion) / sample_size)
-
-                            x_norm = np.linspace(max(0, mean_prop - 4*std_prop),
-                                                min(1, mean_prop + 4*std_prop), 1000)
-                            y_norm = stats.norm.pdf(x_norm, mean_prop, std_prop)
-
-                            ax_dist.plot(x_norm, y_norm, 'r-', linewidth=2,
-                                       label=f'Theoretical N(μ={mean_prop:.3f}, σ={std_prop:.4f})')
-
-                        # Add vertical line at population proportion
-                        ax_dist.axvline(pop_proportion, color='green', linestyle='--', linewidth=2,
-                                      label=f'Population Proportion (p={pop_proportion})')
-
-                        # Add vertical line at mean of sample proportions
-                        if len(current_props) > 0:
-                            ax_dist.axvline(np.mean(current_props), color='orange', linestyle='--', linewidth=2,
-                                          label=f'Mean of Sample Proportions ({np.mean(current_props):.4f})')
-
-                        ax_dist.set_xlabel('Sample Proportion', fontsize=12)
-                        ax_dist.set_ylabel('Density', fontsize=12)
-                        ax_dist.set_title('Sampling Distribution of Sample Proportions',
-                                        fontsize=14, fontweight='bold')
-                        ax_dist.legend(fontsize=9)
-                        ax_dist.grid(True, alpha=0.3)
-
-                        st.pyplot(fig_dist)
-                        plt.close(fig_dist)
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
-                
-                # Display final statistics
-                with stats_placeholder.container():
-                    st.write("---")
-                    st.subheader("Summary Statistics")
-                    
-                    col_a, col_b, col_c = st.columns(3)
-                    
-                    with col_a:
-                        st.metric("Population Proportion (p)", f"{pop_proportion:.4f}")
-                        st.metric("Sample Size (n)", sample_size)
-                    
-                    with col_b:
-                        mean_sample_props = np.mean(sample_proportions)
-                        st.metric("Mean of Sample Proportions", f"{mean_sample_props:.4f}")
-                        st.metric("Standard Deviation of Sample Proportions", f"{np.std(sample_proportions, ddof=1):.4f}")
-                    
-                    with col_c:
-                        theoretical_mean = pop_proportion
-                        theoretical_std = np.sqrt(pop_proportion * (1 - pop_proportion) / sample_size)
-                        st.metric("Theoretical Mean", f"{theoretical_mean:.4f}")
-                        st.metric("Theoretical Std Dev", f"{theoretical_std:.4f}")
-                    
-                    st.write("---")
-                    st.write("**Key Observations:**")
-                    st.write(f"- The mean of sample proportions ({mean_sample_props:.4f}) should be close to the population proportion ({pop_proportion:.4f})")
-                    st.write(f"- The standard deviation of sample proportions is approximately {theoretical_std:.4f}")
-                    st.write(f"- As sample size increases, the sampling distribution becomes narrower (smaller standard deviation)")
-                    st.write(f"- The sampling distribution is approximately normal when np ≥ 10 and n(1-p) ≥ 10")
-                    
-                    # Check conditions for normality
-                    np_check = sample_size * pop_proportion
-                    nq_check = sample_size * (1 - pop_proportion)
-                    
-                    if np_check >= 10 and nq_check >= 10:
-                        st.success(f"✓ Conditions met for normal approximation: np = {np_check:.1f} ≥ 10 and n(1-p) = {nq_check:.1f} ≥ 10")
-                    else:
-                        st.warning(f"⚠ Conditions not fully met: np = {np_check:.1f} and n(1-p) = {nq_check:.1f}")
-                
-            except Exception as e:
-                st.error(f"An error occurred while running the simulation: {e}")
-    
-    with sim_tabs[3]:
-        st.subheader("Unusual Sample Proportions")
-        st.write("""
-        This simulation helps you determine if a sample proportion is unusual given a population proportion. 
-        A sample proportion is typically considered unusual if it falls more than **2 standard errors** away 
-        from the population proportion (approximately outside the 95% confidence region).
-        """)
-        
-        # Create input columns
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            pop_prop = st.number_input(
-                "Population Proportion (p)", 
-                min_value=0.01, 
-                max_value=0.99, 
-                value=0.5, 
-                step=0.01,
-                format="%.3f",
-                help="The assumed or known population proportion",
-                key="unusual_pop_prop"
-            )
-        
-        with col2:
-            sample_prop = st.number_input(
-                "Sample Proportion (p̂)", 
-                min_value=0.0, 
-                max_value=1.0, 
-                value=0.65, 
-                step=0.01,
-                format="%.3f",
-                help="The proportion observed in your sample",
-                key="unusual_sample_prop"
-            )
-        
-        with col3:
-            samp_size = st.number_input(
-                "Sample Size (n)", 
-                min_value=10, 
-                max_value=10000, 
-                value=100, 
-                step=10,
-                help="The size of your sample",
-                key="unusual_sample_size"
-            )
-        
-        # Calculate and plot automatically
+    datasets = {}
+    for label, future in futures.items():
+        # Name the failing tab when several were requested
+        prefix = f"Tab '{label}': " if label != 'active_data' else ""
         try:
-            # Check conditions for normal approximation
-            np_val = samp_size * pop_prop
-            nq_val = samp_size * (1 - pop_prop)
-            
-            if np_val < 10 or nq_val < 10:
-                st.warning(f"⚠ **Note**: Normal approximation may not be accurate. np = {np_val:.1f} and n(1-p) = {nq_val:.1f}. Both should be ≥ 10.")
-            
-            # Calculate standard error
-            standard_error = np.sqrt(pop_prop * (1 - pop_prop) / samp_size)
-            
-            # Calculate z-score
-            z_score = (sample_prop - pop_prop) / standard_error
-            
-            # Calculate bounds for ±2 SE
-            lower_bound_2se = pop_prop - 2 * standard_error
-            upper_bound_2se = pop_prop + 2 * standard_error
-            
-            # Create the plot
-            fig, ax = plt.subplots(figsize=(12, 7))
-            
-            # Create x values for the normal curve
-            x_min = max(0, pop_prop - 4 * standard_error)
-            x_max = min(1, pop_prop + 4 * standard_error)
-            x_values = np.linspace(x_min, x_max, 1000)
-            
-            # Calculate normal distribution values
-            y_values = stats.norm.pdf(x_values, loc=pop_prop, scale=standard_error)
-            
-            # Plot the normal curve
-            ax.plot(x_values, y_values, 'b-', linewidth=2, label='Sampling Distribution')
-            
-            # Shade the region within ±2 SE (usual region)
-            x_fill = x_values[(x_values >= lower_bound_2se) & (x_values <= upper_bound_2se)]
-            y_fill = stats.norm.pdf(x_fill, loc=pop_prop, scale=standard_error)
-            ax.fill_between(x_fill, y_fill, alpha=0.3, color='green', 
-                           label=f'Within 2 SE (Usual)\n[{lower_bound_2se:.4f}, {upper_bound_2se:.4f}]')
-            
-            # Shade unusual regions (beyond ±2 SE)
-            x_left = x_values[x_values < lower_bound_2se]
-            if len(x_left) > 0:
-                y_left = stats.norm.pdf(x_left, loc=pop_prop, scale=standard_error)
-                ax.fill_between(x_left, y_left, alpha=0.3, color='red', label='Unusual (Below -2 SE)')
-            
-            x_right = x_values[x_values > upper_bound_2se]
-            if len(x_right) > 0:
-                y_right = stats.norm.pdf(x_right, loc=pop_prop, scale=standard_error)
-                ax.fill_between(x_right, y_right, alpha=0.3, color='red', label='Unusual (Above +2 SE)')
-            
-            # Mark the population proportion
-            ax.axvline(pop_prop, color='blue', linestyle='--', linewidth=2, 
-                      label=f'Population Proportion (p={pop_prop:.3f})')
-            
-            # Mark the ±2 SE bounds
-            ax.axvline(lower_bound_2se, color='orange', linestyle=':', linewidth=1.5, 
-                      label=f'-2 SE = {lower_bound_2se:.4f}')
-            ax.axvline(upper_bound_2se, color='orange', linestyle=':', linewidth=1.5, 
-                      label=f'+2 SE = {upper_bound_2se:.4f}')
-            
-            # Mark the sample proportion
-            y_max = max(y_values)
-            ax.axvline(sample_prop, color='red' if abs(z_score) > 2 else 'green', 
-                      linestyle='-', linewidth=3, alpha=0.8,
-                      label=f'Sample Proportion (p̂={sample_prop:.3f})')
-            
-            # Add a marker at the top for the sample proportion
-            ax.plot(sample_prop, y_max * 1.05, 'v', 
-                   color='red' if abs(z_score) > 2 else 'green', 
-                   markersize=15, markeredgecolor='black', markeredgewidth=1.5)
-            
-            # Labels and title
-            ax.set_xlabel('Sample Proportion', fontsize=12)
-            ax.set_ylabel('Probability Density', fontsize=12)
-            ax.set_title('Is the Sample Proportion Unusual?\nSampling Distribution of Sample Proportions', 
-                        fontsize=14, fontweight='bold')
-            ax.legend(fontsize=9, loc='upper right')
-            ax.grid(True, alpha=0.3)
-            
-            st.pyplot(fig)
-            plt.close(fig)
-            
-            # Display statistics and interpretation
-            st.write("---")
-            st.subheader("Analysis")
-            
-            col_a, col_b, col_c = st.columns(3)
-            
-            with col_a:
-                st.metric("Standard Error (SE)", f"{standard_error:.4f}")
-                st.metric("2 × SE", f"{2 * standard_error:.4f}")
-            
-            with col_b:
-                st.metric("Z-Score", f"{z_score:.3f}")
-                st.metric("Distance from p", f"{abs(sample_prop - pop_prop):.4f}")
-            
-            with col_c:
-                st.metric("Lower Bound (-2 SE)", f"{lower_bound_2se:.4f}")
-                st.metric("Upper Bound (+2 SE)", f"{upper_bound_2se:.4f}")
-            
-            st.write("---")
-            st.subheader("Interpretation")
-            
-            # Determine if unusual
-            if abs(z_score) > 2:
-                st.error(f"🔴 **The sample proportion ({sample_prop:.3f}) is UNUSUAL**")
-                st.write(f"The sample proportion is **{abs(z_score):.2f} standard errors** away from the population proportion.")
-                st.write(f"This falls **outside** the usual range of ±2 SE from the population proportion.")
-                if z_score > 2:
-                    st.write(f"📈 The sample proportion is **significantly higher** than expected.")
-                else:
-                    st.write(f"📉 The sample proportion is **significantly lower** than expected.")
-            else:
-                st.success(f"🟢 **The sample proportion ({sample_prop:.3f}) is NOT unusual**")
-                st.write(f"The sample proportion is only **{abs(z_score):.2f} standard errors** away from the population proportion.")
-                st.write(f"This falls **within** the usual range of ±2 SE from the population proportion.")
-                st.write(f"✓ This difference could easily occur by random chance.")
-            
-            st.write("---")
-            st.write("**Rule of Thumb:**")
-            st.write("- If |z-score| > 2: The sample proportion is considered **unusual** (roughly outside the 95% range)")
-            st.write("- If |z-score| ≤ 2: The sample proportion is considered **usual** (within the 95% range)")
-            st.write("- Standard Error (SE) = √[p(1-p)/n]")
-            
+            dataset = future.result()
+        except concurrent.futures.CancelledError:
+            st.info("Loading from Google Sheets was cancelled.")
+            return None, None
         except Exception as e:
-            st.error(f"An error occurred: {e}")
-    
-    with sim_tabs[4]:
-        st.subheader("Confidence Interval Explorer for Proportions")
-        st.write("""
-        This simulation helps you understand how confidence intervals work. A confidence interval constructed 
-        around a **sample proportion** will capture the **true population proportion** a certain percentage of the time 
-        (e.g., 95% of the time for a 95% confidence interval).
-        """)
-        
-        # Create input columns
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            ci_pop_prop = st.number_input(
-                "True Population Proportion (p)", 
-                min_value=0.01, 
-                max_value=0.99, 
-                value=0.6, 
-                step=0.01,
-                format="%.3f",
-                help="The true (but usually unknown) population proportion",
-                key="ci_pop_prop"
-            )
-        
-        with col2:
-            ci_sample_size = st.number_input(
-                "Sample Size (n)", 
-                min_value=10, 
-                max_value=1000, 
-                value=100, 
-                step=10,
-                help="The size of your sample",
-                key="ci_sample_size"
-            )
-        
-        with col3:
-            confidence_level = st.selectbox(
-                "Confidence Level",
-                options=[0.90, 0.95, 0.99],
-                index=1,
-                format_func=lambda x: f"{int(x*100)}%",
-                help="The confidence level for the interval",
-                key="ci_confidence_level"
-            )
-        
-        # Calculate z-critical value based on confidence level
-        z_critical = stats.norm.ppf((1 + confidence_level) / 2)
-        
-        # Calculate margin of error based on population proportion
-        standard_error = np.sqrt(ci_pop_prop * (1 - ci_pop_prop) / ci_sample_size)
-        margin_of_error = z_critical * standard_error
-        
-        st.write("---")
-        col_info1, col_info2 = st.columns(2)
-        with col_info1:
-            st.info(f"**Z-critical value**: {z_critical:.3f}")
-            st.info(f"**Standard Error**: {standard_error:.4f}")
-        with col_info2:
-            st.info(f"**Margin of Error**: ±{margin_of_error:.4f}")
-            st.info(f"**Formula**: ME = z* × √[p(1-p)/n]")
-        
-        # Calculate confidence interval around the population proportion (for reference)
-        pop_ci_lower = ci_pop_prop - margin_of_error
-        pop_ci_upper = ci_pop_prop + margin_of_error
-        
-        # Sample proportion input or random generation
-        st.write("---")
-        st.subheader("Choose Exploration Method")
-        
-        exploration_mode = st.radio(
-            "Select Mode",
-            options=["Single Sample", "Multiple Samples"],
-            key="ci_exploration_mode",
-            horizontal=True
-        )
-        
-        ci_sample_prop = None
-        sample_provided = False
-        multiple_samples = []
-        
-        if exploration_mode == "Single Sample":
-            st.write("Add a sample proportion (p̂) to see if an interval with the same margin of error would capture the population proportion.")
-            
-            col_choice1, col_choice2 = st.columns(2)
-            
-            with col_choice1:
-                sample_method = st.radio(
-                    "Method",
-                    options=["Enter Manually", "Generate Random Sample"],
-                    key="ci_sample_method"
-                )
-            
-            with col_choice2:
-                if sample_method == "Enter Manually":
-                    ci_sample_prop = st.slider(
-                        "Sample Proportion (p̂)", 
-                        min_value=0.0, 
-                        max_value=1.0, 
-                        value=None,
-                        step=0.01,
-                        format="%.3f",
-                        help="Move the slider to explore different sample proportions",
-                        key="ci_sample_prop_slider"
-                    )
-                    if ci_sample_prop is not None:
-                        sample_provided = True
-                else:
-                    if st.button("Generate Random Sample", key="generate_random_sample"):
-                        # Generate a random sample
-                        sample = np.random.binomial(1, ci_pop_prop, ci_sample_size)
-                        st.session_state.random_sample_prop = np.mean(sample)
-                        sample_provided = True
-                    
-                    # Display the random sample proportion
-                    if 'random_sample_prop' in st.session_state:
-                        ci_sample_prop = st.session_state.random_sample_prop
-                        st.metric("Generated Sample Proportion", f"{ci_sample_prop:.4f}")
-                        sample_provided = True
-        
-        else:  # Multiple Samples mode
-            st.write(f"""
-            Generate multiple random samples to see what percentage of confidence intervals 
-            capture the true population proportion. This illustrates that a **{int(confidence_level*100)}% confidence level** 
-            means approximately **{int(confidence_level*100)}%** of intervals will contain the true parameter.
-            """)
-            
-            col_multi1, col_multi2 = st.columns(2)
-            
-            with col_multi1:
-                num_samples_to_generate = st.slider(
-                    "Number of Samples to Generate",
-                    min_value=10,
-                    max_value=200,
-                    value=100,
-                    step=10,
-                    key="num_samples_multi"
-                )
-            
-            with col_multi2:
-                if st.button("Generate Multiple Samples", key="generate_multiple_samples"):
-                    # Generate multiple samples
-                    st.session_state.multiple_samples_data = []
-                    for i in range(num_samples_to_generate):
-                        sample = np.random.binomial(1, ci_pop_prop, ci_sample_size)
-                        sample_prop = np.mean(sample)
-                        ci_low = sample_prop - margin_of_error
-                        ci_high = sample_prop + margin_of_error
-                        captures_p = ci_low <= ci_pop_prop <= ci_high
-                        st.session_state.multiple_samples_data.append({
-                            'sample_prop': sample_prop,
-                            'ci_lower': ci_low,
-                            'ci_upper': ci_high,
-                            'captures': captures_p
-                        })
-            
-            if 'multiple_samples_data' in st.session_state and st.session_state.multiple_samples_data:
-                multiple_samples = st.session_state.multiple_samples_data
-                sample_provided = True
-        
-        # Create visualization
-        st.write("---")
-        st.subheader("Visualization")
-        
-        try:
-            if exploration_mode == "Multiple Samples" and multiple_samples:
-                # Multiple samples visualization
-                fig, ax = plt.subplots(figsize=(14, 10))
-                
-                # Calculate statistics
-                num_captured = sum(1 for s in multiple_samples if s['captures'])
-                capture_rate = (num_captured / len(multiple_samples)) * 100
-                
-                # Determine plot range
-                all_bounds = [s['ci_lower'] for s in multiple_samples] + [s['ci_upper'] for s in multiple_samples]
-                plot_min = max(0, min(all_bounds + [ci_pop_prop]) - 0.1)
-                plot_max = min(1, max(all_bounds + [ci_pop_prop]) + 0.1)
-                
-                # Draw vertical line at population proportion
-                ax.axvline(ci_pop_prop, color='purple', linestyle='--', linewidth=3, 
-                          label=f'Population Proportion (p = {ci_pop_prop:.3f})', zorder=10)
-                
-                # Draw each confidence interval
-                for i, sample_data in enumerate(multiple_samples):
-                    y_pos = i
-                    color = 'green' if sample_data['captures'] else 'red'
-                    
-                    # Draw interval line
-                    ax.plot([sample_data['ci_lower'], sample_data['ci_upper']], [y_pos, y_pos],
-                           color=color, linewidth=1.5, alpha=0.7)
-                    
-                    # Draw endpoints
-                    ax.plot([sample_data['ci_lower'], sample_data['ci_upper']], [y_pos, y_pos],
-                           'o', color=color, markersize=3)
-                
-                # Add legend entries for captured/missed
-                ax.plot([], [], color='green', linewidth=2, label=f'Captures p ({num_captured})')
-                ax.plot([], [], color='red', linewidth=2, label=f'Misses p ({len(multiple_samples) - num_captured})')
-                
-                ax.set_xlim(plot_min, plot_max)
-                ax.set_ylim(-1, len(multiple_samples))
-                ax.set_xlabel('Proportion', fontsize=12, fontweight='bold')
-                ax.set_ylabel('Sample Number', fontsize=12, fontweight='bold')
-                ax.set_title(f'{len(multiple_samples)} Confidence Intervals: {capture_rate:.1f}% Capture the Population Proportion\n' + 
-                            f'(Expected: {int(confidence_level*100)}%)', 
-                            fontsize=14, fontweight='bold', pad=15)
-                ax.legend(fontsize=10, loc='upper right')
-                ax.grid(True, alpha=0.3, axis='x')
-                
-                st.pyplot(fig)
-                plt.close(fig)
-                
-                # Display statistics
-                st.write("---")
-                st.subheader("Results Summary")
-                
-                col_stat1, col_stat2, col_stat3 = st.columns(3)
-                
-                with col_stat1:
-                    st.metric("Total Samples", len(multiple_samples))
-                    st.metric("Intervals Capturing p", num_captured)
-                
-                with col_stat2:
-                    st.metric("Intervals Missing p", len(multiple_samples) - num_captured)
-                    st.metric("Capture Rate", f"{capture_rate:.1f}%")
-                
-                with col_stat3:
-                    st.metric("Expected Rate", f"{int(confidence_level*100)}%")
-                    difference = capture_rate - (confidence_level * 100)
-                    st.metric("Difference", f"{difference:+.1f}%")
-                
-                st.write("---")
-                if abs(difference) <= 5:
-                    st.success(f"""
-                    ✓ The observed capture rate ({capture_rate:.1f}%) is very close to the expected {int(confidence_level*100)}%! 
-                    This demonstrates that confidence intervals work as intended.
-                    """)
-                else:
-                    st.info(f"""
-                    The observed capture rate ({capture_rate:.1f}%) differs from the expected {int(confidence_level*100)}% by {abs(difference):.1f}%. 
-                    This is normal due to random variation. Try generating more samples to see the rate approach {int(confidence_level*100)}%.
-                    """)
-                
-                st.write("""
-                **Key Insight:**
-                - Each horizontal line represents a confidence interval from a different sample
-                - Green intervals successfully capture the true population proportion (purple line)
-                - Red intervals miss the population proportion
-                - With a large number of samples, approximately the confidence level percentage will be green
-                """)
-            
-            else:
-                # Single sample visualization
-                fig, ax = plt.subplots(figsize=(14, 8))
-                
-                # Determine plot range
-                if sample_provided and ci_sample_prop is not None:
-                    plot_min = max(0, min(ci_pop_prop, ci_sample_prop) - 0.2)
-                    plot_max = min(1, max(ci_pop_prop, ci_sample_prop) + 0.2)
-                    # Calculate confidence interval around the sample proportion
-                    ci_lower = ci_sample_prop - margin_of_error
-                    ci_upper = ci_sample_prop + margin_of_error
-                    # Check if interval captures population proportion
-                    captures = ci_lower <= ci_pop_prop <= ci_upper
-                else:
-                    plot_min = max(0, ci_pop_prop - 0.3)
-                    plot_max = min(1, ci_pop_prop + 0.3)
-                    captures = None
-                
-                # ALWAYS draw the interval around population proportion (static)
-                y_pop = 0.65
-                ax.plot([pop_ci_lower, pop_ci_upper], [y_pop, y_pop], 
-                       color='steelblue', linewidth=8, alpha=0.5,
-                       label=f'Interval Around p (ME = ±{margin_of_error:.3f})')
-                
-                # Draw endpoints
-                ax.plot([pop_ci_lower, pop_ci_upper], [y_pop, y_pop], 
-                       'o', color='steelblue', markersize=15, markeredgecolor='black', 
-                       markeredgewidth=2)
-                
-                # Draw the population proportion
-                ax.plot(ci_pop_prop, y_pop, 's', color='purple', markersize=20,
-                       markeredgecolor='black', markeredgewidth=2,
-                       label=f'Population Proportion (p = {ci_pop_prop:.3f})', zorder=5)
-                
-                # Add shaded region for population interval
-                ax.axvspan(pop_ci_lower, pop_ci_upper, alpha=0.15, color='steelblue', zorder=1)
-                
-                # Add text annotations for population interval
-                ax.text(pop_ci_lower, y_pop + 0.12, f'{pop_ci_lower:.3f}', 
-                       ha='center', va='bottom', fontsize=10, fontweight='bold', color='steelblue')
-                ax.text(pop_ci_upper, y_pop + 0.12, f'{pop_ci_upper:.3f}', 
-                       ha='center', va='bottom', fontsize=10, fontweight='bold', color='steelblue')
-                
-                # If sample proportion is provided, draw interval around it
-                if sample_provided and ci_sample_prop is not None:
-                    y_sample = 0.35
-                    interval_color = 'green' if captures else 'red'
-                    
-                    # Draw the interval line around sample proportion
-                    ax.plot([ci_lower, ci_upper], [y_sample, y_sample], 
-                           color=interval_color, linewidth=8, alpha=0.7,
-                           label=f'Interval Around p̂ (same ME)')
-                    
-                    # Draw endpoints of the interval
-                    ax.plot([ci_lower, ci_upper], [y_sample, y_sample], 
-                           'o', color=interval_color, markersize=15, markeredgecolor='black', 
-                           markeredgewidth=2)
-                    
-                    # Draw the sample proportion at the center
-                    ax.plot(ci_sample_prop, y_sample, 'D', color='blue', markersize=20,
-                           markeredgecolor='black', markeredgewidth=2,
-                           label=f'Sample Proportion (p̂ = {ci_sample_prop:.3f})', zorder=5)
-                    
-                    # Add shaded region for sample interval
-                    ax.axvspan(ci_lower, ci_upper, alpha=0.15, color=interval_color, zorder=1)
-                    
-                    # Add text annotations for sample interval
-                    ax.text(ci_lower, y_sample - 0.12, f'{ci_lower:.3f}', 
-                           ha='center', va='top', fontsize=10, fontweight='bold', color=interval_color)
-                    ax.text(ci_upper, y_sample - 0.12, f'{ci_upper:.3f}', 
-                           ha='center', va='top', fontsize=10, fontweight='bold', color=interval_color)
-                    
-                    # Draw vertical line at population proportion to see if it's captured
-                    ax.axvline(ci_pop_prop, color='purple', linestyle='--', linewidth=2, alpha=0.6, zorder=3)
-                
-                # Formatting
-                ax.set_xlim(plot_min, plot_max)
-                ax.set_ylim(0, 1)
-                ax.set_yticks([])
-                ax.set_xlabel('Proportion', fontsize=14, fontweight='bold')
-                
-                if sample_provided and ci_sample_prop is not None:
-                    if captures:
-                        title_text = f'✓ Confidence Interval Around p̂ CAPTURES the Population Proportion!'
-                        title_color = 'green'
-                    else:
-                        title_text = f'✗ Confidence Interval Around p̂ DOES NOT capture the Population Proportion'
-                        title_color = 'red'
-                else:
-                    title_text = 'Confidence Interval Around Population Proportion\n(Add a sample proportion to compare)'
-                    title_color = 'black'
-                
-                ax.set_title(title_text, fontsize=16, fontweight='bold', color=title_color, pad=20)
-                ax.legend(fontsize=11, loc='upper right')
-                ax.grid(True, alpha=0.3, axis='x')
-                
-                st.pyplot(fig)
-                plt.close(fig)
-                
-                # Explanation - only show when sample is provided
-                if sample_provided and ci_sample_prop is not None:
-                    st.write("---")
-                    st.subheader("Interpretation")
-                    
-                    col_result1, col_result2 = st.columns(2)
-                    
-                    with col_result1:
-                        st.metric("Confidence Interval Around p̂", f"[{ci_lower:.4f}, {ci_upper:.4f}]")
-                        st.metric("Interval Width", f"{ci_upper - ci_lower:.4f}")
-                        st.metric("Sample Proportion (p̂)", f"{ci_sample_prop:.4f}")
-                    
-                    with col_result2:
-                        st.metric("Population Proportion (p)", f"{ci_pop_prop:.4f}")
-                        st.metric("Distance from p̂ to p", f"{abs(ci_sample_prop - ci_pop_prop):.4f}")
-                        if captures:
-                            st.success("✓ Interval captures p")
-                        else:
-                            st.error("✗ Interval does not capture p")
-                    
-                    st.write("---")
-                    st.write("**Key Concepts:**")
-                    
-                    if captures:
-                        st.success(f"""
-                        🎯 **Success!** The confidence interval [{ci_lower:.3f}, {ci_upper:.3f}] constructed around 
-                        the sample proportion (p̂ = {ci_sample_prop:.3f}) successfully captures the true population 
-                        proportion (p = {ci_pop_prop:.3f}).
-                        """)
-                    else:
-                        st.error(f"""
-                        ❌ **Miss!** The confidence interval [{ci_lower:.3f}, {ci_upper:.3f}] constructed around 
-                        the sample proportion (p̂ = {ci_sample_prop:.3f}) does NOT capture the true population 
-                        proportion (p = {ci_pop_prop:.3f}). This happens about {100-int(confidence_level*100)}% of the time.
-                        """)
-                    
-                    st.write(f"""
-                    - A **{int(confidence_level*100)}% confidence interval** means that if we took many samples and 
-                      constructed an interval around each sample proportion using the same margin of error, 
-                      approximately **{int(confidence_level*100)}%** of those intervals would capture the true population proportion.
-                    
-                    - The **margin of error** ({margin_of_error:.4f}) determines the width of the interval.
-                    
-                    - **Larger sample sizes** lead to smaller margins of error (narrower, more precise intervals).
-                    
-                    - **Higher confidence levels** lead to larger margins of error (wider intervals to increase 
-                      the chance of capturing the true parameter).
-                    
-                    - Try moving the slider or generating random samples to see which intervals capture the population 
-                      proportion and which don't!
-                    """)
-                
-        except Exception as e:
-            st.error(f"An error occurred while creating the visualization: {e}")
-    
-    with sim_tabs[5]:
-        st.subheader("Hypothesis Testing Explorer")
-        st.write("""
-        This interactive simulation helps you understand hypothesis testing by visualizing the relationship 
-        between test statistics, p-values, and significance levels. Adjust the sample statistic to see 
-        how the p-value changes and whether you would reject the null hypothesis.
-        """)
-        
-        # Put controls in an expander to make visualization more prominent
-        with st.expander("⚙️ Test Configuration & Controls", expanded=True):
-            # Test selection and parameters
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                test_type = st.selectbox(
-                    "Select Test Type",
-                    options=["Z-test (Proportion)", "Z-test (Mean)", "T-test (Mean)", "Chi-Square Test"],
-                    key="ht_test_type"
-                )
-            
-            with col2:
-                alternative = st.selectbox(
-                    "Alternative Hypothesis",
-                    options=["Two-tailed (≠)", "Right-tailed (>)", "Left-tailed (<)"],
-                    key="ht_alternative"
-                )
-            
-            with col3:
-                alpha = st.selectbox(
-                    "Significance Level (α)",
-                    options=[0.01, 0.05, 0.10],
-                    index=1,
-                    format_func=lambda x: f"{x}",
-                    key="ht_alpha"
-                )
-            
-            st.write("---")
-            
-            # Test-specific parameters
-            if test_type == "Z-test (Proportion)":
-                null_value = st.number_input(
-                    "Null Hypothesis Value (p₀)",
-                    min_value=0.01,
-                    max_value=0.99,
-                    value=0.5,
-                    step=0.01,
-                    format="%.2f",
-                    key="ht_null_prop"
-                )
-                sample_size_ht = st.number_input(
-                    "Sample Size (n)",
-                    min_value=10,
-                    max_value=1000,
-                    value=100,
-                    step=10,
-                    key="ht_n_prop"
-                )
-                se = np.sqrt(null_value * (1 - null_value) / sample_size_ht)
-                test_stat_min = null_value - 4 * se
-                test_stat_max = null_value + 4 * se
-                default_stat = null_value + 1.5 * se
-                x_label = "Sample Proportion (p̂)"
-                dist_name = "Normal Distribution"
-            elif test_type in ["Z-test (Mean)", "T-test (Mean)"]:  # Mean tests
-                null_value = st.number_input(
-                    "Null Hypothesis Value (μ₀)",
-                    min_value=-100.0,
-                    max_value=100.0,
-                    value=0.0,
-                    step=0.1,
-                    format="%.1f",
-                    key="ht_null_mean"
-                )
-                
-                # Get sample size to calculate SE
-                sample_size_mean = st.number_input(
-                    "Sample Size (n)",
-                    min_value=2,
-                    max_value=500,
-                    value=30,
-                    step=1,
-                    key="ht_n_mean"
-                )
-                
-                sample_std = st.number_input(
-                    "Sample Std Dev (s)" if test_type == "T-test (Mean)" else "Population Std Dev (σ)",
-                    min_value=0.1,
-                    max_value=50.0,
-                    value=5.0,
-                    step=0.1,
-                    format="%.1f",
-                    key="ht_std_mean"
-                )
-                
-                # Calculate SE automatically
-                se = sample_std / np.sqrt(sample_size_mean)
-                if test_type == "T-test (Mean)":
-                    df_ht = sample_size_mean - 1
-                
-                test_stat_min = null_value - 4 * se
-                test_stat_max = null_value + 4 * se
-                default_stat = null_value + 1.5 * se
-                x_label = "Sample Mean (x̄)"
-                dist_name = "T-Distribution" if test_type == "T-test (Mean)" else "Normal Distribution"
-                
-                # Display computed SE
-                st.caption(f"Computed SE = {se:.4f}")
-            elif test_type == "Chi-Square Test":
-                df_chi = st.number_input(
-                    "Degrees of Freedom",
-                    min_value=1,
-                    max_value=50,
-                    value=5,
-                    step=1,
-                    key="ht_df_chi"
-                )
-                
-                null_value = df_chi  # For chi-square, center is at df
-                dist_name = "Chi-Square Distribution"
-                x_label = "χ² Statistic"
-                test_stat_min = 0.0
-                test_stat_max = float(df_chi * 4)
-                default_stat = float(df_chi * 1.5)
-        
-        # Sample statistic slider - separate section for better visibility
-        st.write("---")
-        st.subheader("📊 Adjust Sample Statistic")
-        test_statistic = st.slider(
-            x_label,
-            min_value=float(test_stat_min),
-            max_value=float(test_stat_max),
-            value=float(default_stat),
-            step=float((test_stat_max - test_stat_min)/200) if test_type != "Chi-Square Test" else 0.1,
-            format="%.3f" if test_type != "Chi-Square Test" else "%.2f",
-            key="ht_test_stat",
-            help="Move the slider to adjust the sample statistic and observe how the p-value and test decision change"
-        )
-        
-        # Visualization section - now more prominent above detailed results
-        st.write("---")
-        st.subheader("Visualization")
-        
-        try:
-            fig, ax = plt.subplots(figsize=(10, 4))
-            
-            # Generate distribution
-            if test_type == "Chi-Square Test":
-                x_vals = np.linspace(0.001, df_chi * 4, 1000)
-                y_vals = stats.chi2.pdf(x_vals, df_chi)
-                
-                # Calculate critical values and p-value for chi-square (always right-tailed)
-                crit_val = stats.chi2.ppf(1 - alpha, df_chi)
-                p_value = stats.chi2.sf(test_statistic, df_chi)
-                
-                # Plot distribution
-                ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f'χ²({df_chi})')
-                
-                # Shade significance region (right tail)
-                x_crit = x_vals[x_vals >= crit_val]
-                y_crit = stats.chi2.pdf(x_crit, df_chi)
-                ax.fill_between(x_crit, y_crit, alpha=0.3, color='red', label=f'Rejection Region (α={alpha})')
-                
-                # Shade p-value region
-                x_pval = x_vals[x_vals >= test_statistic]
-                y_pval = stats.chi2.pdf(x_pval, df_chi)
-                ax.fill_between(x_pval, y_pval, alpha=0.5, color='orange', label=f'P-value = {p_value:.4f}')
-                
-                # Mark test statistic
-                ax.axvline(test_statistic, color='green', linestyle='--', linewidth=2, 
-                          label=f'Test Statistic = {test_statistic:.2f}')
-                ax.axvline(crit_val, color='red', linestyle=':', linewidth=2,
-                          label=f'Critical Value = {crit_val:.2f}')
-                
-            else:
-                # For Z-test and T-test - use original scale
-                if test_type == "T-test (Mean)":
-                    # Calculate on original scale
-                    t_stat = (test_statistic - null_value) / se
-                    
-                    # Calculate critical values on standardized scale, then convert to original
-                    if alternative == "Two-tailed (≠)":
-                        crit_lower_std = stats.t.ppf(alpha/2, df_ht)
-                        crit_upper_std = stats.t.ppf(1 - alpha/2, df_ht)
-                        crit_lower = null_value + crit_lower_std * se
-                        crit_upper = null_value + crit_upper_std * se
-                        p_value = 2 * min(stats.t.cdf(t_stat, df_ht), stats.t.sf(t_stat, df_ht))
-                    elif alternative == "Right-tailed (>)":
-                        crit_upper_std = stats.t.ppf(1 - alpha, df_ht)
-                        crit_upper = null_value + crit_upper_std * se
-                        crit_lower = None
-                        p_value = stats.t.sf(t_stat, df_ht)
-                    else:  # Left-tailed
-                        crit_lower_std = stats.t.ppf(alpha, df_ht)
-                        crit_lower = null_value + crit_lower_std * se
-                        crit_upper = None
-                        p_value = stats.t.cdf(t_stat, df_ht)
-                    
-                    # Generate x values on original scale
-                    x_vals = np.linspace(null_value - 4*se, null_value + 4*se, 1000)
-                    # Calculate y values using scaled t-distribution
-                    y_vals = stats.t.pdf((x_vals - null_value) / se, df_ht) / se
-                    
-                    ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f't-distribution (df={df_ht})')
-                    test_stat_plot = test_statistic  # Original scale for plotting
-                    std_test_stat = t_stat  # Standardized for display
-                    
-                else:  # Z-tests
-                    z_stat = (test_statistic - null_value) / se
-                    
-                    # Calculate critical values on standardized scale, then convert to original
-                    if alternative == "Two-tailed (≠)":
-                        crit_lower_std = stats.norm.ppf(alpha/2)
-                        crit_upper_std = stats.norm.ppf(1 - alpha/2)
-                        crit_lower = null_value + crit_lower_std * se
-                        crit_upper = null_value + crit_upper_std * se
-                        p_value = 2 * min(stats.norm.cdf(z_stat), stats.norm.sf(z_stat))
-                    elif alternative == "Right-tailed (>)":
-                        crit_upper_std = stats.norm.ppf(1 - alpha)
-                        crit_upper = null_value + crit_upper_std * se
-                        crit_lower = None
-                        p_value = stats.norm.sf(z_stat)
-                    else:  # Left-tailed
-                        crit_lower_std = stats.norm.ppf(alpha)
-                        crit_lower = null_value + crit_lower_std * se
-                        crit_upper = None
-                        p_value = stats.norm.cdf(z_stat)
-                    
-                    # Generate x values on original scale
-                    x_vals = np.linspace(null_value - 4*se, null_value + 4*se, 1000)
-                    # Calculate y values using scaled normal distribution
-                    y_vals = stats.norm.pdf(x_vals, loc=null_value, scale=se)
-                    
-                    ax.plot(x_vals, y_vals, 'b-', linewidth=2, label=f'Normal Distribution')
-                    test_stat_plot = test_statistic  # Original scale for plotting
-                    std_test_stat = z_stat  # Standardized for display
-                
-                # Shade significance regions
-                if alternative == "Two-tailed (≠)":
-                    x_left = x_vals[x_vals <= crit_lower]
-                    if test_type == "T-test (Mean)":
-                        y_left = stats.t.pdf((x_left - null_value) / se, df_ht) / se
-                    else:
-                        y_left = stats.norm.pdf(x_left, loc=null_value, scale=se)
-                    ax.fill_between(x_left, y_left, alpha=0.3, color='red', label=f'Rejection Region (α={alpha})')
-                    
-                    x_right = x_vals[x_vals >= crit_upper]
-                    if test_type == "T-test (Mean)":
-                        y_right = stats.t.pdf((x_right - null_value) / se, df_ht) / se
-                    else:
-                        y_right = stats.norm.pdf(x_right, loc=null_value, scale=se)
-                    ax.fill_between(x_right, y_right, alpha=0.3, color='red')
-                    
-                elif alternative == "Right-tailed (>)":
-                    x_right = x_vals[x_vals >= crit_upper]
-                    if test_type == "T-test (Mean)":
-                        y_right = stats.t.pdf((x_right - null_value) / se, df_ht) / se
-                    else:
-                        y_right = stats.norm.pdf(x_right, loc=null_value, scale=se)
-                    ax.fill_between(x_right, y_right, alpha=0.3, color='red', label=f'Rejection Region (α={alpha})')
-                    
-                else:  # Left-tailed
-                    x_left = x_vals[x_vals <= crit_lower]
-                    if test_type == "T-test (Mean)":
-                        y_left = stats.t.pdf((x_left - null_value) / se, df_ht) / se
-                    else:
-                        y_left = stats.norm.pdf(x_left, loc=null_value, scale=se)
-                    ax.fill_between(x_left, y_left, alpha=0.3, color='red', label=f'Rejection Region (α={alpha})')
-                
-                # Shade p-value region
-                if alternative == "Two-tailed (≠)":
-                    if test_stat_plot >= null_value:
-                        x_pval = x_vals[x_vals >= test_stat_plot]
-                        x_pval_mirror = x_vals[x_vals <= (null_value - (test_stat_plot - null_value))]
-                    else:
-                        x_pval = x_vals[x_vals <= test_stat_plot]
-                        x_pval_mirror = x_vals[x_vals >= (null_value + (null_value - test_stat_plot))]
-                    
-                    if test_type == "T-test (Mean)":
-                        y_pval = stats.t.pdf((x_pval - null_value) / se, df_ht) / se
-                        y_pval_mirror = stats.t.pdf((x_pval_mirror - null_value) / se, df_ht) / se
-                    else:
-                        y_pval = stats.norm.pdf(x_pval, loc=null_value, scale=se)
-                        y_pval_mirror = stats.norm.pdf(x_pval_mirror, loc=null_value, scale=se)
-                    
-                    ax.fill_between(x_pval, y_pval, alpha=0.5, color='orange', label=f'P-value = {p_value:.4f}')
-                    ax.fill_between(x_pval_mirror, y_pval_mirror, alpha=0.5, color='orange')
-                    
-                elif alternative == "Right-tailed (>)":
-                    x_pval = x_vals[x_vals >= test_stat_plot]
-                    if test_type == "T-test (Mean)":
-                        y_pval = stats.t.pdf((x_pval - null_value) / se, df_ht) / se
-                    else:
-                        y_pval = stats.norm.pdf(x_pval, loc=null_value, scale=se)
-                    ax.fill_between(x_pval, y_pval, alpha=0.5, color='orange', label=f'P-value = {p_value:.4f}')
-                    
-                else:  # Left-tailed
-                    x_pval = x_vals[x_vals <= test_stat_plot]
-                    if test_type == "T-test (Mean)":
-                        y_pval = stats.t.pdf((x_pval - null_value) / se, df_ht) / se
-                    else:
-                        y_pval = stats.norm.pdf(x_pval, loc=null_value, scale=se)
-                    ax.fill_between(x_pval, y_pval, alpha=0.5, color='orange', label=f'P-value = {p_value:.4f}')
-                
-                # Mark test statistic and critical values
-                if test_type == "Chi-Square Test":
-                    stat_label = f'Test Statistic = {test_stat_plot:.3f}'
-                else:
-                    # Show standardized statistic for Z and T tests
-                    stat_label = f'Test Statistic = {std_test_stat:.3f}'
-                ax.axvline(test_stat_plot, color='green', linestyle='--', linewidth=2,
-                          label=stat_label)
-                
-                if alternative == "Two-tailed (≠)":
-                    ax.axvline(crit_lower, color='red', linestyle=':', linewidth=2,
-                              label=f'Critical Values = {crit_lower:.4f}, {crit_upper:.4f}')
-                    ax.axvline(crit_upper, color='red', linestyle=':', linewidth=2)
-                elif alternative == "Right-tailed (>)":
-                    ax.axvline(crit_upper, color='red', linestyle=':', linewidth=2,
-                              label=f'Critical Value = {crit_upper:.4f}')
-                else:  # Left-tailed
-                    ax.axvline(crit_lower, color='red', linestyle=':', linewidth=2,
-                              label=f'Critical Value = {crit_lower:.4f}')
-            
-            # Formatting
-            if test_type == "Chi-Square Test":
-                x_label = 'χ² Statistic'
-            elif test_type == "Z-test (Proportion)":
-                x_label = 'Sampling Distribution of Sample Proportion'
-            else:  # Mean tests
-                x_label = 'Sampling Distribution of Sample Mean'
-            ax.set_xlabel(x_label, 
-                         fontsize=12, fontweight='bold')
-            ax.set_ylabel('Probability Density', fontsize=12, fontweight='bold')
-            
-            # Add null value to x-axis tick marks for non-Chi-Square tests
-            if test_type != "Chi-Square Test":
-                current_ticks = list(ax.get_xticks())
-                # Add the null value if it's not already very close to an existing tick
-                if not any(abs(tick - null_value) < (test_stat_max - test_stat_min) * 0.05 for tick in current_ticks):
-                    current_ticks.append(null_value)
-                    current_ticks.sort()
-                ax.set_xticks(current_ticks)
-            
-            # Determine decision
-            reject = p_value <= alpha
-            
-            ax.legend(fontsize=10, loc='upper right')
-            ax.grid(True, alpha=0.3)
-            
-            st.pyplot(fig)
-            plt.close(fig)
-            
-            # Display detailed results below
-            st.write("---")
-            st.subheader("Detailed Test Results")
-            
-            col_res1, col_res2, col_res3 = st.columns(3)
-            
-            with col_res1:
-                st.metric("Test Statistic", f"{test_statistic:.4f}" if test_type != "Chi-Square Test" else f"{test_statistic:.2f}")
-                if test_type != "Chi-Square Test":
-                    std_stat = (test_statistic - null_value) / se
-                    st.metric("Standardized Statistic", f"{std_stat:.3f}")
-            
-            with col_res2:
-                st.metric("P-value", f"{p_value:.4f}")
-                st.metric("Significance Level (α)", f"{alpha}")
-            
-            with col_res3:
-                if reject:
-                    st.error("**Decision: REJECT H₀**")
-                else:
-                    st.success("**Decision: FAIL TO REJECT H₀**")
-            
-            st.write("---")
-            st.write("**Hypotheses:**")
-            
-            if test_type == "Z-test (Proportion)":
-                h0_text = f"H₀: p = {null_value}"
-                if alternative == "Two-tailed (≠)":
-                    ha_text = f"Hₐ: p ≠ {null_value}"
-                elif alternative == "Right-tailed (>)":
-                    ha_text = f"Hₐ: p > {null_value}"
-                else:
-                    ha_text = f"Hₐ: p < {null_value}"
-            elif test_type == "Chi-Square Test":
-                h0_text = "H₀: Variables are independent (or goodness of fit)"
-                ha_text = "Hₐ: Variables are not independent (or poor fit)"
-            else:
-                h0_text = f"H₀: μ = {null_value}"
-                if alternative == "Two-tailed (≠)":
-                    ha_text = f"Hₐ: μ ≠ {null_value}"
-                elif alternative == "Right-tailed (>)":
-                    ha_text = f"Hₐ: μ > {null_value}"
-                else:
-                    ha_text = f"Hₐ: μ < {null_value}"
-            
-            st.write(f"- **Null Hypothesis**: {h0_text}")
-            st.write(f"- **Alternative Hypothesis**: {ha_text}")
-            
-            st.write("---")
-            st.write("**Interpretation:**")
-            st.write(f"""
-            - The **red shaded region(s)** represent the rejection region (significance level α = {alpha})
-            - The **orange shaded region(s)** represent the p-value area
-            - The **green vertical line** shows your test statistic
-            - The **red dotted line(s)** show the critical value(s)
-            """)
-            
-            if reject:
-                st.error(f"""
-                🔴 **Reject the null hypothesis**: The p-value ({p_value:.4f}) is less than or equal to the significance 
-                level ({alpha}), indicating that the observed result is statistically significant. The test 
-                statistic falls in the rejection region.
-                """)
-            else:
-                st.success(f"""
-                🟢 **Fail to reject the null hypothesis**: The p-value ({p_value:.4f}) is strictly greater 
-                to the significance level ({alpha}), indicating that we do not have sufficient evidence to reject 
-                the null hypothesis. The test statistic does not fall in the rejection region.
-                """)
-            
-            st.write("""
-            **Key Concepts:**
-            - Move the slider to see how different test statistics affect the p-value
-            - The p-value represents the probability of observing a test statistic as extreme or more extreme 
-              than the observed value, assuming the null hypothesis is true
-            - When p-value ≤ α, we reject the null hypothesis
-            - When p-value > α, we fail to reject the null hypothesis
-            """)
-            
-        except Exception as e:
-            st.error(f"An error occurred: {e}")
-    
-    with sim_tabs[6]:
-        st.subheader("Two Proportions")
-        st.write("""
-        This simulation demonstrates the sampling distribution of the difference between two sample proportions.
-        It helps you understand how differences between two groups behave under repeated sampling and visualizes
-        the Central Limit Theorem for the difference between two proportions.
-        """)
-        
-        # Create input columns
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            p1_pop = st.number_input(
-                "Population 1 Proportion (p₁)", 
-                min_value=0.01, 
-                max_value=0.99, 
-                value=0.6, 
-                step=0.01,
-                format="%.3f",
-                help="The true proportion in population 1",
-                key="diff_prop_p1"
-            )
-            n1_size = st.number_input(
-                "Sample Size from Population 1 (n₁)", 
-                min_value=10, 
-                max_value=1000, 
-                value=100, 
-                step=10,
-                help="Size of each sample from population 1",
-                key="diff_prop_n1"
-            )
-        
-        with col2:
-            p2_pop = st.number_input(
-                "Population 2 Proportion (p₂)", 
-                min_value=0.01, 
-                max_value=0.99, 
-                value=0.4, 
-                step=0.01,
-                format="%.3f",
-                help="The true proportion in population 2",
-                key="diff_prop_p2"
-            )
-            n2_size = st.number_input(
-                "Sample Size from Population 2 (n₂)", 
-                min_value=10, 
-                max_value=1000, 
-                value=100, 
-                step=10,
-                help="Size of each sample from population 2",
-                key="diff_prop_n2"
-            )
-        
-        with col3:
-            num_samples_diff_prop = st.number_input(
-                "Number of Samples", 
-                min_value=100, 
-                max_value=10000, 
-                value=1000, 
-                step=100,
-                help="Number of pairs of samples to generate",
-                key="diff_prop_num_samples"
-            )
-        
-        if st.button("Run Simulation", key="run_diff_prop_sim"):
-            try:
-                rng = np.random.default_rng()
-                # Create placeholders for progressive updates
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                plot_placeholder = st.empty()
-                stats_placeholder = st.empty()
-                
-                # Store differences
-                differences = []
-                
-                # Generate samples in batches
-                batch_size = 100
-                num_batches = int(np.ceil(num_samples_diff_prop / batch_size))
-                update_batches = get_update_batches(num_batches, max_updates=12)
-                
-                for batch in range(num_batches):
-                    # Update progress
-                    progress = (batch + 1) / num_batches
-                    progress_bar.progress(progress)
-                    status_text.text(f"Generating samples... {int(progress * 100)}%")
-                    
-                    # Generate batch of samples
-                    samples_in_batch = min(batch_size, num_samples_diff_prop - batch * batch_size)
-
-                    sample1_batch = rng.binomial(1, p1_pop, size=(samples_in_batch, n1_size))
-                    sample2_batch = rng.binomial(1, p2_pop, size=(samples_in_batch, n2_size))
-                    batch_differences = np.mean(sample1_batch, axis=1) - np.mean(sample2_batch, axis=1)
-                    differences.extend(batch_differences.tolist())
-                    
-                    # Update plot every few batches
-                    if batch in update_batches or batch == num_batches - 1:
-                        with plot_placeholder.container():
-                            fig, ax = plt.subplots(figsize=(12, 6))
-                            
-                            # Plot histogram
-                            ax.hist(differences, bins=50, density=True, alpha=0.7, color='steelblue', 
-                                   edgecolor='black', label='Sample Differences')
-                            
-                            # Calculate theoretical distribution
-                            true_diff = p1_pop - p2_pop
-                            theoretical_std = np.sqrt(p1_pop * (1 - p1_pop) / n1_size + p2_pop * (1 - p2_pop) / n2_size)
-                            
-                            # Overlay normal curve
-                            x_range = np.linspace(min(differences), max(differences), 200)
-                            normal_curve = stats.norm.pdf(x_range, loc=true_diff, scale=theoretical_std)
-                            ax.plot(x_range, normal_curve, 'r-', linewidth=2, 
-                                   label=f'Normal(μ={true_diff:.3f}, σ={theoretical_std:.3f})')
-                            
-                            # Mark the true difference
-                            ax.axvline(true_diff, color='darkgreen', linestyle='--', linewidth=2, 
-                                      label=f'True Difference (p₁ - p₂ = {true_diff:.3f})')
-                            
-                            # Mark the mean of sample differences
-                            mean_diff = np.mean(differences)
-                            ax.axvline(mean_diff, color='orange', linestyle=':', linewidth=2, 
-                                      label=f'Mean of Differences = {mean_diff:.3f}')
-                            
-                            ax.set_xlabel('Difference in Sample Proportions (p̂₁ - p̂₂)', fontsize=12)
-                            ax.set_ylabel('Density', fontsize=12)
-                            ax.set_title('Sampling Distribution of Difference Between Two Proportions', fontsize=14, fontweight='bold')
-                            ax.legend(loc='best', fontsize=10)
-                            ax.grid(True, alpha=0.3)
-                            
-                            st.pyplot(fig)
-                            plt.close()
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
-                
-                # Display final statistics
-                with stats_placeholder.container():
-                    st.write("---")
-                    st.subheader("Summary Statistics")
-                    
-                    col_a, col_b, col_c = st.columns(3)
-                    
-                    with col_a:
-                        st.metric("Population 1 Proportion (p₁)", f"{p1_pop:.4f}")
-                        st.metric("Population 2 Proportion (p₂)", f"{p2_pop:.4f}")
-                        st.metric("True Difference (p₁ - p₂)", f"{p1_pop - p2_pop:.4f}")
-                    
-                    with col_b:
-                        mean_diff = np.mean(differences)
-                        std_diff = np.std(differences, ddof=1)
-                        st.metric("Mean of Sample Differences", f"{mean_diff:.4f}")
-                        st.metric("Std Dev of Sample Differences", f"{std_diff:.4f}")
-                        st.metric("Number of Samples", f"{len(differences)}")
-                    
-                    with col_c:
-                        theoretical_mean = p1_pop - p2_pop
-                        theoretical_std = np.sqrt(p1_pop * (1 - p1_pop) / n1_size + p2_pop * (1 - p2_pop) / n2_size)
-                        st.metric("Theoretical Mean", f"{theoretical_mean:.4f}")
-                        st.metric("Theoretical Std Dev", f"{theoretical_std:.4f}")
-                    
-                    st.write("---")
-                    st.write("**Key Observations:**")
-                    st.write(f"- The mean of sample differences ({mean_diff:.4f}) should be close to the true difference ({theoretical_mean:.4f})")
-                    st.write(f"- The standard deviation is approximately {theoretical_std:.4f}")
-                    st.write(f"- The distribution is approximately normal by the Central Limit Theorem")
-                    st.write(f"- Larger sample sizes lead to a narrower (more precise) distribution")
-                    
-                    # Check conditions for normality
-                    n1p1 = n1_size * p1_pop
-                    n1q1 = n1_size * (1 - p1_pop)
-                    n2p2 = n2_size * p2_pop
-                    n2q2 = n2_size * (1 - p2_pop)
-                    
-                    st.write("**Conditions for Normal Approximation:**")
-                    if n1p1 >= 10 and n1q1 >= 10 and n2p2 >= 10 and n2q2 >= 10:
-                        st.success(f"✓ All conditions met: n₁p₁={n1p1:.1f}, n₁(1-p₁)={n1q1:.1f}, n₂p₂={n2p2:.1f}, n₂(1-p₂)={n2q2:.1f} (all ≥ 10)")
-                    else:
-                        st.warning(f"⚠ Some conditions not met: n₁p₁={n1p1:.1f}, n₁(1-p₁)={n1q1:.1f}, n₂p₂={n2p2:.1f}, n₂(1-p₂)={n2q2:.1f}")
-                
-            except Exception as e:
-                st.error(f"An error occurred while running the simulation: {e}")
-    
-    with sim_tabs[7]:
-        st.subheader("Two Means")
-        st.write("""
-        This simulation demonstrates the sampling distribution of the difference between two sample means
-        using **sample standard deviations** and the **t-distribution**. This reflects real-world scenarios
-        where population standard deviations are unknown and must be estimated from the samples.
-        """)
-        
-        # Create input columns
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            mu1_pop = st.number_input(
-                "Population 1 Mean (μ₁)", 
-                min_value=-100.0, 
-                max_value=100.0, 
-                value=50.0, 
-                step=1.0,
-                format="%.2f",
-                help="The true mean of population 1",
-                key="diff_mean_mu1"
-            )
-            sigma1_pop = st.number_input(
-                "Population 1 Std Dev (σ₁)", 
-                min_value=0.1, 
-                max_value=100.0, 
-                value=10.0, 
-                step=0.5,
-                format="%.2f",
-                help="The true standard deviation of population 1 (used to generate samples)",
-                key="diff_mean_sigma1"
-            )
-            n1_mean_size = st.number_input(
-                "Sample Size from Population 1 (n₁)", 
-                min_value=5, 
-                max_value=500, 
-                value=30, 
-                step=5,
-                help="Size of each sample from population 1",
-                key="diff_mean_n1"
-            )
-        
-        with col2:
-            mu2_pop = st.number_input(
-                "Population 2 Mean (μ₂)", 
-                min_value=-100.0, 
-                max_value=100.0, 
-                value=45.0, 
-                step=1.0,
-                format="%.2f",
-                help="The true mean of population 2",
-                key="diff_mean_mu2"
-            )
-            sigma2_pop = st.number_input(
-                "Population 2 Std Dev (σ₂)", 
-                min_value=0.1, 
-                max_value=100.0, 
-                value=12.0, 
-                step=0.5,
-                format="%.2f",
-                help="The true standard deviation of population 2 (used to generate samples)",
-                key="diff_mean_sigma2"
-            )
-            n2_mean_size = st.number_input(
-                "Sample Size from Population 2 (n₂)", 
-                min_value=5, 
-                max_value=500, 
-                value=30, 
-                step=5,
-                help="Size of each sample from population 2",
-                key="diff_mean_n2"
-            )
-        
-        with col3:
-            num_samples_diff_mean = st.number_input(
-                "Number of Samples", 
-                min_value=100, 
-                max_value=10000, 
-                value=1000, 
-                step=100,
-                help="Number of pairs of samples to generate",
-                key="diff_mean_num_samples"
-            )
-            equal_vars = st.checkbox(
-                "Assume Equal Variances (Pooled)",
-                value=True,
-                help="If checked, uses pooled standard deviation; otherwise uses Welch's approximation",
-                key="diff_mean_equal_vars"
-            )
-        
-        if st.button("Run Simulation", key="run_diff_mean_sim"):
-            try:
-                rng = np.random.default_rng()
-                # Create placeholders for progressive updates
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                plot_placeholder = st.empty()
-                stats_placeholder = st.empty()
-                
-                # Store differences and sample statistics
-                differences = []
-                sample_s1_list = []
-                sample_s2_list = []
-                
-                # Generate samples in batches
-                batch_size = 100
-                num_batches = int(np.ceil(num_samples_diff_mean / batch_size))
-                update_batches = get_update_batches(num_batches, max_updates=12)
-                
-                for batch in range(num_batches):
-                    # Update progress
-                    progress = (batch + 1) / num_batches
-                    progress_bar.progress(progress)
-                    status_text.text(f"Generating samples... {int(progress * 100)}%")
-                    
-                    # Generate batch of samples
-                    samples_in_batch = min(batch_size, num_samples_diff_mean - batch * batch_size)
-
-                    sample1_batch = rng.normal(mu1_pop, sigma1_pop, size=(samples_in_batch, n1_mean_size))
-                    sample2_batch = rng.normal(mu2_pop, sigma2_pop, size=(samples_in_batch, n2_mean_size))
-                    mean1_batch = np.mean(sample1_batch, axis=1)
-                    mean2_batch = np.mean(sample2_batch, axis=1)
-                    s1_batch = np.std(sample1_batch, axis=1, ddof=1)
-                    s2_batch = np.std(sample2_batch, axis=1, ddof=1)
-
-                    differences.extend((mean1_batch - mean2_batch).tolist())
-                    sample_s1_list.extend(s1_batch.tolist())
-                    sample_s2_list.extend(s2_batch.tolist())
-                    
-                    # Update plot every few batches
-                    if batch in update_batches or batch == num_batches - 1:
-                        with plot_placeholder.container():
-                            fig, ax = plt.subplots(figsize=(12, 6))
-                            
-                            # Plot histogram
-                            ax.hist(differences, bins=50, density=True, alpha=0.7, color='steelblue', 
-                                   edgecolor='black', label='Sample Differences')
-                            
-                            # Calculate average sample standard deviations
-                            avg_s1 = np.mean(sample_s1_list)
-                            avg_s2 = np.mean(sample_s2_list)
-                            
-                            # Calculate standard error using sample std devs
-                            if equal_vars:
-                                # Pooled standard deviation approach
-                                pooled_var = ((n1_mean_size - 1) * avg_s1**2 + (n2_mean_size - 1) * avg_s2**2) / (n1_mean_size + n2_mean_size - 2)
-                                se = np.sqrt(pooled_var * (1/n1_mean_size + 1/n2_mean_size))
-                                df = n1_mean_size + n2_mean_size - 2
-                            else:
-                                # Welch's approach
-                                se = np.sqrt(avg_s1**2 / n1_mean_size + avg_s2**2 / n2_mean_size)
-                                df = (avg_s1**2 / n1_mean_size + avg_s2**2 / n2_mean_size)**2 / \
-                                     ((avg_s1**2 / n1_mean_size)**2 / (n1_mean_size - 1) + \
-                                      (avg_s2**2 / n2_mean_size)**2 / (n2_mean_size - 1))
-                            
-                            # Overlay t-distribution curve
-                            true_diff = mu1_pop - mu2_pop
-                            x_range = np.linspace(min(differences), max(differences), 200)
-                            t_curve = stats.t.pdf((x_range - true_diff) / se, df) / se
-                            ax.plot(x_range, t_curve, 'r-', linewidth=2, 
-                                   label=f't-distribution (df≈{df:.1f}, SE≈{se:.2f})')
-                            
-                            # Mark the true difference
-                            ax.axvline(true_diff, color='darkgreen', linestyle='--', linewidth=2, 
-                                      label=f'True Difference (μ₁ - μ₂ = {true_diff:.2f})')
-                            
-                            # Mark the mean of sample differences
-                            mean_diff = np.mean(differences)
-                            ax.axvline(mean_diff, color='orange', linestyle=':', linewidth=2, 
-                                      label=f'Mean of Differences = {mean_diff:.2f}')
-                            
-                            ax.set_xlabel('Difference in Sample Means (x̄₁ - x̄₂)', fontsize=12)
-                            ax.set_ylabel('Density', fontsize=12)
-                            ax.set_title('Sampling Distribution of Difference Between Two Means (Using t-distribution)', fontsize=14, fontweight='bold')
-                            ax.legend(loc='best', fontsize=10)
-                            ax.grid(True, alpha=0.3)
-                            
-                            st.pyplot(fig)
-                            plt.close()
-                
-                # Clear progress indicators
-                progress_bar.empty()
-                status_text.empty()
-                
-                # Calculate final statistics
-                mean_diff = np.mean(differences)
-                std_diff = np.std(differences, ddof=1)
-                avg_s1 = np.mean(sample_s1_list)
-                avg_s2 = np.mean(sample_s2_list)
-                
-                # Calculate standard error and degrees of freedom
-                if equal_vars:
-                    pooled_var = ((n1_mean_size - 1) * avg_s1**2 + (n2_mean_size - 1) * avg_s2**2) / (n1_mean_size + n2_mean_size - 2)
-                    se_final = np.sqrt(pooled_var * (1/n1_mean_size + 1/n2_mean_size))
-                    df_final = n1_mean_size + n2_mean_size - 2
-                    pooled_s = np.sqrt(pooled_var)
-                else:
-                    se_final = np.sqrt(avg_s1**2 / n1_mean_size + avg_s2**2 / n2_mean_size)
-                    df_final = (avg_s1**2 / n1_mean_size + avg_s2**2 / n2_mean_size)**2 / \
-                               ((avg_s1**2 / n1_mean_size)**2 / (n1_mean_size - 1) + \
-                                (avg_s2**2 / n2_mean_size)**2 / (n2_mean_size - 1))
-                
-                # Display final statistics
-                with stats_placeholder.container():
-                    st.write("---")
-                    st.subheader("Summary Statistics")
-                    
-                    col_a, col_b, col_c = st.columns(3)
-                    
-                    with col_a:
-                        st.metric("Population 1 Mean (μ₁)", f"{mu1_pop:.2f}")
-                        st.metric("Population 2 Mean (μ₂)", f"{mu2_pop:.2f}")
-                        st.metric("True Difference (μ₁ - μ₂)", f"{mu1_pop - mu2_pop:.2f}")
-                        st.metric("Number of Samples", f"{len(differences)}")
-                    
-                    with col_b:
-                        st.metric("Mean of Sample Differences", f"{mean_diff:.2f}")
-                        st.metric("Std Dev of Sample Differences", f"{std_diff:.2f}")
-                        st.metric("Average Sample s₁", f"{avg_s1:.2f}")
-                        st.metric("Average Sample s₂", f"{avg_s2:.2f}")
-                    
-                    with col_c:
-                        st.metric("Standard Error (SE)", f"{se_final:.2f}")
-                        st.metric("Degrees of Freedom", f"{df_final:.1f}")
-                        if equal_vars:
-                            st.metric("Pooled Std Dev (sp)", f"{pooled_s:.2f}")
-                        else:
-                            st.metric("Method", "Welch's")
-                    
-                    st.write("---")
-                    st.write("**Key Observations:**")
-                    st.write(f"- The mean of sample differences ({mean_diff:.2f}) should be close to the true difference ({mu1_pop - mu2_pop:.2f})")
-                    st.write(f"- Using **sample standard deviations** (s₁ and s₂) to estimate the standard error")
-                    st.write(f"- The **t-distribution** with df ≈ {df_final:.1f} is used instead of the normal distribution")
-                    st.write(f"- Standard Error: SE ≈ {se_final:.2f}")
-                    
-                    if equal_vars:
-                        st.write(f"- **Pooled approach**: Assumes equal population variances, df = n₁ + n₂ - 2 = {df_final:.0f}")
-                        st.write(f"- Pooled standard deviation: sp = {pooled_s:.2f}")
-                        st.write(f"- SE = sp × √(1/n₁ + 1/n₂)")
-                    else:
-                        st.write(f"- **Welch's approach**: Does not assume equal variances")
-                        st.write(f"- Degrees of freedom calculated using Welch-Satterthwaite equation: df ≈ {df_final:.1f}")
-                        st.write(f"- SE = √(s₁²/n₁ + s₂²/n₂)")
-                    
-                    st.write("**Note:** In practice, population standard deviations are unknown, so we use sample")
-                    st.write("standard deviations and the t-distribution, which accounts for the additional uncertainty.")
-                
-            except Exception as e:
-                st.error(f"An error occurred while running the simulation: {e}")
-    
-    with sim_tabs[8]:
-        st.subheader("t-Distribution vs Standard Normal Distribution")
-        st.write("""
-        This simulation illustrates the key differences between the **t-distribution** and the **Standard Normal (Z) distribution**.
-        The t-distribution is used when the population standard deviation is unknown and must be estimated from the sample.
-        It has heavier tails than the normal distribution, especially with small sample sizes.
-        """)
-        
-        # Create input columns
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            df_value = st.slider(
-                "Degrees of Freedom (df)", 
-                min_value=1, 
-                max_value=100, 
-                value=5,
-                help="Lower degrees of freedom → heavier tails and more spread"
-            )
-        
-        with col2:
-            show_multiple = st.checkbox(
-                "Show Multiple df Values",
-                value=False,
-                help="Display multiple t-distributions with different degrees of freedom"
-            )
-        
-        try:
-            # Generate x values for plotting
-            x = np.linspace(-5, 5, 1000)
-            
-            # Calculate distributions
-            standard_normal = stats.norm.pdf(x, 0, 1)
-            t_dist = stats.t.pdf(x, df_value)
-            
-            # Create the plot
-            fig, ax = plt.subplots(figsize=(12, 7))
-            
-            # Plot Standard Normal
-            ax.plot(x, standard_normal, 'b-', linewidth=2.5, label='Standard Normal (Z)', alpha=0.8)
-            
-            if show_multiple:
-                # Show multiple t-distributions
-                df_values = [1, 3, 5, 10, 30]
-                colors = ['red', 'orange', 'green', 'purple', 'brown']
-                
-                for df, color in zip(df_values, colors):
-                    t_curve = stats.t.pdf(x, df)
-                    ax.plot(x, t_curve, color=color, linewidth=2, 
-                           label=f't-distribution (df={df})', alpha=0.7)
-            else:
-                # Show single t-distribution
-                ax.plot(x, t_dist, 'r-', linewidth=2.5, 
-                       label=f't-distribution (df={df_value})', alpha=0.8)
-            
-            # Add shaded regions to highlight tail differences
-            if not show_multiple:
-                # Shade the tails beyond ±2
-                tail_mask_right = x >= 2
-                tail_mask_left = x <= -2
-                
-                ax.fill_between(x[tail_mask_right], 0, standard_normal[tail_mask_right], 
-                               alpha=0.2, color='blue', label='Normal tail area')
-                ax.fill_between(x[tail_mask_right], 0, t_dist[tail_mask_right], 
-                               alpha=0.2, color='red', label='t-distribution tail area')
-                
-                ax.fill_between(x[tail_mask_left], 0, standard_normal[tail_mask_left], 
-                               alpha=0.2, color='blue')
-                ax.fill_between(x[tail_mask_left], 0, t_dist[tail_mask_left], 
-                               alpha=0.2, color='red')
-            
-            # Styling
-            ax.set_xlabel('Value', fontsize=12)
-            ax.set_ylabel('Probability Density', fontsize=12)
-            ax.set_title('Comparison: t-Distribution vs Standard Normal Distribution', 
-                        fontsize=14, fontweight='bold')
-            ax.legend(fontsize=10, loc='upper right')
-            ax.grid(True, alpha=0.3)
-            ax.axhline(y=0, color='black', linewidth=0.5)
-            ax.axvline(x=0, color='gray', linestyle='--', linewidth=1, alpha=0.5)
-            
-            st.pyplot(fig)
-            
-            # Add comprehensive accessibility description
-            if show_multiple:
-                st.caption(f"""
-                **Accessibility Description:** Comparison plot showing Standard Normal distribution (blue curve) 
-                overlaid with multiple t-distributions at different degrees of freedom. 
-                The t-distributions shown have df values of 1, 3, 5, 10, and 30 in colors red, orange, green, 
-                purple, and brown respectively. As degrees of freedom increase, the t-distribution curves 
-                converge toward the Standard Normal distribution. Distributions with lower df show heavier 
-                tails and flatter peaks compared to the Standard Normal.
-                """)
-            else:
-                st.caption(f"""
-                **Accessibility Description:** Comparison plot showing Standard Normal distribution (blue curve) 
-                overlaid with t-distribution having {df_value} degrees of freedom (red curve). 
-                Shaded regions highlight differences in tail areas beyond ±2 standard deviations. 
-                Blue shaded areas show Standard Normal tail probabilities, red shaded areas show 
-                t-distribution tail probabilities. The t-distribution with df={df_value} has 
-                {'heavier' if df_value < 30 else 'similar'} tails compared to the Standard Normal, 
-                meaning extreme values are {'more' if df_value < 30 else 'similarly'} likely.
-                """)
-            plt.close()
-            
-            # Add interpretation section
-            st.write("---")
-            st.subheader("Key Differences")
-            
-            col_a, col_b = st.columns(2)
-            
-            with col_a:
-                st.write("**Standard Normal (Z) Distribution:**")
-                st.write("- Mean = 0, Standard Deviation = 1")
-                st.write("- Used when σ (population std dev) is **known**")
-                st.write("- Fixed shape - always the same")
-                st.write("- Lighter tails")
-                st.write("- Critical values: z* = 1.96 (95% confidence)")
-                
-            with col_b:
-                st.write(f"**t-Distribution (df = {df_value}):**")
-                st.write("- Mean = 0 (when df > 1)")
-                st.write("- Used when σ is **unknown** (estimated by s)")
-                st.write("- Shape depends on degrees of freedom")
-                st.write("- Heavier tails (especially with small df)")
-                t_critical = stats.t.ppf(0.975, df_value)
-                st.write(f"- Critical values: t* = {t_critical:.3f} (95% confidence)")
-            
-            st.write("---")
-            
-            # Calculate and display tail probabilities
-            st.subheader("Tail Probability Comparison")
-            
-            # Calculate probabilities beyond certain values
-            test_values = [1.5, 2.0, 2.5, 3.0]
-            
-            comparison_data = {
-                'Value': test_values,
-                'P(Z > value)': [1 - stats.norm.cdf(v) for v in test_values],
-                f'P(t > value) [df={df_value}]': [1 - stats.t.cdf(v, df_value) for v in test_values],
-            }
-            
-            comparison_df = pd.DataFrame(comparison_data)
-            comparison_df['P(Z > value)'] = comparison_df['P(Z > value)'].map('{:.4f}'.format)
-            comparison_df[f'P(t > value) [df={df_value}]'] = comparison_df[f'P(t > value) [df={df_value}]'].map('{:.4f}'.format)
-            
-            st.dataframe(comparison_df, use_container_width=True)
-            
-            st.write("""
-            **Observations:**
-            - The t-distribution has **heavier tails**, meaning extreme values are more likely
-            - As degrees of freedom increase, the t-distribution approaches the standard normal
-            - With small sample sizes (low df), using the t-distribution is more conservative
-            - When df ≥ 30, the t-distribution is very similar to the standard normal
-            """)
-            
-            # Interactive section: Critical values
-            st.write("---")
-            st.subheader("Critical Values Comparison")
-            
-            confidence_level = st.slider(
-                "Confidence Level (%)", 
-                min_value=80, 
-                max_value=99, 
-                value=95,
-                help="Select the confidence level to compare critical values"
-            )
-            
-            alpha = 1 - confidence_level/100
-            
-            # Calculate critical values
-            z_critical = stats.norm.ppf(1 - alpha/2)
-            t_critical = stats.t.ppf(1 - alpha/2, df_value)
-            
-            col_c, col_d, col_e = st.columns(3)
-            
-            with col_c:
-                st.metric("Confidence Level", f"{confidence_level}%")
-            
-            with col_d:
-                st.metric("z* (Standard Normal)", f"{z_critical:.4f}")
-            
-            with col_e:
-                st.metric(f"t* (df={df_value})", f"{t_critical:.4f}")
-                difference = t_critical - z_critical
-                st.metric("Difference (t* - z*)", f"{difference:.4f}")
-            
-            st.write(f"""
-            - For a {confidence_level}% confidence interval, the t* critical value ({t_critical:.4f}) is 
-            **{'larger' if t_critical > z_critical else 'smaller'}** than the z* critical value ({z_critical:.4f})
-            - This results in **wider confidence intervals** when using the t-distribution
-            - This accounts for the additional uncertainty from estimating σ with the sample standard deviation
-            """)
-            
-        except Exception as e:
-            st.error(f"An error occurred while generating the comparison: {e}")
-    
-    with sim_tabs[9]:
-        st.subheader("F-Statistic Explorer: Understanding Within-Group and Between-Group Variation")
-        st.write("""
-        This side-by-side simulation keeps group means and sample sizes fixed and lets you compare
-        two scenarios with different **within-group standard deviations**.
-
-        Because the means are fixed, this view isolates how changes in within-group spread affect
-        the ANOVA F-statistic.
-        """)
-
-        fixed_means = [50.0, 55.0, 60.0]
-        fixed_sizes = [30, 30, 30]
-
-        st.write("**Fixed configuration (applies to both scenarios):**")
-        st.write(f"- Group means: {fixed_means}")
-        st.write(f"- Group sample sizes: {fixed_sizes}")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            std_scenario_a = st.slider(
-                "Scenario A Std Dev",
-                min_value=1.0,
-                max_value=20.0,
-                value=4.0,
-                step=0.5,
-                help="Common within-group standard deviation for Scenario A",
-                key="f_explorer_std_a"
-            )
+            return None, prefix + describe_sheets_load_error(e)
+        if dataset is None or dataset.empty:
+            return None, prefix + "The Google Sheet appears to be empty. Please check that your sheet contains data and try again."
+        datasets[label] = dataset
+
+    # Replace any existing dataframes with the new ones
+    set_loaded_datasets(datasets)
+    return datasets, None
+
+def load_large_csv_upload(uploaded_file):
+    """Parse a large CSV upload in chunks, showing a preview and progress while it loads."""
+    preview_placeholder = st.empty()
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    def show_preview(preview):
+        with preview_placeholder.container():
+            st.caption(f"Preview of the first {len(preview)} rows while the rest of the file loads:")
+            st.dataframe(preview, hide_index=True)
+
+    def show_progress(fraction, rows_read):
+        progress_bar.progress(fraction)
+        status_text.text(f"Loading data... {rows_read:,} rows read ({int(fraction * 100)}%)")
+
+    uploaded_file.seek(0)
+    dataset = ingest_csv_in_chunks(uploaded_file, total_bytes=uploaded_file.size,
+                                   on_progress=show_progress, on_preview=show_preview)
+    progress_bar.empty()
+    status_text.empty()
+    preview_placeholder.empty()
+    return dataset
+
+def get_excel_sheet_names(uploaded_file, file_extension):
+    """Return the sheet names of an uploaded workbook, remembered per upload for the sheet picker."""
+    sheets_key = get_upload_cache_key(uploaded_file, 'sheets')
+    cached = st.session_state.get('excel_sheet_names')
+    if cached and cached[0] == sheets_key:
+        return cached[1]
+    sheet_names = list_excel_sheets(uploaded_file.getvalue(), file_extension)
+    st.session_state['excel_sheet_names'] = (sheets_key, sheet_names)
+    return sheet_names
+
+def load_excel_upload(uploaded_file, file_extension, sheet_name):
+    """Read one sheet of an uploaded workbook, showing progress and the achieved rows/sec."""
+    progress_bar = st.progress(0)
+    status_text = st.empty()
+
+    def show_progress(fraction, rows_read):
+        progress_bar.progress(fraction)
+        status_text.text(f"Reading sheet '{sheet_name}'... {rows_read:,} rows read")
+
+    started = time.perf_counter()
+    df, engine = read_excel_sheet(uploaded_file.getvalue(), file_extension, sheet_name, on_progress=show_progress)
+    elapsed = max(time.perf_counter() - started, 1e-6)
+    progress_bar.empty()
+    status_text.empty()
+    st.caption(f"Read {len(df):,} rows from sheet '{sheet_name}' in {elapsed:.2f}s "
+               f"({len(df) / elapsed:,.0f} rows/sec, {engine} engine).")
+    return df
 
-        with col2:
-            std_scenario_b = st.slider(
-                "Scenario B Std Dev",
-                min_value=1.0,
-                max_value=20.0,
-                value=10.0,
-                step=0.5,
-                help="Common within-group standard deviation for Scenario B",
-                key="f_explorer_std_b"
-            )
-
-        st.write("""
-        The F-statistic still follows: **F = (Between-Group Variability) / (Within-Group Variability)**.
-        Since means are fixed here, changing standard deviation primarily changes the denominator (MSW).
-        """)
-
-        if 'f_explorer_seed' not in st.session_state:
-            st.session_state.f_explorer_seed = 42
-
-        seed_col1, seed_col2 = st.columns([1, 2])
-        with seed_col1:
-            if st.button("Reseed Samples", key="f_explorer_reseed"):
-                st.session_state.f_explorer_seed = int(np.random.default_rng().integers(1, 2_147_483_647))
-        with seed_col2:
-            st.caption(f"Current sample seed: {st.session_state.f_explorer_seed}")
-        
-        try:
-            def compute_anova_components(groups):
-                all_values = np.concatenate(groups)
-                k_groups = len(groups)
-                n_total = len(all_values)
-                group_means = [np.mean(g) for g in groups]
-                group_sizes = [len(g) for g in groups]
-                grand_mean = float(np.mean(all_values))
-
-                ssb_local = float(sum(n * (m - grand_mean) ** 2 for n, m in zip(group_sizes, group_means)))
-                ssw_local = float(sum(np.sum((g - m) ** 2) for g, m in zip(groups, group_means)))
-
-                df_between_local = k_groups - 1
-                df_within_local = n_total - k_groups
-                msb_local = ssb_local / df_between_local
-                msw_local = ssw_local / df_within_local
-                f_local = msb_local / msw_local if msw_local > 0 else np.inf
-                p_local = 1 - stats.f.cdf(f_local, df_between_local, df_within_local)
-
-                return {
-                    "all_values": all_values,
-                    "group_means": group_means,
-                    "group_sizes": group_sizes,
-                    "grand_mean": grand_mean,
-                    "ssb": ssb_local,
-                    "ssw": ssw_local,
-                    "df_between": df_between_local,
-                    "df_within": df_within_local,
-                    "msb": msb_local,
-                    "msw": msw_local,
-                    "f": f_local,
-                    "p": p_local,
-                }
-
-            base_seed = int(st.session_state.f_explorer_seed)
-            rng_a = np.random.default_rng(base_seed)
-            rng_b = np.random.default_rng(base_seed + 1)
-
-            groups_a = [
-                rng_a.normal(fixed_means[0], std_scenario_a, fixed_sizes[0]),
-                rng_a.normal(fixed_means[1], std_scenario_a, fixed_sizes[1]),
-                rng_a.normal(fixed_means[2], std_scenario_a, fixed_sizes[2]),
-            ]
-            groups_b = [
-                rng_b.normal(fixed_means[0], std_scenario_b, fixed_sizes[0]),
-                rng_b.normal(fixed_means[1], std_scenario_b, fixed_sizes[1]),
-                rng_b.normal(fixed_means[2], std_scenario_b, fixed_sizes[2]),
-            ]
-
-            stats_a = compute_anova_components(groups_a)
-            stats_b = compute_anova_components(groups_b)
-
-            fig, axes = plt.subplots(2, 2, figsize=(16, 10))
-            ax_raw_a, ax_raw_b = axes[0, 0], axes[0, 1]
-            ax_box_a, ax_box_b = axes[1, 0], axes[1, 1]
-
-            colors = ['#0173B2', '#DE8F05', '#029E73']
-            group_names = ['Group 1', 'Group 2', 'Group 3']
-
-            def draw_raw_panel(ax, groups, summary_stats, std_value, title_prefix):
-                for idx, (group_values, color, group_name) in enumerate(zip(groups, colors, group_names), start=1):
-                    jitter = np.random.default_rng(idx).normal(0, 0.04, len(group_values))
-                    ax.scatter(
-                        np.ones(len(group_values)) * idx + jitter,
-                        group_values,
-                        alpha=0.6,
-                        s=30,
-                        color=color,
-                        label=group_name
-                    )
-                    ax.hlines(
-                        fixed_means[idx - 1],
-                        idx - 0.25,
-                        idx + 0.25,
-                        colors=color,
-                        linewidth=3,
-                    )
-
-                ax.axhline(
-                    summary_stats["grand_mean"],
-                    color='red',
-                    linestyle='--',
-                    linewidth=2,
-                    label=f"Grand Mean = {summary_stats['grand_mean']:.2f}"
-                )
-                ax.set_xlim(0.5, 3.5)
-                ax.set_xticks([1, 2, 3])
-                ax.set_xticklabels(group_names)
-                ax.set_ylabel('Value', fontsize=11)
-                ax.set_title(f"{title_prefix} Raw Data (Std Dev = {std_value:.1f})", fontsize=12, fontweight='bold')
-                ax.grid(True, alpha=0.3, axis='y')
-                ax.legend(fontsize=8, loc='best')
-
-            def draw_box_panel(ax, groups, summary_stats, std_value, title_prefix):
-                bp = ax.boxplot(
-                    groups,
-                    positions=[1, 2, 3],
-                    widths=0.55,
-                    patch_artist=True,
-                    labels=group_names,
-                )
-                for patch, color in zip(bp['boxes'], colors):
-                    patch.set_facecolor(color)
-                    patch.set_alpha(0.6)
-
-                ax.axhline(
-                    summary_stats["grand_mean"],
-                    color='red',
-                    linestyle='--',
-                    linewidth=2,
-                    label=f"Grand Mean = {summary_stats['grand_mean']:.2f}"
-                )
-                ax.set_ylabel('Value', fontsize=11)
-                ax.set_title(f"{title_prefix} Boxplots (Std Dev = {std_value:.1f})", fontsize=12, fontweight='bold')
-                ax.grid(True, alpha=0.3, axis='y')
-                ax.legend(fontsize=8, loc='best')
-
-            draw_raw_panel(ax_raw_a, groups_a, stats_a, std_scenario_a, "Scenario A")
-            draw_raw_panel(ax_raw_b, groups_b, stats_b, std_scenario_b, "Scenario B")
-            draw_box_panel(ax_box_a, groups_a, stats_a, std_scenario_a, "Scenario A")
-            draw_box_panel(ax_box_b, groups_b, stats_b, std_scenario_b, "Scenario B")
-
-            # Use common y-axis limits across each visual pair to make comparisons direct.
-            all_values_both_scenarios = np.concatenate(groups_a + groups_b)
-            y_min = float(np.min(all_values_both_scenarios))
-            y_max = float(np.max(all_values_both_scenarios))
-            y_padding = max(1.0, (y_max - y_min) * 0.08)
-            shared_ylim = (y_min - y_padding, y_max + y_padding)
-
-            ax_raw_a.set_ylim(shared_ylim)
-            ax_raw_b.set_ylim(shared_ylim)
-            ax_box_a.set_ylim(shared_ylim)
-            ax_box_b.set_ylim(shared_ylim)
-
-            plt.tight_layout()
-            st.pyplot(fig)
-            
-            st.caption(f"""
-            **Accessibility Description:** Four-panel F-statistic comparison with two scenarios.
-            Top row: raw-data scatter plots (Scenario A left, Scenario B right).
-            Bottom row: boxplots (Scenario A left, Scenario B right).
-            Both scenarios use fixed means {fixed_means} and fixed sample sizes {fixed_sizes}.
-            Scenario A uses standard deviation {std_scenario_a:.1f} with F = {stats_a['f']:.4f}, p = {stats_a['p']:.6f}.
-            Scenario B uses standard deviation {std_scenario_b:.1f} with F = {stats_b['f']:.4f}, p = {stats_b['p']:.6f}.
-            """)
-            plt.close()
-            
-            st.write("---")
-            st.subheader("ANOVA Calculation Breakdown (Side-by-Side)")
-
-            col_a, col_b = st.columns(2)
-
-            with col_a:
-                st.write("**Scenario A**")
-                st.write(f"- Std Dev: {std_scenario_a:.2f}")
-                st.write(f"- SSB: {stats_a['ssb']:.2f}")
-                st.write(f"- SSW: {stats_a['ssw']:.2f}")
-                st.write(f"- MSB: {stats_a['msb']:.2f}")
-                st.write(f"- MSW: {stats_a['msw']:.2f}")
-                st.metric("F-value (A)", f"{stats_a['f']:.4f}")
-                st.metric("p-value (A)", f"{stats_a['p']:.6f}")
-                if stats_a['p'] < 0.05:
-                    st.success("Scenario A: Significant at α = 0.05")
-                else:
-                    st.info("Scenario A: Not significant at α = 0.05")
-            
-            with col_b:
-                st.write("**Scenario B**")
-                st.write(f"- Std Dev: {std_scenario_b:.2f}")
-                st.write(f"- SSB: {stats_b['ssb']:.2f}")
-                st.write(f"- SSW: {stats_b['ssw']:.2f}")
-                st.write(f"- MSB: {stats_b['msb']:.2f}")
-                st.write(f"- MSW: {stats_b['msw']:.2f}")
-                st.metric("F-value (B)", f"{stats_b['f']:.4f}")
-                st.metric("p-value (B)", f"{stats_b['p']:.6f}")
-                if stats_b['p'] < 0.05:
-                    st.success("Scenario B: Significant at α = 0.05")
-                else:
-                    st.info("Scenario B: Not significant at α = 0.05")
-            
-            st.write("---")
-            st.write("**F-Statistic Formula:**")
-            st.latex(r"F = \frac{MSB}{MSW}")
-            st.write(f"Scenario A: F = {stats_a['msb']:.2f} / {stats_a['msw']:.2f} = {stats_a['f']:.4f}")
-            st.write(f"Scenario B: F = {stats_b['msb']:.2f} / {stats_b['msw']:.2f} = {stats_b['f']:.4f}")
-            
-            st.write("---")
-            st.subheader("Key Insights")
-            
-            st.write("**Comparison Focus:**")
-            st.write("- Group means and sample sizes are fixed, so between-group structure is held constant.")
-            st.write("- Increasing within-group standard deviation raises MSW (denominator).")
-            st.write("- As MSW rises, F typically decreases, making significance harder to achieve.")
-
-            if stats_a['f'] > stats_b['f']:
-                st.write(f"- Scenario A currently has the larger F-statistic ({stats_a['f']:.2f} vs {stats_b['f']:.2f}).")
-            elif stats_b['f'] > stats_a['f']:
-                st.write(f"- Scenario B currently has the larger F-statistic ({stats_b['f']:.2f} vs {stats_a['f']:.2f}).")
-            else:
-                st.write(f"- Both scenarios currently have similar F-statistics ({stats_a['f']:.2f} vs {stats_b['f']:.2f}).")
-            
-            st.write("---")
-            st.info("""
-            **Try These Experiments:**
-            1. Set Scenario A to low std dev and Scenario B to high std dev.
-            2. Observe that Scenario B usually has larger within-group spread and lower F.
-            3. Bring both std dev sliders together and observe F-statistics become more similar.
-
-            This view emphasizes the role of within-group variation in ANOVA when means are held fixed.
-            """)
-            
-        except Exception as e:
-            st.error(f"An error occurred while running the F-statistic explorer: {e}")
+# --- Main Content Area ---
 
-# Placeholder for other tabs
-else:
-    st.header(selected_tab)
-    st.info("This tab is under construction. Please use the 'Data Input' tab first to load or enter data.")
+run_page(selected_tab)